@@ -8,10 +8,16 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from playwright.async_api import async_playwright, Browser, Page
 
+from extractors.api_extractor import APIExtractor
+from extractors.http_extractor import HTTPExtractor
+from crawlers.livebridge_queue import LivebridgeTaskQueue
+from utils.comment_cursors import CommentCursorStore
+from utils.request_filter import RequestFilter
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,8 +26,14 @@ class BaseCrawler(ABC):
 
     CRAWLER_VERSION = "1.0.0"
 
+    # Abort images/media/fonts/trackers by default (subclasses that only need JSON APIs enable it)
+    BLOCK_RESOURCES = False
+
     def __init__(self, headless: bool = True, external_context=None,
-                 crawl_livebridge: bool = False, use_livebridge_llm: bool = True):
+                 crawl_livebridge: bool = False, use_livebridge_llm: bool = True,
+                 use_http_engine: bool = False, browser_fallback: bool = True,
+                 block_resources: Optional[bool] = None, livebridge_queue: Optional[LivebridgeTaskQueue] = None,
+                 prefetched_apis: Optional[HTTPExtractor] = None):
         """
         Initialize BaseCrawler
 
@@ -30,6 +42,13 @@ class BaseCrawler(ABC):
             external_context: Optional external browser context from pool (for optimization)
             crawl_livebridge: Whether to automatically crawl livebridge pages (default: False)
             use_livebridge_llm: Whether to use LLM for livebridge image extraction (default: True)
+            use_http_engine: Try direct HTTP API extraction before launching a browser (default: False)
+            browser_fallback: Fall back to the browser if the HTTP engine fails (default: True)
+            block_resources: Abort media/images/fonts/trackers on pages (default: class BLOCK_RESOURCES)
+            livebridge_queue: Shared livebridge queue; crawl() returns without waiting for its tasks
+                              (default: a private queue that crawl() waits for)
+            prefetched_apis: HTTPExtractor that already fetched this broadcast's broadcast,
+                             coupons and benefits APIs; the HTTP engine reuses its responses
         """
         self.headless = headless
         self.browser: Optional[Browser] = None
@@ -39,6 +58,14 @@ class BaseCrawler(ABC):
         self.owns_browser = external_context is None  # Track if we own the browser lifecycle
         self.crawl_livebridge = crawl_livebridge
         self.use_livebridge_llm = use_livebridge_llm
+        self.use_http_engine = use_http_engine
+        self.browser_fallback = browser_fallback
+        self.block_resources = self.BLOCK_RESOURCES if block_resources is None else block_resources
+        self.request_filter: Optional[RequestFilter] = None
+        self.livebridge_queue = livebridge_queue
+        self.owns_livebridge_queue = False
+        self._livebridge_task: Optional[asyncio.Task] = None
+        self.prefetched_apis = prefetched_apis
 
     @abstractmethod
     async def extract_data(self, url: str) -> Dict[str, Any]:
@@ -57,6 +84,22 @@ class BaseCrawler(ABC):
         """
         pass
 
+    async def extract_data_http(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract broadcast data over plain HTTP (no browser)
+        Override in subclasses that support the HTTP engine
+
+        Args:
+            url: The URL to crawl
+
+        Returns:
+            Dict containing broadcast data, or None if not supported
+
+        Raises:
+            Exception: If a direct call fails (triggers browser fallback)
+        """
+        return None
+
     @abstractmethod
     def get_extraction_method(self) -> str:
         """
@@ -95,6 +138,15 @@ class BaseCrawler(ABC):
         logger.info(f"Starting crawler for URL: {url}")
         logger.info(f"Detected URL type: {self.get_url_type()}")
 
+        # Try browserless extraction first
+        if self.use_http_engine:
+            result = await self.crawl_http(url)
+            if result is not None:
+                return result
+            if not self.browser_fallback:
+                raise Exception("HTTP engine failed and browser fallback is disabled")
+            logger.info("Falling back to browser crawl")
+
         try:
             # Launch browser
             await self._launch_browser()
@@ -116,6 +168,29 @@ class BaseCrawler(ABC):
             # Always close browser
             await self._close_browser()
 
+    async def crawl_http(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Crawl using direct HTTP calls only (no browser)
+
+        Args:
+            url: The URL to crawl
+
+        Returns:
+            Complete crawl result, or None if unsupported or a direct call failed
+        """
+        try:
+            broadcast_data = await self.extract_data_http(url)
+        except Exception as e:
+            logger.warning(f"HTTP engine failed for {url}: {e}")
+            return None
+
+        if broadcast_data is None:
+            logger.debug(f"HTTP engine not supported for {self.get_url_type()}")
+            return None
+
+        logger.info("Crawl completed via HTTP engine")
+        return self._build_result(url, broadcast_data)
+
     async def _launch_browser(self):
         """Launch Playwright browser or use external context from pool"""
 
@@ -123,6 +198,7 @@ class BaseCrawler(ABC):
         if self.external_context:
             logger.info("Using external browser context from pool")
             self.page = await self.external_context.new_page()
+            await self._attach_request_filter()
             logger.info("Page created from external context")
             return
 
@@ -140,12 +216,29 @@ class BaseCrawler(ABC):
             }
         )
         self.page = await context.new_page()
+        await self._attach_request_filter()
 
         logger.info("Browser launched successfully")
 
+    async def _attach_request_filter(self):
+        """Install the resource-blocking route on the current page (if enabled)"""
+        if not self.block_resources:
+            return
+
+        self.request_filter = RequestFilter(allow_patterns=APIExtractor.TARGET_API_PATTERNS)
+        await self.request_filter.attach(self.page)
+
     async def _close_browser(self):
         """Close Playwright browser (only if we own it)"""
 
+        # Report what the request filter saved on this page
+        if self.request_filter:
+            stats = self.request_filter.get_stats()
+            logger.info(
+                f"🚫 Blocked {stats['blocked_total']} requests {stats['blocked']}, "
+                f"~{stats['estimated_bytes_saved'] / 1024:.0f}KB saved"
+            )
+
         # Always close the page
         if self.page:
             await self.page.close()
@@ -188,12 +281,81 @@ class BaseCrawler(ABC):
             metadata["errors"] = broadcast_data.pop("_errors")
         if "_warnings" in broadcast_data:
             metadata["warnings"] = broadcast_data.pop("_warnings")
+        if self.request_filter:
+            metadata["request_filter"] = self.request_filter.get_stats()
 
         return {
             "metadata": metadata,
             "broadcast": broadcast_data
         }
 
+    async def _fetch_all_products_via_api(self, broadcast_id: int, expected_count: int) -> List[Dict[str, Any]]:
+        """
+        Fetch all products via direct API pagination
+
+        Pages after the first are fetched concurrently through the shared
+        HTTP client (HTTPClientRegistry).
+
+        Args:
+            broadcast_id: The broadcast ID
+            expected_count: Expected total product count
+
+        Returns:
+            List of raw product dicts from all API pages
+        """
+        try:
+            # Get cookies from current page context (none in HTTP engine mode)
+            cookies = await self.page.context.cookies() if self.page else []
+            cookie_dict = {c['name']: c['value'] for c in cookies}
+
+            return await HTTPExtractor.fetch_all_products(
+                broadcast_id,
+                referer=f"https://view.shoppinglive.naver.com/{self.get_url_type()}/{broadcast_id}",
+                cookies=cookie_dict,
+                expected_count=expected_count
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to fetch products via API: {e}")
+            return []
+
+    async def _fetch_live_chat(
+        self,
+        api_extractor: APIExtractor,
+        broadcast_id: int,
+        broadcast_data: Dict[str, Any],
+        warnings: list
+    ):
+        """
+        Fetch comments into broadcast_data['live_chat'], resuming from the stored cursor
+
+        On a revisit only comments newer than the last saved cursor are fetched;
+        the result is flagged live_chat_incremental so persistence appends them
+        instead of replacing the stored chat. The new cursor is attached as
+        comment_cursor and committed by the saver once the broadcast is saved.
+
+        Args:
+            api_extractor: APIExtractor of the current page
+            broadcast_id: The broadcast ID
+            broadcast_data: Broadcast dict to fill (updated in place)
+            warnings: Warning list (updated in place)
+        """
+        cursor = CommentCursorStore.default().get(broadcast_id)
+        comments, next_cursor = await api_extractor.fetch_comments_since(
+            broadcast_id=broadcast_id,
+            cursor=cursor,
+            page_size=100,
+            keep_odd_only=True  # Keep only odd indices (~50%) to reduce DB storage for demo
+        )
+
+        broadcast_data['live_chat'] = self._extract_comments(comments) if comments else []
+        if cursor:
+            broadcast_data['live_chat_incremental'] = True
+        elif not comments:
+            self._add_warning(warnings, "live_chat", "No comments available", [])
+        if next_cursor:
+            broadcast_data['comment_cursor'] = next_cursor
+
     def construct_livebridge_url(self, broadcast_id: int) -> str:
         """
         Construct livebridge URL from broadcast ID
@@ -206,91 +368,60 @@ class BaseCrawler(ABC):
         """
         return f"https://shoppinglive.naver.com/livebridge/{broadcast_id}"
 
-    async def _crawl_livebridge_if_available(self, broadcast_id: int) -> Optional[Dict[str, Any]]:
+    def _start_livebridge(self, broadcast_id: Optional[int]):
         """
-        Check if livebridge page is available and crawl it
+        Queue the livebridge sub-crawl as soon as the broadcast ID is known
+
+        The livebridge task runs concurrently with the rest of the extraction
+        and never uses the browser page. No-op if livebridge crawling is
+        disabled or the task was already started.
 
         Args:
             broadcast_id: The broadcast ID
+        """
+        if not self.crawl_livebridge or not broadcast_id or self._livebridge_task is not None:
+            return
 
-        Returns:
-            Dict with livebridge crawl result or None
+        if self.livebridge_queue is None:
+            self.livebridge_queue = LivebridgeTaskQueue(use_llm=self.use_livebridge_llm)
+            self.owns_livebridge_queue = True
+        # Only a private queue's task is awaited, so only then is the crawled data kept
+        self._livebridge_task = self.livebridge_queue.submit(broadcast_id, keep_data=self.owns_livebridge_queue)
+
+    async def _finish_livebridge(self, result: Optional[Dict[str, Any]]):
         """
-        if not broadcast_id:
-            logger.debug("No broadcast_id provided, skipping livebridge")
-            return None
+        Attach the livebridge outcome to a crawl result (called after the browser page is closed)
 
-        livebridge_url = self.construct_livebridge_url(broadcast_id)
-        logger.info(f"Checking livebridge: {livebridge_url}")
+        With a shared queue the task keeps running in the background and the
+        result only records that it was queued; with a private queue the task
+        is awaited and the queue closed.
 
-        try:
-            # Check if livebridge page is accessible
-            import requests
-            response = requests.head(livebridge_url, timeout=5, verify=False, allow_redirects=True)
-
-            if response.status_code == 200:
-                logger.info("✓ Livebridge page accessible, crawling...")
-
-                # Import LivebridgeCrawler dynamically to avoid circular imports
-                try:
-                    from crawlers.livebridge_crawler import LivebridgeCrawler
-                except ImportError:
-                    logger.warning("Livebridge crawler not available")
-                    return {
-                        'status': 'error',
-                        'error': 'LivebridgeCrawler not available'
-                    }
-
-                # Initialize and crawl livebridge
-                livebridge_crawler = LivebridgeCrawler(
-                    use_llm=self.use_livebridge_llm,
-                    use_supabase=True
-                )
-
-                # Crawl livebridge page
-                livebridge_data = await livebridge_crawler.crawl(livebridge_url)
-
-                # Save to Supabase
-                livebridge_id = livebridge_crawler.save_to_supabase(livebridge_data)
-
-                if livebridge_id:
-                    logger.info(f"✓ Livebridge saved to Supabase (ID: {livebridge_id})")
-                    return {
-                        'status': 'success',
-                        'livebridge_id': livebridge_id,
-                        'url': livebridge_url,
-                        'data': livebridge_data,
-                        'records': {
-                            'special_coupons': len(livebridge_data.get('special_coupons', [])),
-                            'products': len(livebridge_data.get('products', [])),
-                            'live_benefits': len(livebridge_data.get('live_benefits', [])),
-                            'benefits_by_amount': len(livebridge_data.get('benefits_by_amount', [])),
-                            'simple_coupons': len(livebridge_data.get('coupons', []))
-                        }
-                    }
-                else:
-                    logger.warning("✗ Failed to save livebridge to Supabase")
-                    return {
-                        'status': 'save_failed',
-                        'url': livebridge_url,
-                        'error': 'Failed to save to Supabase'
-                    }
-
-            else:
-                logger.info(f"✗ Livebridge page not accessible (status: {response.status_code})")
-                return {
-                    'status': 'not_available',
-                    'url': livebridge_url,
-                    'http_status': response.status_code
-                }
+        Args:
+            result: Crawl result (None if the crawl failed)
+        """
+        if not self.crawl_livebridge:
+            return
 
-        except Exception as e:
-            logger.error(f"✗ Livebridge crawl failed: {e}")
-            return {
-                'status': 'error',
-                'url': livebridge_url,
-                'error': str(e)
-            }
+        if result is not None:
+            self._start_livebridge(result.get('broadcast', {}).get('broadcast_id'))
+        task, self._livebridge_task = self._livebridge_task, None
+        if task is None:
+            return
+
+        if not self.owns_livebridge_queue:
+            if result is not None:
+                broadcast_id = result.get('broadcast', {}).get('broadcast_id')
+                result['livebridge'] = {'status': 'queued', 'url': self.construct_livebridge_url(broadcast_id)}
+            return
+
+        try:
+            livebridge_result = await task
+            if result is not None and livebridge_result:
+                result['livebridge'] = livebridge_result
+        finally:
+            await self.livebridge_queue.aclose()
+            self.livebridge_queue = None
+            self.owns_livebridge_queue = False
 
     def _add_error(self, errors: list, error_type: str, message: str, **kwargs):
         """
@@ -7,14 +7,14 @@ Example URLs:
     https://shoppinglive.naver.com/livebridge/1776510
 """
 
+import asyncio
 import json
 import re
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import sys
-import requests
 import urllib3
 import os
 from dotenv import load_dotenv
@@ -25,6 +25,10 @@ load_dotenv()
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from extractors.embedded_json import EmbeddedJSONExtractor
+from utils.http_clients import HTTPClientRegistry
+from utils.vision_cache import VisionResponseCache
+
 try:
     from vision_extractor import VisionExtractor, VisionProvider
     VISION_AVAILABLE = True
@@ -41,6 +45,13 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     print("⚠ Supabase client not available. Install with: pip install supabase")
 
+try:
+    from persistence.async_client import AsyncSupabaseClient
+    from persistence.config import SupabaseConfig
+    ASYNC_DB_AVAILABLE = True
+except ImportError:
+    ASYNC_DB_AVAILABLE = False
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 import warnings
@@ -52,7 +63,12 @@ logger = logging.getLogger(__name__)
 class LivebridgeCrawler:
     """Crawler for Naver Shopping Live livebridge pages"""
 
-    def __init__(self, use_llm: bool = True, vision_provider: VisionProvider = None, use_supabase: bool = True):
+    # Bridge products API paging
+    PRODUCT_PAGE_SIZE = 20
+    MAX_PRODUCT_PAGES = 50
+
+    def __init__(self, use_llm: bool = True, vision_provider: VisionProvider = None, use_supabase: bool = True,
+                 async_db: Optional['AsyncSupabaseClient'] = None):
         """
         Initialize the livebridge crawler
 
@@ -60,17 +76,20 @@ class LivebridgeCrawler:
             use_llm: Whether to use LLM for image extraction (default: True)
             vision_provider: Vision LLM provider to use (default: GPT_4O_MINI)
             use_supabase: Whether to save data to Supabase (default: True)
+            async_db: Async PostgREST client for save_to_supabase_async (default: created on first save)
         """
         self.use_llm = use_llm and VISION_AVAILABLE
         self.use_supabase = use_supabase and SUPABASE_AVAILABLE
+        self.async_db = async_db
+        self.owns_async_db = async_db is None
+        self.supabase_config: Optional['SupabaseConfig'] = None
 
-        self.session = requests.Session()
-        self.session.verify = False  # Disable SSL verification for Naver
-        self.session.headers.update({
+        # Requests go through the shared pooled async client (HTTPClientRegistry); headers are per request
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        })
+        }
 
         # Initialize vision extractor if enabled
         if self.use_llm:
@@ -97,6 +116,8 @@ class LivebridgeCrawler:
                     # Create httpx client with SSL verification disabled and override
                     http_client = httpx.Client(verify=False)
                     self.supabase.postgrest.session = http_client
+                    if ASYNC_DB_AVAILABLE:
+                        self.supabase_config = SupabaseConfig(url=supabase_url, key=supabase_key)
                     logger.info("✓ Supabase client initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize Supabase client: {e}")
@@ -114,16 +135,15 @@ class LivebridgeCrawler:
         """
         logger.info(f"Starting livebridge crawl: {url}")
 
-        try:
-            # Step 1: Fetch the page
-            html = self._fetch_page(url)
-            if not html:
-                raise Exception("Failed to fetch page")
+        # Livebridge URLs carry the broadcast ID: start the product/coupon APIs while the page loads and parses
+        url_broadcast_id = self._broadcast_id_from_url(url)
+        api_task = asyncio.create_task(self._fetch_bridge_apis(url_broadcast_id)) if url_broadcast_id else None
 
-            # Step 2: Extract __NEXT_DATA__
-            next_data = self._extract_next_data(html)
+        try:
+            # Step 1-2: Stream the page and parse __NEXT_DATA__ as soon as its script closes
+            next_data = await self._fetch_next_data(url)
             if not next_data:
-                raise Exception("Failed to extract __NEXT_DATA__")
+                raise Exception("Failed to fetch page or extract __NEXT_DATA__")
 
             # Step 3: Parse bridge info
             bridge_info = self._parse_bridge_info(next_data)
@@ -133,12 +153,16 @@ class LivebridgeCrawler:
             # Step 4: Extract image URLs from contentsJson
             images = self._extract_images(bridge_info)
 
-            # Step 5: Extract products from API
+            # Step 5-6: Products and special coupons (started above unless the page names another broadcast)
             broadcast_id = bridge_info.get('broadcastId')
-            products = self._extract_products_from_api(broadcast_id) if broadcast_id else []
-
-            # Step 6: Extract special coupons from API
-            special_coupons = self._extract_coupons_from_api(broadcast_id) if broadcast_id else []
+            products, special_coupons = [], []
+            if broadcast_id and api_task and str(broadcast_id) == str(url_broadcast_id):
+                products, special_coupons = await api_task
+            else:
+                # The early fetch targets the wrong broadcast: stop it before fetching the right one
+                await self._cancel_task(api_task)
+                if broadcast_id:
+                    products, special_coupons = await self._fetch_bridge_apis(broadcast_id)
 
             # Step 7: Extract content from images using LLM (if enabled)
             extracted_content = {
@@ -169,19 +193,46 @@ class LivebridgeCrawler:
             logger.error(f"Crawl failed: {e}")
             raise
 
-    def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch the livebridge page HTML with retry logic"""
+        finally:
+            await self._cancel_task(api_task)
+
+    @staticmethod
+    async def _cancel_task(task: Optional[asyncio.Task]):
+        """Cancel a background task and wait for it, discarding its result or error"""
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def _broadcast_id_from_url(self, url: str) -> Optional[str]:
+        """Extract the broadcast ID from a livebridge URL"""
+        match = re.search(r'/livebridge/(\d+)', url)
+        return match.group(1) if match else None
+
+    async def _fetch_next_data(self, url: str) -> Optional[Dict]:
+        """Stream the livebridge page and extract __NEXT_DATA__ with retry logic (shared async client)"""
         max_retries = 3
         timeout = 30  # Increased timeout
+        client = HTTPClientRegistry.get_async_client()
 
         for attempt in range(max_retries):
             try:
                 logger.info(f"Fetching (attempt {attempt + 1}/{max_retries}): {url}")
-                response = self.session.get(url, timeout=timeout)
-                response.raise_for_status()
+                async with client.stream('GET', url, headers=self.headers, timeout=timeout) as response:
+                    response.raise_for_status()
+                    next_data = await EmbeddedJSONExtractor.stream_script_json(response.aiter_bytes())
+
+                if next_data is None:
+                    logger.error("__NEXT_DATA__ not found in HTML")
+                    return None
+
+                logger.info("Successfully extracted __NEXT_DATA__")
+                return next_data
 
-                logger.info(f"Page fetched: {len(response.text)} bytes")
-                return response.text
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to extract __NEXT_DATA__: {e}")
+                return None
 
             except Exception as e:
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -192,18 +243,13 @@ class LivebridgeCrawler:
         return None
 
     def _extract_next_data(self, html: str) -> Optional[Dict]:
-        """Extract __NEXT_DATA__ from HTML"""
+        """Extract __NEXT_DATA__ from already fetched HTML"""
         try:
-            # Look for <script id="__NEXT_DATA__">...</script>
-            pattern = r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>'
-            matches = re.findall(pattern, html, re.DOTALL)
-
-            if not matches:
+            data = EmbeddedJSONExtractor.script_json(html)
+            if data is None:
                 logger.error("__NEXT_DATA__ not found in HTML")
                 return None
 
-            # Parse JSON
-            data = json.loads(matches[0])
             logger.info("Successfully extracted __NEXT_DATA__")
             return data
 
@@ -266,138 +312,148 @@ class LivebridgeCrawler:
             logger.error(f"Failed to extract images: {e}")
             return []
 
-    def _extract_products_from_api(self, broadcast_id: int) -> List[Dict]:
-        """Extract products from Naver Shopping Live API with pagination support"""
-        products = []
+    async def _fetch_bridge_apis(self, broadcast_id: int) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Fetch MAIN products, SUB products and special coupons concurrently
 
-        try:
-            # API endpoint for products
-            api_url = f'https://apis.naver.com/selectiveweb/live_commerce_web/v1/broadcast-bridge/{broadcast_id}/products'
+        Args:
+            broadcast_id: Broadcast ID of the livebridge page
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'Referer': f'https://shoppinglive.naver.com/livebridge/{broadcast_id}',
-                'apigw-routing-key': 'real-home-api',
-            }
+        Returns:
+            (products, special_coupons)
+        """
+        products, special_coupons = await asyncio.gather(
+            self._extract_products_from_api(broadcast_id),
+            self._extract_coupons_from_api(broadcast_id)
+        )
+        return products, special_coupons
 
-            # Fetch ALL MAIN products with pagination
-            logger.info(f"Fetching MAIN products from API (with pagination)...")
-            page = 0
-            total_main = 0
-            while True:
-                params_main = {'attachmentType': 'MAIN', 'page': page, 'size': 20}
-                response_main = self.session.get(api_url, headers=headers, params=params_main, timeout=10)
-
-                if response_main.status_code == 200:
-                    data_main = response_main.json()
-                    main_products = data_main.get('list', [])
-
-                    if not main_products:
-                        # No more products, exit pagination loop
-                        break
-
-                    logger.info(f"Page {page}: Found {len(main_products)} MAIN products")
-                    total_main += len(main_products)
-
-                    for product in main_products:
-                        products.append({
-                            'product_id': str(product.get('productNo') or product.get('key')),
-                            'product_name': product.get('productName') or product.get('name'),
-                            'brand_name': product.get('brandName'),
-                            'price': product.get('price'),
-                            'sale_price': product.get('salePrice'),
-                            'discounted_price': product.get('discountedSalePrice'),
-                            'discount_rate': product.get('discountRate'),
-                            'product_url': product.get('productEndUrl'),
-                            'bridge_url': product.get('productBridgeUrl'),
-                            'image_url': product.get('image'),
-                            'stock': product.get('stock'),
-                            'status': product.get('status'),
-                            'is_represent': product.get('represent', False),
-                            'badges': self._extract_product_badges(product),
-                            'attachment_type': 'MAIN',
-                            'source': 'API'
-                        })
-
-                    # Check if there are more pages using totalCount
-                    total_count = data_main.get('totalCount')
-                    if total_count and total_main >= total_count:
-                        # Collected all products based on totalCount
-                        break
-                    if len(main_products) < 20:
-                        # Last page has fewer items than page size
-                        break
-
-                    page += 1
-                else:
-                    logger.warning(f"Failed to fetch MAIN products page {page}: {response_main.status_code}")
-                    break
+    async def _extract_products_from_api(self, broadcast_id: int) -> List[Dict]:
+        """
+        Extract MAIN and SUB products from Naver Shopping Live API
 
-            logger.info(f"Total MAIN products: {total_main}")
+        Both attachment types are paged concurrently; see _fetch_product_pages.
 
-            # Fetch ALL SUB products with pagination
-            logger.info(f"Fetching SUB products from API (with pagination)...")
-            page = 0
-            total_sub = 0
-            while True:
-                params_sub = {'attachmentType': 'SUB', 'page': page, 'size': 20}
-                response_sub = self.session.get(api_url, headers=headers, params=params_sub, timeout=10)
-
-                if response_sub.status_code == 200:
-                    data_sub = response_sub.json()
-                    sub_products = data_sub.get('list', [])
-
-                    if not sub_products:
-                        # No more products, exit pagination loop
-                        break
-
-                    logger.info(f"Page {page}: Found {len(sub_products)} SUB products")
-                    total_sub += len(sub_products)
-
-                    for product in sub_products:
-                        products.append({
-                            'product_id': str(product.get('productNo') or product.get('key')),
-                            'product_name': product.get('productName') or product.get('name'),
-                            'brand_name': product.get('brandName'),
-                            'price': product.get('price'),
-                            'sale_price': product.get('salePrice'),
-                            'discounted_price': product.get('discountedSalePrice'),
-                            'discount_rate': product.get('discountRate'),
-                            'product_url': product.get('productEndUrl'),
-                            'bridge_url': product.get('productBridgeUrl'),
-                            'image_url': product.get('image'),
-                            'stock': product.get('stock'),
-                            'status': product.get('status'),
-                            'is_represent': product.get('represent', False),
-                            'badges': self._extract_product_badges(product),
-                            'attachment_type': 'SUB',
-                            'source': 'API'
-                        })
-
-                    # Check if there are more pages using totalCount
-                    total_count = data_sub.get('totalCount')
-                    if total_count and total_sub >= total_count:
-                        # Collected all products based on totalCount
-                        break
-                    if len(sub_products) < 20:
-                        # Last page has fewer items than page size
-                        break
-
-                    page += 1
-                else:
-                    logger.warning(f"Failed to fetch SUB products page {page}: {response_sub.status_code}")
-                    break
+        Args:
+            broadcast_id: Broadcast ID of the livebridge page
 
-            logger.info(f"Total SUB products: {total_sub}")
-            logger.info(f"Total products extracted: {len(products)} (MAIN: {total_main}, SUB: {total_sub})")
-            return products
+        Returns:
+            MAIN products followed by SUB products (page order; duplicates are dropped
+            within each attachment type, so a product listed as both MAIN and SUB
+            appears once per type)
+        """
+        try:
+            main_products, sub_products = await asyncio.gather(
+                self._fetch_product_pages(broadcast_id, 'MAIN'),
+                self._fetch_product_pages(broadcast_id, 'SUB')
+            )
+            logger.info(f"Total products extracted: {len(main_products) + len(sub_products)} "
+                        f"(MAIN: {len(main_products)}, SUB: {len(sub_products)})")
+            return main_products + sub_products
 
         except Exception as e:
             logger.error(f"Failed to extract products from API: {e}")
             return []
 
-    def _extract_coupons_from_api(self, broadcast_id: int) -> List[Dict]:
+    async def _fetch_product_pages(self, broadcast_id: int, attachment_type: str) -> List[Dict]:
+        """
+        Fetch all product pages of one attachment type
+
+        The first page reports totalCount; the remaining pages are then
+        requested concurrently. Without totalCount, pages are followed one by
+        one until a short or empty page.
+
+        Args:
+            broadcast_id: Broadcast ID of the livebridge page
+            attachment_type: 'MAIN' or 'SUB'
+
+        Returns:
+            Product dicts in page order (duplicate product IDs dropped)
+        """
+        client = HTTPClientRegistry.get_async_client()
+        api_url = f'https://apis.naver.com/selectiveweb/live_commerce_web/v1/broadcast-bridge/{broadcast_id}/products'
+        headers = {
+            **self.headers,
+            'Accept': 'application/json',
+            'Referer': f'https://shoppinglive.naver.com/livebridge/{broadcast_id}',
+            'apigw-routing-key': 'real-home-api',
+        }
+
+        async def fetch_page(page: int) -> Optional[Dict]:
+            params = {'attachmentType': attachment_type, 'page': page, 'size': self.PRODUCT_PAGE_SIZE}
+            response = await client.get(api_url, headers=headers, params=params, timeout=10)
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch {attachment_type} products page {page}: {response.status_code}")
+                return None
+            return response.json()
+
+        first = await fetch_page(0)
+        if not first or not first.get('list'):
+            return self._build_products([], attachment_type)
+
+        pages = [first.get('list', [])]
+        total_count = first.get('totalCount')
+
+        if total_count:
+            # Fan out the remaining pages now that the total is known
+            page_count = min(-(-total_count // self.PRODUCT_PAGE_SIZE), self.MAX_PRODUCT_PAGES)
+            rest = await asyncio.gather(*(fetch_page(page) for page in range(1, page_count)))
+            pages.extend((data or {}).get('list', []) for data in rest)
+        else:
+            page = 0
+            while len(pages[-1]) >= self.PRODUCT_PAGE_SIZE and page + 1 < self.MAX_PRODUCT_PAGES:
+                page += 1
+                data = await fetch_page(page)
+                if not data or not data.get('list'):
+                    break
+                pages.append(data['list'])
+
+        raw_products = [product for page_products in pages for product in page_products]
+        logger.info(f"Total {attachment_type} products: {len(raw_products)} ({len(pages)} pages)")
+        return self._build_products(raw_products, attachment_type)
+
+    def _build_products(self, raw_products: List[Dict], attachment_type: str) -> List[Dict]:
+        """
+        Convert API products to output dicts, dropping repeated product IDs
+
+        Deduplicates within one attachment type only; the same product under
+        MAIN and SUB is kept in both lists, tagged by attachment_type.
+
+        Args:
+            raw_products: Products from the bridge products API
+            attachment_type: 'MAIN' or 'SUB'
+
+        Returns:
+            Product dicts in input order
+        """
+        products = []
+        seen = set()
+        for product in raw_products:
+            product_id = str(product.get('productNo') or product.get('key'))
+            if product_id in seen:
+                continue
+            seen.add(product_id)
+            products.append({
+                'product_id': product_id,
+                'product_name': product.get('productName') or product.get('name'),
+                'brand_name': product.get('brandName'),
+                'price': product.get('price'),
+                'sale_price': product.get('salePrice'),
+                'discounted_price': product.get('discountedSalePrice'),
+                'discount_rate': product.get('discountRate'),
+                'product_url': product.get('productEndUrl'),
+                'bridge_url': product.get('productBridgeUrl'),
+                'image_url': product.get('image'),
+                'stock': product.get('stock'),
+                'status': product.get('status'),
+                'is_represent': product.get('represent', False),
+                'badges': self._extract_product_badges(product),
+                'attachment_type': attachment_type,
+                'source': 'API'
+            })
+        return products
+
+    async def _extract_coupons_from_api(self, broadcast_id: int) -> List[Dict]:
         """Extract special coupons from Naver Shopping Live API"""
         try:
             api_url = f'https://apis.naver.com/selectiveweb/live_commerce_web/v3/broadcast/{broadcast_id}/coupons'
@@ -413,7 +469,8 @@ class LivebridgeCrawler:
             params = {'liveCoupon': 'true'}
 
             logger.info(f"Fetching coupons from API...")
-            response = self.session.get(api_url, headers=headers, params=params, timeout=10)
+            client = HTTPClientRegistry.get_async_client()
+            response = await client.get(api_url, headers={**self.headers, **headers}, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -481,31 +538,45 @@ class LivebridgeCrawler:
             'products': []
         }
 
-        # Download images to temp directory for processing
-        temp_dir = Path(__file__).parent.parent / 'output' / 'temp_images'
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        cache = getattr(self.vision_extractor, 'cache', None)
 
-        downloaded_images = []
+        # Revalidate images concurrently (conditional GET when validators are cached) and hash their bytes
+        responses = await asyncio.gather(
+            *(self._fetch_image(img['url'], cache) for img in images), return_exceptions=True
+        )
+        fetched = []
+        for img, response in zip(images, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to download image {img['url']}: {response}")
+                continue
+            content, image_hash = response
+            fetched.append({'img': img, 'content': content, 'hash': image_hash})
 
-        for idx, img in enumerate(images):
-            try:
-                # Download image
-                response = self.session.get(img['url'], timeout=10)
-                response.raise_for_status()
+        if not fetched:
+            logger.warning("No images downloaded for LLM extraction")
+            return result
 
-                # Save to temp file
-                filename = f"image_{idx}_{img['filename']}"
-                filepath = temp_dir / filename
+        # Unchanged banners: reuse the cached extraction without downloading or calling the LLM
+        extracted = self.vision_extractor.get_cached(
+            [item['hash'] for item in fetched], group_size=self.vision_extractor.GROUP_SIZE
+        ) if cache else None
+        if extracted:
+            logger.info(f"⚡ Vision cache hit for {len(fetched)} images (no download, no LLM call)")
+            self._map_vision_result(extracted, result)
+            return result
 
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
+        # Images stay in memory: VisionExtractor resizes / tiles / encodes the bytes directly
+        downloaded_images = []
 
-                downloaded_images.append({
-                    'path': str(filepath),
-                    'filename': img['filename'],
-                    'url': img['url']
-                })
+        for item in fetched:
+            img = item['img']
+            try:
+                content = item['content']
+                if content is None:
+                    # Not modified, but the cached response is gone: fetch the bytes again
+                    content, _ = await self._fetch_image(img['url'], None)
 
+                downloaded_images.append(content)
                 logger.info(f"Downloaded: {img['filename']}")
 
             except Exception as e:
@@ -520,27 +591,13 @@ class LivebridgeCrawler:
         # Note: vision_extractor uses its own built-in prompt for event extraction
         try:
             logger.info(f"Processing {len(downloaded_images)} images with vision LLM...")
-            image_paths = [img['path'] for img in downloaded_images]
 
-            extracted = self.vision_extractor.extract_from_images(image_paths)
+            # Banner groups are sent concurrently and merged in image order
+            extracted = await self.vision_extractor.extract_from_images_grouped(downloaded_images)
 
             if extracted:
                 logger.info(f"LLM extraction successful")
-
-                # Map vision extractor output to our format
-                if 'live_benefits' in extracted:
-                    result['live_benefits'].extend(extracted['live_benefits'])
-
-                if 'benefits_by_purchase_amount' in extracted:
-                    result['benefits_by_amount'].extend(extracted['benefits_by_purchase_amount'])
-
-                if 'coupon_benefits' in extracted:
-                    # Convert coupon strings to structured format
-                    for coupon_text in extracted['coupon_benefits']:
-                        result['coupons'].append({
-                            'text': coupon_text,
-                            'confidence': 0.85
-                        })
+                self._map_vision_result(extracted, result)
 
             else:
                 logger.warning("Vision extractor returned no data")
@@ -550,18 +607,63 @@ class LivebridgeCrawler:
             import traceback
             traceback.print_exc()
 
-        # Cleanup temp files
-        for img_info in downloaded_images:
-            try:
-                Path(img_info['path']).unlink()
-            except:
-                pass
-
         logger.info(f"Extraction complete: {len(result['live_benefits'])} benefits, "
                    f"{len(result['coupons'])} coupons, {len(result['products'])} products")
 
         return result
 
+    async def _fetch_image(self, url: str, cache=None) -> Tuple[Optional[bytes], str]:
+        """
+        Download an image, revalidating with cached ETag / Last-Modified when available
+
+        Args:
+            url: Image URL
+            cache: VisionResponseCache holding image validators (None: plain download)
+
+        Returns:
+            (image bytes or None if not modified, bytes hash)
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        headers = dict(self.headers)
+        validators = cache.get_validators(url) if cache else None
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        response = await HTTPClientRegistry.get_async_client().get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and validators:
+            return None, validators['image_hash']
+        response.raise_for_status()
+
+        image_hash = VisionResponseCache.hash_image(response.content)
+        if cache:
+            cache.put_validators(
+                url, image_hash,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+        return response.content, image_hash
+
+    def _map_vision_result(self, extracted: Dict, result: Dict):
+        """Map vision extractor output to the livebridge content format (in place)"""
+        if 'live_benefits' in extracted:
+            result['live_benefits'].extend(extracted['live_benefits'])
+
+        if 'benefits_by_purchase_amount' in extracted:
+            result['benefits_by_amount'].extend(extracted['benefits_by_purchase_amount'])
+
+        if 'coupon_benefits' in extracted:
+            # Convert coupon strings to structured format
+            for coupon_text in extracted['coupon_benefits']:
+                result['coupons'].append({
+                    'text': coupon_text,
+                    'confidence': 0.85
+                })
+
     def _create_benefits_prompt(self) -> str:
         """Create prompt for extracting benefits from images"""
         return """이 이미지에서 라이브 방송 혜택 정보를 추출해주세요.
@@ -712,6 +814,49 @@ class LivebridgeCrawler:
 
         return result
 
+    # Child tables replaced on every save (table -> label for logs)
+    CHILD_TABLES = {
+        "livebridge_coupons": "special coupons",
+        "livebridge_products": "products",
+        "livebridge_live_benefits": "live benefits",
+        "livebridge_benefits_by_amount": "benefits by amount",
+        "livebridge_simple_coupons": "simple coupons",
+    }
+
+    def _main_record(self, data: Dict) -> Dict:
+        """Build the main livebridge row"""
+        return {
+            "url": data["url"],
+            "live_datetime": data.get("live_datetime"),
+            "title": data["title"],
+            "brand_name": data.get("brand_name")
+        }
+
+    def _child_rows(self, data: Dict, livebridge_id: int) -> Dict[str, List[Dict]]:
+        """Build child rows per table (same order as CHILD_TABLES)"""
+        return {
+            "livebridge_coupons": [
+                {**coupon, "livebridge_id": livebridge_id}
+                for coupon in data.get("special_coupons") or []
+            ],
+            "livebridge_products": [
+                {**product, "livebridge_id": livebridge_id}
+                for product in data.get("products") or []
+            ],
+            "livebridge_live_benefits": [
+                {"livebridge_id": livebridge_id, "benefit_text": benefit}
+                for benefit in data.get("live_benefits") or []
+            ],
+            "livebridge_benefits_by_amount": [
+                {"livebridge_id": livebridge_id, "benefit_text": benefit}
+                for benefit in data.get("benefits_by_amount") or []
+            ],
+            "livebridge_simple_coupons": [
+                {"livebridge_id": livebridge_id, "coupon_text": coupon}
+                for coupon in data.get("coupons") or []
+            ],
+        }
+
     def save_to_supabase(self, data: Dict) -> Optional[int]:
         """
         Save extracted livebridge data to Supabase
@@ -730,15 +875,8 @@ class LivebridgeCrawler:
             logger.info("Saving data to Supabase...")
 
             # 1. Upsert main livebridge record
-            main_data = {
-                "url": data["url"],
-                "live_datetime": data.get("live_datetime"),
-                "title": data["title"],
-                "brand_name": data.get("brand_name")
-            }
-
             result = self.supabase.table("livebridge")\
-                .upsert(main_data, on_conflict="url")\
+                .upsert(self._main_record(data), on_conflict="url")\
                 .execute()
 
             if not result.data:
@@ -750,56 +888,14 @@ class LivebridgeCrawler:
 
             # 2. Delete existing related records (for update case)
             logger.info("Cleaning up existing related records...")
-            self.supabase.table("livebridge_coupons").delete().eq("livebridge_id", livebridge_id).execute()
-            self.supabase.table("livebridge_products").delete().eq("livebridge_id", livebridge_id).execute()
-            self.supabase.table("livebridge_live_benefits").delete().eq("livebridge_id", livebridge_id).execute()
-            self.supabase.table("livebridge_benefits_by_amount").delete().eq("livebridge_id", livebridge_id).execute()
-            self.supabase.table("livebridge_simple_coupons").delete().eq("livebridge_id", livebridge_id).execute()
-
-            # 3. Insert special coupons
-            if data.get("special_coupons"):
-                coupons = [
-                    {**coupon, "livebridge_id": livebridge_id}
-                    for coupon in data["special_coupons"]
-                ]
-                self.supabase.table("livebridge_coupons").insert(coupons).execute()
-                logger.info(f"✓ Inserted {len(coupons)} special coupons")
-
-            # 4. Insert products
-            if data.get("products"):
-                products = [
-                    {**product, "livebridge_id": livebridge_id}
-                    for product in data["products"]
-                ]
-                self.supabase.table("livebridge_products").insert(products).execute()
-                logger.info(f"✓ Inserted {len(products)} products")
-
-            # 5. Insert live benefits
-            if data.get("live_benefits"):
-                benefits = [
-                    {"livebridge_id": livebridge_id, "benefit_text": benefit}
-                    for benefit in data["live_benefits"]
-                ]
-                self.supabase.table("livebridge_live_benefits").insert(benefits).execute()
-                logger.info(f"✓ Inserted {len(benefits)} live benefits")
-
-            # 6. Insert benefits by amount
-            if data.get("benefits_by_amount"):
-                benefits = [
-                    {"livebridge_id": livebridge_id, "benefit_text": benefit}
-                    for benefit in data["benefits_by_amount"]
-                ]
-                self.supabase.table("livebridge_benefits_by_amount").insert(benefits).execute()
-                logger.info(f"✓ Inserted {len(benefits)} benefits by amount")
-
-            # 7. Insert simple coupons
-            if data.get("coupons"):
-                coupons = [
-                    {"livebridge_id": livebridge_id, "coupon_text": coupon}
-                    for coupon in data["coupons"]
-                ]
-                self.supabase.table("livebridge_simple_coupons").insert(coupons).execute()
-                logger.info(f"✓ Inserted {len(coupons)} simple coupons")
+            for table in self.CHILD_TABLES:
+                self.supabase.table(table).delete().eq("livebridge_id", livebridge_id).execute()
+
+            # 3. Insert coupons, products, benefits and simple coupons
+            for table, rows in self._child_rows(data, livebridge_id).items():
+                if rows:
+                    self.supabase.table(table).insert(rows).execute()
+                    logger.info(f"✓ Inserted {len(rows)} {self.CHILD_TABLES[table]}")
 
             logger.info(f"✓ Successfully saved all data to Supabase (ID: {livebridge_id})")
             return livebridge_id
@@ -810,6 +906,62 @@ class LivebridgeCrawler:
             traceback.print_exc()
             return None
 
+    async def save_to_supabase_async(self, data: Dict) -> Optional[int]:
+        """
+        Save extracted livebridge data to Supabase without blocking the event loop
+
+        Same writes as save_to_supabase on the async PostgREST client; the child
+        table deletes run concurrently, then the inserts.
+
+        Args:
+            data: Extracted livebridge data dictionary
+
+        Returns:
+            The livebridge_id if successful, None otherwise
+        """
+        if not self.use_supabase or not self.supabase_config:
+            logger.warning("Supabase not available, skipping database save")
+            return None
+
+        try:
+            if self.async_db is None:
+                self.async_db = AsyncSupabaseClient(config=self.supabase_config)
+            db = self.async_db
+            logger.info("Saving data to Supabase...")
+
+            # 1. Upsert main livebridge record
+            result = await db.table("livebridge").upsert(self._main_record(data), on_conflict="url").execute()
+            if not result.data:
+                logger.error("Failed to insert main livebridge record")
+                return None
+
+            livebridge_id = result.data[0]["id"]
+            logger.info(f"✓ Main record saved (ID: {livebridge_id})")
+
+            # 2. Delete existing related records (for update case)
+            await asyncio.gather(*(
+                db.table(table).delete().eq("livebridge_id", livebridge_id).execute()
+                for table in self.CHILD_TABLES
+            ))
+
+            # 3. Insert coupons, products, benefits and simple coupons
+            child_rows = {table: rows for table, rows in self._child_rows(data, livebridge_id).items() if rows}
+            await asyncio.gather(*(db.table(table).insert(rows).execute() for table, rows in child_rows.items()))
+            for table, rows in child_rows.items():
+                logger.info(f"✓ Inserted {len(rows)} {self.CHILD_TABLES[table]}")
+
+            logger.info(f"✓ Successfully saved all data to Supabase (ID: {livebridge_id})")
+            return livebridge_id
+
+        except Exception as e:
+            logger.error(f"Failed to save to Supabase: {e}")
+            return None
+
+    async def aclose(self):
+        """Close the async DB client (only if this crawler created it)"""
+        if self.owns_async_db and self.async_db is not None:
+            await self.async_db.disconnect()
+            self.async_db = None
 
 async def main():
     """Test the crawler"""
@@ -852,5 +1004,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    import asyncio
     asyncio.run(main())
@@ -0,0 +1,192 @@
+"""
+Livebridge Task Queue
+Runs livebridge sub-crawls as background asyncio tasks, off the browser pool
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from utils.http_clients import HTTPClientRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class LivebridgeTaskQueue:
+    """
+    Background queue of livebridge crawls (check, crawl, save)
+
+    Broadcast crawlers submit a broadcast ID as soon as they know it; the
+    livebridge page is then crawled and saved concurrently with the rest of
+    the broadcast extraction, using async HTTP and the async PostgREST client
+    only (no browser context is involved). At most max_concurrency livebridge
+    crawls run at once, and each broadcast ID is crawled once per queue.
+    Finished tasks are dropped from the queue; only the submitted IDs are
+    remembered for deduplication.
+
+    One LivebridgeCrawler (vision extractor, DB client) is shared by all tasks.
+    Call aclose() when done: it waits for pending tasks and closes the DB client.
+
+    Example:
+        >>> queue = LivebridgeTaskQueue(use_llm=False)
+        >>> task = queue.submit(1776510, keep_data=True)
+        >>> ...  # crawl the broadcast meanwhile
+        >>> livebridge_result = await task
+        >>> await queue.aclose()
+    """
+
+    MAX_CONCURRENCY = 4
+    CHECK_TIMEOUT = 5.0
+
+    def __init__(self, use_llm: bool = True, use_supabase: bool = True, max_concurrency: Optional[int] = None):
+        """
+        Initialize queue
+
+        Args:
+            use_llm: Whether to use LLM for livebridge image extraction
+            use_supabase: Whether to save livebridge data to Supabase
+            max_concurrency: Maximum concurrent livebridge crawls (default: MAX_CONCURRENCY)
+        """
+        self.use_llm = use_llm
+        self.use_supabase = use_supabase
+        self._semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENCY)
+        self._tasks: Dict[str, asyncio.Task] = {}  # Pending tasks only
+        self._seen: Set[str] = set()
+        self._crawler = None
+        self._crawler_lock = asyncio.Lock()
+
+        self.stats = {'submitted': 0, 'success': 0, 'not_available': 0, 'save_failed': 0, 'error': 0}
+
+    @staticmethod
+    def construct_url(broadcast_id: Any) -> str:
+        """
+        Construct livebridge URL from broadcast ID
+
+        Args:
+            broadcast_id: The broadcast ID
+
+        Returns:
+            Livebridge URL
+        """
+        return f"https://shoppinglive.naver.com/livebridge/{broadcast_id}"
+
+    def submit(self, broadcast_id: Any, keep_data: bool = False) -> Optional[asyncio.Task]:
+        """
+        Schedule the livebridge crawl of a broadcast (must be called inside the event loop)
+
+        Args:
+            broadcast_id: The broadcast ID
+            keep_data: Keep the crawled livebridge data in the result (only useful
+                if the caller awaits the task; otherwise it is dropped once saved)
+
+        Returns:
+            Task resolving to the livebridge result dict (the pending task if already
+            submitted), or None if the broadcast was already crawled by this queue
+        """
+        key = str(broadcast_id)
+        task = self._tasks.get(key)
+        if task is None and key not in self._seen:
+            task = asyncio.create_task(self._run(broadcast_id, keep_data), name=f"livebridge-{key}")
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+            self._tasks[key] = task
+            self._seen.add(key)
+            self.stats['submitted'] += 1
+            logger.debug(f"Livebridge crawl queued for broadcast {key}")
+        return task
+
+    async def _get_crawler(self):
+        """Create the shared LivebridgeCrawler on first use (constructor does blocking setup)"""
+        async with self._crawler_lock:
+            if self._crawler is None:
+                # Imported lazily: vision/Supabase dependencies load only when a livebridge page exists
+                from crawlers.livebridge_crawler import LivebridgeCrawler
+                self._crawler = await asyncio.to_thread(
+                    LivebridgeCrawler, use_llm=self.use_llm, use_supabase=self.use_supabase
+                )
+            return self._crawler
+
+    async def _run(self, broadcast_id: Any, keep_data: bool) -> Dict[str, Any]:
+        """
+        Check, crawl and save one livebridge page
+
+        Args:
+            broadcast_id: The broadcast ID
+            keep_data: Keep the crawled livebridge data under 'data'
+
+        Returns:
+            Dict with status ('success', 'not_available', 'save_failed' or 'error') and details
+        """
+        livebridge_url = self.construct_url(broadcast_id)
+
+        async with self._semaphore:
+            try:
+                result = await self._crawl(livebridge_url)
+            except Exception as e:
+                logger.error(f"✗ Livebridge crawl failed ({livebridge_url}): {e}")
+                result = {'status': 'error', 'url': livebridge_url, 'error': str(e)}
+
+        self.stats[result['status']] += 1
+        if not keep_data:
+            result.pop('data', None)
+        return result
+
+    async def _crawl(self, livebridge_url: str) -> Dict[str, Any]:
+        """Livebridge check + crawl + save (raises on unexpected errors)"""
+        logger.info(f"Checking livebridge: {livebridge_url}")
+
+        # Check if livebridge page is accessible (shared pooled client)
+        client = HTTPClientRegistry.get_async_client()
+        response = await client.head(livebridge_url, timeout=self.CHECK_TIMEOUT)
+
+        if response.status_code != 200:
+            logger.info(f"✗ Livebridge page not accessible (status: {response.status_code})")
+            return {'status': 'not_available', 'url': livebridge_url, 'http_status': response.status_code}
+
+        logger.info("✓ Livebridge page accessible, crawling...")
+        crawler = await self._get_crawler()
+        livebridge_data = await crawler.crawl(livebridge_url)
+        livebridge_id = await crawler.save_to_supabase_async(livebridge_data)
+
+        if not livebridge_id:
+            logger.warning("✗ Failed to save livebridge to Supabase")
+            return {'status': 'save_failed', 'url': livebridge_url, 'error': 'Failed to save to Supabase'}
+
+        logger.info(f"✓ Livebridge saved to Supabase (ID: {livebridge_id})")
+        return {
+            'status': 'success',
+            'livebridge_id': livebridge_id,
+            'url': livebridge_url,
+            'data': livebridge_data,
+            'records': {
+                'special_coupons': len(livebridge_data.get('special_coupons', [])),
+                'products': len(livebridge_data.get('products', [])),
+                'live_benefits': len(livebridge_data.get('live_benefits', [])),
+                'benefits_by_amount': len(livebridge_data.get('benefits_by_amount', [])),
+                'simple_coupons': len(livebridge_data.get('coupons', []))
+            }
+        }
+
+    async def join(self) -> List[Dict[str, Any]]:
+        """
+        Wait for all pending livebridge crawls
+
+        Returns:
+            Results of the tasks still pending at the call, in submission order
+        """
+        return list(await asyncio.gather(*list(self._tasks.values())))
+
+    async def aclose(self):
+        """Wait for pending crawls, then close the shared crawler's DB client"""
+        await self.join()
+        if self._crawler is not None:
+            await self._crawler.aclose()
+            self._crawler = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get queue statistics
+
+        Returns:
+            Dict with submitted count and counts per result status
+        """
+        return dict(self.stats)
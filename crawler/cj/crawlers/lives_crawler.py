@@ -5,11 +5,13 @@ Crawler for /lives/ URLs using hybrid approach (embedded JSON + API interception
 
 import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from crawlers.base_crawler import BaseCrawler
 from extractors.json_extractor import JSONExtractor
 from extractors.api_extractor import APIExtractor
+from extractors.http_extractor import HTTPExtractor
+from utils.url_detector import URLDetector
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,8 @@ logger = logging.getLogger(__name__)
 class LivesCrawler(BaseCrawler):
     """Crawler for /lives/ URLs using hybrid approach"""
 
+    BLOCK_RESOURCES = True
+
     def get_extraction_method(self) -> str:
         return "HYBRID"
 
@@ -51,7 +55,7 @@ class LivesCrawler(BaseCrawler):
         await api_extractor.wait_for_optional_apis(
             ['coupons', 'benefits'],
             max_wait=15.0,
-            min_wait=3.0  # Wait at least 3s even if some APIs are captured
+            min_wait=3.0  # Grace floor for missing APIs (learned from arrival times)
         )
 
         # Check what APIs were captured
@@ -67,8 +71,58 @@ class LivesCrawler(BaseCrawler):
             self._add_error(errors, "JSONError", "Failed to extract embedded broadcast JSON")
             raise Exception("Failed to extract embedded broadcast JSON from HTML")
 
+        return await self._build_broadcast_data(json_data, api_extractor, errors, warnings)
+
+    async def extract_data_http(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract data from lives URL over plain HTTP
+        (embedded JSON from raw HTML + direct coupons/benefits API calls)
+
+        Args:
+            url: The lives URL to crawl
+
+        Returns:
+            Dict containing broadcast data
+
+        Raises:
+            Exception: If a direct call fails (triggers browser fallback)
+        """
+        async with HTTPExtractor() as http_extractor:
+            json_data = await http_extractor.fetch_embedded_json(url, 'window.__viewerConfig.broadcast')
+            if not json_data:
+                raise Exception("Embedded broadcast JSON not found in raw HTML")
+
+            if self.prefetched_apis is not None:
+                logger.info("Reusing prefetched coupons/benefits APIs")
+                return await self._build_broadcast_data(json_data, self.prefetched_apis, [], [])
+
+            broadcast_id = json_data.get('id') or URLDetector.extract_id(url)
+            await http_extractor.fetch_broadcast_apis(broadcast_id, referer=url, include_broadcast=False)
+
+            return await self._build_broadcast_data(json_data, http_extractor, [], [])
+
+    async def _build_broadcast_data(
+        self,
+        json_data: Dict[str, Any],
+        api_extractor: APIExtractor,
+        errors: list,
+        warnings: list
+    ) -> Dict[str, Any]:
+        """
+        Build broadcast data from embedded JSON and captured APIs (shared by browser and HTTP paths)
+
+        Args:
+            json_data: Embedded broadcast JSON
+            api_extractor: Extractor holding coupons/benefits data
+            errors: Errors collected so far
+            warnings: Warnings collected so far
+
+        Returns:
+            Dict containing broadcast data
+        """
         # Extract broadcast fields from JSON
         broadcast_data = self._extract_broadcast_fields(json_data)
+        self._start_livebridge(broadcast_data.get('broadcast_id'))
 
         # Extract products: Try multiple sources (API > DOM > JSON)
         json_products = broadcast_data.get('products', [])
@@ -88,7 +142,12 @@ class LivesCrawler(BaseCrawler):
                 broadcast_data['products'] = api_products  # Already transformed by _extract_products above
                 broadcast_data['products_source'] = 'API'
             else:
-                # Fallback to DOM extraction
+                # Fallback to DOM extraction (needs a browser page)
+                if not self.page:
+                    raise Exception(
+                        f"API pagination incomplete ({len(api_products)}/{total_product_count} products), "
+                        "DOM extraction requires a browser"
+                    )
                 logger.info(f"API pagination incomplete ({len(api_products)} products), trying DOM extraction...")
                 dom_products = await self._extract_products_from_dom()
 
@@ -127,18 +186,9 @@ class LivesCrawler(BaseCrawler):
             self._add_warning(warnings, "live_benefits", "No benefits available", [])
             broadcast_data['live_benefits'] = []
 
-        # Extract comments with pagination (100 per page, keep odd indices for storage optimization)
-        logger.info("Fetching all comments with pagination...")
-        all_comments = await api_extractor.fetch_all_comments_paginated(
-            broadcast_id=broadcast_data.get('broadcast_id'),
-            page_size=100,
-            keep_odd_only=True  # Keep only odd indices (~50%) to reduce DB storage for demo
-        )
-        if all_comments:
-            broadcast_data['live_chat'] = self._extract_comments(all_comments)
-        else:
-            self._add_warning(warnings, "live_chat", "No comments available", [])
-            broadcast_data['live_chat'] = []
+        # Extract comments with pagination (only new ones when the broadcast was crawled before)
+        logger.info("Fetching comments with pagination...")
+        await self._fetch_live_chat(api_extractor, broadcast_data.get('broadcast_id'), broadcast_data, warnings)
 
         # Add errors and warnings
         if errors:
@@ -453,79 +503,6 @@ class LivesCrawler(BaseCrawler):
             logger.debug(f"Failed to extract from current panel: {e}")
             return []
 
-    async def _fetch_all_products_via_api(self, broadcast_id: int, expected_count: int) -> List[Dict[str, Any]]:
-        """
-        Fetch all products via direct API pagination
-
-        Args:
-            broadcast_id: The broadcast ID
-            expected_count: Expected total product count
-
-        Returns:
-            List of raw product dicts from all API pages
-        """
-        try:
-            # Get cookies from current page context
-            cookies = await self.page.context.cookies()
-            cookie_dict = {c['name']: c['value'] for c in cookies}
-
-            # Use httpx for direct API requests
-            import httpx
-
-            all_products = []
-            page_num = 0
-
-            async with httpx.AsyncClient(verify=False) as client:
-                while True:
-                    api_url = (
-                        f"https://apis.naver.com/live_commerce_web/viewer_api_web/v1/broadcast/{broadcast_id}/products"
-                        f"?attachmentType=MAIN&categoryId=-1&page={page_num}&size=30&tr=lim"
-                    )
-
-                    try:
-                        response = await client.get(
-                            api_url,
-                            cookies=cookie_dict,
-                            headers={
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                                'Referer': f'https://view.shoppinglive.naver.com/lives/{broadcast_id}'
-                            },
-                            timeout=15.0
-                        )
-
-                        if response.status_code != 200:
-                            logger.warning(f"API request failed with status {response.status_code} on page {page_num}")
-                            break
-
-                        data = response.json()
-                        products = data.get('list', [])
-                        total_pages = data.get('totalPage', 0)
-
-                        logger.debug(f"Fetched page {page_num}: {len(products)} products (total pages: {total_pages})")
-
-                        if not products:
-                            break
-
-                        all_products.extend(products)
-
-                        # Check if we've fetched all pages
-                        if total_pages and page_num >= total_pages - 1:
-                            break
-
-                        page_num += 1
-                        await asyncio.sleep(0.3)  # Rate limiting
-
-                    except Exception as e:
-                        logger.debug(f"Error fetching page {page_num}: {e}")
-                        break
-
-            logger.info(f"✓ Fetched {len(all_products)} products from {page_num + 1} API pages")
-            return all_products
-
-        except Exception as e:
-            logger.error(f"Failed to fetch products via API: {e}")
-            return []
-
     async def crawl(self, url: str) -> Dict[str, Any]:
         """
         Override crawl() to add automatic livebridge integration
@@ -536,15 +513,14 @@ class LivesCrawler(BaseCrawler):
         Returns:
             Complete crawl result with broadcast data and optional livebridge data
         """
-        # Call parent crawl() to get broadcast data
-        result = await super().crawl(url)
-
-        # If livebridge crawling is enabled, try to crawl it
-        if self.crawl_livebridge:
-            broadcast_id = result.get('broadcast', {}).get('broadcast_id')
-            if broadcast_id:
-                livebridge_result = await self._crawl_livebridge_if_available(broadcast_id)
-                if livebridge_result:
-                    result['livebridge'] = livebridge_result
+        # Call parent crawl() to get broadcast data (livebridge task starts once the ID is known)
+        try:
+            result = await super().crawl(url)
+        except Exception:
+            await self._finish_livebridge(None)
+            raise
+
+        # Browser page is closed by now: the livebridge task never holds it
+        await self._finish_livebridge(result)
 
         return result
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class ShortClipsCrawler(BaseCrawler):
     """Crawler for /shortclips/ URLs using hybrid approach"""
 
+    BLOCK_RESOURCES = True
+
     def get_extraction_method(self) -> str:
         return "HYBRID"
 
@@ -442,76 +444,3 @@ class ShortClipsCrawler(BaseCrawler):
         except Exception as e:
             logger.error(f"Failed to extract products from DOM: {e}")
             return []
-
-    async def _fetch_all_products_via_api(self, broadcast_id: int, expected_count: int) -> List[Dict[str, Any]]:
-        """
-        Fetch all products via direct API pagination
-
-        Args:
-            broadcast_id: The broadcast ID
-            expected_count: Expected total product count
-
-        Returns:
-            List of raw product dicts from all API pages
-        """
-        try:
-            # Get cookies from current page context
-            cookies = await self.page.context.cookies()
-            cookie_dict = {c['name']: c['value'] for c in cookies}
-
-            # Use httpx for direct API requests
-            import httpx
-
-            all_products = []
-            page_num = 0
-
-            async with httpx.AsyncClient(verify=False) as client:
-                while True:
-                    api_url = (
-                        f"https://apis.naver.com/live_commerce_web/viewer_api_web/v1/broadcast/{broadcast_id}/products"
-                        f"?attachmentType=MAIN&categoryId=-1&page={page_num}&size=30&tr=lim"
-                    )
-
-                    try:
-                        response = await client.get(
-                            api_url,
-                            cookies=cookie_dict,
-                            headers={
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                                'Referer': f'https://view.shoppinglive.naver.com/shortclips/{broadcast_id}'
-                            },
-                            timeout=15.0
-                        )
-
-                        if response.status_code != 200:
-                            logger.warning(f"API request failed with status {response.status_code} on page {page_num}")
-                            break
-
-                        data = response.json()
-                        products = data.get('list', [])
-                        total_pages = data.get('totalPage', 0)
-
-                        logger.debug(f"Fetched page {page_num}: {len(products)} products (total pages: {total_pages})")
-
-                        if not products:
-                            break
-
-                        all_products.extend(products)
-
-                        # Check if we've fetched all pages
-                        if total_pages and page_num >= total_pages - 1:
-                            break
-
-                        page_num += 1
-                        await asyncio.sleep(0.3)  # Rate limiting
-
-                    except Exception as e:
-                        logger.debug(f"Error fetching page {page_num}: {e}")
-                        break
-
-            logger.info(f"✓ Fetched {len(all_products)} products from {page_num + 1} API pages")
-            return all_products
-
-        except Exception as e:
-            logger.error(f"Failed to fetch products via API: {e}")
-            return []
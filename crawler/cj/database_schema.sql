@@ -53,6 +53,7 @@ CREATE TABLE IF NOT EXISTS broadcast_products (
     review_count INTEGER,
     delivery_fee NUMERIC(10,2),
     raw_data JSONB,
+    content_hash TEXT,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     UNIQUE(broadcast_id, product_id)
@@ -81,6 +82,7 @@ CREATE TABLE IF NOT EXISTS broadcast_coupons (
     valid_start TIMESTAMPTZ,
     valid_end TIMESTAMPTZ,
     raw_data JSONB,
+    content_hash TEXT,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -103,6 +105,7 @@ CREATE TABLE IF NOT EXISTS broadcast_benefits (
     detail TEXT,
     benefit_type TEXT,
     raw_data JSONB,
+    content_hash TEXT,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -128,6 +131,7 @@ CREATE TABLE IF NOT EXISTS broadcast_chat (
     created_at_source TIMESTAMPTZ,
     comment_type TEXT,
     raw_data JSONB,
+    content_hash TEXT,
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
@@ -135,6 +139,25 @@ CREATE TABLE IF NOT EXISTS broadcast_chat (
 CREATE INDEX IF NOT EXISTS idx_chat_broadcast_id ON broadcast_chat(broadcast_id);
 CREATE INDEX IF NOT EXISTS idx_chat_created_at_source ON broadcast_chat(created_at_source DESC);
 
+-- ========================================
+-- Content hashes for diff-based child sync (existing databases)
+-- ========================================
+ALTER TABLE broadcast_products ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE broadcast_coupons ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE broadcast_benefits ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE broadcast_chat ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN broadcast_chat.content_hash IS 'SHA-1 of row content, used by DatabaseUpserter child_sync=diff';
+
+-- ========================================
+-- Compressed raw data (DatabaseUpserter raw_data='compressed')
+-- ========================================
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS raw_data_compressed BYTEA;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS raw_data_codec TEXT;
+
+COMMENT ON COLUMN broadcasts.raw_data_compressed IS 'Compressed complete crawler JSON (raw_data policy compressed; raw_data is then NULL)';
+COMMENT ON COLUMN broadcasts.raw_data_codec IS 'Codec of raw_data_compressed: zstd or zlib';
+
 COMMENT ON TABLE broadcast_chat IS 'Chat messages from broadcast (replays only)';
 COMMENT ON COLUMN broadcast_chat.created_at_source IS 'Original timestamp from the broadcast';
 
@@ -6,8 +6,11 @@ Intercepts and extracts data from API responses during page load
 import asyncio
 import json
 import logging
-import httpx
-from typing import Dict, Any, List, Optional
+import time
+from collections import defaultdict, deque
+from typing import Dict, Any, Deque, List, Optional, Tuple
+
+from utils.http_clients import HTTPClientRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +18,32 @@ logger = logging.getLogger(__name__)
 class APIExtractor:
     """Extract data from intercepted API responses"""
 
+    # URL substrings of the APIs we intercept (also never blocked by RequestFilter)
+    TARGET_API_PATTERNS = (
+        '/v1/broadcast/',
+        '/v2/broadcast/',
+        '/v1/shortclip/',
+        '/broadcast-benefits',
+        '/shopping-app/benefit',
+        '/coupons',
+        '/replays/comments',
+        '/products'  # Products API (paginated)
+    )
+
+    # Arrival-time learning for optional API waits (shared across instances)
+    ARRIVAL_HISTORY_SIZE = 200
+    MIN_ARRIVAL_SAMPLES = 5
+    ARRIVAL_MARGIN = 1.5
+    _arrival_history: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=APIExtractor.ARRIVAL_HISTORY_SIZE))
+
     def __init__(self):
         """Initialize APIExtractor"""
         self.api_data: Dict[str, Any] = {}
         self.products_list: List[Any] = []  # Accumulate products from all API calls
         self.response_lock = asyncio.Lock()
+        self._api_events: Dict[str, asyncio.Event] = {}  # Set when an API is stored
+        self._any_data_event = asyncio.Event()
+        self._started_at: Optional[float] = None  # Interception setup time (monotonic)
 
     async def setup_interception(self, page):
         """
@@ -28,9 +52,31 @@ class APIExtractor:
         Args:
             page: Playwright page object
         """
+        self._started_at = time.monotonic()
         page.on('response', self._handle_response)
         logger.info("API interception setup complete")
 
+    def _get_event(self, api_name: str) -> asyncio.Event:
+        """Get (or create) the readiness event for an API"""
+        if api_name not in self._api_events:
+            self._api_events[api_name] = asyncio.Event()
+        return self._api_events[api_name]
+
+    def _signal_api(self, api_name: str):
+        """
+        Mark an API as stored and wake up waiters
+
+        Records the arrival time (first arrival only) for learned wait periods.
+
+        Args:
+            api_name: API key that was stored
+        """
+        event = self._get_event(api_name)
+        if not event.is_set() and self._started_at is not None:
+            self._arrival_history[api_name].append(time.monotonic() - self._started_at)
+        event.set()
+        self._any_data_event.set()
+
     async def _handle_response(self, response):
         """
         Handle intercepted API responses
@@ -81,18 +127,7 @@ class APIExtractor:
         Returns:
             True if this is a target API
         """
-        target_patterns = [
-            '/v1/broadcast/',
-            '/v2/broadcast/',
-            '/v1/shortclip/',
-            '/broadcast-benefits',
-            '/shopping-app/benefit',
-            '/coupons',
-            '/replays/comments',
-            '/products'  # Products API (paginated)
-        ]
-
-        return any(pattern in url for pattern in target_patterns)
+        return any(pattern in url for pattern in self.TARGET_API_PATTERNS)
 
     async def _store_api_data(self, url: str, body: Any):
         """
@@ -105,31 +140,37 @@ class APIExtractor:
         # Main broadcast API: /v1/broadcast/{id}
         if '/v1/broadcast/' in url and 'needTimeMachine' in url:
             self.api_data['broadcast'] = body
+            self._signal_api('broadcast')
             logger.info(f"✓ Stored broadcast API data from {url}")
 
         # Coupons API: /v2/broadcast/{id}/coupons
         elif '/v2/broadcast/' in url and '/coupons' in url:
             self.api_data['coupons'] = body
+            self._signal_api('coupons')
             logger.info(f"✓ Stored coupons API data from {url}")
 
         # Benefits API: /v1/broadcast/{id}/broadcast-benefits (list of benefits)
         elif '/broadcast-benefits' in url:
             self.api_data['benefits'] = body
+            self._signal_api('benefits')
             logger.info(f"✓ Stored benefits API data from {url}")
 
         # Shopping app benefit API: /shopping-app/benefit (banner/notice info - different from live benefits)
         elif '/shopping-app/benefit' in url:
             self.api_data['shopping_app_benefit'] = body
+            self._signal_api('shopping_app_benefit')
             logger.debug(f"✓ Stored shopping app benefit data from {url}")
 
         # Comments API: /v1/broadcast/{id}/replays/comments
         elif '/replays/comments' in url:
             self.api_data['comments'] = body
+            self._signal_api('comments')
             logger.info(f"✓ Stored comments API data from {url}")
 
         # Shortclip API: /v1/shortclip/{id}
         elif '/v1/shortclip/' in url:
             self.api_data['shortclip'] = body
+            self._signal_api('shortclip')
             logger.info(f"✓ Stored shortclip API data from {url}")
 
         # Products API: /v1/broadcast/{id}/products (paginated)
@@ -220,20 +261,62 @@ class APIExtractor:
         """
         return list(self.api_data.keys())
 
+    @classmethod
+    def learned_wait(cls, api_names: List[str]) -> Optional[float]:
+        """
+        Get learned grace period for APIs from observed arrival times
+
+        Uses the p95 arrival time (since interception setup) of each API,
+        multiplied by ARRIVAL_MARGIN. Returns None until every API has
+        at least MIN_ARRIVAL_SAMPLES observations.
+
+        Args:
+            api_names: API keys (e.g., ['coupons', 'benefits'])
+
+        Returns:
+            Grace period in seconds, or None if not enough samples
+        """
+        cutoffs = []
+        for name in api_names:
+            samples = cls._arrival_history.get(name)
+            if not samples or len(samples) < cls.MIN_ARRIVAL_SAMPLES:
+                return None
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            cutoffs.append(p95 * cls.ARRIVAL_MARGIN)
+
+        return max(cutoffs) if cutoffs else None
+
+    async def _wait_for_events(self, api_names: List[str], timeout: float) -> bool:
+        """
+        Wait until all given APIs are stored (event-driven, no polling)
+
+        Args:
+            api_names: API keys to wait for
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if all APIs arrived, False on timeout
+        """
+        waiters = [self._get_event(name).wait() for name in api_names]
+        try:
+            await asyncio.wait_for(asyncio.gather(*waiters), timeout=max(timeout, 0.0))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def wait_for_required_apis(
         self,
         required_apis: List[str],
-        max_wait: float = 30.0,
-        check_interval: float = 0.5
+        max_wait: float = 30.0
     ) -> bool:
         """
         Smart wait for required APIs to be captured
-        Optimization #3: Instead of fixed 30s wait, check if APIs are ready
+        Wakes up as soon as the last required response is stored
 
         Args:
             required_apis: List of required API keys (e.g., ['broadcast', 'coupons'])
             max_wait: Maximum time to wait in seconds (default: 30)
-            check_interval: How often to check in seconds (default: 0.5)
 
         Returns:
             True if all required APIs captured, False if timeout
@@ -241,27 +324,14 @@ class APIExtractor:
         Example:
             >>> await api_extractor.wait_for_required_apis(['broadcast', 'coupons'], max_wait=30)
         """
-        elapsed = 0.0
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
 
         logger.info(f"Waiting for required APIs: {required_apis} (max {max_wait}s)")
 
-        while elapsed < max_wait:
-            # Check if all required APIs are captured
-            captured = self.get_captured_apis()
-            missing = [api for api in required_apis if api not in captured]
-
-            if not missing:
-                logger.info(f"✓ All required APIs captured in {elapsed:.1f}s: {captured}")
-                return True
-
-            # Log progress
-            if elapsed > 0 and int(elapsed) % 5 == 0:
-                logger.info(f"Still waiting for: {missing} (elapsed: {elapsed:.1f}s)")
-
-            # Wait and check again
-            await asyncio.sleep(check_interval)
-            elapsed = asyncio.get_event_loop().time() - start_time
+        if await self._wait_for_events(required_apis, max_wait):
+            elapsed = time.monotonic() - start_time
+            logger.info(f"✓ All required APIs captured in {elapsed:.1f}s: {self.get_captured_apis()}")
+            return True
 
         # Timeout
         captured = self.get_captured_apis()
@@ -271,52 +341,44 @@ class APIExtractor:
         )
         return False
 
-    async def wait_for_any_data(
-        self,
-        max_wait: float = 10.0,
-        check_interval: float = 0.5
-    ) -> bool:
+    async def wait_for_any_data(self, max_wait: float = 10.0) -> bool:
         """
         Wait for at least some API data to be captured
 
         Args:
             max_wait: Maximum time to wait in seconds
-            check_interval: How often to check in seconds
 
         Returns:
             True if any data captured, False if timeout
         """
-        elapsed = 0.0
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
 
-        while elapsed < max_wait:
-            if self.has_data():
-                logger.info(f"✓ API data captured in {elapsed:.1f}s")
-                return True
-
-            await asyncio.sleep(check_interval)
-            elapsed = asyncio.get_event_loop().time() - start_time
+        try:
+            await asyncio.wait_for(self._any_data_event.wait(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            logger.warning(f"No API data captured after {max_wait}s")
+            return False
 
-        logger.warning(f"No API data captured after {max_wait}s")
-        return False
+        logger.info(f"✓ API data captured in {time.monotonic() - start_time:.1f}s")
+        return True
 
     async def wait_for_optional_apis(
         self,
         optional_apis: List[str],
         max_wait: float = 15.0,
-        min_wait: float = 3.0,
-        check_interval: float = 0.5
+        min_wait: float = 3.0
     ) -> List[str]:
         """
         Smart wait for optional APIs (not all required to be present)
-        Waits at least min_wait seconds, up to max_wait seconds
-        Returns early if all optional APIs are captured after min_wait
+        Returns as soon as all optional APIs are captured. If some never arrive,
+        gives up after a grace period learned from observed arrival times
+        (clamped to [min_wait, max_wait]); falls back to max_wait until enough
+        arrivals have been observed.
 
         Args:
             optional_apis: List of optional API keys (e.g., ['coupons', 'benefits'])
             max_wait: Maximum time to wait in seconds (default: 15)
-            min_wait: Minimum time to wait in seconds (default: 3)
-            check_interval: How often to check in seconds (default: 0.5)
+            min_wait: Minimum grace period for missing APIs in seconds (default: 3)
 
         Returns:
             List of APIs that were captured
@@ -329,56 +391,42 @@ class APIExtractor:
             ... )
             >>> print(f"Captured: {captured}")
         """
-        elapsed = 0.0
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
+
+        learned = self.learned_wait(optional_apis)
+        if learned is None or self._started_at is None:
+            timeout = max_wait
+        else:
+            # Grace period is measured from interception setup, like the samples
+            since_setup = start_time - self._started_at
+            timeout = min(max_wait, max(min_wait, learned) - since_setup)
 
         logger.info(
             f"Waiting for optional APIs: {optional_apis} "
-            f"(min: {min_wait}s, max: {max_wait}s)"
+            f"(timeout: {max(timeout, 0.0):.1f}s, max: {max_wait}s"
+            f"{f', learned: {learned:.1f}s' if learned is not None else ''})"
         )
 
-        while elapsed < max_wait:
-            # Check which optional APIs are captured
-            captured = self.get_captured_apis()
-            captured_optional = [api for api in optional_apis if api in captured]
-            missing = [api for api in optional_apis if api not in captured]
+        all_captured = await self._wait_for_events(optional_apis, timeout)
+        elapsed = time.monotonic() - start_time
 
-            # If we've waited at least min_wait and all optional APIs are captured, return
-            if elapsed >= min_wait and not missing:
-                logger.info(
-                    f"✓ All optional APIs captured in {elapsed:.1f}s: {captured_optional}"
-                )
-                return captured_optional
-
-            # Log progress every 3 seconds
-            if elapsed > 0 and int(elapsed) % 3 == 0 and elapsed < max_wait - check_interval:
-                if captured_optional:
-                    logger.info(
-                        f"Progress: {len(captured_optional)}/{len(optional_apis)} "
-                        f"APIs captured: {captured_optional} (elapsed: {elapsed:.1f}s)"
-                    )
-                else:
-                    logger.info(f"Still waiting for optional APIs (elapsed: {elapsed:.1f}s)")
-
-            # Wait and check again
-            await asyncio.sleep(check_interval)
-            elapsed = asyncio.get_event_loop().time() - start_time
-
-        # Timeout or completed
         captured = self.get_captured_apis()
         captured_optional = [api for api in optional_apis if api in captured]
         missing = [api for api in optional_apis if api not in captured]
 
-        if captured_optional:
+        if all_captured:
+            logger.info(
+                f"✓ All optional APIs captured in {elapsed:.1f}s: {captured_optional}"
+            )
+        elif captured_optional:
             logger.info(
                 f"✓ Optional APIs captured ({len(captured_optional)}/{len(optional_apis)}): "
                 f"{captured_optional} after {elapsed:.1f}s"
             )
-            if missing:
-                logger.info(f"  Missing optional APIs (not critical): {missing}")
+            logger.info(f"  Missing optional APIs (not critical): {missing}")
         else:
             logger.warning(
-                f"No optional APIs captured after {max_wait}s. "
+                f"No optional APIs captured after {elapsed:.1f}s. "
                 f"This is OK if the broadcast has no {'/'.join(optional_apis)}."
             )
 
@@ -405,64 +453,166 @@ class APIExtractor:
         Example:
             >>> comments = await api_extractor.fetch_all_comments_paginated(1776510, page_size=100)
         """
-        all_comments = []
+        comments, _ = await self.fetch_comments_since(broadcast_id, None, page_size, keep_odd_only)
+        return comments
+
+    @staticmethod
+    def _comments_request(broadcast_id: int) -> Tuple[str, Dict[str, str]]:
+        """Comments API URL and request headers for a broadcast"""
         url = f"https://apis.naver.com/selectiveweb/live_commerce_web/v1/broadcast/{broadcast_id}/replays/comments"
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Referer': f'https://view.shoppinglive.naver.com/replays/{broadcast_id}'
         }
+        return url, headers
+
+    @classmethod
+    async def has_comments_since(cls, broadcast_id: int, cursor: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check with a single small request whether comments exist beyond a stored cursor
+
+        Args:
+            broadcast_id: The broadcast ID
+            cursor: Cursor returned by fetch_comments_since (None: any comments at all)
+
+        Returns:
+            True if fetch_comments_since would return new comments (or the check failed)
+        """
+        url, headers = cls._comments_request(broadcast_id)
+        params: Dict[str, Any] = {'size': 1}
+        if cursor:
+            if cursor.get('last_comment_no') is not None:
+                params['lastCommentNo'] = cursor['last_comment_no']
+                params['lastCreatedAtMilli'] = cursor.get('last_created_at_milli')
+            # Comments after the cursor that were already consumed come first
+            params['size'] = cursor.get('skip', 0) + 1
+
+        try:
+            client = HTTPClientRegistry.get_async_client()
+            response = await client.get(url, headers=headers, params=params)
+            if response.status_code != 200:
+                logger.debug(f"Comment check failed for {broadcast_id}: {response.status_code}")
+                return True
+            data = response.json()
+        except Exception as e:
+            logger.debug(f"Comment check failed for {broadcast_id}: {e}")
+            return True
+
+        return len(data.get('comments') or []) >= params['size'] or bool(data.get('hasNext'))
+
+    async def fetch_comments_since(
+        self,
+        broadcast_id: int,
+        cursor: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        keep_odd_only: bool = True
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Fetch comments newer than a stored cursor (all comments if cursor is None)
+
+        Pagination resumes from the cursor's lastCommentNo/lastCreatedAtMilli, skipping
+        the comments already consumed after it, so a recrawl only downloads new chat.
+        keep_odd_only uses the global comment index, so the kept half is the same
+        whether comments arrive in one crawl or across several.
+
+        Args:
+            broadcast_id: The broadcast ID
+            cursor: Cursor returned by a previous call (see CommentCursorStore)
+            page_size: Number of comments per page (default: 100)
+            keep_odd_only: If True, keeps only odd-indexed comments to save storage (default: True)
+
+        Returns:
+            Tuple of (new comments, cursor to resume from next time or None if nothing was read)
+        """
+        new_comments = []
+        url, headers = self._comments_request(broadcast_id)
 
         params = {'size': page_size}
+        to_skip = 0
+        offset = 0
+        if cursor:
+            if cursor.get('last_comment_no') is not None:
+                params['lastCommentNo'] = cursor['last_comment_no']
+                params['lastCreatedAtMilli'] = cursor.get('last_created_at_milli')
+            to_skip = cursor.get('skip', 0)
+            offset = cursor.get('fetched', 0)
+        next_cursor = dict(cursor) if cursor else None
+        skip_from_cursor = 0
         page_num = 1
 
-        logger.info(f"Fetching comments with pagination (page_size={page_size}, keep_odd_only={keep_odd_only})...")
+        logger.info(
+            f"Fetching comments with pagination (page_size={page_size}, keep_odd_only={keep_odd_only}"
+            f"{', resuming after ' + str(offset) + ' comments' if cursor else ''})..."
+        )
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, verify=False) as client:
-                while True:
-                    # Fetch page
-                    response = await client.get(url, headers=headers, params=params)
-
-                    if response.status_code != 200:
-                        logger.warning(f"Failed to fetch comments page {page_num}: {response.status_code}")
-                        break
-
-                    data = response.json()
-                    comments = data.get('comments', [])
-                    has_next = data.get('hasNext', False)
-
-                    if not comments:
-                        logger.info(f"No more comments on page {page_num}")
-                        break
-
-                    # Add comments to collection
-                    all_comments.extend(comments)
-                    logger.info(f"✓ Page {page_num}: fetched {len(comments)} comments (total: {len(all_comments)})")
-
-                    # Check if there are more pages
-                    if not has_next:
-                        logger.info(f"✓ No more pages (hasNext=False)")
-                        break
-
-                    # Set pagination cursors for next page
-                    params['lastCommentNo'] = data.get('lastCommentNo')
-                    params['lastCreatedAtMilli'] = data.get('lastCreatedAtMilli')
-                    page_num += 1
-
-                    # Safety limit: max 50 pages (5000 comments with page_size=100)
-                    if page_num > 50:
-                        logger.warning(f"Reached safety limit of 50 pages, stopping pagination")
-                        break
+            client = HTTPClientRegistry.get_async_client()
+            while True:
+                # Fetch page
+                response = await client.get(url, headers=headers, params=params)
+
+                if response.status_code != 200:
+                    logger.warning(f"Failed to fetch comments page {page_num}: {response.status_code}")
+                    break
+
+                data = response.json()
+                comments = data.get('comments', [])
+                has_next = data.get('hasNext', False)
+
+                if not comments:
+                    logger.info(f"No more comments on page {page_num}")
+                    break
+
+                # Drop comments already consumed by the previous crawl
+                page_count = len(comments)
+                if to_skip:
+                    skipped = min(to_skip, page_count)
+                    comments = comments[skipped:]
+                    to_skip -= skipped
+
+                # Add comments to collection
+                new_comments.extend(comments)
+                skip_from_cursor += page_count
+                next_cursor = {
+                    'last_comment_no': params.get('lastCommentNo'),
+                    'last_created_at_milli': params.get('lastCreatedAtMilli'),
+                    'skip': skip_from_cursor,
+                    'fetched': offset + len(new_comments)
+                }
+                logger.info(f"✓ Page {page_num}: fetched {len(comments)} comments (total: {len(new_comments)})")
+
+                # Check if there are more pages
+                if not has_next or data.get('lastCommentNo') is None:
+                    logger.info(f"✓ No more pages (hasNext=False)")
+                    break
+
+                # Set pagination cursors for next page
+                params['lastCommentNo'] = data.get('lastCommentNo')
+                params['lastCreatedAtMilli'] = data.get('lastCreatedAtMilli')
+                skip_from_cursor = 0
+                next_cursor.update(
+                    last_comment_no=params['lastCommentNo'],
+                    last_created_at_milli=params['lastCreatedAtMilli'],
+                    skip=0
+                )
+                page_num += 1
+
+                # Safety limit: max 50 pages (5000 comments with page_size=100); the next crawl continues here
+                if page_num > 50:
+                    logger.warning(f"Reached safety limit of 50 pages, stopping pagination")
+                    break
 
         except Exception as e:
             logger.error(f"Error fetching paginated comments: {e}")
 
         # Filter to odd indices for storage optimization (demo mode)
-        if keep_odd_only and all_comments:
-            original_count = len(all_comments)
-            # Keep comments at odd indices: 1, 3, 5, 7, ... (roughly 50%)
-            all_comments = [comment for idx, comment in enumerate(all_comments) if idx % 2 == 1]
-            logger.info(f"✓ Filtered to odd indices: {len(all_comments)}/{original_count} comments ({len(all_comments)/original_count*100:.1f}%)")
-
-        logger.info(f"✓ Total comments fetched: {len(all_comments)}")
-        return all_comments
+        if keep_odd_only and new_comments:
+            original_count = len(new_comments)
+            # Keep comments at odd global indices: 1, 3, 5, 7, ... (roughly 50%)
+            new_comments = [
+                comment for idx, comment in enumerate(new_comments, offset) if idx % 2 == 1
+            ]
+            logger.info(f"✓ Filtered to odd indices: {len(new_comments)}/{original_count} comments ({len(new_comments)/original_count*100:.1f}%)")
+
+        logger.info(f"✓ Total {'new ' if cursor else ''}comments fetched: {len(new_comments)}")
+        return new_comments, next_cursor
@@ -0,0 +1,306 @@
+"""
+Embedded JSON Extractor
+Locates page state (__NEXT_DATA__, window.__viewerConfig.*, window.__shortclip) with str.find and zero-copy slicing
+"""
+
+import json
+import logging
+import re
+from typing import Any, AsyncIterator, Optional, Tuple, Union
+
+# orjson is optional: several times faster than json on large page state
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+Document = Union[str, bytes, bytearray]
+
+_ESCAPE_MAP = {
+    r'\"': '"',
+    r'\/': '/',
+    r'\\': '\\',
+    r'\n': '\n',
+    r'\r': '\r',
+    r'\t': '\t',
+    r'\b': '\b',
+    r'\f': '\f',
+}
+_ESCAPE_PATTERN = re.compile(r'\\["\\/nrtbf]')
+
+
+def unescape_js_string(s: str) -> str:
+    """
+    Unescape a JavaScript string while preserving UTF-8 encoding.
+
+    Handles common JavaScript escape sequences but preserves UTF-8 characters.
+    """
+    if '\\' not in s:
+        return s
+    return _ESCAPE_PATTERN.sub(lambda match: _ESCAPE_MAP[match.group(0)], s)
+
+
+class EmbeddedJSONExtractor:
+    """
+    Extract JSON state embedded in HTML without scanning the document with regexes
+
+    Two kinds of targets are supported:
+        - script: <script id="..."> blocks holding raw JSON (Next.js __NEXT_DATA__)
+        - assignment: `window.x = '...';` (JSON in a JS string) or `window.x = {...};`
+
+    Boundaries are found with str.find / bytes.find (C speed), the payload is
+    sliced through a memoryview when the document is bytes, and decoded with
+    orjson when installed. The same locators run incrementally over a response
+    stream, so the payload is parsed as soon as its closing marker arrives and
+    the rest of the page is never downloaded.
+
+    Example:
+        >>> next_data = EmbeddedJSONExtractor.script_json(html, '__NEXT_DATA__')
+        >>> broadcast = EmbeddedJSONExtractor.assignment_json(html, 'window.__viewerConfig.broadcast')
+        >>> async with client.stream('GET', url) as response:
+        ...     next_data = await EmbeddedJSONExtractor.stream_script_json(response.aiter_bytes(), '__NEXT_DATA__')
+    """
+
+    NEXT_DATA_ID = '__NEXT_DATA__'
+    WHITESPACE = ' \t\r\n'
+
+    # ==================== Decoding ====================
+
+    @staticmethod
+    def loads(data: Union[str, bytes, memoryview]) -> Any:
+        """
+        Decode JSON text (orjson when available)
+
+        Args:
+            data: JSON as str, bytes or memoryview
+
+        Returns:
+            Decoded value
+
+        Raises:
+            json.JSONDecodeError: If data is not valid JSON (orjson's error is a subclass)
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    # ==================== Locators ====================
+    # Each locator returns (start, end, kind) of the payload in doc, or None if
+    # the payload is not (yet) complete. kind is 'json', 'js_string' or 'object'.
+
+    @staticmethod
+    def _marker(doc: Document, text: str) -> Union[str, bytes]:
+        """Marker in the document's type (markers are ASCII, so byte offsets stay valid)"""
+        return text if isinstance(doc, str) else text.encode('ascii')
+
+    @classmethod
+    def _locate_script(cls, doc: Document, script_id: str, pos: int = 0) -> Optional[Tuple[int, int, str]]:
+        """Locate the body of <script id="script_id" ...>...</script>"""
+        tag = doc.find(cls._marker(doc, f'id="{script_id}"'), pos)
+        if tag < 0:
+            return None
+        start = doc.find(cls._marker(doc, '>'), tag)
+        if start < 0:
+            return None
+        end = doc.find(cls._marker(doc, '</script>'), start)
+        if end < 0:
+            return None
+        return start + 1, end, 'json'
+
+    @classmethod
+    def _locate_assignment(cls, doc: Document, target: str, pos: int = 0) -> Optional[Tuple[int, int, str]]:
+        """Locate the value of `target = '...';` or `target = {...};`"""
+        marker = cls._marker(doc, target)
+        ws = cls._marker(doc, cls.WHITESPACE)
+        quote, brace, semicolon = (cls._marker(doc, c) for c in ("'", '{', ';'))
+
+        while True:
+            found = doc.find(marker, pos)
+            if found < 0:
+                return None
+            i = cls._skip(doc, found + len(marker), ws)
+            if doc[i:i + 1] != cls._marker(doc, '='):
+                # Longer identifier or comparison (e.g. window.__viewerConfig.broadcastId): keep looking
+                pos = found + len(marker)
+                continue
+            i = cls._skip(doc, i + 1, ws)
+            opener = doc[i:i + 1]
+            if not opener:
+                return None
+
+            if opener == quote:
+                # Same end rule as the former '(.+?)'\s*; regex: the first quote followed by ;
+                start = close = i + 1
+                while True:
+                    close = doc.find(quote, close + 1)
+                    if close < 0:
+                        return None
+                    after = cls._skip(doc, close + 1, ws)
+                    if after >= len(doc):
+                        return None
+                    if doc[after:after + 1] == semicolon:
+                        return start, close, 'js_string'
+            if opener == brace:
+                close = doc.find(cls._marker(doc, '};'), i)
+                if close < 0:
+                    return None
+                return i, close + 1, 'object'
+
+            # Not a literal (e.g. `target = target || {};`): a later assignment may hold the data
+            pos = i
+
+    @staticmethod
+    def _skip(doc: Document, i: int, ws: Union[str, bytes]) -> int:
+        """Index of the first non-whitespace character at or after i"""
+        n = len(doc)
+        while i < n and doc[i:i + 1] in ws:
+            i += 1
+        return i
+
+    # ==================== Slicing + parsing ====================
+
+    @classmethod
+    def _parse(cls, doc: Document, span: Tuple[int, int, str]) -> Any:
+        """Decode the located payload (memoryview slice for bytes, no intermediate copy)"""
+        start, end, kind = span
+        if isinstance(doc, str):
+            return cls._decode(doc[start:end], kind)
+        with memoryview(doc) as view, view[start:end] as payload:
+            return cls._decode(payload, kind)
+
+    @classmethod
+    def _decode(cls, payload: Union[str, memoryview], kind: str) -> Any:
+        """Decode a payload slice (JS string literals are unescaped first)"""
+        if kind == 'js_string':
+            text = payload if isinstance(payload, str) else str(payload, 'utf-8')
+            return cls.loads(cls._unescape_literal(text))
+        return cls.loads(payload)
+
+    @classmethod
+    def _unescape_literal(cls, text: str) -> str:
+        """
+        Unescape a JS string literal body
+
+        The literal is decoded as a JSON string in C when its escapes are all
+        JSON escapes (same result as unescape_js_string); \\u escapes, \\' and
+        bare double quotes take the unescape_js_string path.
+        """
+        if '\\' not in text:
+            return text
+        if '\\u' not in text:
+            try:
+                return cls.loads(f'"{text}"')
+            except ValueError:
+                pass
+        return unescape_js_string(text)
+
+    @classmethod
+    def script_json(cls, html: Document, script_id: str = NEXT_DATA_ID) -> Optional[Any]:
+        """
+        Extract the JSON body of a <script id="..."> block
+
+        Args:
+            html: HTML as str or bytes
+            script_id: Script element id (default: __NEXT_DATA__)
+
+        Returns:
+            Decoded JSON, or None if the script is not in the page
+
+        Raises:
+            json.JSONDecodeError: If the script body is not valid JSON
+        """
+        span = cls._locate_script(html, script_id)
+        return cls._parse(html, span) if span else None
+
+    @classmethod
+    def assignment_json(cls, html: Document, target: str) -> Optional[Any]:
+        """
+        Extract the JSON assigned to a JS variable (quoted JSON string or object literal)
+
+        Args:
+            html: HTML as str or bytes
+            target: Assignment target (e.g. 'window.__viewerConfig.broadcast')
+
+        Returns:
+            Decoded JSON, or None if the assignment is not in the page
+
+        Raises:
+            json.JSONDecodeError: If the assigned value is not valid JSON
+        """
+        span = cls._locate_assignment(html, target)
+        return cls._parse(html, span) if span else None
+
+    # ==================== Streaming ====================
+
+    @classmethod
+    async def stream_script_json(cls, chunks: AsyncIterator[bytes], script_id: str = NEXT_DATA_ID) -> Optional[Any]:
+        """
+        Extract a <script id="..."> JSON block from a response stream
+
+        Args:
+            chunks: Response body chunks (e.g. response.aiter_bytes())
+            script_id: Script element id (default: __NEXT_DATA__)
+
+        Returns:
+            Decoded JSON, or None if the stream ended without the script
+        """
+        return await cls._stream(
+            chunks, f'id="{script_id}"', '</script>', lambda doc, pos: cls._locate_script(doc, script_id, pos)
+        )
+
+    @classmethod
+    async def stream_assignment_json(cls, chunks: AsyncIterator[bytes], target: str) -> Optional[Any]:
+        """
+        Extract JSON assigned to a JS variable from a response stream
+
+        Args:
+            chunks: Response body chunks (e.g. response.aiter_bytes())
+            target: Assignment target (e.g. 'window.__viewerConfig.broadcast')
+
+        Returns:
+            Decoded JSON, or None if the stream ended without the assignment
+        """
+        return await cls._stream(
+            chunks, target, ';', lambda doc, pos: cls._locate_assignment(doc, target, pos)
+        )
+
+    @classmethod
+    async def _stream(cls, chunks: AsyncIterator[bytes], opener: str, closer: str, locate) -> Optional[Any]:
+        """
+        Buffer chunks until locate() finds a complete payload, then parse it
+
+        The opening marker and then the closing marker are searched only in
+        newly received bytes, and the full locator runs only when a candidate
+        closer arrives, so long payloads in small chunks are not rescanned.
+        Reading stops as soon as the payload is complete (the caller's stream
+        context then closes the response without downloading the rest of the page).
+        """
+        open_marker, close_marker = opener.encode('ascii'), closer.encode('ascii')
+        buffer = bytearray()
+        anchor = -1
+        pos = 0
+
+        async for chunk in chunks:
+            buffer += chunk
+            if anchor < 0:
+                anchor = buffer.find(open_marker, pos)
+                if anchor < 0:
+                    # A marker split across chunks is still found next time
+                    pos = max(0, len(buffer) - len(open_marker) + 1)
+                    continue
+                pos = anchor
+
+            if buffer.find(close_marker, pos) >= 0:
+                span = locate(buffer, anchor)
+                if span:
+                    logger.debug(f"Found {opener} after {len(buffer)} bytes")
+                    return cls._parse(buffer, span)
+            pos = max(anchor, len(buffer) - len(close_marker) + 1)
+
+        return None
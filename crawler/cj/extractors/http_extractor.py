@@ -0,0 +1,281 @@
+"""
+HTTP Extractor
+Fetches broadcast API data directly over HTTP (no browser required)
+"""
+
+import asyncio
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from extractors.api_extractor import APIExtractor
+from extractors.embedded_json import EmbeddedJSONExtractor
+from utils.http_clients import HTTPClientRegistry
+
+logger = logging.getLogger(__name__)
+
+
+VIEWER_API_BASE = "https://apis.naver.com/live_commerce_web/viewer_api_web"
+
+
+class HTTPExtractor(APIExtractor):
+    """
+    Extract broadcast data by calling the viewer APIs directly
+
+    Stores responses through APIExtractor._store_api_data, so the same getters
+    (get_broadcast_data, get_coupons, get_benefits, ...) work as with page interception.
+
+    Example:
+        >>> async with HTTPExtractor() as extractor:
+        ...     await extractor.fetch_broadcast_apis(1776510, referer=url)
+        ...     broadcast = extractor.get_broadcast_data()
+    """
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    def __init__(self, timeout: float = 15.0):
+        """
+        Initialize HTTPExtractor
+
+        Args:
+            timeout: Request timeout in seconds (default: 15)
+        """
+        super().__init__()
+        self.timeout = timeout
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        """Context manager entry (borrows the shared client)"""
+        self.client = HTTPClientRegistry.get_async_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit (shared client stays open)"""
+        self.client = None
+
+    def _headers(self, referer: str, accept: str = 'application/json') -> Dict[str, str]:
+        """Build request headers mimicking the viewer page"""
+        return {
+            'User-Agent': self.USER_AGENT,
+            'Accept': accept,
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Referer': referer
+        }
+
+    async def _get_json(self, url: str, referer: str) -> Optional[Any]:
+        """
+        GET a JSON endpoint
+
+        Args:
+            url: API URL
+            referer: Referer header (viewer page URL)
+
+        Returns:
+            Parsed JSON body, or None if the endpoint returned 404
+
+        Raises:
+            httpx.HTTPError: On transport errors or non-2xx responses (except 404)
+        """
+        response = await self.client.get(url, headers=self._headers(referer), timeout=self.timeout)
+
+        if response.status_code == 404:
+            logger.debug(f"API not available (404): {url}")
+            return None
+
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_html(self, url: str) -> str:
+        """
+        Fetch viewer page HTML (for embedded JSON extraction)
+
+        Args:
+            url: Viewer page URL
+
+        Returns:
+            HTML content
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        response = await self.client.get(url, headers=self._headers(url, accept='text/html'), timeout=self.timeout)
+        response.raise_for_status()
+        logger.info(f"Fetched page HTML: {len(response.text)} bytes")
+        return response.text
+
+    async def fetch_embedded_json(self, url: str, target: str) -> Optional[Any]:
+        """
+        Stream viewer page HTML and parse the JSON assigned to a JS variable
+
+        Reading stops as soon as the assignment is complete, so the rest of
+        the page is neither downloaded nor buffered.
+
+        Args:
+            url: Viewer page URL
+            target: Assignment target (e.g. 'window.__viewerConfig.broadcast')
+
+        Returns:
+            Decoded JSON, or None if the page has no such assignment
+
+        Raises:
+            httpx.HTTPError: If request fails
+            json.JSONDecodeError: If the assigned value is not valid JSON
+        """
+        headers = self._headers(url, accept='text/html')
+        async with self.client.stream('GET', url, headers=headers, timeout=self.timeout) as response:
+            response.raise_for_status()
+            data = await EmbeddedJSONExtractor.stream_assignment_json(response.aiter_bytes(), target)
+
+        if data is not None:
+            logger.info(f"Extracted {target} from streamed page HTML")
+        return data
+
+    async def fetch_broadcast_apis(
+        self,
+        broadcast_id: int,
+        referer: str,
+        include_broadcast: bool = True
+    ) -> List[str]:
+        """
+        Fetch broadcast, coupons and benefits APIs concurrently
+
+        Args:
+            broadcast_id: The broadcast ID
+            referer: Viewer page URL used as Referer
+            include_broadcast: Whether to fetch the main broadcast API (default: True)
+
+        Returns:
+            List of captured API names
+
+        Raises:
+            Exception: If any direct call fails (caller should fall back to the browser)
+        """
+        urls = [
+            f"{VIEWER_API_BASE}/v2/broadcast/{broadcast_id}/coupons",
+            f"{VIEWER_API_BASE}/v1/broadcast/{broadcast_id}/broadcast-benefits",
+        ]
+        if include_broadcast:
+            urls.insert(0, f"{VIEWER_API_BASE}/v1/broadcast/{broadcast_id}?needTimeMachine=true")
+
+        logger.info(f"Fetching {len(urls)} broadcast APIs directly for {broadcast_id}...")
+
+        bodies = await asyncio.gather(
+            *(self._get_json(url, referer) for url in urls),
+            return_exceptions=True
+        )
+
+        for url, body in zip(urls, bodies):
+            if isinstance(body, Exception):
+                raise Exception(f"Direct API call failed for {url}: {body}")
+            if body is not None:
+                await self._store_api_data(url, body)
+
+        captured = self.get_captured_apis()
+        logger.info(f"✓ Direct APIs captured: {captured}")
+        return captured
+
+    # ---- Product pagination ----
+
+    PRODUCTS_PAGE_SIZE = 30
+
+    @classmethod
+    async def _fetch_products_page(
+        cls,
+        broadcast_id: int,
+        page_num: int,
+        headers: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of the broadcast products API
+
+        Args:
+            broadcast_id: The broadcast ID
+            page_num: Zero-based page number
+            headers: Request headers (User-Agent, Referer, Cookie)
+
+        Returns:
+            Parsed page body, or None if the request failed
+        """
+        client = HTTPClientRegistry.get_async_client()
+        api_url = (
+            f"{VIEWER_API_BASE}/v1/broadcast/{broadcast_id}/products"
+            f"?attachmentType=MAIN&categoryId=-1&page={page_num}&size={cls.PRODUCTS_PAGE_SIZE}&tr=lim"
+        )
+
+        try:
+            response = await client.get(api_url, headers=headers, timeout=15.0)
+
+            if response.status_code != 200:
+                logger.warning(f"API request failed with status {response.status_code} on page {page_num}")
+                return None
+
+            return response.json()
+
+        except Exception as e:
+            logger.debug(f"Error fetching page {page_num}: {e}")
+            return None
+
+    @classmethod
+    async def fetch_all_products(
+        cls,
+        broadcast_id: int,
+        referer: str,
+        cookies: Optional[Dict[str, str]] = None,
+        expected_count: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all product pages of a broadcast
+
+        The first page reports totalPage, so the remaining pages are requested
+        concurrently through the shared client (bounded by its per-host limit). If
+        totalPage is missing, pages are fetched one by one until an empty page.
+
+        Args:
+            broadcast_id: The broadcast ID
+            referer: Viewer page URL used as Referer
+            cookies: Cookies from the viewer page (optional)
+            expected_count: Expected total product count (used if totalPage is missing)
+
+        Returns:
+            List of raw product dicts in page order
+        """
+        headers = {'User-Agent': cls.USER_AGENT, 'Referer': referer}
+        if cookies:
+            headers['Cookie'] = '; '.join(f"{name}={value}" for name, value in cookies.items())
+
+        first = await cls._fetch_products_page(broadcast_id, 0, headers)
+        if not first:
+            return []
+
+        all_products = list(first.get('list', []))
+        total_pages = first.get('totalPage') or 0
+        if not total_pages and expected_count and len(all_products) >= cls.PRODUCTS_PAGE_SIZE:
+            total_pages = math.ceil(expected_count / cls.PRODUCTS_PAGE_SIZE)
+
+        pages_fetched = 1
+        if total_pages > 1:
+            bodies = await asyncio.gather(
+                *(cls._fetch_products_page(broadcast_id, page_num, headers) for page_num in range(1, total_pages))
+            )
+            for page_num, body in enumerate(bodies, 1):
+                if body is None:
+                    logger.warning(f"Product page {page_num}/{total_pages} missing for broadcast {broadcast_id}")
+                    continue
+                all_products.extend(body.get('list', []))
+            pages_fetched = total_pages
+        elif not total_pages and len(all_products) >= cls.PRODUCTS_PAGE_SIZE:
+            # No page count available: walk pages until one comes back empty
+            page_num = 1
+            while True:
+                body = await cls._fetch_products_page(broadcast_id, page_num, headers)
+                products = body.get('list', []) if body else []
+                if not products:
+                    break
+                all_products.extend(products)
+                page_num += 1
+            pages_fetched = page_num
+
+        logger.info(f"✓ Fetched {len(all_products)} products from {pages_fetched} API pages")
+        return all_products
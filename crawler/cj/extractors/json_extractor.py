@@ -5,47 +5,18 @@ Extracts data from embedded JSON in HTML pages
 
 import json
 import logging
-import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
-logger = logging.getLogger(__name__)
-
-
-def unescape_js_string(s: str) -> str:
-    """
-    Unescape a JavaScript string while preserving UTF-8 encoding.
-
-    Handles common JavaScript escape sequences but preserves UTF-8 characters.
-    """
-    # Map of escape sequences
-    escape_map = {
-        r'\"': '"',
-        r'\/': '/',
-        r'\\': '\\',
-        r'\n': '\n',
-        r'\r': '\r',
-        r'\t': '\t',
-        r'\b': '\b',
-        r'\f': '\f',
-    }
-
-    def replace_escape(match):
-        """Replace escape sequence with its actual character"""
-        seq = match.group(0)
-        return escape_map.get(seq, seq)
-
-    # Match escape sequences: backslash followed by specific characters
-    pattern = r'\\["\\/nrtbf]'
-    result = re.sub(pattern, replace_escape, s)
+from extractors.embedded_json import EmbeddedJSONExtractor, unescape_js_string  # noqa: F401 (re-exported)
 
-    return result
+logger = logging.getLogger(__name__)
 
 
 class JSONExtractor:
-    """Extract data from embedded JSON in HTML"""
+    """Extract data from embedded JSON in HTML (str or bytes; see EmbeddedJSONExtractor)"""
 
     @staticmethod
-    def extract_broadcast_json(html: str) -> Optional[Dict[str, Any]]:
+    def extract_broadcast_json(html: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
         Extract window.__viewerConfig.broadcast JSON from HTML
 
@@ -56,16 +27,10 @@ class JSONExtractor:
             Parsed broadcast data as dict, or None if not found
         """
         try:
-            # Pattern to match window.__viewerConfig.broadcast = '...'
-            pattern = r'window\.__viewerConfig\.broadcast\s*=\s*\'(.+?)\'\s*;'
-            match = re.search(pattern, html, re.DOTALL)
-
-            if match:
-                json_str = match.group(1)
-                # Unescape JavaScript string while preserving UTF-8 encoding
-                json_str = unescape_js_string(json_str)
+            # window.__viewerConfig.broadcast = '...'
+            data = EmbeddedJSONExtractor.assignment_json(html, 'window.__viewerConfig.broadcast')
 
-                data = json.loads(json_str)
+            if data is not None:
                 logger.info("Successfully extracted broadcast JSON from HTML")
                 return data
             else:
@@ -80,7 +45,7 @@ class JSONExtractor:
             return None
 
     @staticmethod
-    def extract_shortclip_json(html: str) -> Optional[Dict[str, Any]]:
+    def extract_shortclip_json(html: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
         Extract window.__shortclip JSON from HTML
 
@@ -91,28 +56,11 @@ class JSONExtractor:
             Parsed shortclip data as dict, or None if not found
         """
         try:
-            # Pattern to match window.__shortclip = '...' or window.__shortclip = {...}
-            # First try quoted JSON string
-            pattern = r'window\.__shortclip\s*=\s*\'(.+?)\'\s*;'
-            match = re.search(pattern, html, re.DOTALL)
-
-            if match:
-                json_str = match.group(1)
-                # Unescape JavaScript string while preserving UTF-8 encoding
-                json_str = unescape_js_string(json_str)
-
-                data = json.loads(json_str)
-                logger.info("Successfully extracted shortclip JSON from HTML (quoted)")
-                return data
+            # window.__shortclip = '...' (quoted JSON string) or window.__shortclip = {...}
+            data = EmbeddedJSONExtractor.assignment_json(html, 'window.__shortclip')
 
-            # Try unquoted JSON object
-            pattern = r'window\.__shortclip\s*=\s*(\{.+?\});'
-            match = re.search(pattern, html, re.DOTALL)
-
-            if match:
-                json_str = match.group(1)
-                data = json.loads(json_str)
-                logger.info("Successfully extracted shortclip JSON from HTML (object)")
+            if data is not None:
+                logger.info("Successfully extracted shortclip JSON from HTML")
                 return data
 
             logger.warning("Could not find window.__shortclip in HTML")
@@ -126,7 +74,7 @@ class JSONExtractor:
             return None
 
     @staticmethod
-    def extract_any_json(html: str, variable_name: str) -> Optional[Dict[str, Any]]:
+    def extract_any_json(html: Union[str, bytes], variable_name: str) -> Optional[Dict[str, Any]]:
         """
         Extract any window.__viewerConfig.{variable_name} JSON from HTML
 
@@ -138,16 +86,10 @@ class JSONExtractor:
             Parsed data as dict, or None if not found
         """
         try:
-            # Pattern to match window.__viewerConfig.{variable_name} = '...'
-            pattern = rf'window\.__viewerConfig\.{re.escape(variable_name)}\s*=\s*\'(.+?)\'\s*;'
-            match = re.search(pattern, html, re.DOTALL)
-
-            if match:
-                json_str = match.group(1)
-                # Unescape JavaScript string while preserving UTF-8 encoding
-                json_str = unescape_js_string(json_str)
+            # window.__viewerConfig.{variable_name} = '...'
+            data = EmbeddedJSONExtractor.assignment_json(html, f'window.__viewerConfig.{variable_name}')
 
-                data = json.loads(json_str)
+            if data is not None:
                 logger.info(f"Successfully extracted {variable_name} JSON from HTML")
                 return data
             else:
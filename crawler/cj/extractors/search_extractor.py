@@ -0,0 +1,277 @@
+"""
+Search API Extractor
+Discovers broadcast URLs from the shopping-live search JSON endpoints (no browser required)
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from utils.http_clients import HTTPClientRegistry
+
+logger = logging.getLogger(__name__)
+
+
+SEARCH_API_BASE = "https://apis.naver.com/live_commerce_web/viewer_api_web/v1/search"
+VIEWER_BASE = "https://view.shoppinglive.naver.com"
+
+
+class SearchAPIExtractor:
+    """
+    Discover broadcasts for a search query by calling the search JSON APIs directly
+
+    Returns the same [{url, external_id, event_type, ...}] list as
+    NaverSearchCrawler.extract_broadcasts, in the same order (lives, replays,
+    shortclips). Responses are parsed structurally: any viewer URL (or
+    broadcast/shortclip ID field) in the payload counts, so renamed wrapper
+    fields do not break discovery. Generic 'id' fields are ignored, since
+    products, brands and banners carry them too. The endpoints are queried
+    concurrently and the successful ones merged; only if none returns a
+    broadcast are links read from the server-rendered search page instead.
+    An empty result means the caller should fall back to the browser.
+
+    Example:
+        >>> broadcasts = SearchAPIExtractor().search(
+        ...     "https://shoppinglive.naver.com/search/lives?query=설화수", limit=50
+        ... )
+    """
+
+    # Search tabs in NaverSearchCrawler's collection order (override if the endpoints move)
+    SEARCH_ENDPOINTS = {
+        'lives': f"{SEARCH_API_BASE}/broadcasts",
+        'replays': f"{SEARCH_API_BASE}/replays",
+        'shortclips': f"{SEARCH_API_BASE}/shortclips",
+    }
+    EVENT_TYPES = {'lives': 'live', 'replays': 'replay', 'shortclips': 'shortclip'}
+    # Item fields that identify a broadcast of the endpoint's kind (never a bare 'id')
+    ID_KEYS = {
+        'lives': ('broadcastId',),
+        'replays': ('broadcastId',),
+        'shortclips': ('shortClipId', 'shortclipId'),
+    }
+    PAGE_SIZE = 20
+    MAX_PAGES = 10
+    TIMEOUT = 10.0
+
+    URL_PATTERN = re.compile(r'shoppinglive\.naver\.com\\?/(lives|replays|shortclips)\\?/(\d+)')
+    HTML_LINK_PATTERN = re.compile(r'(?:shoppinglive\.naver\.com)?\\?/(lives|replays|shortclips)\\?/(\d+)')
+
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+    def __init__(self):
+        """Initialize SearchAPIExtractor (uses the shared sync HTTP client)"""
+        self.client = HTTPClientRegistry.get_sync_client()
+
+    def _headers(self, referer: str) -> Dict[str, str]:
+        """Build request headers mimicking the search page"""
+        return {
+            'User-Agent': self.USER_AGENT,
+            'Accept': 'application/json, text/html;q=0.9',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Referer': referer
+        }
+
+    def search(self, search_url: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Discover broadcasts for a search URL
+
+        Args:
+            search_url: Search page URL (query taken from its ?query= parameter)
+            limit: Maximum number of broadcasts to return
+
+        Returns:
+            List of broadcast dictionaries (empty if discovery failed)
+        """
+        query = parse_qs(urlparse(search_url).query).get('query', [None])[0]
+        if not query:
+            logger.warning(f"No query parameter in search URL: {search_url}")
+            return []
+
+        # Query all endpoints concurrently; one failing endpoint must not discard the others' hits
+        with ThreadPoolExecutor(max_workers=len(self.SEARCH_ENDPOINTS)) as executor:
+            futures = {
+                kind: executor.submit(self._search_endpoint, kind, endpoint, query, search_url, limit)
+                for kind, endpoint in self.SEARCH_ENDPOINTS.items()
+            }
+
+        urls: Dict[str, None] = {}
+        succeeded = 0
+        for kind, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.warning(f"⚠ Search API {kind} failed: {error}")
+                continue
+            succeeded += 1
+            urls.update(dict.fromkeys(future.result()))
+
+        if succeeded:
+            logger.info(
+                f"✓ Search API: {len(urls)} broadcasts for '{query}' "
+                f"({succeeded}/{len(futures)} endpoints)"
+            )
+        else:
+            logger.warning("⚠ Search API failed, reading links from search page HTML")
+
+        if not urls:
+            try:
+                urls = dict.fromkeys(self._search_html(search_url))
+                logger.info(f"✓ Search page HTML: {len(urls)} broadcasts for '{query}'")
+            except Exception as e:
+                logger.warning(f"⚠ Search page HTML unavailable: {e}")
+
+        return [self._build_broadcast(url, index) for index, url in enumerate(list(urls)[:limit])]
+
+    def _search_endpoint(self, kind: str, endpoint: str, query: str, referer: str, limit: int) -> List[str]:
+        """
+        Page through one search endpoint
+
+        Args:
+            kind: 'lives', 'replays' or 'shortclips'
+            endpoint: Endpoint URL
+            query: Search text
+            referer: Search page URL
+            limit: Maximum URLs to collect
+
+        Returns:
+            Viewer URLs in result order
+
+        Raises:
+            httpx.HTTPError: On transport errors or non-2xx responses (except 404)
+        """
+        urls: Dict[str, None] = {}
+        for page in range(1, self.MAX_PAGES + 1):
+            response = self.client.get(
+                endpoint,
+                params={'query': query, 'page': page, 'size': self.PAGE_SIZE},
+                headers=self._headers(referer),
+                timeout=self.TIMEOUT
+            )
+            if response.status_code == 404:
+                logger.debug(f"Search endpoint not available (404): {endpoint}")
+                break
+            response.raise_for_status()
+
+            payload = response.json()
+            found = self._extract_urls(payload, kind)
+            new_urls = [url for url in found if url not in urls]
+            urls.update(dict.fromkeys(new_urls))
+            logger.debug(f"{kind} page {page}: {len(new_urls)} new broadcasts")
+
+            if len(urls) >= limit or not new_urls or not self._has_next(payload, len(found)):
+                break
+
+        return list(urls)[:limit]
+
+    def _has_next(self, payload: Any, page_count: int) -> bool:
+        """Whether another page exists (explicit flag, else a full page)"""
+        if isinstance(payload, dict):
+            for key in ('hasNext', 'hasMore', 'next'):
+                if key in payload:
+                    return bool(payload[key])
+        return page_count >= self.PAGE_SIZE
+
+    def _extract_urls(self, payload: Any, kind: str) -> List[str]:
+        """
+        Collect viewer URLs from a search response
+
+        Each item contributes one URL: a viewer URL of the endpoint's kind if the
+        item carries one, else any viewer URL, else one built from its
+        broadcast/shortclip ID field (see ID_KEYS and _valid_id).
+
+        Args:
+            payload: Parsed JSON response
+            kind: Endpoint kind (used for id-only items)
+
+        Returns:
+            Canonical viewer URLs in payload order
+        """
+        urls: List[str] = []
+
+        def walk(node: Any):
+            if isinstance(node, list):
+                for child in node:
+                    walk(child)
+                return
+            if not isinstance(node, dict):
+                return
+
+            matches = [
+                match for value in node.values() if isinstance(value, str)
+                for match in self.URL_PATTERN.findall(value)
+            ]
+            if matches:
+                url_kind, item_id = next((m for m in matches if m[0] == kind), matches[0])
+                urls.append(f"{VIEWER_BASE}/{url_kind}/{item_id}")
+                return
+
+            item_id = next((node[key] for key in self.ID_KEYS[kind] if self._valid_id(node.get(key))), None)
+            if item_id is not None:
+                urls.append(f"{VIEWER_BASE}/{kind}/{int(item_id)}")
+                return
+
+            for child in node.values():
+                walk(child)
+
+        walk(payload)
+        return list(dict.fromkeys(urls))
+
+    @staticmethod
+    def _valid_id(value: Any) -> bool:
+        """Whether a field value looks like a broadcast/shortclip ID (positive integer or digit string)"""
+        if isinstance(value, bool):
+            return False
+        if isinstance(value, int):
+            return value > 0
+        return isinstance(value, str) and value.isdigit() and int(value) > 0
+
+    def _search_html(self, search_url: str) -> List[str]:
+        """
+        Collect viewer URLs from the server-rendered search page (links and embedded JSON)
+
+        Args:
+            search_url: Search page URL
+
+        Returns:
+            Viewer URLs in NaverSearchCrawler's order (lives, replays, shortclips)
+
+        Raises:
+            httpx.HTTPError: If the page request fails
+        """
+        response = self.client.get(search_url, headers=self._headers(search_url), timeout=self.TIMEOUT)
+        response.raise_for_status()
+
+        by_kind: Dict[str, Dict[str, None]] = {kind: {} for kind in self.SEARCH_ENDPOINTS}
+        for kind, item_id in self.HTML_LINK_PATTERN.findall(response.text):
+            by_kind[kind][f"{VIEWER_BASE}/{kind}/{item_id}"] = None
+
+        return [url for urls in by_kind.values() for url in urls]
+
+    def _build_broadcast(self, url: str, index: int) -> Dict[str, Any]:
+        """
+        Build a broadcast dict in NaverSearchCrawler.extract_broadcast_info's format
+
+        Args:
+            url: Viewer URL
+            index: Position in the results
+
+        Returns:
+            Broadcast dictionary (metadata is filled in later by the detail crawlers)
+        """
+        match = re.search(r'/(lives|replays|shortclips)/(\d+)', url)
+        kind: Optional[str] = match.group(1) if match else None
+
+        return {
+            'external_id': f"{kind}_{match.group(2)}" if match else None,
+            'url': url,
+            'event_type': self.EVENT_TYPES.get(kind),
+            'extracted_at': datetime.now().isoformat(),
+            'index': index,
+            # These will be populated by detail crawlers:
+            'title': None,
+            'thumbnail': None,
+            'status': None,
+            'start_date': None,
+        }
@@ -13,6 +13,8 @@ from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from utils.rate_limiter import HostRateLimiter
+
 
 class AdvancedNaverCrawler:
     """Advanced crawler with anti-detection measures"""
@@ -23,12 +25,16 @@ class AdvancedNaverCrawler:
         self.session = None
         self._init_session()
 
-        # Strategy-based delays (min, max) in seconds
+        # Strategy-based starting delays (min, max) in seconds; the per-host limiter adapts from here
         self.delay_strategies = {
             'gentle': (3, 7),      # Very slow, most human-like
             'moderate': (2, 4),    # Balanced
             'aggressive': (1, 2)   # Faster, but still safe
         }
+        min_delay, max_delay = self.delay_strategies[self.strategy]
+        # Caps only tighten, so another crawler instance cannot loosen the shared buckets
+        self.rate_limits = HostRateLimiter.spacing_limits(min_delay, max_delay)
+        HostRateLimiter.limit('brand.naver.com', **self.rate_limits)
 
     def _init_session(self):
         """Initialize session with advanced anti-detection"""
@@ -53,12 +59,27 @@ class AdvancedNaverCrawler:
             'sec-ch-ua-platform': '"Windows"'
         })
 
-    def _human_delay(self, action="action"):
-        """Random delay based on strategy"""
-        min_delay, max_delay = self.delay_strategies[self.strategy]
-        delay = random.uniform(min_delay, max_delay)
-        print(f"    ⏱ Human delay ({action}): {delay:.1f}s")
-        time.sleep(delay)
+    def _human_delay(self, url: str, action="action"):
+        """Wait for the host's rate limiter slot before a request"""
+        # Image CDN hosts are only known per URL; keep them at the strategy's spacing too
+        HostRateLimiter.limit(url, **self.rate_limits)
+        waited = HostRateLimiter.acquire_sync(url)
+        if waited > 0:
+            print(f"    ⏱ Rate limit ({action}): {waited:.1f}s")
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the session, feeding status and latency back to the rate limiter"""
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            HostRateLimiter.record(url, None)
+            raise
+        HostRateLimiter.record(
+            url, response.status_code, time.monotonic() - started,
+            response.headers.get('Retry-After')
+        )
+        return response
 
     def _rotate_user_agent(self):
         """Rotate user agent to avoid detection"""
@@ -77,11 +98,8 @@ class AdvancedNaverCrawler:
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    # Exponential backoff
-                    backoff = (2 ** attempt) * random.uniform(1, 3)
+                    # Backoff comes from the rate limiter (429/403 pause and slow the host)
                     print(f"\n🔄 Retry {attempt + 1}/{max_retries}")
-                    print(f"    ⏱ Backoff delay: {backoff:.1f}s")
-                    time.sleep(backoff)
                     # Rotate user agent on retry
                     self._rotate_user_agent()
                     # Reinitialize session
@@ -90,12 +108,11 @@ class AdvancedNaverCrawler:
                 print(f"\n📄 Fetching page...")
                 print(f"    URL: {url}")
 
-                # Initial delay before request
-                if attempt == 0:
-                    self._human_delay("initial request")
+                # Wait for a rate limiter slot before every attempt
+                self._human_delay(url, "page request")
 
                 # Make request with cookies and referer
-                response = self.session.get(
+                response = self._get(
                     url,
                     timeout=30,
                     allow_redirects=True,
@@ -206,9 +223,8 @@ class AdvancedNaverCrawler:
 
         for idx, url in enumerate(image_urls, 1):
             try:
-                # Human delay between downloads
-                if idx > 1:
-                    self._human_delay(f"image {idx}")
+                # Per-host pacing between downloads
+                self._human_delay(url, f"image {idx}")
 
                 # Occasionally rotate user agent
                 if idx % 3 == 0:
@@ -218,7 +234,7 @@ class AdvancedNaverCrawler:
                 print(f"[{idx}/{len(image_urls)}] Downloading...")
                 print(f"    URL: {url[:80]}...")
 
-                response = self.session.get(
+                response = self._get(
                     url,
                     timeout=30,
                     verify=False,
@@ -249,9 +265,8 @@ class AdvancedNaverCrawler:
 
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 429:
-                    print(f"    ⚠ Rate limit on image download!")
-                    print(f"    💡 Increasing delay...")
-                    time.sleep(random.uniform(5, 10))
+                    # Limiter already halved this host's rate and paused it
+                    print(f"    ⚠ Rate limit on image download! Slowing down...")
                 else:
                     print(f"    ✗ HTTP error: {e}")
 
@@ -50,13 +50,14 @@ class CrawlerFactory:
     """Factory for creating appropriate crawler based on URL type"""
 
     @staticmethod
-    def create_crawler(url: str, headless: bool = True):
+    def create_crawler(url: str, headless: bool = True, block_resources: bool = True):
         """
         Create crawler instance based on URL type
 
         Args:
             url: The URL to crawl
             headless: Whether to run browser in headless mode
+            block_resources: Abort media/images/fonts/trackers on the page (default: True)
 
         Returns:
             Appropriate crawler instance
@@ -67,11 +68,11 @@ class CrawlerFactory:
         url_type = URLDetector.detect(url)
 
         if url_type == URLType.REPLAYS:
-            return ReplaysCrawler(headless=headless)
+            return ReplaysCrawler(headless=headless, block_resources=block_resources)
         elif url_type == URLType.LIVES:
-            return LivesCrawler(headless=headless)
+            return LivesCrawler(headless=headless, block_resources=block_resources)
         elif url_type == URLType.SHORTCLIPS:
-            return ShortClipsCrawler(headless=headless)
+            return ShortClipsCrawler(headless=headless, block_resources=block_resources)
         else:
             raise ValueError(f"Unknown URL type: {url_type}")
 
@@ -120,6 +121,12 @@ Examples:
         help='Save to database only, skip JSON file output'
     )
 
+    parser.add_argument(
+        '--no-block-resources',
+        action='store_true',
+        help='Load images, media, fonts and trackers (default: blocked, only JSON APIs needed)'
+    )
+
     args = parser.parse_args()
 
     # Validate URL and extract ID
@@ -140,7 +147,11 @@ Examples:
 
     # Create crawler
     try:
-        crawler = CrawlerFactory.create_crawler(args.url, headless=not args.headful)
+        crawler = CrawlerFactory.create_crawler(
+            args.url,
+            headless=not args.headful,
+            block_resources=not args.no_block_resources
+        )
     except ValueError as e:
         logger.error(f"Failed to create crawler: {e}")
         return 2
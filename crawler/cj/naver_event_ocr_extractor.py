@@ -9,10 +9,11 @@ import os
 import json
 import re
 import time
-import random
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from utils.rate_limiter import HostRateLimiter
+
 # Import extraction strategies
 try:
     from .extraction_strategy import ExtractionStrategy
@@ -41,8 +42,9 @@ class NaverEventOCRExtractor:
 
         Args:
             api_key: OCR.space API key
-            delay_min: Minimum delay between API calls (seconds)
-            delay_max: Maximum delay between API calls (seconds)
+            delay_min: Initial minimum delay between API calls (seconds); the per-host
+                limiter adapts from here
+            delay_max: Initial maximum delay between API calls (seconds)
             strategy: Extraction strategy to use (default: AUTO)
             llm_provider: LLM provider if using LLM strategy (default: GPT4O_MINI)
         """
@@ -51,6 +53,10 @@ class NaverEventOCRExtractor:
         self.delay_min = delay_min
         self.delay_max = delay_max
 
+        # Start OCR.space pacing at the mean configured delay; it adapts to 429s/latency
+        # but never faster than delay_min
+        HostRateLimiter.limit(self.ocr_url, **HostRateLimiter.spacing_limits(delay_min, delay_max))
+
         # Set default strategy
         if strategy is None:
             if ExtractionStrategy:
@@ -113,10 +119,10 @@ class NaverEventOCRExtractor:
         print(f"✓ Strategy initialized: {strategy_str}")
 
     def _delay(self, message="OCR API rate limiting"):
-        """Add delay to respect API rate limits"""
-        delay = random.uniform(self.delay_min, self.delay_max)
-        print(f"    ⏱ {message}: {delay:.1f}초 대기 중...")
-        time.sleep(delay)
+        """Wait for the OCR.space rate limiter (adaptive per-host token bucket)"""
+        waited = HostRateLimiter.acquire_sync(self.ocr_url)
+        if waited > 0:
+            print(f"    ⏱ {message}: {waited:.1f}초 대기")
 
     def extract_text_from_image(self, image_path: str) -> Optional[str]:
         """Extract text from image using OCR.space API"""
@@ -135,12 +141,21 @@ class NaverEventOCRExtractor:
                     'OCREngine': 2  # Engine 2 for Asian languages
                 }
 
-                response = requests.post(
-                    self.ocr_url,
-                    files=files,
-                    data=data,
-                    timeout=30,
-                    verify=False
+                started = time.monotonic()
+                try:
+                    response = requests.post(
+                        self.ocr_url,
+                        files=files,
+                        data=data,
+                        timeout=30,
+                        verify=False
+                    )
+                except requests.exceptions.RequestException:
+                    HostRateLimiter.record(self.ocr_url, None)
+                    raise
+                HostRateLimiter.record(
+                    self.ocr_url, response.status_code, time.monotonic() - started,
+                    response.headers.get('Retry-After')
                 )
 
                 if response.status_code == 200:
@@ -164,9 +179,8 @@ class NaverEventOCRExtractor:
         extracted_texts = {}
 
         for idx, image_file in enumerate(image_files, 1):
-            # Add delay between API calls (except first one)
-            if idx > 1:
-                self._delay(f"이미지 {idx} OCR 전 대기")
+            # Wait for a rate limiter slot before each API call
+            self._delay(f"이미지 {idx} OCR 전 대기")
 
             print(f"[{idx}/{len(image_files)}] {os.path.basename(image_file)} 처리 중...")
 
@@ -14,6 +14,8 @@ from playwright.async_api import async_playwright, Page
 from playwright_stealth import Stealth
 import requests
 
+from utils.rate_limiter import HostRateLimiter
+
 
 class NaverPlaywrightCrawler:
     """Playwright-based crawler with stealth mode"""
@@ -23,19 +25,24 @@ class NaverPlaywrightCrawler:
         self.headless = headless
         self.strategy = strategy
 
-        # Strategy-based delays
+        # Strategy-based starting delays (the per-host limiter adapts from here)
         self.delay_strategies = {
             'gentle': (5, 10),     # Slow and steady for high success rate
             'moderate': (2, 4),    # Balanced
             'aggressive': (1, 2)   # Faster
         }
-
-    def _human_delay(self, action="action"):
-        """Human-like delay"""
         min_delay, max_delay = self.delay_strategies[self.strategy]
-        delay = random.uniform(min_delay, max_delay)
-        print(f"    ⏱ Human delay ({action}): {delay:.1f}s")
-        time.sleep(delay)
+        # Caps only tighten, so another crawler instance cannot loosen the shared buckets
+        self.rate_limits = HostRateLimiter.spacing_limits(min_delay, max_delay)
+        HostRateLimiter.limit('brand.naver.com', **self.rate_limits)
+
+    def _human_delay(self, url: str, action="action"):
+        """Wait for the host's rate limiter slot before a request"""
+        # Image CDN hosts are only known per URL; keep them at the strategy's spacing too
+        HostRateLimiter.limit(url, **self.rate_limits)
+        waited = HostRateLimiter.acquire_sync(url)
+        if waited > 0:
+            print(f"    ⏱ Rate limit ({action}): {waited:.1f}s")
 
     async def _scroll_page_slowly(self, page: Page):
         """Scroll page with human-like behavior"""
@@ -159,14 +166,22 @@ class NaverPlaywrightCrawler:
 
         for idx, url in enumerate(image_urls, 1):
             try:
-                # Human delay
-                if idx > 1:
-                    self._human_delay(f"image {idx}")
+                # Per-host pacing (image CDN hosts are limited separately from brand.naver.com)
+                self._human_delay(url, f"image {idx}")
 
                 print(f"[{idx}/{len(image_urls)}] Downloading...")
                 print(f"    URL: {url[:80]}...")
 
-                response = session.get(url, timeout=30, verify=False)
+                started = time.monotonic()
+                try:
+                    response = session.get(url, timeout=30, verify=False)
+                except requests.exceptions.RequestException:
+                    HostRateLimiter.record(url, None)
+                    raise
+                HostRateLimiter.record(
+                    url, response.status_code, time.monotonic() - started,
+                    response.headers.get('Retry-After')
+                )
                 response.raise_for_status()
 
                 # Determine extension
@@ -257,12 +272,14 @@ Headless: {self.headless}
                 print(f"\n📄 Navigating to page...")
                 # Use 'load' instead of 'networkidle' for better reliability
                 # 'load' waits for the page load event, which is less strict
-                await page.goto(url, wait_until='load', timeout=90000)
+                await HostRateLimiter.acquire(url)
+                started = time.monotonic()
+                response = await page.goto(url, wait_until='load', timeout=90000)
+                HostRateLimiter.record(
+                    url, response.status if response else None, time.monotonic() - started
+                )
                 print(f"    ✓ Page loaded")
 
-                # Human-like delay
-                self._human_delay("after page load")
-
                 # Random mouse movements
                 await self._random_mouse_movements(page)
 
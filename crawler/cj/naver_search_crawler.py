@@ -3,8 +3,11 @@
 Naver Shopping Live Search Crawler
 Crawls search results page and extracts broadcast URLs
 
+Discovery calls the search JSON APIs directly (SearchAPIExtractor); Selenium
+is only started when that returns nothing.
+
 Usage:
-    python naver_search_crawler.py <search_url> [--limit LIMIT] [--json]
+    python naver_search_crawler.py <search_url> [--limit LIMIT] [--json] [--selenium]
 
 Example:
     python naver_search_crawler.py "https://shoppinglive.naver.com/search/lives?query=설화수"
@@ -15,16 +18,29 @@ import argparse
 import json
 import logging
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Selenium is only needed for the browser fallback
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from webdriver_manager.chrome import ChromeDriverManager
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+try:
+    from extractors.search_extractor import SearchAPIExtractor
+    SEARCH_API_AVAILABLE = True
+except ImportError:
+    SEARCH_API_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -38,9 +54,19 @@ logger = logging.getLogger(__name__)
 class NaverSearchCrawler:
     """Crawler for Naver Shopping Live search results"""
 
-    def __init__(self, headless=True):
-        """Initialize crawler"""
+    # One Selenium session at a time (fixed remote-debugging port), e.g. in multi-brand sweeps
+    _driver_lock = threading.Lock()
+
+    def __init__(self, headless=True, use_api=True):
+        """
+        Initialize crawler
+
+        Args:
+            headless: Run the fallback browser headless
+            use_api: Discover via the search JSON APIs first (default: True)
+        """
         self.headless = headless
+        self.use_api = use_api and SEARCH_API_AVAILABLE
         self.driver = None
 
     def setup_driver(self):
@@ -84,6 +110,22 @@ class NaverSearchCrawler:
         Returns:
             List of broadcast dictionaries
         """
+        # Direct JSON discovery (no browser)
+        if self.use_api:
+            broadcasts = SearchAPIExtractor().search(search_url, limit=limit)
+            if broadcasts:
+                logger.info(f"Found {len(broadcasts)} broadcasts via search API")
+                return broadcasts
+            logger.info("Search API returned no broadcasts, falling back to Selenium")
+
+        if not SELENIUM_AVAILABLE:
+            raise Exception("Search API returned no broadcasts and Selenium is not installed")
+
+        with self._driver_lock:
+            return self._crawl_with_selenium(search_url, limit)
+
+    def _crawl_with_selenium(self, search_url, limit):
+        """Crawl the search page in Chrome (fallback when the search API finds nothing)"""
         broadcasts = []
 
         try:
@@ -396,11 +438,12 @@ def main():
     parser.add_argument('--limit', type=int, default=50, help='Maximum number of broadcasts to extract (default: 50)')
     parser.add_argument('--json', action='store_true', help='Output results as JSON')
     parser.add_argument('--headful', action='store_true', help='Run browser in headful mode (with GUI)')
+    parser.add_argument('--selenium', action='store_true', help='Skip the search API and always use Selenium')
 
     args = parser.parse_args()
 
     # Create crawler
-    crawler = NaverSearchCrawler(headless=not args.headful)
+    crawler = NaverSearchCrawler(headless=not args.headful, use_api=not args.selenium)
 
     try:
         # Crawl search results
@@ -7,14 +7,23 @@ from .config import SupabaseConfig
 from .client import SupabaseClient
 from .transformer import DataTransformer
 from .validator import SchemaValidator
+from .base_upserter import BaseUpserter, ChunkedInsertError
 from .upserter import DatabaseUpserter
 from .saver import BroadcastSaver
+from .async_client import AsyncSupabaseClient
+from .async_upserter import AsyncDatabaseUpserter
+from .async_saver import AsyncBroadcastSaver
 
 __all__ = [
     'SupabaseConfig',
     'SupabaseClient',
     'DataTransformer',
     'SchemaValidator',
+    'BaseUpserter',
     'DatabaseUpserter',
+    'ChunkedInsertError',
     'BroadcastSaver',
+    'AsyncSupabaseClient',
+    'AsyncDatabaseUpserter',
+    'AsyncBroadcastSaver',
 ]
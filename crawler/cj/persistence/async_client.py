@@ -0,0 +1,180 @@
+"""
+Async Supabase (PostgREST) client for broadcast crawler
+Uses one pooled httpx.AsyncClient so saves never block the event loop
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+from postgrest import AsyncPostgrestClient, AsyncRequestBuilder
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
+
+from .config import SupabaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSupabaseClient:
+    """
+    Async PostgREST client for the broadcasts schema
+
+    Counterpart of SupabaseClient for use inside the asyncio crawl loop. Queries
+    are built by postgrest's AsyncPostgrestClient (the library behind supabase-py,
+    so filters, upserts and APIError match the sync client); all requests share
+    one pooled httpx.AsyncClient (keep-alive, bounded connections).
+
+    Example:
+        >>> async with AsyncSupabaseClient() as client:
+        ...     response = await client.table('broadcasts').select('id').limit(1).execute()
+    """
+
+    def __init__(
+        self,
+        config: Optional[SupabaseConfig] = None,
+        max_connections: int = 20,
+        timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize async Supabase client
+
+        Args:
+            config: SupabaseConfig instance. If None, loads from environment.
+            max_connections: Maximum pooled connections to PostgREST (default: 20)
+            timeout: Request timeout in seconds (default: 30)
+            http_client: Pooled client to send requests with (default: created on connect;
+                postgrest sets its base URL and auth headers)
+        """
+        self.config = config or SupabaseConfig.from_env()
+        self.config.validate()
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._http = http_client
+        self._postgrest: Optional[AsyncPostgrestClient] = None
+
+    @property
+    def rest_url(self) -> str:
+        """PostgREST endpoint of the project"""
+        return f"{self.config.url.rstrip('/')}/rest/v1"
+
+    @property
+    def postgrest(self) -> AsyncPostgrestClient:
+        """
+        Get or create the PostgREST client (lazy initialization)
+
+        Returns:
+            AsyncPostgrestClient sending through the pooled HTTP client
+        """
+        if self._postgrest is None:
+            self.connect()
+        return self._postgrest
+
+    def connect(self) -> AsyncPostgrestClient:
+        """
+        Create the pooled HTTP client and the PostgREST client on top of it
+
+        Returns:
+            AsyncPostgrestClient instance
+        """
+        headers = {
+            'apikey': self.config.key,
+            'Authorization': f'Bearer {self.config.key}',
+        }
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.rest_url,
+                headers=headers,
+                verify=False,  # Consistent with SupabaseClient (development)
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        self._postgrest = AsyncPostgrestClient(
+            self.rest_url,
+            headers={**DEFAULT_POSTGREST_CLIENT_HEADERS, **headers},
+            http_client=self._http
+        )
+        logger.info("Async Supabase client ready")
+        return self._postgrest
+
+    def table(self, name: str) -> AsyncRequestBuilder:
+        """
+        Start a query on a table
+
+        Args:
+            name: Table name
+
+        Returns:
+            postgrest AsyncRequestBuilder (same chain API as supabase-py)
+        """
+        return self.postgrest.from_(name)
+
+    async def disconnect(self):
+        """Close pooled connections"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._postgrest = None
+            logger.info("Disconnected async Supabase client")
+
+    async def test_connection(self) -> bool:
+        """
+        Test database connection by querying broadcasts table
+
+        Returns:
+            bool: True if connection is successful
+
+        Raises:
+            Exception: If connection test fails
+        """
+        try:
+            await self.table('broadcasts').select('id').limit(1).execute()
+            logger.info("Database connection test successful")
+            return True
+        except Exception as e:
+            logger.error(f"Database connection test failed: {e}")
+            raise
+
+    async def get_brand_by_name(self, name: str) -> Optional[dict]:
+        """
+        Get brand by name from brands table with fuzzy matching
+
+        Args:
+            name: Brand name to search for
+
+        Returns:
+            dict: Brand record if found, None otherwise
+        """
+        try:
+            if not name:
+                return None
+
+            normalized_name = name.strip()
+
+            # Exact, case-insensitive, then partial match (same order as SupabaseClient)
+            for query, label in (
+                (self.table('brands').select('*').eq('name', normalized_name), 'exact match'),
+                (self.table('brands').select('*').ilike('name', normalized_name), 'case-insensitive'),
+                (self.table('brands').select('*').ilike('name', f'%{normalized_name}%'), 'partial match'),
+            ):
+                result = await query.execute()
+                if result.data:
+                    logger.debug(f"Found brand ({label}): '{normalized_name}' -> '{result.data[0]['name']}'")
+                    return result.data[0]
+
+            return None
+        except Exception as e:
+            logger.error(f"Error looking up brand '{name}': {e}")
+            return None
+
+    async def __aenter__(self):
+        """Context manager entry"""
+        self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        await self.disconnect()
@@ -0,0 +1,108 @@
+"""
+Async high-level interface for saving broadcast data to Supabase
+"""
+
+import logging
+from typing import Dict, List, Any, Optional
+
+from .config import SupabaseConfig
+from .async_client import AsyncSupabaseClient
+from .async_upserter import AsyncDatabaseUpserter
+from .saver import commit_comment_cursors
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBroadcastSaver:
+    """
+    Async counterpart of BroadcastSaver for use inside the crawl event loop
+
+    Create one instance per run and reuse it: all saves share the pooled
+    HTTP connections of its AsyncSupabaseClient.
+
+    Example usage:
+        >>> async with AsyncBroadcastSaver() as saver:
+        ...     result = await saver.save_batch([data1, data2])
+        ...     print(f"Saved {result['successful']}/{result['total']}")
+    """
+
+    def __init__(
+        self,
+        supabase_url: Optional[str] = None,
+        supabase_key: Optional[str] = None,
+        child_sync: str = 'replace',
+        raw_data: str = 'full',
+        max_connections: int = 20
+    ):
+        """
+        Initialize AsyncBroadcastSaver
+
+        Args:
+            supabase_url: Supabase project URL (optional, loads from env if not provided)
+            supabase_key: Supabase API key (optional, loads from env if not provided)
+            child_sync: 'replace' (delete + reinsert child records) or 'diff' (content-hash sync)
+            raw_data: raw_data policy: 'full', 'slim', 'compressed' or 'off' (see DataTransformer)
+            max_connections: Maximum pooled connections to PostgREST (default: 20)
+        """
+        if supabase_url and supabase_key:
+            config = SupabaseConfig(url=supabase_url, key=supabase_key)
+        else:
+            config = SupabaseConfig.from_env()
+
+        self.client = AsyncSupabaseClient(config, max_connections=max_connections)
+        self.upserter = AsyncDatabaseUpserter(self.client, child_sync=child_sync, raw_data=raw_data)
+
+        logger.info("AsyncBroadcastSaver initialized")
+
+    async def save_from_dict(self, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Save broadcast data from dictionary
+
+        Args:
+            crawler_data: Crawler output as dictionary
+
+        Returns:
+            Dict with save status and statistics
+        """
+        result = await self.upserter.upsert_broadcast_data(crawler_data)
+        commit_comment_cursors([crawler_data], [result])
+        return result
+
+    async def save_batch(self, crawler_data_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Save multiple broadcasts with combined requests per table
+
+        Args:
+            crawler_data_list: List of crawler outputs as dictionaries
+
+        Returns:
+            Dict with batch statistics and per-broadcast results (input order)
+        """
+        batch_result = await self.upserter.upsert_batch(crawler_data_list)
+        commit_comment_cursors(crawler_data_list, batch_result['results'])
+        return batch_result
+
+    async def test_connection(self) -> bool:
+        """
+        Test database connection
+
+        Returns:
+            bool: True if connection is successful
+        """
+        try:
+            return await self.client.test_connection()
+        except Exception as e:
+            logger.error(f"Connection test failed: {e}")
+            return False
+
+    async def close(self):
+        """Close pooled connections"""
+        await self.client.disconnect()
+
+    async def __aenter__(self):
+        """Context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        await self.close()
@@ -0,0 +1,641 @@
+"""
+Async database upserter (concurrent child-table writes over a pooled connection)
+"""
+
+import asyncio
+import time
+import logging
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from functools import wraps
+
+import httpx
+
+from .base_upserter import BaseUpserter, Chunk
+
+logger = logging.getLogger(__name__)
+
+
+def async_retry_with_backoff(max_retries=3, base_delay=1):
+    """
+    Decorator for retrying coroutines with exponential backoff
+
+    Async counterpart of retry_with_backoff: connection-level failures are
+    retried, everything else is raised immediately.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+        base_delay: Base delay in seconds (doubles with each retry)
+
+    Returns:
+        Decorated coroutine function
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return await func(*args, **kwargs)
+                except (ConnectionError, httpx.TransportError) as e:
+                    if attempt == max_retries - 1:
+                        logger.error(f"Connection failed after {max_retries} attempts: {e}")
+                        raise
+                    delay = base_delay * (2 ** attempt)
+                    logger.warning(
+                        f"Connection error, retrying in {delay}s... "
+                        f"(attempt {attempt + 1}/{max_retries})"
+                    )
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    # Don't retry on other exceptions
+                    logger.error(f"Error in {func.__name__}: {e}")
+                    raise
+            return None
+        return wrapper
+    return decorator
+
+
+class AsyncDatabaseUpserter(BaseUpserter):
+    """
+    Async version of DatabaseUpserter
+
+    Produces the same results as DatabaseUpserter (planning and row building
+    are shared in BaseUpserter), but child tables are written concurrently
+    (one task per table) instead of one after another. All child tables
+    reference broadcasts only, so their writes are independent.
+    """
+
+    @async_retry_with_backoff(max_retries=3, base_delay=1)
+    async def upsert_broadcast(self, broadcast_data: Dict[str, Any]) -> bool:
+        """
+        Upsert broadcast record
+
+        Args:
+            broadcast_data: Broadcast data dictionary
+
+        Returns:
+            bool: True if successful
+
+        Raises:
+            Exception: If upsert fails after retries
+        """
+        try:
+            response = await self.client.table('broadcasts').upsert(
+                broadcast_data,
+                on_conflict='id'
+            ).execute()
+
+            if response.data:
+                logger.info(f"✓ Broadcast {broadcast_data['id']} upserted successfully")
+                return True
+            else:
+                logger.warning("⚠ Broadcast upsert returned no data")
+                return False
+
+        except Exception as e:
+            logger.error(f"✗ Failed to upsert broadcast {broadcast_data.get('id')}: {e}")
+            raise
+
+    @async_retry_with_backoff(max_retries=3, base_delay=1)
+    async def upsert_broadcasts(self, broadcasts: List[Dict[str, Any]]) -> int:
+        """
+        Upsert multiple broadcast records in a single request
+
+        Args:
+            broadcasts: List of broadcast data dictionaries (unique ids)
+
+        Returns:
+            int: Number of broadcasts upserted
+
+        Raises:
+            Exception: If upsert fails after retries
+        """
+        if not broadcasts:
+            return 0
+
+        try:
+            response = await self.client.table('broadcasts').upsert(
+                broadcasts,
+                on_conflict='id'
+            ).execute()
+
+            count = len(response.data) if response.data else 0
+            logger.info(f"✓ Upserted {count} broadcasts in one request")
+            return count
+
+        except Exception as e:
+            logger.error(f"✗ Failed to bulk upsert {len(broadcasts)} broadcasts: {e}")
+            raise
+
+    @async_retry_with_backoff(max_retries=3, base_delay=1)
+    async def delete_child_records_bulk(self, broadcast_ids: List[int], chat_ids: Optional[List[int]] = None):
+        """
+        Delete existing child records for multiple broadcasts (tables in parallel)
+
+        Args:
+            broadcast_ids: List of broadcast IDs
+            chat_ids: Broadcasts whose chat is deleted too (default: all; incremental chat is kept)
+
+        Raises:
+            Exception: If deletion fails after retries
+        """
+        if not broadcast_ids:
+            return
+
+        chat_ids = broadcast_ids if chat_ids is None else chat_ids
+        await asyncio.gather(*(
+            self.client.table(table).delete().in_('broadcast_id', chat_ids if key == 'chat' else broadcast_ids).execute()
+            for key, (table, _) in self.CHILD_TABLES.items()
+            if key != 'chat' or chat_ids
+        ))
+
+        logger.debug(f"Deleted existing child records for {len(broadcast_ids)} broadcasts")
+
+    async def delete_child_records(self, broadcast_id: int, include_chat: bool = True):
+        """
+        Delete existing child records for a broadcast (tables in parallel)
+
+        Args:
+            broadcast_id: Broadcast ID
+            include_chat: Also delete chat (False when appending incremental chat)
+        """
+        try:
+            await self.delete_child_records_bulk([broadcast_id], chat_ids=None if include_chat else [])
+        except Exception as e:
+            logger.warning(f"Failed to delete child records for broadcast {broadcast_id}: {e}")
+            # Don't raise - continue with insertion even if deletion fails
+
+    async def _insert_rows(self, key: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert rows into the child table for `key` (chunked, see insert_chunked)
+
+        Args:
+            key: Transformed data key ('products', 'coupons', 'benefits', 'chat')
+            rows: Rows to insert (products without product_id are skipped)
+
+        Returns:
+            int: Number of rows inserted
+
+        Raises:
+            ChunkedInsertError: If some chunks still fail after retries
+        """
+        insertable = self.insertable_rows(key, rows)
+        if len(insertable) < len(rows):
+            logger.warning(f"Skipping {len(rows) - len(insertable)} products without product_id")
+        rows = insertable
+        if not rows:
+            logger.debug(f"No {self.CHILD_LABELS[key]} to insert")
+            return 0
+        return await self.insert_chunked(self.CHILD_TABLES[key][0], rows, self.CHILD_LABELS[key])
+
+    async def insert_chunked(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        label: str,
+        on_conflict: Optional[str] = None
+    ) -> int:
+        """
+        Insert rows in size-bounded chunks, concurrently, retrying only failed chunks
+
+        Async counterpart of DatabaseUpserter.insert_chunked: same chunking
+        and retry rules, with at most INSERT_CONCURRENCY chunks in flight.
+
+        Args:
+            table: Table name
+            rows: Rows to insert
+            label: Row kind for log messages
+            on_conflict: Upsert on this column instead of inserting (e.g. 'id' to update rows in place)
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            ChunkedInsertError: If some chunks still fail after retries
+        """
+        semaphore = asyncio.Semaphore(self.INSERT_CONCURRENCY)
+
+        async def insert(chunk: Chunk) -> int:
+            async with semaphore:
+                query = self.client.table(table)
+                query = query.upsert(chunk, on_conflict=on_conflict) if on_conflict else query.insert(chunk)
+                response = await query.execute()
+                return len(response.data) if response.data else 0
+
+        pending = self.plan_chunks(rows, label)
+        inserted = 0
+        failed: List[Tuple[Chunk, Exception]] = []
+        for attempt in range(self.INSERT_CHUNK_RETRIES):
+            if not pending:
+                break
+            if attempt:
+                await asyncio.sleep(self.retry_delay(attempt, pending, label))
+            outcomes = await asyncio.gather(*(insert(chunk) for chunk in pending), return_exceptions=True)
+            written, pending = self.settle_round(attempt, pending, outcomes, failed)
+            inserted += written
+        return self.chunked_result(label, inserted, failed)
+
+    @async_retry_with_backoff(max_retries=3, base_delay=1)
+    async def insert_metadata(self, metadata: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
+        """
+        Insert crawl metadata record(s)
+
+        Args:
+            metadata: Metadata dictionary, or list of dictionaries for a bulk insert
+
+        Returns:
+            bool: True if successful
+
+        Raises:
+            Exception: If insertion fails after retries
+        """
+        try:
+            response = await self.client.table('crawl_metadata').insert(metadata).execute()
+
+            if response.data:
+                logger.info("✓ Inserted crawl metadata")
+                return True
+            else:
+                logger.warning("⚠ Metadata insertion returned no data")
+                return False
+
+        except Exception as e:
+            logger.error(f"✗ Failed to insert metadata: {e}")
+            raise
+
+    async def resolve_brand_id(
+        self,
+        brand_name: Optional[str],
+        cache: Optional[Dict[str, Optional[str]]] = None
+    ) -> Optional[str]:
+        """
+        Look up brand_id for a brand name
+
+        Args:
+            brand_name: Brand name extracted by the crawler
+            cache: Optional dict reused across a batch so each name is looked up once
+
+        Returns:
+            Brand ID, or None if not found
+        """
+        if not brand_name:
+            logger.warning("⚠ No brand_name extracted - brand_id will be null")
+            return None
+
+        if cache is not None and brand_name in cache:
+            return cache[brand_name]
+
+        brand = await self.client.get_brand_by_name(brand_name)
+        brand_id = brand.get('id') if brand else None
+
+        if brand_id:
+            logger.debug(f"✓ Found brand_id: {brand_id} for brand_name: '{brand_name}'")
+        else:
+            logger.warning(f"⚠ Brand not found in database: '{brand_name}' - brand_id will be null")
+
+        if cache is not None:
+            cache[brand_name] = brand_id
+        return brand_id
+
+    async def upsert_broadcast_data(self, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Upsert complete broadcast data (broadcast + all child records)
+
+        Same steps and result format as DatabaseUpserter.upsert_broadcast_data,
+        with the four child tables written concurrently.
+
+        Args:
+            crawler_data: Complete crawler output JSON
+
+        Returns:
+            Dict with status, broadcast_id, records_saved and duration (or error)
+        """
+        start_time = time.time()
+
+        try:
+            transformed = self.transform(crawler_data)
+            broadcast_id = transformed['broadcast']['id']
+
+            transformed['broadcast']['brand_id'] = await self.resolve_brand_id(
+                transformed['broadcast'].get('brand_name')
+            )
+
+            error = self.validation_error(transformed)
+            if error:
+                return error
+
+            # 1. Upsert broadcast (children reference it)
+            await self.upsert_broadcast(transformed['broadcast'])
+
+            child_writes = None
+            if self.child_sync == 'diff':
+                # 2-3. Sync child records by content hash (tables in parallel)
+                counts, child_errors, writes = await self.sync_child_records({broadcast_id: transformed})
+                if child_errors:
+                    raise Exception('; '.join(child_errors[broadcast_id]))
+                records_saved = counts[broadcast_id]
+                child_writes = writes[broadcast_id]
+            else:
+                # 2. Delete old child records, 3. insert new ones (tables in parallel)
+                await self.delete_child_records(broadcast_id, include_chat=not transformed['chat_append'])
+                keys = list(self.CHILD_TABLES)
+                inserted = await asyncio.gather(*(self._insert_rows(key, transformed[key]) for key in keys))
+                records_saved = dict(zip(keys, inserted))
+
+            # 4. Insert metadata
+            await self.insert_metadata(transformed['metadata'])
+
+            return self.success_result(transformed, records_saved, time.time() - start_time, child_writes)
+
+        except Exception as e:
+            try:
+                await self.client.table('crawl_metadata').insert(self.error_metadata(crawler_data, e)).execute()
+            except Exception as meta_error:
+                logger.warning(f"Failed to save error metadata: {meta_error}")
+
+            logger.error(f"✗ Failed to save broadcast data: {e}")
+            return self.error_result(crawler_data, e, time.time() - start_time)
+
+    async def upsert_batch(self, crawler_data_list: List[Dict[str, Any]], bulk: bool = True) -> Dict[str, Any]:
+        """
+        Upsert multiple broadcasts efficiently
+
+        Bulk mode mirrors DatabaseUpserter.upsert_batch (one request per table),
+        with the child tables running concurrently. Non-bulk mode saves the
+        broadcasts concurrently, one upsert_broadcast_data call each.
+
+        Args:
+            crawler_data_list: List of crawler output JSONs
+            bulk: Use combined requests (default: True)
+
+        Returns:
+            Dict with total, successful, failed and results (same order as input)
+        """
+        logger.info(f"Starting async batch upsert for {len(crawler_data_list)} broadcasts...")
+
+        if bulk:
+            results = await self._upsert_batch_bulk(crawler_data_list)
+        else:
+            results = list(await asyncio.gather(
+                *(self.upsert_broadcast_data(crawler_data) for crawler_data in crawler_data_list)
+            ))
+
+        return self.batch_summary(results)
+
+    async def _upsert_batch_bulk(self, crawler_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Save a batch with combined requests per table (tables in parallel)
+
+        Args:
+            crawler_data_list: List of crawler output JSONs
+
+        Returns:
+            List of per-broadcast results (same order as input)
+        """
+        start_time = time.time()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(crawler_data_list)
+
+        # 1. Transform, resolve brands (once per name) and validate
+        transformed_list = self.transform_batch(crawler_data_list, results)
+        brand_cache: Dict[str, Optional[str]] = {}
+        for _, transformed in transformed_list:
+            transformed['broadcast']['brand_id'] = await self.resolve_brand_id(
+                transformed['broadcast'].get('brand_name'), cache=brand_cache
+            )
+        prepared, index_by_id = self.collect_prepared(transformed_list, results)
+
+        if not prepared:
+            return results
+
+        # 2. Upsert all broadcasts in one request (fall back to the per-broadcast path on failure)
+        try:
+            await self.upsert_broadcasts([t['broadcast'] for t in prepared.values()])
+        except Exception as e:
+            logger.warning(f"⚠ Bulk broadcast upsert failed, saving one by one: {e}")
+            fallback = await asyncio.gather(
+                *(self.upsert_broadcast_data(crawler_data_list[i]) for i in index_by_id.values())
+            )
+            for i, result in zip(index_by_id.values(), fallback):
+                results[i] = result
+            return results
+
+        broadcast_ids = list(prepared)
+        writes: Dict[int, Dict[str, int]] = {}
+        if self.child_sync == 'diff':
+            # 3-4. Sync child records by content hash (tables in parallel)
+            counts, child_errors, writes = await self.sync_child_records(prepared)
+        else:
+            # 3. Delete old child records (one request per table, in parallel)
+            try:
+                await self.delete_child_records_bulk(
+                    broadcast_ids,
+                    chat_ids=[broadcast_id for broadcast_id, t in prepared.items() if not t['chat_append']]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to bulk delete child records: {e}")
+
+            # 4. Insert each child table in one combined request (tables in parallel)
+            child_errors: Dict[int, List[str]] = {}
+            counts: Dict[int, Dict[str, int]] = {broadcast_id: {} for broadcast_id in broadcast_ids}
+            await asyncio.gather(*(
+                self._insert_children_combined(key, prepared, counts, child_errors)
+                for key in self.CHILD_TABLES
+            ))
+
+        # 5. Insert metadata for all broadcasts (errors recorded on the row)
+        try:
+            await self.insert_metadata(self.metadata_rows(prepared, child_errors))
+        except Exception as e:
+            logger.warning(f"Failed to insert crawl metadata for batch: {e}")
+
+        duration = round(time.time() - start_time, 2)
+        self.bulk_results(results, prepared, index_by_id, counts, child_errors, writes, duration)
+
+        logger.info(f"✓ Bulk saved {len(prepared)} broadcasts in {duration:.2f}s")
+        return results
+
+    async def _insert_children_combined(
+        self,
+        key: str,
+        prepared: Dict[int, Dict[str, Any]],
+        counts: Dict[int, Dict[str, int]],
+        child_errors: Dict[int, List[str]]
+    ):
+        """
+        Insert one child table for all broadcasts, retrying per broadcast on failure
+
+        Args:
+            key: Transformed data key ('products', 'coupons', 'benefits', 'chat')
+            prepared: broadcast_id -> transformed data
+            counts: broadcast_id -> {key: rows inserted} (updated in place)
+            child_errors: broadcast_id -> error messages (updated in place)
+        """
+        rows = [row for transformed in prepared.values() for row in transformed[key]]
+        try:
+            await self._insert_rows(key, rows)
+            for broadcast_id, transformed in prepared.items():
+                counts[broadcast_id][key] = len(self.insertable_rows(key, transformed[key]))
+            return
+        except Exception as e:
+            logger.warning(f"⚠ Combined {key} insert failed, retrying per broadcast: {e}")
+            failed = self._failed_rows_by_broadcast(key, prepared, e)
+
+        # Attribute the error to specific broadcasts, resending only rows of failed chunks
+        for broadcast_id, transformed in prepared.items():
+            stored = len(self.insertable_rows(key, transformed[key]))
+            stored -= len(self.insertable_rows(key, failed[broadcast_id]))
+            if not failed[broadcast_id]:
+                counts[broadcast_id][key] = stored
+                continue
+            try:
+                counts[broadcast_id][key] = stored + await self._insert_rows(key, failed[broadcast_id])
+            except Exception as e:
+                counts[broadcast_id][key] = stored + getattr(e, 'inserted', 0)
+                child_errors.setdefault(broadcast_id, []).append(f"{key}: {e}")
+
+    async def sync_child_records(
+        self,
+        prepared: Dict[int, Dict[str, Any]]
+    ) -> Tuple[Dict[int, Dict[str, int]], Dict[int, List[str]], Dict[int, Dict[str, int]]]:
+        """
+        Diff-sync child tables against stored content hashes (tables in parallel)
+
+        See DatabaseUpserter.sync_child_records for the sync rules.
+
+        Args:
+            prepared: broadcast_id -> transformed data (from DataTransformer.transform_all)
+
+        Returns:
+            Tuple of (counts, child_errors, writes), same shape as DatabaseUpserter.sync_child_records
+        """
+        counts, child_errors, writes = self.new_sync_state(prepared)
+
+        async def sync_key(key: str, table: str, natural_key: Optional[str]):
+            fresh_by_broadcast, append_ids = self.fresh_child_rows(key, prepared)
+
+            try:
+                table_writes = await self._sync_table(table, natural_key, fresh_by_broadcast, append_ids)
+            except Exception as e:
+                if len(fresh_by_broadcast) == 1:
+                    broadcast_id = next(iter(fresh_by_broadcast))
+                    child_errors.setdefault(broadcast_id, []).append(f"{key}: {e}")
+                    counts[broadcast_id][key] = 0
+                    return
+
+                logger.warning(f"⚠ Combined {key} sync failed, retrying per broadcast: {e}")
+                table_writes = {}
+                for broadcast_id, rows in fresh_by_broadcast.items():
+                    try:
+                        table_writes.update(
+                            await self._sync_table(table, natural_key, {broadcast_id: rows}, append_ids)
+                        )
+                    except Exception as e:
+                        child_errors.setdefault(broadcast_id, []).append(f"{key}: {e}")
+
+            self.tally_table(key, fresh_by_broadcast, table_writes, counts, writes)
+
+        await asyncio.gather(*(
+            sync_key(key, table, natural_key)
+            for key, (table, natural_key) in self.CHILD_TABLES.items()
+        ))
+
+        self.log_sync_totals(writes)
+        return counts, child_errors, writes
+
+    async def _sync_table(
+        self,
+        table: str,
+        natural_key: Optional[str],
+        fresh_by_broadcast: Dict[int, List[Dict[str, Any]]],
+        append_ids: Optional[Set[int]] = None
+    ) -> Dict[int, Dict[str, int]]:
+        """
+        Diff-sync one child table for a set of broadcasts (see plan_table)
+
+        Args:
+            table: Child table name
+            natural_key: Column used to pair changed rows with stale rows (or None)
+            fresh_by_broadcast: broadcast_id -> fresh rows with content_hash
+            append_ids: Broadcasts whose fresh rows are only appended (stored rows kept)
+
+        Returns:
+            broadcast_id -> {'inserted', 'updated', 'deleted', 'unchanged'}
+
+        Raises:
+            Exception: If a request fails after retries
+        """
+        append_ids = append_ids or set()
+        diff_ids = self.diff_ids(fresh_by_broadcast, append_ids)
+        stored_rows = await self._fetch_child_hashes(table, natural_key, diff_ids) if diff_ids else []
+        deletes, updates, inserts, table_writes = self.plan_table(
+            natural_key, fresh_by_broadcast, stored_rows, append_ids
+        )
+
+        # Deletes first so freed natural keys can be reused by updates/inserts
+        await self._delete_child_rows(table, deletes)
+        await self._write_child_rows(table, updates, update=True)
+        await self._write_child_rows(table, inserts, update=False)
+
+        logger.debug(
+            f"{table}: {len(inserts)} inserted, {len(updates)} updated, {len(deletes)} deleted"
+        )
+        return table_writes
+
+    @async_retry_with_backoff(max_retries=3, base_delay=1)
+    async def _fetch_child_hashes(
+        self,
+        table: str,
+        natural_key: Optional[str],
+        broadcast_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch id, broadcast_id, content_hash (and natural key) of stored child rows
+
+        Args:
+            table: Child table name
+            natural_key: Extra column to select (or None)
+            broadcast_ids: Broadcast IDs to fetch
+
+        Returns:
+            List of stored row summaries
+        """
+        columns = self.hash_columns(natural_key)
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+
+        while True:
+            response = await (
+                self.client.table(table)
+                .select(columns)
+                .in_('broadcast_id', broadcast_ids)
+                .order('id')
+                .range(offset, offset + self.FETCH_PAGE_SIZE - 1)
+                .execute()
+            )
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < self.FETCH_PAGE_SIZE:
+                return rows
+            offset += self.FETCH_PAGE_SIZE
+
+    @async_retry_with_backoff(max_retries=3, base_delay=1)
+    async def _delete_child_rows(self, table: str, ids: List[int]):
+        """Delete child rows by primary key (chunked to keep URLs short, chunks in parallel)"""
+        await asyncio.gather(*(
+            self.client.table(table).delete().in_('id', ids[i:i + self.DELETE_CHUNK_SIZE]).execute()
+            for i in range(0, len(ids), self.DELETE_CHUNK_SIZE)
+        ))
+
+    async def _write_child_rows(self, table: str, rows: List[Dict[str, Any]], update: bool):
+        """
+        Insert child rows, or update them in place by id (upsert on primary key)
+
+        Both go through insert_chunked, so large diffs respect the row and byte
+        budgets and only failed chunks are retried.
+
+        Raises:
+            ChunkedInsertError: If some chunks still fail after retries
+        """
+        if not rows:
+            return
+        label = f"{'updated' if update else 'new'} {table} rows"
+        await self.insert_chunked(table, rows, label, on_conflict='id' if update else None)
@@ -0,0 +1,739 @@
+"""
+Shared planning and row-building logic of the sync and async database upserters
+"""
+
+import json
+import logging
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+
+import httpx
+
+from .transformer import DataTransformer
+from .validator import SchemaValidator
+
+logger = logging.getLogger(__name__)
+
+
+Chunk = List[Dict[str, Any]]
+
+
+class ChunkedInsertError(Exception):
+    """
+    Some chunks of a chunked insert still failed after their retries
+
+    The other chunks were inserted; only failed_rows are missing from the table.
+
+    Attributes:
+        inserted: Number of rows inserted by the successful chunks
+        failed_rows: Rows of the chunks that failed
+        last_error: Last error raised by a failed chunk
+    """
+
+    def __init__(self, label: str, inserted: int, failed_rows: List[Dict[str, Any]], last_error: Exception):
+        super().__init__(f"{len(failed_rows)} of {inserted + len(failed_rows)} {label} failed to insert: {last_error}")
+        self.inserted = inserted
+        self.failed_rows = failed_rows
+        self.last_error = last_error
+
+
+class BaseUpserter:
+    """
+    Everything DatabaseUpserter and AsyncDatabaseUpserter share except I/O
+
+    Subclasses implement the requests (upserts, deletes, chunk inserts, hash
+    fetches) with a sync or async client; transformation, validation, chunk
+    planning, retry bookkeeping, diff planning and result building live here
+    so both upserters produce the same rows and results.
+    """
+
+    # Transformed key -> (table, natural key used to pair changed rows)
+    CHILD_TABLES = {
+        'products': ('broadcast_products', 'product_id'),
+        'coupons': ('broadcast_coupons', None),
+        'benefits': ('broadcast_benefits', 'benefit_id'),
+        'chat': ('broadcast_chat', None),
+    }
+    CHILD_LABELS = {
+        'products': 'products',
+        'coupons': 'coupons',
+        'benefits': 'benefits',
+        'chat': 'chat messages',
+    }
+
+    # PostgREST returns at most 1000 rows per request by default
+    FETCH_PAGE_SIZE = 1000
+    DELETE_CHUNK_SIZE = 500
+
+    # Child inserts are split by row count and serialized size (gateways reject large bodies,
+    # chat rows carry raw_data JSONB); chunks run in parallel and only failed chunks are retried
+    INSERT_CHUNK_ROWS = 500
+    INSERT_CHUNK_BYTES = 1024 * 1024
+    INSERT_CONCURRENCY = 4
+    INSERT_CHUNK_RETRIES = 3
+    RETRYABLE_STATUS = {408, 413, 429, 500, 502, 503, 504}
+    # postgrest APIError codes of transient failures: Postgres SQLSTATEs (statement timeout,
+    # too many connections, serialization failure, deadlock) and PostgREST's own
+    # database-connection/schema-cache/timeout errors (served as 503/504)
+    RETRYABLE_ERROR_CODES = {
+        '57014', '53300', '40001', '40P01',
+        'PGRST000', 'PGRST001', 'PGRST002', 'PGRST003',
+    }
+
+    def __init__(self, client, child_sync: str = 'replace', raw_data: str = 'full'):
+        """
+        Initialize database upserter
+
+        Args:
+            client: SupabaseClient or AsyncSupabaseClient instance
+            child_sync: 'replace' (delete + reinsert children) or 'diff' (content-hash sync,
+                requires the content_hash column on child tables)
+            raw_data: How much original JSON to store: 'full', 'slim', 'compressed'
+                (requires the raw_data_compressed column) or 'off' (see DataTransformer)
+        """
+        if child_sync not in ('replace', 'diff'):
+            raise ValueError(f"child_sync must be 'replace' or 'diff', got '{child_sync}'")
+        if raw_data not in DataTransformer.RAW_DATA_POLICIES:
+            raise ValueError(f"raw_data must be one of {DataTransformer.RAW_DATA_POLICIES}, got '{raw_data}'")
+
+        self.client = client
+        self.child_sync = child_sync
+        self.raw_data = raw_data
+
+    # ==================== Transform + validate ====================
+
+    def transform(self, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Transform crawler output with this upserter's raw_data policy"""
+        return DataTransformer.transform_all(crawler_data, raw_data=self.raw_data)
+
+    @staticmethod
+    def validation_error(transformed: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Validate transformed data
+
+        Args:
+            transformed: Output of transform() with brand_id resolved
+
+        Returns:
+            Error result for the broadcast, or None if the data is valid
+        """
+        valid, errors = SchemaValidator.validate_all(transformed)
+        if valid:
+            return None
+
+        broadcast_id = transformed['broadcast']['id']
+        logger.error(f"Validation errors for broadcast {broadcast_id}: {errors}")
+        return {
+            'status': 'error',
+            'broadcast_id': broadcast_id,
+            'error': 'Validation failed',
+            'validation_errors': errors
+        }
+
+    def transform_batch(
+        self,
+        crawler_data_list: List[Dict[str, Any]],
+        results: List[Optional[Dict[str, Any]]]
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Transform a batch, recording failures in results
+
+        Args:
+            crawler_data_list: List of crawler output JSONs
+            results: Per-input results (updated in place for failed inputs)
+
+        Returns:
+            List of (input index, transformed data)
+        """
+        transformed_list = []
+        for i, crawler_data in enumerate(crawler_data_list):
+            try:
+                transformed_list.append((i, self.transform(crawler_data)))
+            except Exception as e:
+                broadcast_id = crawler_data.get('broadcast', {}).get('broadcast_id')
+                logger.error(f"✗ Failed to prepare broadcast {broadcast_id}: {e}")
+                results[i] = {
+                    'status': 'error',
+                    'broadcast_id': broadcast_id,
+                    'error': str(e),
+                    'error_type': type(e).__name__
+                }
+        return transformed_list
+
+    def collect_prepared(
+        self,
+        transformed_list: List[Tuple[int, Dict[str, Any]]],
+        results: List[Optional[Dict[str, Any]]]
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, int]]:
+        """
+        Validate a transformed batch (brand_id resolved) and drop superseded crawls
+
+        Args:
+            transformed_list: Output of transform_batch
+            results: Per-input results (updated in place for invalid or superseded inputs)
+
+        Returns:
+            Tuple of (broadcast_id -> transformed, broadcast_id -> input index);
+            when a broadcast appears twice, the latest crawl wins
+        """
+        prepared: Dict[int, Dict[str, Any]] = {}
+        index_by_id: Dict[int, int] = {}
+
+        for i, transformed in transformed_list:
+            error = self.validation_error(transformed)
+            if error:
+                results[i] = error
+                continue
+
+            broadcast_id = transformed['broadcast']['id']
+            if broadcast_id in index_by_id:
+                results[index_by_id[broadcast_id]] = {
+                    'status': 'success',
+                    'broadcast_id': broadcast_id,
+                    'superseded': True
+                }
+            prepared[broadcast_id] = transformed
+            index_by_id[broadcast_id] = i
+
+        return prepared, index_by_id
+
+    # ==================== Results ====================
+
+    @staticmethod
+    def success_result(
+        transformed: Dict[str, Any],
+        records_saved: Dict[str, int],
+        duration: float,
+        child_writes: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Result of a single saved broadcast (logs the saved counts)
+
+        Args:
+            transformed: Transformed data of the broadcast
+            records_saved: key -> rows now stored
+            duration: Save duration in seconds
+            child_writes: Diff-sync write counts (or None in replace mode)
+
+        Returns:
+            Dict with status, broadcast_id, records_saved, duration_seconds
+            (and child_writes / raw_data_report when present)
+        """
+        broadcast_id = transformed['broadcast']['id']
+        result = {
+            'status': 'success',
+            'broadcast_id': broadcast_id,
+            'records_saved': records_saved,
+            'duration_seconds': round(duration, 2)
+        }
+        if child_writes:
+            result['child_writes'] = child_writes
+        if 'raw_data_report' in transformed:
+            result['raw_data_report'] = transformed['raw_data_report']
+
+        logger.info(f"✓ Successfully saved broadcast {broadcast_id} in {duration:.2f}s")
+        logger.info(f"  Products: {records_saved['products']}, Coupons: {records_saved['coupons']}, "
+                    f"Benefits: {records_saved['benefits']}, Chat: {records_saved['chat']}")
+        if 'raw_data_report' in transformed:
+            report = transformed['raw_data_report']
+            logger.info(f"  Raw data ({report['policy']}): {report['stored_bytes']} of "
+                        f"{report['full_bytes']} bytes stored ({report['saved_percent']}% saved)")
+        return result
+
+    @staticmethod
+    def error_metadata(crawler_data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """
+        crawl_metadata row recording a failed save
+
+        Raises:
+            KeyError: If crawler_data lacks broadcast_id / source_url / crawled_at
+        """
+        return {
+            'broadcast_id': crawler_data['broadcast']['broadcast_id'],
+            'source_url': crawler_data['metadata']['source_url'],
+            'crawled_at': crawler_data['metadata']['crawled_at'],
+            'status': 'error',
+            'error_message': str(error)
+        }
+
+    @staticmethod
+    def error_result(crawler_data: Dict[str, Any], error: Exception, duration: float) -> Dict[str, Any]:
+        """Result of a broadcast whose save failed"""
+        return {
+            'status': 'error',
+            'broadcast_id': crawler_data.get('broadcast', {}).get('broadcast_id'),
+            'error': str(error),
+            'error_type': type(error).__name__,
+            'duration_seconds': round(duration, 2)
+        }
+
+    @staticmethod
+    def metadata_rows(
+        prepared: Dict[int, Dict[str, Any]],
+        child_errors: Dict[int, List[str]]
+    ) -> List[Dict[str, Any]]:
+        """crawl_metadata rows of a bulk save (child errors recorded on the row)"""
+        rows = []
+        for broadcast_id, transformed in prepared.items():
+            metadata = transformed['metadata']
+            if broadcast_id in child_errors:
+                metadata['status'] = 'error'
+                metadata['error_message'] = '; '.join(child_errors[broadcast_id])
+            rows.append(metadata)
+        return rows
+
+    @staticmethod
+    def bulk_results(
+        results: List[Optional[Dict[str, Any]]],
+        prepared: Dict[int, Dict[str, Any]],
+        index_by_id: Dict[int, int],
+        counts: Dict[int, Dict[str, int]],
+        child_errors: Dict[int, List[str]],
+        writes: Dict[int, Dict[str, int]],
+        duration: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Fill in the per-broadcast results of a bulk save
+
+        Args:
+            results: Per-input results (updated in place)
+            prepared: broadcast_id -> transformed data
+            index_by_id: broadcast_id -> input index
+            counts: broadcast_id -> {key: rows now stored}
+            child_errors: broadcast_id -> error messages
+            writes: broadcast_id -> diff-sync write counts (empty in replace mode)
+            duration: Batch duration in seconds
+
+        Returns:
+            results
+        """
+        for broadcast_id, i in index_by_id.items():
+            if broadcast_id in child_errors:
+                results[i] = {
+                    'status': 'error',
+                    'broadcast_id': broadcast_id,
+                    'error': '; '.join(child_errors[broadcast_id]),
+                    'records_saved': counts[broadcast_id],
+                    'duration_seconds': duration
+                }
+            else:
+                results[i] = {
+                    'status': 'success',
+                    'broadcast_id': broadcast_id,
+                    'records_saved': counts[broadcast_id],
+                    'duration_seconds': duration
+                }
+            if broadcast_id in writes:
+                results[i]['child_writes'] = writes[broadcast_id]
+            if 'raw_data_report' in prepared[broadcast_id]:
+                results[i]['raw_data_report'] = prepared[broadcast_id]['raw_data_report']
+        return results
+
+    def batch_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Batch statistics of upsert_batch
+
+        Returns:
+            Dict with total, successful, failed, results
+            (and raw_data_saved_bytes unless the raw_data policy is 'full')
+        """
+        successful = sum(1 for result in results if result['status'] == 'success')
+        failed = len(results) - successful
+
+        logger.info(f"Batch upsert complete: {successful} successful, {failed} failed")
+
+        batch_result = {
+            'total': len(results),
+            'successful': successful,
+            'failed': failed,
+            'results': results
+        }
+        if self.raw_data != 'full':
+            batch_result['raw_data_saved_bytes'] = self.raw_data_saved_bytes(results)
+        return batch_result
+
+    @staticmethod
+    def raw_data_saved_bytes(results: List[Dict[str, Any]]) -> int:
+        """
+        Total raw_data bytes saved by the raw_data policy across saved broadcasts
+
+        Args:
+            results: Per-broadcast save results (with raw_data_report)
+
+        Returns:
+            int: Sum of saved_bytes of successful results
+        """
+        saved = sum(
+            result['raw_data_report']['saved_bytes']
+            for result in results
+            if result['status'] == 'success' and 'raw_data_report' in result
+        )
+        logger.info(f"Raw data policy saved {saved / 1024:.1f} KB")
+        return saved
+
+    # ==================== Chunked inserts ====================
+
+    @staticmethod
+    def insertable_rows(key: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rows the insert for `key` sends (products without product_id violate the unique constraint)"""
+        if key != 'products':
+            return rows
+        return [row for row in rows if row.get('product_id')]
+
+    @classmethod
+    def chunk_rows(
+        cls,
+        rows: List[Dict[str, Any]],
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Split rows into insert chunks bounded by row count and serialized size
+
+        Sizes are measured on ASCII-escaped JSON, an upper bound of the UTF-8
+        request body. A single row above the byte budget gets a chunk of its own.
+
+        Args:
+            rows: Rows to insert (order is kept)
+            max_rows: Maximum rows per chunk (default: INSERT_CHUNK_ROWS)
+            max_bytes: Maximum serialized bytes per chunk (default: INSERT_CHUNK_BYTES)
+
+        Returns:
+            List of chunks
+        """
+        max_rows = max_rows or cls.INSERT_CHUNK_ROWS
+        max_bytes = max_bytes or cls.INSERT_CHUNK_BYTES
+
+        chunks: List[List[Dict[str, Any]]] = []
+        chunk: List[Dict[str, Any]] = []
+        chunk_bytes = 0
+        for row in rows:
+            size = len(json.dumps(row, default=str, separators=(',', ':'))) + 1
+            if chunk and (len(chunk) >= max_rows or chunk_bytes + size > max_bytes):
+                chunks.append(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append(row)
+            chunk_bytes += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @classmethod
+    def is_retryable(cls, error: Exception) -> bool:
+        """
+        Whether a failed insert chunk is worth retrying
+
+        Transport errors, timeouts, rate limits, oversized bodies, 5xx
+        responses and transient database errors (RETRYABLE_ERROR_CODES) are
+        retried; constraint and validation errors are not.
+
+        Args:
+            error: Exception raised by the insert request
+
+        Returns:
+            True for transient failures
+        """
+        if isinstance(error, (ConnectionError, TimeoutError, httpx.TransportError)):
+            return True
+        code = getattr(error, 'code', None)
+        if code is not None and str(code) in cls.RETRYABLE_ERROR_CODES:
+            return True
+        # postgrest's APIError has no response; for non-JSON bodies its code is the HTTP status
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None) or code
+        try:
+            return int(status) in cls.RETRYABLE_STATUS
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def split_chunks(chunks: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """Halve multi-row chunks (a chunk may have failed for being too large)"""
+        halves = []
+        for chunk in chunks:
+            if len(chunk) > 1:
+                middle = len(chunk) // 2
+                halves.extend([chunk[:middle], chunk[middle:]])
+            else:
+                halves.append(chunk)
+        return halves
+
+    def plan_chunks(self, rows: List[Dict[str, Any]], label: str) -> List[Chunk]:
+        """First round of a chunked insert"""
+        chunks = self.chunk_rows(rows, self.INSERT_CHUNK_ROWS, self.INSERT_CHUNK_BYTES)
+        if len(chunks) > 1:
+            logger.debug(f"Inserting {len(rows)} {label} in {len(chunks)} chunks")
+        return chunks
+
+    def retry_delay(self, attempt: int, pending: List[Chunk], label: str) -> int:
+        """Backoff before retry round `attempt` (logs the retry)"""
+        delay = 2 ** (attempt - 1)
+        logger.warning(
+            f"Retrying {len(pending)} failed {label} chunks in {delay}s... "
+            f"(attempt {attempt + 1}/{self.INSERT_CHUNK_RETRIES})"
+        )
+        return delay
+
+    def settle_round(
+        self,
+        attempt: int,
+        pending: List[Chunk],
+        outcomes: List[Union[int, BaseException]],
+        failed: List[Tuple[Chunk, Exception]]
+    ) -> Tuple[int, List[Chunk]]:
+        """
+        Tally one round of chunk outcomes
+
+        Args:
+            attempt: Round number (0-based)
+            pending: Chunks sent this round
+            outcomes: Rows written, or the exception, per chunk
+            failed: Chunks given up on (updated in place)
+
+        Returns:
+            Tuple of (rows written this round, chunks for the next round)
+        """
+        written = 0
+        retry = []
+        for chunk, outcome in zip(pending, outcomes):
+            if not isinstance(outcome, BaseException):
+                written += outcome
+            elif self.is_retryable(outcome) and attempt < self.INSERT_CHUNK_RETRIES - 1:
+                retry.append(chunk)
+            else:
+                failed.append((chunk, outcome))
+        return written, self.split_chunks(retry)
+
+    @staticmethod
+    def chunked_result(label: str, inserted: int, failed: List[Tuple[Chunk, Exception]]) -> int:
+        """
+        Final outcome of a chunked insert
+
+        Returns:
+            int: Number of rows inserted
+
+        Raises:
+            ChunkedInsertError: If some chunks failed
+        """
+        if failed:
+            failed_rows = [row for chunk, _ in failed for row in chunk]
+            logger.error(f"✗ Failed to insert {len(failed_rows)} {label}: {failed[-1][1]}")
+            raise ChunkedInsertError(label, inserted, failed_rows, failed[-1][1])
+
+        logger.info(f"✓ Inserted {inserted} {label}")
+        return inserted
+
+    @staticmethod
+    def _failed_rows_by_broadcast(
+        key: str,
+        prepared: Dict[int, Dict[str, Any]],
+        error: Exception
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Rows per broadcast that a failed combined insert did not store
+
+        Args:
+            key: Transformed data key
+            prepared: broadcast_id -> transformed data
+            error: Exception raised by the combined insert
+
+        Returns:
+            broadcast_id -> rows to resend (all rows unless only some chunks failed)
+        """
+        if not isinstance(error, ChunkedInsertError):
+            return {broadcast_id: transformed[key] for broadcast_id, transformed in prepared.items()}
+
+        failed_ids = {id(row) for row in error.failed_rows}
+        return {
+            broadcast_id: [row for row in transformed[key] if id(row) in failed_ids]
+            for broadcast_id, transformed in prepared.items()
+        }
+
+    # ==================== Diff sync ====================
+
+    @staticmethod
+    def new_sync_state(
+        prepared: Dict[int, Dict[str, Any]]
+    ) -> Tuple[Dict[int, Dict[str, int]], Dict[int, List[str]], Dict[int, Dict[str, int]]]:
+        """Empty (counts, child_errors, writes) for sync_child_records"""
+        counts: Dict[int, Dict[str, int]] = {broadcast_id: {} for broadcast_id in prepared}
+        child_errors: Dict[int, List[str]] = {}
+        writes: Dict[int, Dict[str, int]] = {
+            broadcast_id: {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+            for broadcast_id in prepared
+        }
+        return counts, child_errors, writes
+
+    @staticmethod
+    def fresh_child_rows(
+        key: str,
+        prepared: Dict[int, Dict[str, Any]]
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Set[int]]:
+        """
+        Rows to sync for one child key, with content_hash set
+
+        Args:
+            key: Transformed data key
+            prepared: broadcast_id -> transformed data
+
+        Returns:
+            Tuple of (broadcast_id -> fresh rows, broadcasts whose rows are only appended)
+        """
+        append_ids = (
+            {broadcast_id for broadcast_id, t in prepared.items() if t.get('chat_append')}
+            if key == 'chat' else set()
+        )
+        fresh_by_broadcast = {}
+        for broadcast_id, transformed in prepared.items():
+            rows = transformed[key]
+            if key == 'products':
+                rows = [row for row in rows if row.get('product_id')]
+            for row in rows:
+                row['content_hash'] = DataTransformer.content_hash(row)
+            fresh_by_broadcast[broadcast_id] = rows
+        return fresh_by_broadcast, append_ids
+
+    @staticmethod
+    def tally_table(
+        key: str,
+        fresh_by_broadcast: Dict[int, List[Dict[str, Any]]],
+        table_writes: Dict[int, Dict[str, int]],
+        counts: Dict[int, Dict[str, int]],
+        writes: Dict[int, Dict[str, int]]
+    ):
+        """Add one table's sync outcome to counts and writes (broadcasts missing from table_writes failed)"""
+        for broadcast_id, rows in fresh_by_broadcast.items():
+            if broadcast_id not in table_writes:
+                counts[broadcast_id][key] = 0
+                continue
+            counts[broadcast_id][key] = len(rows)
+            for op, n in table_writes[broadcast_id].items():
+                writes[broadcast_id][op] += n
+
+    @staticmethod
+    def log_sync_totals(writes: Dict[int, Dict[str, int]]):
+        """Log the write totals of a child sync"""
+        total = {op: sum(w[op] for w in writes.values()) for op in ('inserted', 'updated', 'deleted', 'unchanged')}
+        logger.info(
+            f"✓ Child sync: {total['unchanged']} unchanged, {total['inserted']} inserted, "
+            f"{total['updated']} updated, {total['deleted']} deleted"
+        )
+
+    @staticmethod
+    def diff_ids(fresh_by_broadcast: Dict[int, List[Dict[str, Any]]], append_ids: Set[int]) -> List[int]:
+        """Broadcasts whose stored hashes have to be fetched"""
+        return [broadcast_id for broadcast_id in fresh_by_broadcast if broadcast_id not in append_ids]
+
+    @classmethod
+    def plan_table(
+        cls,
+        natural_key: Optional[str],
+        fresh_by_broadcast: Dict[int, List[Dict[str, Any]]],
+        stored_rows: List[Dict[str, Any]],
+        append_ids: Set[int]
+    ) -> Tuple[List[int], List[Dict[str, Any]], List[Dict[str, Any]], Dict[int, Dict[str, int]]]:
+        """
+        Plan the combined writes of one child table for a set of broadcasts
+
+        Args:
+            natural_key: Column used to pair changed rows with stale rows (or None)
+            fresh_by_broadcast: broadcast_id -> fresh rows with content_hash
+            stored_rows: Stored row summaries of the broadcasts (from the hash fetch)
+            append_ids: Broadcasts whose fresh rows are only appended (stored rows kept)
+
+        Returns:
+            Tuple of (ids to delete, rows to update, rows to insert,
+            broadcast_id -> {'inserted', 'updated', 'deleted', 'unchanged'})
+        """
+        stored_by_broadcast: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for row in stored_rows:
+            stored_by_broadcast[row['broadcast_id']].append(row)
+
+        deletes: List[int] = []
+        updates: List[Dict[str, Any]] = []
+        inserts: List[Dict[str, Any]] = []
+        table_writes: Dict[int, Dict[str, int]] = {}
+
+        for broadcast_id, fresh in fresh_by_broadcast.items():
+            if broadcast_id in append_ids:
+                plan = {'inserts': fresh, 'updates': [], 'deletes': [], 'unchanged': 0}
+            else:
+                plan = cls._plan_child_sync(fresh, stored_by_broadcast.get(broadcast_id, []), natural_key)
+            deletes.extend(plan['deletes'])
+            updates.extend(plan['updates'])
+            inserts.extend(plan['inserts'])
+            table_writes[broadcast_id] = {
+                'inserted': len(plan['inserts']),
+                'updated': len(plan['updates']),
+                'deleted': len(plan['deletes']),
+                'unchanged': plan['unchanged']
+            }
+
+        return deletes, updates, inserts, table_writes
+
+    @staticmethod
+    def _plan_child_sync(
+        fresh: List[Dict[str, Any]],
+        stored: List[Dict[str, Any]],
+        natural_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Plan the minimal writes to turn stored rows into fresh rows
+
+        1. Fresh rows whose hash matches a stored row are unchanged (multiset match)
+        2. Changed rows update a stale stored row with the same natural key
+        3. Remaining changed rows update any remaining stale row
+        4. Leftover changed rows are inserted, leftover stale rows deleted
+
+        Args:
+            fresh: Fresh rows with content_hash
+            stored: Stored rows with id, content_hash (and natural key)
+            natural_key: Column to pair rows by (or None)
+
+        Returns:
+            Dict with 'inserts', 'updates' (rows with id), 'deletes' (ids) and 'unchanged' count
+        """
+        pool: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        for row in stored:
+            pool[row.get('content_hash')].append(row)
+
+        changed = []
+        unchanged = 0
+        for row in fresh:
+            matches = pool.get(row['content_hash'])
+            if matches:
+                matches.pop()
+                unchanged += 1
+            else:
+                changed.append(row)
+
+        stale = [row for rows in pool.values() for row in rows]
+        updates = []
+        if natural_key:
+            stale_by_key = {row[natural_key]: row for row in stale if row.get(natural_key) is not None}
+            unpaired = []
+            for row in changed:
+                match = stale_by_key.pop(row.get(natural_key), None) if row.get(natural_key) is not None else None
+                if match:
+                    updates.append({**row, 'id': match['id']})
+                else:
+                    unpaired.append(row)
+            paired_ids = {row['id'] for row in updates}
+            stale = [row for row in stale if row['id'] not in paired_ids]
+            changed = unpaired
+
+        for row, match in zip(changed, stale):
+            updates.append({**row, 'id': match['id']})
+
+        n_paired = min(len(changed), len(stale))
+        return {
+            'inserts': changed[n_paired:],
+            'updates': updates,
+            'deletes': [row['id'] for row in stale[n_paired:]],
+            'unchanged': unchanged
+        }
+
+    @staticmethod
+    def hash_columns(natural_key: Optional[str]) -> str:
+        """Columns selected by the stored-hash fetch"""
+        return 'id,broadcast_id,content_hash' + (f',{natural_key}' if natural_key else '')
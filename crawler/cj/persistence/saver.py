@@ -11,9 +11,35 @@ from .config import SupabaseConfig
 from .client import SupabaseClient
 from .upserter import DatabaseUpserter
 
+# Comment cursors live with the crawler utils (absent when persistence is used standalone)
+try:
+    from utils.comment_cursors import CommentCursorStore
+    COMMENT_CURSORS_AVAILABLE = True
+except ImportError:
+    COMMENT_CURSORS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def commit_comment_cursors(crawler_data_list: List[Dict[str, Any]], results: List[Dict[str, Any]]):
+    """
+    Advance the stored comment cursors of successfully saved broadcasts
+
+    Crawlers fetch only comments newer than the stored cursor, so the cursor
+    must move only once those comments are in the database.
+
+    Args:
+        crawler_data_list: Saved crawler outputs
+        results: Per-broadcast save results (same order)
+    """
+    if not COMMENT_CURSORS_AVAILABLE:
+        return
+    try:
+        CommentCursorStore.default().commit_saved(crawler_data_list, results)
+    except Exception as e:
+        logger.warning(f"Failed to commit comment cursors: {e}")
+
+
 class BroadcastSaver:
     """
     High-level interface for saving broadcast data
@@ -31,7 +57,9 @@ class BroadcastSaver:
     def __init__(
         self,
         supabase_url: Optional[str] = None,
-        supabase_key: Optional[str] = None
+        supabase_key: Optional[str] = None,
+        child_sync: str = 'replace',
+        raw_data: str = 'full'
     ):
         """
         Initialize BroadcastSaver
@@ -39,6 +67,8 @@ class BroadcastSaver:
         Args:
             supabase_url: Supabase project URL (optional, loads from env if not provided)
             supabase_key: Supabase API key (optional, loads from env if not provided)
+            child_sync: 'replace' (delete + reinsert child records) or 'diff' (content-hash sync)
+            raw_data: raw_data policy: 'full', 'slim', 'compressed' or 'off' (see DataTransformer)
         """
         if supabase_url and supabase_key:
             config = SupabaseConfig(url=supabase_url, key=supabase_key)
@@ -46,7 +76,7 @@ class BroadcastSaver:
             config = SupabaseConfig.from_env()
 
         self.client = SupabaseClient(config)
-        self.upserter = DatabaseUpserter(self.client)
+        self.upserter = DatabaseUpserter(self.client, child_sync=child_sync, raw_data=raw_data)
 
         logger.info("BroadcastSaver initialized")
 
@@ -111,7 +141,28 @@ class BroadcastSaver:
             >>> data = {...}  # crawler output
             >>> result = saver.save_from_dict(data)
         """
-        return self.upserter.upsert_broadcast_data(crawler_data)
+        result = self.upserter.upsert_broadcast_data(crawler_data)
+        commit_comment_cursors([crawler_data], [result])
+        return result
+
+    def save_batch(self, crawler_data_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Save multiple broadcasts with combined requests per table
+
+        Args:
+            crawler_data_list: List of crawler outputs as dictionaries
+
+        Returns:
+            Dict with batch statistics and per-broadcast results (input order)
+
+        Example:
+            >>> saver = BroadcastSaver()
+            >>> result = saver.save_batch([data1, data2])
+            >>> print(f"Saved {result['successful']}/{result['total']}")
+        """
+        batch_result = self.upserter.upsert_batch(crawler_data_list)
+        commit_comment_cursors(crawler_data_list, batch_result['results'])
+        return batch_result
 
     def save_multiple(
         self,
@@ -163,7 +214,7 @@ class BroadcastSaver:
                 'results': []
             }
 
-        return self.upserter.upsert_batch(crawler_data_list)
+        return self.save_batch(crawler_data_list)
 
     def save_from_directory(
         self,
@@ -2,23 +2,65 @@
 Data transformer for converting crawler JSON to database schema
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+import hashlib
+import json
 import logging
+import zlib
+
+# zstandard is optional: raw_data='compressed' falls back to zlib without it
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
 class DataTransformer:
-    """Transform crawler JSON format to database-ready format"""
+    """
+    Transform crawler JSON format to database-ready format
+
+    The raw_data policy controls how much original JSON is stored next to the
+    normalized columns:
+        - full: the complete crawler JSON on the broadcast row and each source
+          item on its child row (default)
+        - slim: broadcast raw_data without the child arrays already normalized
+          into tables; child rows keep only source fields that have no column
+        - compressed: one compressed archive of the complete crawler JSON on the
+          broadcast row (raw_data_compressed, requires the column), nothing on child rows
+        - off: no raw_data at all
+    """
+
+    RAW_DATA_POLICIES = ('full', 'slim', 'compressed', 'off')
+
+    # Crawler broadcast arrays normalized into child tables
+    CHILD_ARRAYS = ('products', 'coupons', 'live_benefits', 'live_chat')
+
+    # Source fields stored in child table columns (dropped from slim raw_data)
+    PRODUCT_FIELDS = {
+        'product_id', 'name', 'brand_name', 'discount_rate', 'discounted_price', 'original_price',
+        'stock', 'image', 'image_url', 'link', 'link_url', 'review_count', 'delivery_fee'
+    }
+    COUPON_FIELDS = {
+        'title', 'benefit_type', 'benefit_unit', 'benefit_value', 'min_order_amount',
+        'max_discount_amount', 'valid_start', 'valid_end'
+    }
+    BENEFIT_FIELDS = {'id', 'benefit_id', 'message', 'detail', 'type', 'benefit_type'}
+    CHAT_FIELDS = {'nickname', 'message', 'created_at', 'comment_type'}
+
+    ZSTD_LEVEL = 10
 
-    @staticmethod
-    def transform_broadcast(crawler_data: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def transform_broadcast(cls, crawler_data: Dict[str, Any], raw_data: str = 'full') -> Dict[str, Any]:
         """
         Transform broadcast data from crawler JSON to DB schema
 
         Args:
             crawler_data: Complete crawler output with metadata and broadcast sections
+            raw_data: raw_data policy ('full', 'slim', 'compressed' or 'off')
 
         Returns:
             Dict: Broadcast data ready for database insertion
@@ -26,7 +68,7 @@ class DataTransformer:
         broadcast = crawler_data.get('broadcast', {})
         metadata = crawler_data.get('metadata', {})
 
-        return {
+        row = {
             'id': broadcast.get('broadcast_id'),
             'replay_url': broadcast.get('replay_url'),
             'broadcast_url': broadcast.get('broadcast_url'),
@@ -41,17 +83,34 @@ class DataTransformer:
             'status': broadcast.get('status'),
             'stand_by_image': broadcast.get('stand_by_image'),
             'broadcast_type': metadata.get('url_type'),
-            'raw_data': crawler_data  # Store complete original JSON
+            'raw_data': None
         }
 
-    @staticmethod
-    def transform_products(broadcast_id: int, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if raw_data == 'full':
+            row['raw_data'] = crawler_data  # Store complete original JSON
+        elif raw_data == 'slim':
+            row['raw_data'] = cls.slim_crawler_data(crawler_data)
+        elif raw_data == 'compressed':
+            blob, codec = cls.compress_raw_data(crawler_data)
+            row['raw_data_compressed'] = '\\x' + blob.hex()  # PostgREST bytea hex input
+            row['raw_data_codec'] = codec
+
+        return row
+
+    @classmethod
+    def transform_products(
+        cls,
+        broadcast_id: int,
+        products: List[Dict[str, Any]],
+        raw_data: str = 'full'
+    ) -> List[Dict[str, Any]]:
         """
         Transform products data from crawler JSON to DB schema
 
         Args:
             broadcast_id: Broadcast ID
             products: List of product dictionaries from crawler
+            raw_data: raw_data policy ('full', 'slim', 'compressed' or 'off')
 
         Returns:
             List[Dict]: Products data ready for database insertion
@@ -78,21 +137,27 @@ class DataTransformer:
                 'link_url': link_url,
                 'review_count': product.get('review_count'),
                 'delivery_fee': product.get('delivery_fee'),
-                'raw_data': product  # Store complete original product data
+                'raw_data': cls._child_raw_data(product, cls.PRODUCT_FIELDS, raw_data)
             }
 
             transformed_products.append(transformed_product)
 
         return transformed_products
 
-    @staticmethod
-    def transform_coupons(broadcast_id: int, coupons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @classmethod
+    def transform_coupons(
+        cls,
+        broadcast_id: int,
+        coupons: List[Dict[str, Any]],
+        raw_data: str = 'full'
+    ) -> List[Dict[str, Any]]:
         """
         Transform coupons data from crawler JSON to DB schema
 
         Args:
             broadcast_id: Broadcast ID
             coupons: List of coupon dictionaries from crawler
+            raw_data: raw_data policy ('full', 'slim', 'compressed' or 'off')
 
         Returns:
             List[Dict]: Coupons data ready for database insertion
@@ -110,21 +175,27 @@ class DataTransformer:
                 'max_discount_amount': coupon.get('max_discount_amount'),
                 'valid_start': coupon.get('valid_start'),
                 'valid_end': coupon.get('valid_end'),
-                'raw_data': coupon  # Store complete original coupon data
+                'raw_data': cls._child_raw_data(coupon, cls.COUPON_FIELDS, raw_data)
             }
 
             transformed_coupons.append(transformed_coupon)
 
         return transformed_coupons
 
-    @staticmethod
-    def transform_benefits(broadcast_id: int, benefits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @classmethod
+    def transform_benefits(
+        cls,
+        broadcast_id: int,
+        benefits: List[Dict[str, Any]],
+        raw_data: str = 'full'
+    ) -> List[Dict[str, Any]]:
         """
         Transform benefits data from crawler JSON to DB schema
 
         Args:
             broadcast_id: Broadcast ID
             benefits: List of benefit dictionaries from crawler
+            raw_data: raw_data policy ('full', 'slim', 'compressed' or 'off')
 
         Returns:
             List[Dict]: Benefits data ready for database insertion
@@ -144,21 +215,27 @@ class DataTransformer:
                 'message': benefit.get('message', ''),
                 'detail': benefit.get('detail'),
                 'benefit_type': benefit_type,
-                'raw_data': benefit  # Store complete original benefit data
+                'raw_data': cls._child_raw_data(benefit, cls.BENEFIT_FIELDS, raw_data)
             }
 
             transformed_benefits.append(transformed_benefit)
 
         return transformed_benefits
 
-    @staticmethod
-    def transform_chat(broadcast_id: int, chat_messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @classmethod
+    def transform_chat(
+        cls,
+        broadcast_id: int,
+        chat_messages: List[Dict[str, Any]],
+        raw_data: str = 'full'
+    ) -> List[Dict[str, Any]]:
         """
         Transform chat messages from crawler JSON to DB schema
 
         Args:
             broadcast_id: Broadcast ID
             chat_messages: List of chat message dictionaries from crawler
+            raw_data: raw_data policy ('full', 'slim', 'compressed' or 'off')
 
         Returns:
             List[Dict]: Chat messages ready for database insertion
@@ -172,7 +249,7 @@ class DataTransformer:
                 'message': message.get('message', ''),
                 'created_at_source': message.get('created_at'),
                 'comment_type': message.get('comment_type'),
-                'raw_data': message  # Store complete original message data
+                'raw_data': cls._child_raw_data(message, cls.CHAT_FIELDS, raw_data)
             }
 
             transformed_chat.append(transformed_message)
@@ -207,7 +284,7 @@ class DataTransformer:
         }
 
     @classmethod
-    def transform_all(cls, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_all(cls, crawler_data: Dict[str, Any], raw_data: str = 'full') -> Dict[str, Any]:
         """
         Transform complete crawler output to database-ready format
 
@@ -215,6 +292,7 @@ class DataTransformer:
 
         Args:
             crawler_data: Complete crawler output
+            raw_data: raw_data policy ('full', 'slim', 'compressed' or 'off')
 
         Returns:
             Dict containing all transformed data:
@@ -223,35 +301,184 @@ class DataTransformer:
                 - coupons: List of coupons
                 - benefits: List of benefits
                 - chat: List of chat messages
+                - chat_append: True if chat holds only new comments (append, keep stored history)
                 - metadata: Crawl metadata
+                - raw_data_report: Bytes saved by the raw_data policy (only when not 'full')
         """
+        if raw_data not in cls.RAW_DATA_POLICIES:
+            raise ValueError(f"raw_data must be one of {cls.RAW_DATA_POLICIES}, got '{raw_data}'")
+
         broadcast_data = crawler_data.get('broadcast', {})
         broadcast_id = broadcast_data.get('broadcast_id')
 
         if not broadcast_id:
             raise ValueError("Missing broadcast_id in crawler data")
 
-        return {
-            'broadcast': cls.transform_broadcast(crawler_data),
+        transformed = {
+            'broadcast': cls.transform_broadcast(crawler_data, raw_data),
             'products': cls.transform_products(
                 broadcast_id,
-                broadcast_data.get('products', [])
+                broadcast_data.get('products', []),
+                raw_data
             ),
             'coupons': cls.transform_coupons(
                 broadcast_id,
-                broadcast_data.get('coupons', [])
+                broadcast_data.get('coupons', []),
+                raw_data
             ),
             'benefits': cls.transform_benefits(
                 broadcast_id,
-                broadcast_data.get('live_benefits', [])
+                broadcast_data.get('live_benefits', []),
+                raw_data
             ),
             'chat': cls.transform_chat(
                 broadcast_id,
-                broadcast_data.get('live_chat', [])
+                broadcast_data.get('live_chat', []),
+                raw_data
             ),
+            'chat_append': bool(broadcast_data.get('live_chat_incremental')),
             'metadata': cls.transform_metadata(crawler_data)
         }
 
+        if raw_data != 'full':
+            transformed['raw_data_report'] = cls.raw_data_report(crawler_data, transformed, raw_data)
+
+        return transformed
+
+    @classmethod
+    def _child_raw_data(cls, item: Dict[str, Any], column_fields: set, raw_data: str) -> Optional[Dict[str, Any]]:
+        """raw_data of a child row under the policy (slim keeps only fields without a column)"""
+        if raw_data == 'full':
+            return item
+        if raw_data == 'slim':
+            rest = {k: v for k, v in item.items() if k not in column_fields}
+            return rest or None
+        return None
+
+    @classmethod
+    def slim_crawler_data(cls, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy of the crawler JSON without the child arrays normalized into tables
+
+        Args:
+            crawler_data: Complete crawler output
+
+        Returns:
+            Dict: Crawler output with broadcast products, coupons, live_benefits and live_chat removed
+        """
+        broadcast = crawler_data.get('broadcast', {})
+        return {
+            **crawler_data,
+            'broadcast': {k: v for k, v in broadcast.items() if k not in cls.CHILD_ARRAYS}
+        }
+
+    @classmethod
+    def compress_raw_data(cls, crawler_data: Dict[str, Any]) -> Tuple[bytes, str]:
+        """
+        Compress the crawler JSON for the raw_data_compressed column
+
+        Args:
+            crawler_data: Complete crawler output
+
+        Returns:
+            Tuple of (compressed bytes, codec: 'zstd' or 'zlib')
+        """
+        payload = json.dumps(crawler_data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+        if ZSTD_AVAILABLE:
+            return zstandard.ZstdCompressor(level=cls.ZSTD_LEVEL).compress(payload), 'zstd'
+        return zlib.compress(payload, 9), 'zlib'
+
+    @staticmethod
+    def decompress_raw_data(blob: bytes, codec: str) -> Dict[str, Any]:
+        """
+        Restore crawler JSON stored by the 'compressed' policy
+
+        Args:
+            blob: raw_data_compressed bytes (decode PostgREST's '\\x...' hex first)
+            codec: raw_data_codec value
+
+        Returns:
+            Dict: Original crawler output
+
+        Raises:
+            ValueError: If the codec is unknown or unavailable
+        """
+        if codec == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise ValueError("zstandard is required to read zstd raw_data (pip install zstandard)")
+            payload = zstandard.ZstdDecompressor().decompress(blob)
+        elif codec == 'zlib':
+            payload = zlib.decompress(blob)
+        else:
+            raise ValueError(f"Unknown raw_data codec: {codec}")
+        return json.loads(payload)
+
+    @classmethod
+    def raw_data_report(
+        cls,
+        crawler_data: Dict[str, Any],
+        transformed: Dict[str, Any],
+        raw_data: str
+    ) -> Dict[str, Any]:
+        """
+        Compare raw_data bytes under a policy with what the 'full' policy would store
+
+        Sizes are UTF-8 JSON bytes (compressed archives count their compressed size).
+
+        Args:
+            crawler_data: Complete crawler output
+            transformed: Output of transform_all with the policy applied
+            raw_data: raw_data policy used
+
+        Returns:
+            Dict with policy, full_bytes, stored_bytes, saved_bytes and saved_percent
+        """
+        broadcast = crawler_data.get('broadcast', {})
+        full_bytes = cls._json_size(crawler_data) + sum(
+            cls._json_size(item) for key in cls.CHILD_ARRAYS for item in broadcast.get(key) or []
+        )
+
+        broadcast_row = transformed['broadcast']
+        stored_bytes = (len(broadcast_row.get('raw_data_compressed', '')) - 2) // 2 if raw_data == 'compressed' else 0
+        stored_bytes += sum(
+            cls._json_size(row['raw_data'])
+            for rows in ([broadcast_row], transformed['products'], transformed['coupons'],
+                         transformed['benefits'], transformed['chat'])
+            for row in rows if row.get('raw_data') is not None
+        )
+
+        saved_bytes = full_bytes - stored_bytes
+        return {
+            'policy': raw_data,
+            'full_bytes': full_bytes,
+            'stored_bytes': stored_bytes,
+            'saved_bytes': saved_bytes,
+            'saved_percent': round(100 * saved_bytes / full_bytes, 1) if full_bytes else 0.0
+        }
+
+    @staticmethod
+    def _json_size(value: Any) -> int:
+        """UTF-8 size of a value as compact JSON"""
+        return len(json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8'))
+
+    @staticmethod
+    def content_hash(row: Dict[str, Any]) -> str:
+        """
+        Compute a stable content hash for a child record
+
+        Excludes broadcast_id, id and content_hash so identical rows hash the same
+        across recrawls.
+
+        Args:
+            row: Transformed child record
+
+        Returns:
+            str: SHA-1 hex digest of the canonical JSON
+        """
+        content = {k: v for k, v in row.items() if k not in ('id', 'broadcast_id', 'content_hash')}
+        canonical = json.dumps(content, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
     @staticmethod
     def clean_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
         """
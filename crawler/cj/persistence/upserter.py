@@ -4,13 +4,11 @@ Database upserter with retry logic and transaction support
 
 import time
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from functools import wraps
-from datetime import datetime
 
-from .client import SupabaseClient
-from .transformer import DataTransformer
-from .validator import SchemaValidator
+from .base_upserter import BaseUpserter, Chunk
 
 logger = logging.getLogger(__name__)
 
@@ -51,18 +49,9 @@ def retry_with_backoff(max_retries=3, base_delay=1):
     return decorator
 
 
-class DatabaseUpserter:
+class DatabaseUpserter(BaseUpserter):
     """Insert/update records in Supabase with error handling and retries"""
 
-    def __init__(self, client: SupabaseClient):
-        """
-        Initialize database upserter
-
-        Args:
-            client: SupabaseClient instance
-        """
-        self.client = client
-
     @retry_with_backoff(max_retries=3, base_delay=1)
     def upsert_broadcast(self, broadcast_data: Dict[str, Any]) -> bool:
         """
@@ -95,7 +84,63 @@ class DatabaseUpserter:
             raise
 
     @retry_with_backoff(max_retries=3, base_delay=1)
-    def delete_child_records(self, broadcast_id: int):
+    def upsert_broadcasts(self, broadcasts: List[Dict[str, Any]]) -> int:
+        """
+        Upsert multiple broadcast records in a single request
+
+        Args:
+            broadcasts: List of broadcast data dictionaries (unique ids)
+
+        Returns:
+            int: Number of broadcasts upserted
+
+        Raises:
+            Exception: If upsert fails after retries
+        """
+        if not broadcasts:
+            return 0
+
+        try:
+            response = self.client.client.table('broadcasts').upsert(
+                broadcasts,
+                on_conflict='id'
+            ).execute()
+
+            count = len(response.data) if response.data else 0
+            logger.info(f"✓ Upserted {count} broadcasts in one request")
+            return count
+
+        except Exception as e:
+            logger.error(f"✗ Failed to bulk upsert {len(broadcasts)} broadcasts: {e}")
+            raise
+
+    @retry_with_backoff(max_retries=3, base_delay=1)
+    def delete_child_records_bulk(self, broadcast_ids: List[int], chat_ids: Optional[List[int]] = None):
+        """
+        Delete existing child records for multiple broadcasts (one request per table)
+
+        Args:
+            broadcast_ids: List of broadcast IDs
+            chat_ids: Broadcasts whose chat is deleted too (default: all; incremental chat is kept)
+
+        Raises:
+            Exception: If deletion fails after retries
+        """
+        if not broadcast_ids:
+            return
+
+        chat_ids = broadcast_ids if chat_ids is None else chat_ids
+        if chat_ids:
+            self.client.client.table('broadcast_chat').delete().in_('broadcast_id', chat_ids).execute()
+
+        # Delete in reverse dependency order
+        for table in ('broadcast_benefits', 'broadcast_coupons', 'broadcast_products'):
+            self.client.client.table(table).delete().in_('broadcast_id', broadcast_ids).execute()
+
+        logger.debug(f"Deleted existing child records for {len(broadcast_ids)} broadcasts")
+
+    @retry_with_backoff(max_retries=3, base_delay=1)
+    def delete_child_records(self, broadcast_id: int, include_chat: bool = True):
         """
         Delete existing child records for a broadcast
 
@@ -103,13 +148,15 @@ class DatabaseUpserter:
 
         Args:
             broadcast_id: Broadcast ID
+            include_chat: Also delete chat (False when appending incremental chat)
 
         Raises:
             Exception: If deletion fails after retries
         """
         try:
             # Delete in reverse dependency order
-            self.client.client.table('broadcast_chat').delete().eq('broadcast_id', broadcast_id).execute()
+            if include_chat:
+                self.client.client.table('broadcast_chat').delete().eq('broadcast_id', broadcast_id).execute()
             self.client.client.table('broadcast_benefits').delete().eq('broadcast_id', broadcast_id).execute()
             self.client.client.table('broadcast_coupons').delete().eq('broadcast_id', broadcast_id).execute()
             self.client.client.table('broadcast_products').delete().eq('broadcast_id', broadcast_id).execute()
@@ -121,51 +168,24 @@ class DatabaseUpserter:
             # Don't raise - continue with insertion even if deletion fails
             # (e.g., first time saving this broadcast)
 
-    @retry_with_backoff(max_retries=3, base_delay=1)
     def insert_products(self, products: List[Dict[str, Any]]) -> int:
         """
-        Insert product records
+        Insert product records (chunked, see insert_chunked)
 
         Args:
-            products: List of product dictionaries
+            products: List of product dictionaries (rows without product_id are skipped)
 
         Returns:
             int: Number of products inserted
 
         Raises:
-            Exception: If insertion fails after retries
+            ChunkedInsertError: If some chunks still fail after retries
         """
-        if not products:
-            logger.debug("No products to insert")
-            return 0
+        return self._insert_rows('products', products)
 
-        try:
-            # Filter out products without product_id (required for unique constraint)
-            valid_products = [p for p in products if p.get('product_id')]
-
-            if not valid_products:
-                logger.warning(f"All {len(products)} products missing product_id, skipping insertion")
-                return 0
-
-            if len(valid_products) < len(products):
-                logger.warning(
-                    f"Skipping {len(products) - len(valid_products)} products without product_id"
-                )
-
-            response = self.client.client.table('broadcast_products').insert(valid_products).execute()
-
-            count = len(response.data) if response.data else 0
-            logger.info(f"✓ Inserted {count} products")
-            return count
-
-        except Exception as e:
-            logger.error(f"✗ Failed to insert products: {e}")
-            raise
-
-    @retry_with_backoff(max_retries=3, base_delay=1)
     def insert_coupons(self, coupons: List[Dict[str, Any]]) -> int:
         """
-        Insert coupon records
+        Insert coupon records (chunked, see insert_chunked)
 
         Args:
             coupons: List of coupon dictionaries
@@ -174,27 +194,13 @@ class DatabaseUpserter:
             int: Number of coupons inserted
 
         Raises:
-            Exception: If insertion fails after retries
+            ChunkedInsertError: If some chunks still fail after retries
         """
-        if not coupons:
-            logger.debug("No coupons to insert")
-            return 0
-
-        try:
-            response = self.client.client.table('broadcast_coupons').insert(coupons).execute()
+        return self._insert_rows('coupons', coupons)
 
-            count = len(response.data) if response.data else 0
-            logger.info(f"✓ Inserted {count} coupons")
-            return count
-
-        except Exception as e:
-            logger.error(f"✗ Failed to insert coupons: {e}")
-            raise
-
-    @retry_with_backoff(max_retries=3, base_delay=1)
     def insert_benefits(self, benefits: List[Dict[str, Any]]) -> int:
         """
-        Insert benefit records
+        Insert benefit records (chunked, see insert_chunked)
 
         Args:
             benefits: List of benefit dictionaries
@@ -203,27 +209,13 @@ class DatabaseUpserter:
             int: Number of benefits inserted
 
         Raises:
-            Exception: If insertion fails after retries
+            ChunkedInsertError: If some chunks still fail after retries
         """
-        if not benefits:
-            logger.debug("No benefits to insert")
-            return 0
-
-        try:
-            response = self.client.client.table('broadcast_benefits').insert(benefits).execute()
+        return self._insert_rows('benefits', benefits)
 
-            count = len(response.data) if response.data else 0
-            logger.info(f"✓ Inserted {count} benefits")
-            return count
-
-        except Exception as e:
-            logger.error(f"✗ Failed to insert benefits: {e}")
-            raise
-
-    @retry_with_backoff(max_retries=3, base_delay=1)
     def insert_chat(self, chat_messages: List[Dict[str, Any]]) -> int:
         """
-        Insert chat message records
+        Insert chat message records (chunked, see insert_chunked)
 
         Args:
             chat_messages: List of chat message dictionaries
@@ -232,30 +224,89 @@ class DatabaseUpserter:
             int: Number of chat messages inserted
 
         Raises:
-            Exception: If insertion fails after retries
+            ChunkedInsertError: If some chunks still fail after retries
         """
-        if not chat_messages:
-            logger.debug("No chat messages to insert")
+        return self._insert_rows('chat', chat_messages)
+
+    def _insert_rows(self, key: str, rows: List[Dict[str, Any]]) -> int:
+        """Insert rows into the child table for `key` (see insert_chunked)"""
+        insertable = self.insertable_rows(key, rows)
+        if len(insertable) < len(rows):
+            logger.warning(f"Skipping {len(rows) - len(insertable)} products without product_id")
+        rows = insertable
+        if not rows:
+            logger.debug(f"No {self.CHILD_LABELS[key]} to insert")
             return 0
+        return self.insert_chunked(self.CHILD_TABLES[key][0], rows, self.CHILD_LABELS[key])
+
+    def insert_chunked(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        label: str,
+        on_conflict: Optional[str] = None
+    ) -> int:
+        """
+        Insert rows in size-bounded chunks, in parallel, retrying only failed chunks
 
-        try:
-            response = self.client.client.table('broadcast_chat').insert(chat_messages).execute()
+        Chunks run on up to INSERT_CONCURRENCY threads. After each round, chunks
+        that failed with a transient error are halved and retried with
+        exponential backoff (up to INSERT_CHUNK_RETRIES rounds). Successful chunks
+        are never resent, so rows are not duplicated.
 
-            count = len(response.data) if response.data else 0
-            logger.info(f"✓ Inserted {count} chat messages")
-            return count
+        Args:
+            table: Table name
+            rows: Rows to insert
+            label: Row kind for log messages (e.g. 'chat messages')
+            on_conflict: Upsert on this column instead of inserting (e.g. 'id' to update rows in place)
 
-        except Exception as e:
-            logger.error(f"✗ Failed to insert chat messages: {e}")
-            raise
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            ChunkedInsertError: If some chunks still fail after retries
+        """
+        pending = self.plan_chunks(rows, label)
+        inserted = 0
+        failed: List[Tuple[Chunk, Exception]] = []
+        for attempt in range(self.INSERT_CHUNK_RETRIES):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(self.retry_delay(attempt, pending, label))
+            outcomes = self._run_insert_chunks(table, pending, on_conflict)
+            written, pending = self.settle_round(attempt, pending, outcomes, failed)
+            inserted += written
+        return self.chunked_result(label, inserted, failed)
+
+    def _run_insert_chunks(
+        self,
+        table: str,
+        chunks: List[Chunk],
+        on_conflict: Optional[str] = None
+    ) -> List[Union[int, Exception]]:
+        """Write chunks on a bounded thread pool; returns rows written or the exception, per chunk"""
+        def insert(chunk: Chunk) -> Union[int, Exception]:
+            try:
+                query = self.client.client.table(table)
+                query = query.upsert(chunk, on_conflict=on_conflict) if on_conflict else query.insert(chunk)
+                response = query.execute()
+                return len(response.data) if response.data else 0
+            except Exception as e:
+                return e
+
+        if len(chunks) == 1:
+            return [insert(chunks[0])]
+        with ThreadPoolExecutor(max_workers=min(self.INSERT_CONCURRENCY, len(chunks))) as executor:
+            return list(executor.map(insert, chunks))
 
     @retry_with_backoff(max_retries=3, base_delay=1)
-    def insert_metadata(self, metadata: Dict[str, Any]) -> bool:
+    def insert_metadata(self, metadata: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
         """
-        Insert crawl metadata record
+        Insert crawl metadata record(s)
 
         Args:
-            metadata: Metadata dictionary
+            metadata: Metadata dictionary, or list of dictionaries for a bulk insert
 
         Returns:
             bool: True if successful
@@ -277,6 +328,41 @@ class DatabaseUpserter:
             logger.error(f"✗ Failed to insert metadata: {e}")
             raise
 
+    def resolve_brand_id(
+        self,
+        brand_name: Optional[str],
+        cache: Optional[Dict[str, Optional[str]]] = None
+    ) -> Optional[str]:
+        """
+        Look up brand_id for a brand name
+
+        Args:
+            brand_name: Brand name extracted by the crawler
+            cache: Optional dict reused across a batch so each name is looked up once
+
+        Returns:
+            Brand ID, or None if not found
+        """
+        if not brand_name:
+            logger.warning("⚠ No brand_name extracted - brand_id will be null")
+            return None
+
+        if cache is not None and brand_name in cache:
+            return cache[brand_name]
+
+        logger.debug(f"Looking up brand_id for brand_name: '{brand_name}'")
+        brand = self.client.get_brand_by_name(brand_name)
+        brand_id = brand.get('id') if brand else None
+
+        if brand_id:
+            logger.debug(f"✓ Found brand_id: {brand_id} for brand_name: '{brand_name}'")
+        else:
+            logger.warning(f"⚠ Brand not found in database: '{brand_name}' - brand_id will be null")
+
+        if cache is not None:
+            cache[brand_name] = brand_id
+        return brand_id
+
     def upsert_broadcast_data(self, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Upsert complete broadcast data (broadcast + all child records)
@@ -304,39 +390,21 @@ class DatabaseUpserter:
         try:
             # Transform data
             logger.info("Transforming crawler data to database format...")
-            transformed = DataTransformer.transform_all(crawler_data)
+            transformed = self.transform(crawler_data)
 
             broadcast_id = transformed['broadcast']['id']
             logger.info(f"Processing broadcast {broadcast_id}: {transformed['broadcast'].get('title', '')[:50]}...")
 
             # Look up brand_id from brand_name
-            brand_name = transformed['broadcast'].get('brand_name')
-            if brand_name:
-                logger.debug(f"Looking up brand_id for brand_name: '{brand_name}'")
-                brand = self.client.get_brand_by_name(brand_name)
-                if brand:
-                    brand_id = brand.get('id')
-                    transformed['broadcast']['brand_id'] = brand_id
-                    logger.debug(f"✓ Found brand_id: {brand_id} for brand_name: '{brand_name}'")
-                else:
-                    logger.warning(f"⚠ Brand not found in database: '{brand_name}' - brand_id will be null")
-                    transformed['broadcast']['brand_id'] = None
-            else:
-                logger.warning("⚠ No brand_name extracted - brand_id will be null")
-                transformed['broadcast']['brand_id'] = None
+            transformed['broadcast']['brand_id'] = self.resolve_brand_id(
+                transformed['broadcast'].get('brand_name')
+            )
 
             # Validate data
             logger.info("Validating data...")
-            valid, errors = SchemaValidator.validate_all(transformed)
-
-            if not valid:
-                logger.error(f"Validation errors found: {errors}")
-                return {
-                    'status': 'error',
-                    'broadcast_id': broadcast_id,
-                    'error': 'Validation failed',
-                    'validation_errors': errors
-                }
+            error = self.validation_error(transformed)
+            if error:
+                return error
 
             # Start saving (this is not a real transaction, but we handle errors per-operation)
             logger.info("Saving data to database...")
@@ -345,50 +413,30 @@ class DatabaseUpserter:
             logger.debug(f"Upserting broadcast {broadcast_id}...")
             self.upsert_broadcast(transformed['broadcast'])
 
-            # 2. Delete old child records
-            self.delete_child_records(broadcast_id)
+            child_writes = None
+            if self.child_sync == 'diff':
+                # 2-3. Sync child records by content hash (only changed rows are written)
+                counts, child_errors, writes = self.sync_child_records({broadcast_id: transformed})
+                if child_errors:
+                    raise Exception('; '.join(child_errors[broadcast_id]))
+                records_saved = counts[broadcast_id]
+                child_writes = writes[broadcast_id]
+            else:
+                # 2. Delete old child records
+                self.delete_child_records(broadcast_id, include_chat=not transformed['chat_append'])
 
-            # 3. Insert new child records
-            products_count = self.insert_products(transformed['products'])
-            coupons_count = self.insert_coupons(transformed['coupons'])
-            benefits_count = self.insert_benefits(transformed['benefits'])
-            chat_count = self.insert_chat(transformed['chat'])
+                # 3. Insert new child records
+                records_saved = {key: self._insert_rows(key, transformed[key]) for key in self.CHILD_TABLES}
 
             # 4. Insert metadata
             self.insert_metadata(transformed['metadata'])
 
-            # Calculate duration
-            duration = time.time() - start_time
-
-            result = {
-                'status': 'success',
-                'broadcast_id': broadcast_id,
-                'records_saved': {
-                    'products': products_count,
-                    'coupons': coupons_count,
-                    'benefits': benefits_count,
-                    'chat': chat_count
-                },
-                'duration_seconds': round(duration, 2)
-            }
-
-            logger.info(f"✓ Successfully saved broadcast {broadcast_id} in {duration:.2f}s")
-            logger.info(f"  Products: {products_count}, Coupons: {coupons_count}, "
-                       f"Benefits: {benefits_count}, Chat: {chat_count}")
-
-            return result
+            return self.success_result(transformed, records_saved, time.time() - start_time, child_writes)
 
         except Exception as e:
             # Log error to database if possible
             try:
-                error_metadata = {
-                    'broadcast_id': crawler_data['broadcast']['broadcast_id'],
-                    'source_url': crawler_data['metadata']['source_url'],
-                    'crawled_at': crawler_data['metadata']['crawled_at'],
-                    'status': 'error',
-                    'error_message': str(e)
-                }
-                self.client.client.table('crawl_metadata').insert(error_metadata).execute()
+                self.client.client.table('crawl_metadata').insert(self.error_metadata(crawler_data, e)).execute()
             except Exception as meta_error:
                 logger.warning(f"Failed to save error metadata: {meta_error}")
 
@@ -398,51 +446,290 @@ class DatabaseUpserter:
             import traceback
             logger.debug(f"Full traceback:\n{traceback.format_exc()}")
 
-            return {
-                'status': 'error',
-                'broadcast_id': crawler_data.get('broadcast', {}).get('broadcast_id'),
-                'error': str(e),
-                'error_type': type(e).__name__,
-                'duration_seconds': round(time.time() - start_time, 2)
-            }
+            return self.error_result(crawler_data, e, time.time() - start_time)
 
-    def upsert_batch(self, crawler_data_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def upsert_batch(self, crawler_data_list: List[Dict[str, Any]], bulk: bool = True) -> Dict[str, Any]:
         """
         Upsert multiple broadcasts efficiently
 
+        Bulk mode resolves each brand once, upserts all broadcasts in one request,
+        deletes children with one `in` filter per table and inserts each child table
+        in one combined request. If a combined request fails, that step is retried
+        per broadcast so errors are attributed to the broadcasts that caused them.
+
         Args:
             crawler_data_list: List of crawler output JSONs
+            bulk: Use combined requests (default: True); False saves one broadcast at a time
 
         Returns:
             Dict with batch statistics:
                 - total: Total number of broadcasts
                 - successful: Number successfully saved
                 - failed: Number that failed
-                - results: List of individual results
+                - results: List of individual results (same order as input)
         """
         logger.info(f"Starting batch upsert for {len(crawler_data_list)} broadcasts...")
 
-        results = []
-        successful = 0
-        failed = 0
+        if bulk:
+            results = self._upsert_batch_bulk(crawler_data_list)
+        else:
+            results = []
+            for i, crawler_data in enumerate(crawler_data_list, 1):
+                broadcast_id = crawler_data.get('broadcast', {}).get('broadcast_id', 'unknown')
+                logger.info(f"Processing broadcast {i}/{len(crawler_data_list)}: {broadcast_id}")
+                results.append(self.upsert_broadcast_data(crawler_data))
 
-        for i, crawler_data in enumerate(crawler_data_list, 1):
-            broadcast_id = crawler_data.get('broadcast', {}).get('broadcast_id', 'unknown')
-            logger.info(f"Processing broadcast {i}/{len(crawler_data_list)}: {broadcast_id}")
+        return self.batch_summary(results)
 
-            result = self.upsert_broadcast_data(crawler_data)
-            results.append(result)
+    def _upsert_batch_bulk(self, crawler_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Save a batch with combined requests per table
 
-            if result['status'] == 'success':
-                successful += 1
-            else:
-                failed += 1
+        Args:
+            crawler_data_list: List of crawler output JSONs
+
+        Returns:
+            List of per-broadcast results (same order as input)
+        """
+        start_time = time.time()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(crawler_data_list)
+
+        # 1. Transform, resolve brands (once per name) and validate
+        transformed_list = self.transform_batch(crawler_data_list, results)
+        brand_cache: Dict[str, Optional[str]] = {}
+        for _, transformed in transformed_list:
+            transformed['broadcast']['brand_id'] = self.resolve_brand_id(
+                transformed['broadcast'].get('brand_name'), cache=brand_cache
+            )
+        prepared, index_by_id = self.collect_prepared(transformed_list, results)
+
+        if not prepared:
+            return results
+
+        # 2. Upsert all broadcasts in one request (fall back to the per-broadcast path on failure)
+        try:
+            self.upsert_broadcasts([t['broadcast'] for t in prepared.values()])
+        except Exception as e:
+            logger.warning(f"⚠ Bulk broadcast upsert failed, saving one by one: {e}")
+            for broadcast_id, i in index_by_id.items():
+                results[i] = self.upsert_broadcast_data(crawler_data_list[i])
+            return results
+
+        broadcast_ids = list(prepared)
+        writes: Dict[int, Dict[str, int]] = {}
+        if self.child_sync == 'diff':
+            # 3-4. Sync child records by content hash (combined requests per table)
+            counts, child_errors, writes = self.sync_child_records(prepared)
+        else:
+            # 3. Delete old child records (one request per table)
+            try:
+                self.delete_child_records_bulk(
+                    broadcast_ids,
+                    chat_ids=[broadcast_id for broadcast_id, t in prepared.items() if not t['chat_append']]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to bulk delete child records: {e}")
+
+            # 4. Insert each child table in one combined request
+            child_errors: Dict[int, List[str]] = {}
+            counts: Dict[int, Dict[str, int]] = {broadcast_id: {} for broadcast_id in broadcast_ids}
+            for key in self.CHILD_TABLES:
+                self._insert_children_combined(key, prepared, counts, child_errors)
+
+        # 5. Insert metadata for all broadcasts (errors recorded on the row)
+        try:
+            self.insert_metadata(self.metadata_rows(prepared, child_errors))
+        except Exception as e:
+            logger.warning(f"Failed to insert crawl metadata for batch: {e}")
 
-        logger.info(f"Batch upsert complete: {successful} successful, {failed} failed")
+        duration = round(time.time() - start_time, 2)
+        self.bulk_results(results, prepared, index_by_id, counts, child_errors, writes, duration)
 
-        return {
-            'total': len(crawler_data_list),
-            'successful': successful,
-            'failed': failed,
-            'results': results
-        }
+        logger.info(f"✓ Bulk saved {len(prepared)} broadcasts in {duration:.2f}s")
+        return results
+
+    def _insert_children_combined(
+        self,
+        key: str,
+        prepared: Dict[int, Dict[str, Any]],
+        counts: Dict[int, Dict[str, int]],
+        child_errors: Dict[int, List[str]]
+    ):
+        """
+        Insert one child table for all broadcasts, retrying per broadcast on failure
+
+        Args:
+            key: Transformed data key ('products', 'coupons', 'benefits', 'chat')
+            prepared: broadcast_id -> transformed data
+            counts: broadcast_id -> {key: rows inserted} (updated in place)
+            child_errors: broadcast_id -> error messages (updated in place)
+        """
+        rows = [row for transformed in prepared.values() for row in transformed[key]]
+        try:
+            self._insert_rows(key, rows)
+            for broadcast_id, transformed in prepared.items():
+                counts[broadcast_id][key] = len(self.insertable_rows(key, transformed[key]))
+            return
+        except Exception as e:
+            logger.warning(f"⚠ Combined {key} insert failed, retrying per broadcast: {e}")
+            failed = self._failed_rows_by_broadcast(key, prepared, e)
+
+        # Attribute the error to specific broadcasts, resending only rows of failed chunks
+        for broadcast_id, transformed in prepared.items():
+            stored = len(self.insertable_rows(key, transformed[key]))
+            stored -= len(self.insertable_rows(key, failed[broadcast_id]))
+            if not failed[broadcast_id]:
+                counts[broadcast_id][key] = stored
+                continue
+            try:
+                counts[broadcast_id][key] = stored + self._insert_rows(key, failed[broadcast_id])
+            except Exception as e:
+                counts[broadcast_id][key] = stored + getattr(e, 'inserted', 0)
+                child_errors.setdefault(broadcast_id, []).append(f"{key}: {e}")
+
+    def sync_child_records(
+        self,
+        prepared: Dict[int, Dict[str, Any]]
+    ) -> Tuple[Dict[int, Dict[str, int]], Dict[int, List[str]], Dict[int, Dict[str, int]]]:
+        """
+        Diff-sync child tables against stored content hashes
+
+        For each table, stored (id, content_hash) rows are fetched for all broadcasts.
+        Rows with an identical hash are left alone; changed rows update a stale row in
+        place (paired by natural key first), and only the remainder is inserted or deleted.
+        Deletes, updates and inserts are one combined request each per table. If a
+        table's combined sync fails, it is retried per broadcast for error attribution.
+        Incremental chat (chat_append) is inserted as-is without touching stored rows.
+
+        Args:
+            prepared: broadcast_id -> transformed data (from DataTransformer.transform_all)
+
+        Returns:
+            Tuple of:
+                - counts: broadcast_id -> {key: rows now stored}
+                - child_errors: broadcast_id -> error messages
+                - writes: broadcast_id -> {'inserted', 'updated', 'deleted', 'unchanged'}
+        """
+        counts, child_errors, writes = self.new_sync_state(prepared)
+
+        for key, (table, natural_key) in self.CHILD_TABLES.items():
+            fresh_by_broadcast, append_ids = self.fresh_child_rows(key, prepared)
+
+            try:
+                table_writes = self._sync_table(table, natural_key, fresh_by_broadcast, append_ids)
+            except Exception as e:
+                if len(fresh_by_broadcast) == 1:
+                    broadcast_id = next(iter(fresh_by_broadcast))
+                    child_errors.setdefault(broadcast_id, []).append(f"{key}: {e}")
+                    counts[broadcast_id][key] = 0
+                    continue
+
+                logger.warning(f"⚠ Combined {key} sync failed, retrying per broadcast: {e}")
+                table_writes = {}
+                for broadcast_id, rows in fresh_by_broadcast.items():
+                    try:
+                        table_writes.update(self._sync_table(table, natural_key, {broadcast_id: rows}, append_ids))
+                    except Exception as e:
+                        child_errors.setdefault(broadcast_id, []).append(f"{key}: {e}")
+
+            self.tally_table(key, fresh_by_broadcast, table_writes, counts, writes)
+
+        self.log_sync_totals(writes)
+        return counts, child_errors, writes
+
+    def _sync_table(
+        self,
+        table: str,
+        natural_key: Optional[str],
+        fresh_by_broadcast: Dict[int, List[Dict[str, Any]]],
+        append_ids: Optional[Set[int]] = None
+    ) -> Dict[int, Dict[str, int]]:
+        """
+        Diff-sync one child table for a set of broadcasts (see plan_table)
+
+        Args:
+            table: Child table name
+            natural_key: Column used to pair changed rows with stale rows (or None)
+            fresh_by_broadcast: broadcast_id -> fresh rows with content_hash
+            append_ids: Broadcasts whose fresh rows are only appended (stored rows kept)
+
+        Returns:
+            broadcast_id -> {'inserted', 'updated', 'deleted', 'unchanged'}
+
+        Raises:
+            Exception: If a request fails after retries
+        """
+        append_ids = append_ids or set()
+        diff_ids = self.diff_ids(fresh_by_broadcast, append_ids)
+        stored_rows = self._fetch_child_hashes(table, natural_key, diff_ids) if diff_ids else []
+        deletes, updates, inserts, table_writes = self.plan_table(
+            natural_key, fresh_by_broadcast, stored_rows, append_ids
+        )
+
+        # Deletes first so freed natural keys can be reused by updates/inserts
+        self._delete_child_rows(table, deletes)
+        self._write_child_rows(table, updates, update=True)
+        self._write_child_rows(table, inserts, update=False)
+
+        logger.debug(
+            f"{table}: {len(inserts)} inserted, {len(updates)} updated, {len(deletes)} deleted"
+        )
+        return table_writes
+
+    @retry_with_backoff(max_retries=3, base_delay=1)
+    def _fetch_child_hashes(
+        self,
+        table: str,
+        natural_key: Optional[str],
+        broadcast_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch id, broadcast_id, content_hash (and natural key) of stored child rows
+
+        Args:
+            table: Child table name
+            natural_key: Extra column to select (or None)
+            broadcast_ids: Broadcast IDs to fetch
+
+        Returns:
+            List of stored row summaries
+        """
+        columns = self.hash_columns(natural_key)
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+
+        while True:
+            response = (
+                self.client.client.table(table)
+                .select(columns)
+                .in_('broadcast_id', broadcast_ids)
+                .order('id')
+                .range(offset, offset + self.FETCH_PAGE_SIZE - 1)
+                .execute()
+            )
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < self.FETCH_PAGE_SIZE:
+                return rows
+            offset += self.FETCH_PAGE_SIZE
+
+    @retry_with_backoff(max_retries=3, base_delay=1)
+    def _delete_child_rows(self, table: str, ids: List[int]):
+        """Delete child rows by primary key (chunked to keep URLs short)"""
+        for i in range(0, len(ids), self.DELETE_CHUNK_SIZE):
+            self.client.client.table(table).delete().in_('id', ids[i:i + self.DELETE_CHUNK_SIZE]).execute()
+
+    def _write_child_rows(self, table: str, rows: List[Dict[str, Any]], update: bool):
+        """
+        Insert child rows, or update them in place by id (upsert on primary key)
+
+        Both go through insert_chunked, so large diffs respect the row and byte
+        budgets and only failed chunks are retried.
+
+        Raises:
+            ChunkedInsertError: If some chunks still fail after retries
+        """
+        if not rows:
+            return
+        label = f"{'updated' if update else 'new'} {table} rows"
+        self.insert_chunked(table, rows, label, on_conflict='id' if update else None)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of embedded JSON extraction over saved HTML pages
+
+Compares the former full-document regex extraction with EmbeddedJSONExtractor
+(str.find boundaries, memoryview slicing, orjson when installed) for every
+target found in each page, plus the streaming path fed with fixed-size chunks.
+
+Usage:
+    python scripts/bench_embedded_json.py pages/*.html
+    python scripts/bench_embedded_json.py --dir output/pages --repeat 200
+    python scripts/bench_embedded_json.py page.html --chunk-size 16384
+"""
+
+import sys
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from extractors.embedded_json import EmbeddedJSONExtractor, ORJSON_AVAILABLE
+
+
+ASSIGNMENT_TARGETS = ('window.__viewerConfig.broadcast', 'window.__shortclip')
+
+
+# ==================== Former implementations (baseline) ====================
+
+def legacy_unescape_js_string(s: str) -> str:
+    """Former per-call escape map + re.sub unescape"""
+    escape_map = {
+        r'\"': '"', r'\/': '/', r'\\': '\\', r'\n': '\n',
+        r'\r': '\r', r'\t': '\t', r'\b': '\b', r'\f': '\f',
+    }
+    return re.sub(r'\\["\\/nrtbf]', lambda match: escape_map.get(match.group(0), match.group(0)), s)
+
+
+def legacy_next_data(html: str):
+    """Former LivebridgeCrawler._extract_next_data"""
+    matches = re.findall(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.DOTALL)
+    return json.loads(matches[0]) if matches else None
+
+
+def legacy_assignment(html: str, target: str):
+    """Former JSONExtractor quoted / object regexes"""
+    name = re.escape(target)
+    match = re.search(rf'{name}\s*=\s*\'(.+?)\'\s*;', html, re.DOTALL)
+    if match:
+        return json.loads(legacy_unescape_js_string(match.group(1)))
+    match = re.search(rf'{name}\s*=\s*(\{{.+?\}});', html, re.DOTALL)
+    return json.loads(match.group(1)) if match else None
+
+
+# ==================== Timing ====================
+
+def time_call(func: Callable, repeat: int) -> float:
+    """Median wall time of func() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def stream_call(data: bytes, chunk_size: int, extract: Callable):
+    """Run a streaming extraction over data split into chunks"""
+    async def chunks():
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
+    return asyncio.run(extract(chunks()))
+
+
+def bench_page(path: Path, repeat: int, chunk_size: int) -> List[Tuple[str, float, float, float, float]]:
+    """
+    Benchmark every target present in one page
+
+    Returns:
+        Rows of (target, legacy ms, str ms, bytes ms, stream ms)
+    """
+    data = path.read_bytes()
+    html = data.decode('utf-8', errors='replace')
+    rows = []
+
+    if EmbeddedJSONExtractor.script_json(data) is not None:
+        assert EmbeddedJSONExtractor.script_json(html) == legacy_next_data(html), "__NEXT_DATA__ mismatch"
+        rows.append((
+            '__NEXT_DATA__',
+            time_call(lambda: legacy_next_data(html), repeat),
+            time_call(lambda: EmbeddedJSONExtractor.script_json(html), repeat),
+            time_call(lambda: EmbeddedJSONExtractor.script_json(data), repeat),
+            time_call(lambda: stream_call(data, chunk_size, EmbeddedJSONExtractor.stream_script_json), repeat),
+        ))
+
+    for target in ASSIGNMENT_TARGETS:
+        if EmbeddedJSONExtractor.assignment_json(data, target) is None:
+            continue
+        assert EmbeddedJSONExtractor.assignment_json(html, target) == legacy_assignment(html, target), f"{target} mismatch"
+        rows.append((
+            target,
+            time_call(lambda: legacy_assignment(html, target), repeat),
+            time_call(lambda: EmbeddedJSONExtractor.assignment_json(html, target), repeat),
+            time_call(lambda: EmbeddedJSONExtractor.assignment_json(data, target), repeat),
+            time_call(lambda: stream_call(
+                data, chunk_size, lambda chunks: EmbeddedJSONExtractor.stream_assignment_json(chunks, target)
+            ), repeat),
+        ))
+
+    return rows
+
+
+def display_results(results: Dict[Path, List[Tuple[str, float, float, float, float]]]):
+    """Print a per-page, per-target timing table"""
+    print("\n" + "="*100)
+    print(f"EMBEDDED JSON EXTRACTION (orjson: {'yes' if ORJSON_AVAILABLE else 'no'}) - median ms")
+    print("="*100)
+    print(f"{'page':<30} {'target':<34} {'regex':>8} {'str':>8} {'bytes':>8} {'stream':>8} {'speedup':>8}")
+
+    for path, rows in results.items():
+        if not rows:
+            print(f"{path.name[:30]:<30} (no embedded JSON found)")
+        for target, legacy, text, raw, streamed in rows:
+            speedup = legacy / raw if raw else 0
+            print(f"{path.name[:30]:<30} {target:<34} {legacy:>8.3f} {text:>8.3f} {raw:>8.3f} {streamed:>8.3f} {speedup:>7.1f}x")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark embedded JSON extraction over saved HTML pages')
+    parser.add_argument('files', nargs='*', help='Saved HTML pages')
+    parser.add_argument('--dir', help='Directory of saved pages (*.html)')
+    parser.add_argument('--repeat', type=int, default=50, help='Runs per measurement (default: 50)')
+    parser.add_argument('--chunk-size', type=int, default=65536, help='Stream chunk size in bytes (default: 65536)')
+    args = parser.parse_args()
+
+    paths = [Path(f) for f in args.files]
+    if args.dir:
+        paths.extend(sorted(Path(args.dir).glob('*.html')))
+    if not paths:
+        parser.error("no pages given (pass files or --dir)")
+
+    results = {path: bench_page(path, args.repeat, args.chunk_size) for path in paths}
+    display_results(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from naver_broadcast_crawler import CrawlerFactory
 from utils.url_detector import URLDetector
+from utils.rate_limiter import HostRateLimiter
 from persistence import BroadcastSaver
 
 
@@ -145,6 +146,9 @@ async def crawl_and_save_multiple(urls: list, headless: bool = True) -> dict:
     for i, url in enumerate(urls, 1):
         logger.info(f"Progress: {i}/{len(urls)}")
 
+        # Pace page loads per host (adapts to throttling instead of a fixed sleep)
+        await HostRateLimiter.acquire(url)
+
         result = await crawl_and_save_url(url, headless, saver)
         results.append(result)
 
@@ -153,10 +157,6 @@ async def crawl_and_save_multiple(urls: list, headless: bool = True) -> dict:
         else:
             failed += 1
 
-        # Small delay between requests to be respectful
-        if i < len(urls):
-            await asyncio.sleep(2)
-
     return {
         'total': len(urls),
         'successful': successful,
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the CheckpointManager journal (local files only)
+
+Simulates a crawl interrupted mid-write: the journal is truncated inside its
+last record, then replayed by a new CheckpointManager as on resume.
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.checkpoint_manager import CheckpointManager
+
+
+def journal_lines(manager: CheckpointManager):
+    """Parsed journal records (raises on a torn line)"""
+    with open(manager.checkpoint_file, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def run_tests() -> bool:
+    print("="*60)
+    print("Testing checkpoint journal replay")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        print("\n1. Journal appends only new URLs and progress records...")
+        manager = CheckpointManager('exec-1', checkpoint_dir=checkpoint_dir)
+        manager.save_checkpoint(['u1', 'u2'], total_urls=5, items_saved=2, current_chunk=1, total_chunks=3)
+        manager.save_checkpoint(['u2', 'u3'], total_urls=5, items_saved=3, current_chunk=2, total_chunks=3)
+        types = [record['type'] for record in journal_lines(manager)]
+        if types != ['urls', 'progress', 'urls', 'progress']:
+            print(f"   ✗ Unexpected journal records: {types}")
+            return False
+        print(f"   ✓ Records: {types}")
+
+        print("\n2. Truncated final record is skipped on replay...")
+        manager.mark_processed(['u4'])
+        data = manager.checkpoint_file.read_bytes()
+        manager.checkpoint_file.write_bytes(data[:-5])  # Interrupted inside the 'u4' record
+
+        resumed = CheckpointManager('exec-1', checkpoint_dir=checkpoint_dir)
+        checkpoint = resumed.load_checkpoint()
+        if checkpoint['processed_urls'] != ['u1', 'u2', 'u3']:
+            print(f"   ✗ Expected ['u1', 'u2', 'u3'], got {checkpoint['processed_urls']}")
+            return False
+        if checkpoint['items_saved'] != 3 or checkpoint['current_chunk'] != 2:
+            print(f"   ✗ Expected the last complete progress record, got {checkpoint}")
+            return False
+        if not resumed.should_process_url('u4') or resumed.should_process_url('u1'):
+            print("   ✗ should_process_url disagrees with the replayed URLs")
+            return False
+        print(f"   ✓ Resumed with {checkpoint['processed_urls']} at chunk {checkpoint['current_chunk']}")
+
+        print("\n3. Torn journal is compacted before new appends...")
+        records = journal_lines(resumed)
+        if [record['type'] for record in records] != ['snapshot']:
+            print(f"   ✗ Expected a single snapshot, got {records}")
+            return False
+        resumed.save_checkpoint(['u4', 'u5'], total_urls=5, items_saved=5, current_chunk=3, total_chunks=3)
+        final = CheckpointManager('exec-1', checkpoint_dir=checkpoint_dir).load_checkpoint()
+        if final['processed_urls'] != ['u1', 'u2', 'u3', 'u4', 'u5'] or final['progress_percentage'] != 100.0:
+            print(f"   ✗ Expected all 5 URLs at 100%, got {final}")
+            return False
+        print(f"   ✓ Journal readable after resume, {final['progress_percentage']}% done")
+
+        print("\n4. Journal compacts every compact_every records...")
+        manager = CheckpointManager('exec-2', checkpoint_dir=checkpoint_dir, compact_every=3)
+        for index in range(4):
+            manager.mark_processed([f"c{index}"])
+        records = journal_lines(manager)
+        if [record['type'] for record in records] != ['snapshot', 'urls']:
+            print(f"   ✗ Expected snapshot + 1 appended record, got {records}")
+            return False
+        replayed = CheckpointManager('exec-2', checkpoint_dir=checkpoint_dir).get_processed_urls()
+        if replayed != ['c0', 'c1', 'c2', 'c3']:
+            print(f"   ✗ Expected c0..c3 after replay, got {replayed}")
+            return False
+        print(f"   ✓ {len(records)} journal lines for {len(replayed)} URLs")
+
+        print("\n5. Legacy JSON checkpoint is migrated to the journal...")
+        legacy = Path(checkpoint_dir) / 'checkpoint_exec-3.json'
+        legacy.write_text(json.dumps({'processed_urls': ['l1', 'l2'], 'total_urls': 4, 'items_saved': 2}))
+        manager = CheckpointManager('exec-3', checkpoint_dir=checkpoint_dir)
+        if legacy.exists() or manager.get_processed_urls() != ['l1', 'l2']:
+            print(f"   ✗ Legacy checkpoint not migrated: {manager.get_processed_urls()}")
+            return False
+        if manager.load_checkpoint()['total_urls'] != 4:
+            print("   ✗ Legacy progress fields lost")
+            return False
+        print(f"   ✓ Migrated {manager.get_processed_urls()}")
+
+    print("\n" + "="*60)
+    print("✓ All checkpoint journal tests passed!")
+    print("="*60)
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for chunked child inserts (without requiring Supabase connection)
+
+Runs AsyncDatabaseUpserter.insert_chunked and DatabaseUpserter.insert_chunked
+against an in-memory PostgREST stand-in (httpx.MockTransport) to check which
+chunks are retried.
+"""
+
+import sys
+import json
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+from postgrest import SyncPostgrestClient
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from persistence.async_client import AsyncSupabaseClient
+from persistence.async_upserter import AsyncDatabaseUpserter
+from persistence.config import SupabaseConfig
+from persistence.base_upserter import ChunkedInsertError
+from persistence.upserter import DatabaseUpserter
+
+
+class FakePostgREST:
+    """
+    Stores inserted rows; fails each listed message once
+
+    A failure is an HTTP status (plain-text body, like a gateway error) or a
+    (status, code) pair answered with a PostgREST JSON error body.
+    """
+
+    def __init__(self, failures):
+        self.failures = dict(failures)
+        self.rows = []
+        self.requests = []
+        self.upserts = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        rows = json.loads(request.content)
+        self.requests.append([row['message'] for row in rows])
+        if request.url.params.get('on_conflict') == 'id':
+            self.upserts += 1
+        for row in rows:
+            failure = self.failures.pop(row['message'], None)
+            if isinstance(failure, tuple):
+                status, code = failure
+                body = {'code': code, 'message': 'injected failure', 'details': None, 'hint': None}
+                return httpx.Response(status, json=body)
+            if failure:
+                return httpx.Response(failure, text='injected gateway failure')
+        self.rows.extend(rows)
+        return httpx.Response(201, json=rows)
+
+
+def make_upserter(server: FakePostgREST) -> AsyncDatabaseUpserter:
+    """AsyncDatabaseUpserter whose client talks to the in-memory server"""
+    http_client = httpx.AsyncClient(
+        base_url='https://example.supabase.co/rest/v1',
+        transport=httpx.MockTransport(server.handle)
+    )
+    client = AsyncSupabaseClient(
+        SupabaseConfig(url='https://example.supabase.co', key='x' * 40),
+        http_client=http_client
+    )
+    upserter = AsyncDatabaseUpserter(client)
+    upserter.INSERT_CHUNK_ROWS = 2
+    return upserter
+
+
+def make_sync_upserter(server: FakePostgREST) -> DatabaseUpserter:
+    """DatabaseUpserter whose postgrest client talks to the in-memory server"""
+    http_client = httpx.Client(
+        base_url='https://example.supabase.co/rest/v1',
+        transport=httpx.MockTransport(server.handle)
+    )
+    postgrest = SyncPostgrestClient('https://example.supabase.co/rest/v1', http_client=http_client)
+    upserter = DatabaseUpserter(SimpleNamespace(client=postgrest))
+    upserter.INSERT_CHUNK_ROWS = 2
+    return upserter
+
+
+def chat_rows(count: int):
+    return [{'broadcast_id': 1, 'message': f'm{i}'} for i in range(count)]
+
+
+async def run_tests() -> bool:
+    """Run the chunk retry checks"""
+
+    print("="*60)
+    print("Testing chunked inserts")
+    print("="*60)
+
+    print("\n1. A chunk answered with 503 is retried...")
+    server = FakePostgREST({'m2': 503})
+    upserter = make_upserter(server)
+    inserted = await upserter.insert_chunked('broadcast_chat', chat_rows(6), 'chat messages')
+    await upserter.client.disconnect()
+
+    stored = sorted(row['message'] for row in server.rows)
+    if inserted != 6 or stored != [f'm{i}' for i in range(6)]:
+        print(f"   ✗ Expected 6 rows stored once, got {inserted} inserted: {stored}")
+        return False
+    if ['m2'] not in server.requests:
+        print(f"   ✗ Failed chunk was not retried: {server.requests}")
+        return False
+    print(f"   ✓ 6 rows inserted once, requests: {server.requests}")
+
+    print("\n2. A unique violation (409, SQLSTATE 23505) is not retried...")
+    server = FakePostgREST({'m0': (409, '23505')})
+    upserter = make_upserter(server)
+    try:
+        await upserter.insert_chunked('broadcast_chat', chat_rows(4), 'chat messages')
+        print("   ✗ Expected ChunkedInsertError")
+        return False
+    except ChunkedInsertError as e:
+        failed = [row['message'] for row in e.failed_rows]
+        if e.inserted != 2 or failed != ['m0', 'm1'] or len(server.requests) != 2:
+            print(f"   ✗ Unexpected outcome: inserted={e.inserted} failed={failed} requests={server.requests}")
+            return False
+        print(f"   ✓ Constraint error reported without retry ({e})")
+    finally:
+        await upserter.client.disconnect()
+
+    print("\n3. Diff-sync updates and inserts are chunked too...")
+    server = FakePostgREST({'m3': 503})
+    upserter = make_upserter(server)
+    updates = [{'id': i, **row} for i, row in enumerate(chat_rows(4), 1)]
+    await upserter._write_child_rows('broadcast_chat', updates, update=True)
+    await upserter._write_child_rows('broadcast_chat', chat_rows(3), update=False)
+    await upserter.client.disconnect()
+
+    sizes = [len(request) for request in server.requests]
+    if max(sizes) > upserter.INSERT_CHUNK_ROWS or server.upserts != 4 or len(server.rows) != 7:
+        print(f"   ✗ Unexpected requests: {server.requests} ({server.upserts} upserts)")
+        return False
+    print(f"   ✓ Requests of at most {upserter.INSERT_CHUNK_ROWS} rows, failed update chunk retried: {server.requests}")
+
+    print("\n4. Sync client: a statement timeout (500, SQLSTATE 57014) is retried...")
+    server = FakePostgREST({'m1': (500, '57014')})
+    upserter = make_sync_upserter(server)
+    inserted = upserter.insert_chunked('broadcast_chat', chat_rows(4), 'chat messages')
+
+    stored = sorted(row['message'] for row in server.rows)
+    if inserted != 4 or stored != [f'm{i}' for i in range(4)]:
+        print(f"   ✗ Expected 4 rows stored once, got {inserted} inserted: {stored}")
+        return False
+    print(f"   ✓ 4 rows inserted once, requests: {server.requests}")
+
+    print("\n" + "="*60)
+    print("✓ All chunked insert tests passed!")
+    print("="*60)
+    return True
+
+
+if __name__ == '__main__':
+    try:
+        success = asyncio.run(run_tests())
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n✗ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for CommentCursorStore (local files only)
+
+Checks that only cursors of successfully saved broadcasts are committed and
+that the journal replays the newest cursor per broadcast.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.comment_cursors import CommentCursorStore
+
+
+def crawler_data(broadcast_id, cursor):
+    return {'broadcast': {'broadcast_id': broadcast_id, 'comment_cursor': cursor}}
+
+
+def cursor(comment_no, skip=0, fetched=0):
+    return {'last_comment_no': comment_no, 'last_created_at_milli': comment_no * 1000, 'skip': skip, 'fetched': fetched}
+
+
+def run_tests() -> bool:
+    print("="*60)
+    print("Testing comment cursor store")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        index_file = str(Path(index_dir) / 'comment_cursors.jsonl')
+        store = CommentCursorStore(index_file)
+
+        print("\n1. Only successfully saved broadcasts commit their cursor...")
+        store.commit_saved(
+            [crawler_data(1, cursor(10, 2, 40)), crawler_data(2, cursor(20)),
+             crawler_data(3, cursor(30)), crawler_data(4, None)],
+            [{'status': 'success'}, {'status': 'failed'},
+             {'status': 'success', 'superseded': True}, {'status': 'success'}]
+        )
+        committed = {broadcast_id: store.get(broadcast_id) is not None for broadcast_id in (1, 2, 3, 4)}
+        if committed != {1: True, 2: False, 3: False, 4: False}:
+            print(f"   ✗ Unexpected committed cursors: {committed}")
+            return False
+        print("   ✓ Failed, superseded and cursor-less broadcasts not committed")
+
+        print("\n2. Newest cursor wins after a restart...")
+        store.commit({1: cursor(15, 0, 52)})
+        store = CommentCursorStore(index_file)
+        stored = store.get(1)
+        if not stored or stored['last_comment_no'] != 15 or stored['fetched'] != 52 or 'updated_at' not in stored:
+            print(f"   ✗ Expected the second cursor for broadcast 1, got {stored}")
+            return False
+        print(f"   ✓ Broadcast 1 resumes after comment {stored['last_comment_no']} ({stored['fetched']} fetched)")
+
+    print("\n" + "="*60)
+    print("✓ All comment cursor tests passed!")
+    print("="*60)
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests() else 1)
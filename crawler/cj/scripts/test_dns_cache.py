@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTTPClientRegistry DNS cache (no internet access required)
+
+The cache is installed by wrapping the network backend of httpx's connection
+pool, an httpx/httpcore internal. These checks fail if an httpx/httpcore
+upgrade removes that hook, instead of the cache silently turning into a no-op.
+"""
+
+import sys
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.http_clients import HTTPClientRegistry, _AsyncDNSCachingBackend, _DNSCachingBackend
+
+
+class OKHandler(BaseHTTPRequestHandler):
+    """Answers every GET with 200"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def pool_backend(client):
+    """Network backend of the registry client's connection pool"""
+    return client._transport._transport._pool._network_backend
+
+
+async def async_request(url: str):
+    """Request through the shared async client, returning (status, backend)"""
+    client = HTTPClientRegistry.get_async_client()
+    try:
+        response = await client.get(url)
+        return response.status_code, pool_backend(client)
+    finally:
+        await HTTPClientRegistry.aclose()
+
+
+def run_tests() -> bool:
+    """Run the DNS cache checks against a local HTTP server"""
+
+    print("="*60)
+    print("Testing DNS cache hook")
+    print("="*60)
+
+    server = HTTPServer(('127.0.0.1', 0), OKHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://localhost:{server.server_address[1]}/"
+    cache = HTTPClientRegistry._dns_cache
+
+    try:
+        print("\n1. Sync client resolves through the cache...")
+        client = HTTPClientRegistry.get_sync_client()
+        backend = pool_backend(client)
+        if not isinstance(backend, _DNSCachingBackend):
+            print(f"   ✗ Pool backend is {type(backend).__name__}, DNS cache hook is gone")
+            return False
+        response = client.get(url)
+        if response.status_code != 200 or not cache.get('localhost', server.server_address[1]):
+            print(f"   ✗ Expected 200 and a cached localhost entry, got {response.status_code}")
+            return False
+        print(f"   ✓ Request served, {len(cache)} host(s) cached")
+        HTTPClientRegistry.close()
+
+        print("\n2. Async client resolves through the cache...")
+        cache.discard('localhost', server.server_address[1])
+        status, backend = asyncio.run(async_request(url))
+        if not isinstance(backend, _AsyncDNSCachingBackend):
+            print(f"   ✗ Pool backend is {type(backend).__name__}, DNS cache hook is gone")
+            return False
+        if status != 200 or not cache.get('localhost', server.server_address[1]):
+            print(f"   ✗ Expected 200 and a cached localhost entry, got {status}")
+            return False
+        print(f"   ✓ Request served, {len(cache)} host(s) cached")
+    finally:
+        server.shutdown()
+
+    print("\n" + "="*60)
+    print("✓ All DNS cache tests passed!")
+    print("="*60)
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Regression checks for EmbeddedJSONExtractor against the former regex extraction
+
+Each page snippet is extracted from str, from bytes and from a stream of small
+chunks, and compared with legacy_assignment (the former JSONExtractor regexes).
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from extractors.embedded_json import EmbeddedJSONExtractor
+from bench_embedded_json import legacy_assignment, stream_call
+
+
+CASES = [
+    (
+        'non-literal assignment before the data',
+        'window.__shortclip',
+        '<script>window.__shortclip = window.__shortclip || {}; window.__shortclip = {"id": 1};</script>',
+    ),
+    (
+        'quoted JSON string',
+        'window.__viewerConfig.broadcast',
+        "<script>window.__viewerConfig.broadcast = '{\"id\": 7, \"title\": \"a\\/b\"}';</script>",
+    ),
+    (
+        'longer identifier first',
+        'window.__viewerConfig.broadcast',
+        '<script>window.__viewerConfig.broadcastId = 7;\n'
+        'window.__viewerConfig.broadcast = {"id": 7};</script>',
+    ),
+    (
+        'comparison, then conditional, then data',
+        'window.__shortclip',
+        '<script>if (window.__shortclip == null) { window.__shortclip = null; }\n'
+        'window.__shortclip = {"items": [1, 2]};</script>',
+    ),
+    (
+        'no data assignment',
+        'window.__shortclip',
+        '<script>window.__shortclip = window.__shortclip || {};</script>',
+    ),
+]
+
+
+def run_tests() -> bool:
+    """Compare every extraction path with the former regexes"""
+
+    print("="*60)
+    print("Testing embedded JSON extraction")
+    print("="*60)
+
+    passed = True
+    for name, target, html in CASES:
+        expected = legacy_assignment(html, target)
+        data = html.encode('utf-8')
+        results = {
+            'str': EmbeddedJSONExtractor.assignment_json(html, target),
+            'bytes': EmbeddedJSONExtractor.assignment_json(data, target),
+            'stream': stream_call(
+                data, 8, lambda chunks: EmbeddedJSONExtractor.stream_assignment_json(chunks, target)
+            ),
+        }
+        mismatches = {path: value for path, value in results.items() if value != expected}
+        if mismatches:
+            print(f"   ✗ {name}: expected {expected!r}, got {mismatches}")
+            passed = False
+        else:
+            print(f"   ✓ {name}: {expected!r}")
+
+    print("\n" + "="*60)
+    print("✓ All embedded JSON tests passed!" if passed else "✗ Some embedded JSON tests failed")
+    print("="*60)
+    return passed
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for BroadcastFingerprintStore (local files only)
+
+Checks which API changes make a broadcast count as changed, and that
+committed fingerprints survive a restart.
+"""
+
+import sys
+import copy
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.fingerprint_store import BroadcastFingerprintStore
+
+
+BROADCAST = {
+    'status': 'BLOCK',
+    'title': 'Spring sale',
+    'description': 'Replay',
+    'startDate': '2026-03-01T20:00:00',
+    'endDate': '2026-03-01T21:00:00',
+    'viewCount': 1200,
+    'commentCount': 300,
+    'shoppingProducts': [
+        {'key': 1, 'productNo': 101, 'name': 'Cream', 'price': 30000, 'stock': 12},
+        {'key': 2, 'productNo': 102, 'name': 'Toner', 'price': 20000, 'stock': 4},
+    ],
+}
+COUPONS = [{'couponNo': 9, 'title': '10% off', 'issuedCount': 50}]
+BENEFITS = [{'benefitId': 3, 'message': 'Free gift'}]
+
+
+def fingerprint(broadcast=None, coupons=None, benefits=None):
+    return BroadcastFingerprintStore.compute(
+        broadcast or BROADCAST,
+        COUPONS if coupons is None else coupons,
+        BENEFITS if benefits is None else benefits
+    )
+
+
+def run_tests() -> bool:
+    print("="*60)
+    print("Testing broadcast fingerprint store")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        index_file = str(Path(index_dir) / 'fingerprints.jsonl')
+        store = BroadcastFingerprintStore(index_file)
+
+        print("\n1. Unknown broadcasts are crawled, committed ones skipped after restart...")
+        if store.is_unchanged(1, fingerprint()):
+            print("   ✗ Broadcast without a stored fingerprint was skipped")
+            return False
+        store.commit({1: fingerprint()})
+        store = BroadcastFingerprintStore(index_file)
+        if not store.is_unchanged(1, fingerprint()):
+            print("   ✗ Reloaded store does not match the committed fingerprint")
+            return False
+        print("   ✓ Fingerprint matched after reload (saved_at ignored)")
+
+        print("\n2. Volatile counters do not change the fingerprint...")
+        counters = copy.deepcopy(BROADCAST)
+        counters['viewCount'] = 5000
+        counters['commentCount'] = 900
+        counters['shoppingProducts'][0]['stock'] = 0
+        coupons = [{**COUPONS[0], 'issuedCount': 80}]
+        if not store.is_unchanged(1, fingerprint(counters, coupons)):
+            print("   ✗ View/comment/stock/issued counters changed the fingerprint")
+            return False
+        print("   ✓ viewCount, commentCount, stock and issuedCount ignored")
+
+        print("\n3. Content changes are detected...")
+        changes = {
+            'title': dict(BROADCAST, title='Spring sale (extended)'),
+            'product price': dict(BROADCAST, shoppingProducts=[
+                dict(BROADCAST['shoppingProducts'][0], price=25000), BROADCAST['shoppingProducts'][1]
+            ]),
+            'end date': dict(BROADCAST, endDate='2026-03-01T22:00:00'),
+        }
+        for label, changed in changes.items():
+            if store.is_unchanged(1, fingerprint(changed)):
+                print(f"   ✗ Changed {label} was not detected")
+                return False
+        if store.is_unchanged(1, fingerprint(benefits=[])) or store.is_unchanged(1, fingerprint(coupons=[])):
+            print("   ✗ Removed coupons/benefits were not detected")
+            return False
+        print(f"   ✓ Detected: {', '.join(changes)}, coupons, benefits")
+
+        print("\n4. Live broadcasts are never skipped...")
+        live = dict(BROADCAST, status='ONAIR')
+        store.commit({2: fingerprint(live)})
+        if store.is_unchanged(2, fingerprint(live)):
+            print("   ✗ ONAIR broadcast was skipped")
+            return False
+        print("   ✓ ONAIR broadcast recrawled")
+
+    print("\n" + "="*60)
+    print("✓ All fingerprint store tests passed!")
+    print("="*60)
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the adaptive per-host rate limiter (no network access required)
+
+Checks the AIMD rate changes of AdaptiveTokenBucket.record() and that
+cap()/HostRateLimiter.limit() only ever tighten a bucket's limits.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.rate_limiter import AdaptiveTokenBucket, HostRateLimiter
+
+
+def close(a: float, b: float) -> bool:
+    return abs(a - b) < 1e-9
+
+
+def paused_for(bucket: AdaptiveTokenBucket) -> float:
+    """Seconds the bucket stays paused"""
+    return bucket._blocked_until - time.monotonic()
+
+
+def run_tests() -> bool:
+    print("="*60)
+    print("Testing adaptive rate limiter")
+    print("="*60)
+
+    print("\n1. 429 halves the rate and pauses for Retry-After...")
+    bucket = AdaptiveTokenBucket(rate=8.0, burst=4, min_rate=1.0, max_rate=16.0)
+    bucket.record(429, latency=0.1, retry_after=30.0)
+    if not close(bucket.rate, 4.0) or not 29.0 < paused_for(bucket) <= 30.0:
+        print(f"   ✗ Expected rate 4.0 and a 30s pause, got {bucket.rate} and {paused_for(bucket):.1f}s")
+        return False
+    if bucket._tokens > 0 or bucket.stats['throttled'] != 1:
+        print(f"   ✗ Expected no tokens left and 1 throttle, got {bucket._tokens} and {bucket.stats}")
+        return False
+    print(f"   ✓ rate 8.0 → {bucket.rate}, paused {paused_for(bucket):.1f}s")
+
+    print("\n2. 429 without Retry-After pauses for the cooldown, never below min_rate...")
+    bucket = AdaptiveTokenBucket(rate=1.5, burst=1, min_rate=1.0, max_rate=6.0)
+    bucket.record(429)
+    expected = AdaptiveTokenBucket.COOLDOWN_SECONDS
+    if not close(bucket.rate, 1.0) or not expected - 1 < paused_for(bucket) <= expected:
+        print(f"   ✗ Expected rate 1.0 and a {expected}s pause, got {bucket.rate} and {paused_for(bucket):.1f}s")
+        return False
+    print(f"   ✓ rate 1.5 → {bucket.rate} (min_rate), paused {paused_for(bucket):.1f}s")
+
+    print("\n3. Slow responses reduce the rate by 10%...")
+    bucket = AdaptiveTokenBucket(rate=10.0, min_rate=1.0, max_rate=40.0, target_latency=2.0)
+    bucket.record(200, latency=3.0)
+    if not close(bucket.rate, 9.0):
+        print(f"   ✗ Expected rate 9.0, got {bucket.rate}")
+        return False
+    print(f"   ✓ rate 10.0 → {bucket.rate}")
+
+    print("\n4. Fast 2xx responses increase the rate additively up to max_rate...")
+    bucket = AdaptiveTokenBucket(rate=10.0, min_rate=1.0, max_rate=12.0)
+    bucket.record(200, latency=0.1)
+    if not close(bucket.rate, 10.6):
+        print(f"   ✗ Expected rate 10.6 (+5% of max_rate), got {bucket.rate}")
+        return False
+    for _ in range(10):
+        bucket.record(204, latency=0.1)
+    if not close(bucket.rate, 12.0):
+        print(f"   ✗ Expected rate to stop at max_rate 12.0, got {bucket.rate}")
+        return False
+    print(f"   ✓ rate 10.0 → 10.6 → {bucket.rate} (max_rate)")
+
+    print("\n5. cap() tightens limits and never loosens them...")
+    bucket = AdaptiveTokenBucket(rate=10.0, burst=10, min_rate=1.0, max_rate=40.0)
+    bucket.cap(rate=2.0, burst=1, min_rate=0.5, max_rate=4.0)
+    tightened = (bucket.rate, bucket.burst, bucket.min_rate, bucket.max_rate)
+    if tightened != (2.0, 1, 0.5, 4.0) or bucket._tokens > 1:
+        print(f"   ✗ Expected (2.0, 1, 0.5, 4.0) with at most 1 token, got {tightened}, {bucket._tokens}")
+        return False
+    bucket.cap(rate=50.0, burst=20, min_rate=5.0, max_rate=100.0)
+    if (bucket.rate, bucket.burst, bucket.min_rate, bucket.max_rate) != tightened:
+        print(f"   ✗ Looser cap changed the limits: {bucket.rate}, {bucket.burst}, {bucket.min_rate}, {bucket.max_rate}")
+        return False
+    if not close(bucket.increase_step, 0.2):
+        print(f"   ✗ Expected increase_step 0.2 (5% of the capped max_rate), got {bucket.increase_step}")
+        return False
+    print(f"   ✓ (rate, burst, min_rate, max_rate) = {tightened}, looser cap ignored")
+
+    print("\n6. HostRateLimiter.limit() keeps the stricter limits and the adaptive state...")
+    host = 'rate-limiter-test.invalid'
+    HostRateLimiter.configure(host, rate=5.0, burst=5, min_rate=0.5, max_rate=20.0)
+    bucket = HostRateLimiter.get_bucket(f"https://{host}/path")
+    bucket.record(429, retry_after=0.0)
+    HostRateLimiter.limit(host, **HostRateLimiter.spacing_limits(1.0, 3.0))
+    HostRateLimiter.limit(host, **HostRateLimiter.spacing_limits(0.1, 0.2))
+    if HostRateLimiter.get_bucket(host) is not bucket or bucket.stats['throttled'] != 1:
+        print("   ✗ limit() replaced the bucket or lost its statistics")
+        return False
+    # spacing_limits(1.0, 3.0): rate 0.5, burst 1, min_rate 1/6, max_rate 1.0
+    limits = (bucket.rate, bucket.burst, bucket.min_rate, bucket.max_rate)
+    if not all(close(a, b) for a, b in zip(limits, (0.5, 1, 1 / 6, 1.0))):
+        print(f"   ✗ Expected (0.5, 1, 0.167, 1.0), got {limits}")
+        return False
+    print(f"   ✓ rate {bucket.rate}, max_rate {bucket.max_rate} after a looser second limit()")
+
+    print("\n" + "="*60)
+    print("✓ All rate limiter tests passed!")
+    print("="*60)
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests() else 1)
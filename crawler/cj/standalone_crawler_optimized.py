@@ -9,24 +9,33 @@ This is an optimized version of standalone_crawler.py with the following improve
 3. Smart Wait Times: Dynamic API waiting instead of fixed delays (15-25% speedup)
 4. Batch Database Operations: Bulk inserts instead of individual operations
 5. Retry Logic: Exponential backoff for failed crawls
-6. Stream Processing: Process broadcasts in chunks to reduce memory
+6. Stream Processing: Bounded-queue pipeline (discovery -> crawl workers -> persistence workers)
 7. Checkpoint/Resume: Save progress and resume from failures
+8. HTTP Engine: Fetch replays/lives APIs directly, Playwright only as fallback
+9. Fingerprint Skip: Cheap API pre-check skips broadcasts unchanged since the last save
+10. Multi-Brand Sweep: All active brands in one process (shared browser pool, DB client
+    and a global crawl concurrency budget, one execution record per brand)
+11. Background Livebridge: Livebridge pages are crawled/saved by an async task queue
+    started as soon as the broadcast ID is known (never holds a browser context)
 
 Expected Performance: 7-10x faster than original implementation
 
 Usage:
     python standalone_crawler_optimized.py --brand-name "Sulwhasoo"
     python standalone_crawler_optimized.py --brand-name "Sulwhasoo" --resume
+    python standalone_crawler_optimized.py --brand-name "Sulwhasoo" --force-recrawl
+    python standalone_crawler_optimized.py --all-brands --concurrency 10 --brand-concurrency 3
     python standalone_crawler_optimized.py --brand-name "Innisfree" --concurrency 10 --chunk-size 20
 """
 
 import argparse
+import contextlib
 import sys
 import os
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -48,12 +57,14 @@ except ImportError as e:
     NaverSearchCrawler = None
 
 try:
-    import asyncio
     sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__))))
     from crawlers.replays_crawler import ReplaysCrawler
     from crawlers.lives_crawler import LivesCrawler
+    from crawlers.livebridge_queue import LivebridgeTaskQueue
     from utils.url_detector import URLDetector, URLType
-    from persistence import BroadcastSaver
+    from utils.http_clients import HTTPClientRegistry
+    from extractors.http_extractor import HTTPExtractor
+    from persistence import AsyncBroadcastSaver
     BROADCAST_CRAWLER_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️ Warning: Could not import broadcast crawlers: {e}")
@@ -63,10 +74,13 @@ except ImportError as e:
 try:
     from utils.browser_pool import BrowserPool
     from utils.checkpoint_manager import CheckpointManager
+    from utils.fingerprint_store import BroadcastFingerprintStore
+    from utils.comment_cursors import CommentCursorStore
 except ImportError as e:
     print(f"⚠️ Warning: Could not import optimization utilities: {e}")
     BrowserPool = None
     CheckpointManager = None
+    BroadcastFingerprintStore = None
 
 # Configure logging
 logging.basicConfig(
@@ -88,8 +102,19 @@ class OptimizedStandaloneCrawler:
         concurrency: int = 5,
         chunk_size: int = 10,
         max_retries: int = 3,
+        persist_workers: int = 2,
+        queue_size: Optional[int] = None,
+        child_sync: str = 'replace',
+        raw_data: str = 'full',
         crawl_livebridge: bool = True,
-        use_livebridge_llm: bool = False
+        use_livebridge_llm: bool = False,
+        use_http_engine: bool = True,
+        block_resources: bool = True,
+        num_browsers: Optional[int] = None,
+        max_pages_per_context: int = 50,
+        max_browser_memory_mb: Optional[float] = 2048,
+        skip_unchanged: bool = True,
+        db: Optional[SupabaseClient] = None
     ):
         """
         Initialize the optimized crawler
@@ -97,23 +122,57 @@ class OptimizedStandaloneCrawler:
         Args:
             verbose: Enable verbose logging
             concurrency: Number of concurrent browser contexts
-            chunk_size: Number of broadcasts to process per chunk
+            chunk_size: Maximum broadcasts per database batch
             max_retries: Maximum retry attempts for failed crawls
+            persist_workers: Number of concurrent persistence workers (default: 2)
+            queue_size: Capacity of each pipeline queue (default: 2x concurrency)
+            child_sync: 'replace' or 'diff' (content-hash sync of child records on recrawls)
+            raw_data: raw_data policy: 'full', 'slim', 'compressed' or 'off' (see DataTransformer)
             crawl_livebridge: Whether to automatically crawl livebridge pages (default: True)
             use_livebridge_llm: Whether to use LLM for livebridge image extraction (default: False for speed)
+            use_http_engine: Crawl via direct HTTP APIs first, browser only as fallback (default: True)
+            block_resources: Abort media/images/fonts/trackers on browser pages (default: True)
+            num_browsers: Number of Chromium processes to shard contexts across (default: auto from CPU count)
+            max_pages_per_context: Recycle a browser context after this many pages (default: 50)
+            max_browser_memory_mb: Per-browser RSS budget; contexts of a browser are recycled while its
+                Chromium process tree exceeds this (default: 2048, None to disable)
+            skip_unchanged: Skip broadcasts whose fingerprint matches the last save (default: True)
+            db: Database client to reuse (default: the process-wide client)
         """
         self.verbose = verbose
         self.concurrency = concurrency
         self.chunk_size = chunk_size
+        self.persist_workers = persist_workers
+        self.queue_size = queue_size or concurrency * 2
+        self.child_sync = child_sync
+        self.raw_data = raw_data
         self.max_retries = max_retries
         self.crawl_livebridge = crawl_livebridge
         self.use_livebridge_llm = use_livebridge_llm
+        self.use_http_engine = use_http_engine
+        self.block_resources = block_resources
+        self.num_browsers = num_browsers
+        self.max_pages_per_context = max_pages_per_context
+        self.max_browser_memory_mb = max_browser_memory_mb
 
-        self.db: SupabaseClient = get_db_client()
+        self.db: SupabaseClient = db or get_db_client()
         self.execution_id: Optional[str] = None
         self.start_time: Optional[datetime] = None
         self.checkpoint_manager: Optional[CheckpointManager] = None
         self.browser_pool: Optional[BrowserPool] = None
+        self.saver: Optional['AsyncBroadcastSaver'] = None  # Shared by all persistence workers
+        self.livebridge_queue: Optional['LivebridgeTaskQueue'] = None  # Background livebridge crawls
+
+        # Multi-brand sweep: brand runs borrow the sweep's pool, saver, config and budget
+        self.owns_resources = True
+        self.crawl_budget: Optional[asyncio.Semaphore] = None
+        self.shared_config: Optional[Dict[str, str]] = None
+
+        # Fingerprints of crawled broadcasts, committed once their save succeeds
+        self.fingerprint_store: Optional[BroadcastFingerprintStore] = (
+            BroadcastFingerprintStore() if skip_unchanged and BroadcastFingerprintStore else None
+        )
+        self._pending_fingerprints: Dict[str, Dict[str, Any]] = {}
 
         # Statistics
         self.stats = {
@@ -122,7 +181,19 @@ class OptimizedStandaloneCrawler:
             'successful': 0,
             'failed': 0,
             'retried': 0,
-            'skipped': 0
+            'skipped': 0,
+            'unchanged': 0,
+            'http_engine': 0,
+            'browser_fallback': 0,
+            'saved': 0,
+            'raw_data_saved_bytes': 0
+        }
+
+        # Pipeline queue-depth metrics (sampled on every put)
+        self.pipeline_stats = {
+            'crawl_queue': {'samples': 0, 'total_depth': 0, 'max_depth': 0},
+            'save_queue': {'samples': 0, 'total_depth': 0, 'max_depth': 0},
+            'batches_saved': 0
         }
 
         if verbose:
@@ -184,8 +255,8 @@ class OptimizedStandaloneCrawler:
         else:
             self.log(f"  ℹ️  Using default platform, skipping validation")
 
-        # Load crawler config
-        config = self.db.get_all_config()
+        # Load crawler config (loaded once per multi-brand sweep)
+        config = self.shared_config if self.shared_config is not None else self.db.get_all_config()
         self.log(f"  ✅ Config loaded: {len(config)} entries")
 
         return brand, platform, config
@@ -269,7 +340,8 @@ class OptimizedStandaloneCrawler:
     async def execute_broadcast_crawler_with_retry(
         self,
         broadcast_url: str,
-        attempt: int = 1
+        attempt: int = 1,
+        prefetched: Optional['HTTPExtractor'] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Execute broadcast crawler with retry logic (Optimization #5)
@@ -277,13 +349,14 @@ class OptimizedStandaloneCrawler:
         Args:
             broadcast_url: Broadcast URL to crawl
             attempt: Current attempt number (1-indexed)
+            prefetched: HTTPExtractor with the broadcast's API responses (from the fingerprint probe)
 
         Returns:
             Broadcast detail dictionary or None
         """
         for retry in range(attempt, self.max_retries + 1):
             try:
-                result = await self.execute_broadcast_crawler(broadcast_url)
+                result = await self.execute_broadcast_crawler(broadcast_url, prefetched)
                 if result:
                     if retry > 1:
                         self.stats['retried'] += 1
@@ -304,12 +377,17 @@ class OptimizedStandaloneCrawler:
 
         return None
 
-    async def execute_broadcast_crawler(self, broadcast_url: str) -> Optional[Dict[str, Any]]:
+    async def execute_broadcast_crawler(
+        self,
+        broadcast_url: str,
+        prefetched: Optional['HTTPExtractor'] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Execute broadcast detail crawler using browser pool (Optimization #2)
 
         Args:
             broadcast_url: Broadcast URL
+            prefetched: HTTPExtractor with the broadcast's API responses, reused by the HTTP engine
 
         Returns:
             Broadcast detail dictionary or None
@@ -330,32 +408,32 @@ class OptimizedStandaloneCrawler:
             url_type = URLDetector.detect(broadcast_url)
             logger.debug(f"URL type: {url_type.value}")
 
+            if url_type not in (URLType.REPLAYS, URLType.LIVES):
+                logger.warning(f"Unsupported URL type: {url_type.value}")
+                return None
+
+            # Try browserless HTTP engine first (no pooled context held)
+            if self.use_http_engine:
+                crawler = self._create_crawler(url_type, http_only=True, prefetched=prefetched)
+                try:
+                    result = await crawler.crawl(broadcast_url)
+                    self.stats['http_engine'] += 1
+                    logger.debug("✓ Crawled broadcast via HTTP engine")
+                    return result
+                except Exception as e:
+                    logger.info(f"HTTP engine unavailable for {broadcast_url} ({e}), using browser")
+                    self.stats['browser_fallback'] += 1
+
             # Acquire browser context from pool
             context = await self.browser_pool.acquire_context()
 
             # Create appropriate crawler with external context and livebridge settings
-            if url_type == URLType.REPLAYS:
-                crawler = ReplaysCrawler(
-                    headless=True,
-                    external_context=context,
-                    crawl_livebridge=self.crawl_livebridge,
-                    use_livebridge_llm=self.use_livebridge_llm
-                )
-            elif url_type == URLType.LIVES:
-                crawler = LivesCrawler(
-                    headless=True,
-                    external_context=context,
-                    crawl_livebridge=self.crawl_livebridge,
-                    use_livebridge_llm=self.use_livebridge_llm
-                )
-            else:
-                logger.warning(f"Unsupported URL type: {url_type.value}")
-                return None
+            crawler = self._create_crawler(url_type, context=context)
 
             # Execute full crawl (crawler will use context from pool)
             result = await crawler.crawl(broadcast_url)
 
-            logger.debug(f"✓ Crawled broadcast successfully")
+            logger.debug("✓ Crawled broadcast successfully")
             return result
 
         except Exception as e:
@@ -367,67 +445,128 @@ class OptimizedStandaloneCrawler:
             if context and self.browser_pool:
                 await self.browser_pool.release_context(context)
 
-    async def crawl_broadcasts_parallel(
-        self,
-        broadcasts: List[Dict[str, Any]]
-    ) -> List[Optional[Dict[str, Any]]]:
+    def _create_crawler(self, url_type, context=None, http_only: bool = False, prefetched=None):
         """
-        Crawl multiple broadcasts in parallel (Optimization #1)
+        Create crawler for URL type
 
         Args:
-            broadcasts: List of broadcast dictionaries with URLs
+            url_type: URLType.REPLAYS or URLType.LIVES
+            context: Browser context from pool (None for HTTP-only crawl)
+            http_only: Use the HTTP engine without browser fallback
+            prefetched: HTTPExtractor whose API responses the HTTP engine reuses
 
         Returns:
-            List of broadcast detail dictionaries
+            ReplaysCrawler or LivesCrawler instance
         """
-        logger.info(f"🚀 Crawling {len(broadcasts)} broadcasts in parallel (concurrency={self.concurrency})")
+        crawler_class = ReplaysCrawler if url_type == URLType.REPLAYS else LivesCrawler
+        return crawler_class(
+            headless=True,
+            external_context=context,
+            crawl_livebridge=self.crawl_livebridge,
+            use_livebridge_llm=self.use_livebridge_llm,
+            use_http_engine=http_only,
+            browser_fallback=not http_only,
+            block_resources=self.block_resources,
+            livebridge_queue=self.livebridge_queue,
+            prefetched_apis=prefetched
+        )
 
-        # Create semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(self.concurrency)
+    async def crawl_broadcast(self, broadcast: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Crawl a single discovered broadcast (skip check + retry)
 
-        async def crawl_with_limit(broadcast: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-            """Crawl with semaphore limit"""
-            async with semaphore:
-                url = broadcast.get('url')
-                if not url:
-                    logger.warning(f"Broadcast missing URL: {broadcast}")
-                    return None
+        Args:
+            broadcast: Broadcast dictionary with URL
+
+        Returns:
+            Broadcast detail dictionary or None (skipped/failed)
+        """
+        url = broadcast.get('url')
+        if not url:
+            logger.warning(f"Broadcast missing URL: {broadcast}")
+            return None
+
+        # Check if already processed (resume capability)
+        if self.checkpoint_manager and not self.checkpoint_manager.should_process_url(url):
+            logger.info(f"⏭️  Skipping already processed: {url}")
+            self.stats['skipped'] += 1
+            return None
 
-                # Check if already processed (resume capability)
-                if self.checkpoint_manager and not self.checkpoint_manager.should_process_url(url):
-                    logger.info(f"⏭️  Skipping already processed: {url}")
-                    self.stats['skipped'] += 1
+        # Cheap API pre-check: skip broadcasts unchanged since their last save
+        prefetched = None
+        if self.fingerprint_store:
+            probe = await self._probe_fingerprint(url)
+            if probe:
+                broadcast_id, fingerprint, prefetched = probe
+                if (self.fingerprint_store.is_unchanged(broadcast_id, fingerprint)
+                        and not await HTTPExtractor.has_comments_since(
+                            broadcast_id, CommentCursorStore.default().get(broadcast_id))):
+                    logger.info(f"⏭️  Unchanged since last save: {url}")
+                    self.stats['unchanged'] += 1
                     return None
+                self._pending_fingerprints[str(broadcast_id)] = fingerprint
 
-                # Crawl with retry
-                result = await self.execute_broadcast_crawler_with_retry(url)
-                self.stats['processed'] += 1
+        # Crawl with retry (the HTTP engine reuses the probe's API responses)
+        result = await self.execute_broadcast_crawler_with_retry(url, prefetched=prefetched)
+        self.stats['processed'] += 1
 
-                if result:
-                    self.stats['successful'] += 1
+        if result:
+            self.stats['successful'] += 1
 
-                return result
+        return result
 
-        # Execute all crawls in parallel
-        tasks = [crawl_with_limit(broadcast) for broadcast in broadcasts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _probe_fingerprint(self, url: str) -> Optional[Tuple[int, Dict[str, Any], 'HTTPExtractor']]:
+        """
+        Fingerprint a broadcast from its broadcast, coupons and benefits APIs
 
-        # Filter out None and exceptions
-        valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Exception during crawl: {result}")
-                self.stats['failed'] += 1
-            elif result is not None:
-                valid_results.append(result)
+        Args:
+            url: Broadcast URL
+
+        Returns:
+            (broadcast_id, fingerprint, extractor holding the API responses), or None
+            if the APIs are unavailable (crawl normally)
+        """
+        broadcast_id = URLDetector.extract_id(url)
+        if not broadcast_id:
+            return None
+
+        try:
+            async with HTTPExtractor() as extractor:
+                await extractor.fetch_broadcast_apis(broadcast_id, referer=url)
+                broadcast_api_data = extractor.get_broadcast_data()
+                if not broadcast_api_data:
+                    return None
+                fingerprint = BroadcastFingerprintStore.compute(
+                    broadcast_api_data, extractor.get_coupons(), extractor.get_benefits()
+                )
+                return broadcast_id, fingerprint, extractor
+        except Exception as e:
+            logger.debug(f"Fingerprint pre-check failed for {url}: {e}")
+            return None
 
-        logger.info(f"✓ Parallel crawling complete: {len(valid_results)} successful")
-        return valid_results
+    def _commit_fingerprints(self, results: List[Dict[str, Any]]):
+        """
+        Store fingerprints of successfully saved broadcasts
 
-    def store_broadcasts_batch(self, broadcasts: List[Dict[str, Any]]) -> int:
+        Args:
+            results: Per-broadcast save results
+        """
+        fingerprints = {}
+        for result in results:
+            if result['status'] != 'success' or result.get('superseded'):
+                continue
+            fingerprint = self._pending_fingerprints.pop(str(result.get('broadcast_id')), None)
+            if fingerprint:
+                fingerprints[result['broadcast_id']] = fingerprint
+        self.fingerprint_store.commit(fingerprints)
+
+    async def store_broadcasts_batch(self, broadcasts: List[Dict[str, Any]]) -> int:
         """
         Store broadcasts in database using batch operations (Optimization #4)
 
+        Uses one AsyncBroadcastSaver per run, so all batches share its pooled
+        connections and child tables are written concurrently.
+
         Args:
             broadcasts: List of broadcast dictionaries
 
@@ -438,83 +577,182 @@ class OptimizedStandaloneCrawler:
             logger.info("No broadcasts to store")
             return 0
 
-        if not BroadcastSaver:
-            logger.error("BroadcastSaver not available")
+        if not BROADCAST_CRAWLER_AVAILABLE:
+            logger.error("AsyncBroadcastSaver not available")
             return 0
 
         logger.info(f"💾 Storing {len(broadcasts)} broadcasts in batch...")
 
-        saver = BroadcastSaver()
-        successful = 0
-        failed = 0
+        try:
+            if self.saver is None:
+                self.saver = AsyncBroadcastSaver(
+                    child_sync=self.child_sync,
+                    raw_data=self.raw_data,
+                    max_connections=max(self.persist_workers * 4, 10)
+                )
+            batch_result = await self.saver.save_batch(broadcasts)
+        except Exception as e:
+            logger.error(f"Error saving broadcast batch: {e}")
+            return 0
+
+        successful = batch_result['successful']
+        failed = batch_result['failed']
+        self.stats['raw_data_saved_bytes'] += batch_result.get('raw_data_saved_bytes', 0)
+
+        if self.fingerprint_store:
+            self._commit_fingerprints(batch_result['results'])
+
+        for result in batch_result['results']:
+            if result['status'] == 'success':
+                if self.verbose:
+                    broadcast_id = result.get('broadcast_id', 'unknown')
+                    logger.debug(f"✓ Saved broadcast {broadcast_id}")
+            else:
+                error = result.get('error', 'Unknown error')
+                logger.warning(f"Failed to save broadcast: {error}")
+
+        logger.info(f"📊 Batch save complete: {successful} successful, {failed} failed", )
+        return successful
 
-        # Note: BroadcastSaver doesn't have built-in batch support yet,
-        # but we can optimize by processing them in quick succession
-        # without intermediate delays
+    def _record_queue_depth(self, stage: str, queue: asyncio.Queue):
+        """Sample queue depth for per-stage pipeline metrics"""
+        metrics = self.pipeline_stats[stage]
+        depth = queue.qsize()
+        metrics['samples'] += 1
+        metrics['total_depth'] += depth
+        metrics['max_depth'] = max(metrics['max_depth'], depth)
+
+    async def _discovery_producer(self, broadcasts: List[Dict[str, Any]], crawl_queue: asyncio.Queue):
+        """
+        Feed discovered broadcasts to the crawl workers (blocks when the queue is full)
+
+        Args:
+            broadcasts: Discovered broadcast dictionaries
+            crawl_queue: Bounded queue consumed by crawl workers
+        """
         for broadcast in broadcasts:
-            try:
-                result = saver.save_from_dict(broadcast)
+            await crawl_queue.put(broadcast)
+            self._record_queue_depth('crawl_queue', crawl_queue)
 
-                if result['status'] == 'success':
-                    successful += 1
-                    if self.verbose:
-                        broadcast_id = result.get('broadcast_id', 'unknown')
-                        logger.debug(f"✓ Saved broadcast {broadcast_id}")
-                else:
-                    failed += 1
-                    error = result.get('error', 'Unknown error')
-                    logger.warning(f"Failed to save broadcast: {error}")
+        # One stop signal per crawl worker
+        for _ in range(self.concurrency):
+            await crawl_queue.put(None)
+
+    async def _crawl_worker(self, crawl_queue: asyncio.Queue, save_queue: asyncio.Queue):
+        """
+        Crawl broadcasts from the crawl queue and hand results to persistence
 
+        Args:
+            crawl_queue: Queue of broadcast dictionaries (None = stop)
+            save_queue: Bounded queue of (url, result) consumed by persistence workers
+        """
+        while True:
+            broadcast = await crawl_queue.get()
+            if broadcast is None:
+                return
+
+            url = broadcast.get('url')
+            try:
+                # Global budget shared by all brands in a multi-brand sweep
+                async with self.crawl_budget or contextlib.nullcontext():
+                    result = await self.crawl_broadcast(broadcast)
             except Exception as e:
-                failed += 1
-                logger.error(f"Error saving broadcast: {e}")
+                logger.error(f"Exception during crawl: {e}")
+                self.stats['failed'] += 1
+                result = None
 
-        logger.info(f"📊 Batch save complete: {successful} successful, {failed} failed", )
-        return successful
+            # Failed/skipped URLs still go through persistence so they are checkpointed
+            await save_queue.put((url, result))
+            self._record_queue_depth('save_queue', save_queue)
 
-    async def process_chunk(
-        self,
-        chunk: List[Dict[str, Any]],
-        chunk_num: int,
-        total_chunks: int,
-        processed_urls: List[str]
-    ) -> int:
+    async def _persistence_worker(self, save_queue: asyncio.Queue, processed_urls: List[str]):
         """
-        Process a chunk of broadcasts (Optimization #7: Stream Processing)
+        Store crawl results in batches of up to chunk_size and checkpoint progress
+
+        DB writes are awaited on the shared async saver, so crawling continues meanwhile.
 
         Args:
-            chunk: List of broadcast dictionaries
-            chunk_num: Current chunk number (1-indexed)
-            total_chunks: Total number of chunks
+            save_queue: Queue of (url, result) tuples (None = stop)
             processed_urls: List to append processed URLs
+        """
+        stopping = False
+        while not stopping:
+            batch = []
+            item = await save_queue.get()
+            while True:
+                # Consume only our own stop signal, never another worker's
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.chunk_size or save_queue.empty():
+                    break
+                item = save_queue.get_nowait()
+
+            if not batch:
+                continue
+
+            results = [result for _, result in batch if result]
+            if results:
+                saved = await self.store_broadcasts_batch(results)
+                self.stats['saved'] += saved
+
+            batch_urls = [url for url, _ in batch if url]
+            processed_urls.extend(batch_urls)
+            self.pipeline_stats['batches_saved'] += 1
 
-        Returns:
-            Number of items saved
+            if self.checkpoint_manager:
+                # Journal append: only this batch's URLs are written
+                total = self.stats['total_broadcasts']
+                self.checkpoint_manager.save_checkpoint(
+                    processed_urls=batch_urls,
+                    total_urls=total,
+                    items_saved=self.stats['saved'],
+                    current_chunk=self.pipeline_stats['batches_saved'],
+                    total_chunks=(total + self.chunk_size - 1) // self.chunk_size
+                )
+
+    async def run_pipeline(self, broadcasts: List[Dict[str, Any]], processed_urls: List[str]):
         """
-        logger.info(f"📦 Processing chunk {chunk_num}/{total_chunks} ({len(chunk)} broadcasts)")
+        Run discovery -> crawl workers -> persistence workers over bounded queues
 
-        # Step 1: Crawl broadcasts in parallel
-        broadcast_details = await self.crawl_broadcasts_parallel(chunk)
+        Crawling and saving overlap continuously; full queues apply backpressure
+        to the stage before them instead of waiting on chunk barriers.
 
-        # Step 2: Store broadcasts in batch
-        items_saved = self.store_broadcasts_batch(broadcast_details)
+        Args:
+            broadcasts: Discovered broadcast dictionaries
+            processed_urls: List to append processed URLs
+        """
+        logger.info(
+            f"🚀 Pipeline: {len(broadcasts)} broadcasts, {self.concurrency} crawl workers, "
+            f"{self.persist_workers} persistence workers (queue size {self.queue_size})"
+        )
 
-        # Step 3: Update processed URLs
-        for broadcast in chunk:
-            if broadcast.get('url'):
-                processed_urls.append(broadcast['url'])
+        crawl_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        save_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
 
-        # Step 4: Save checkpoint (Optimization #8)
-        if self.checkpoint_manager:
-            self.checkpoint_manager.save_checkpoint(
-                processed_urls=processed_urls,
-                total_urls=self.stats['total_broadcasts'],
-                items_saved=self.stats['successful'],
-                current_chunk=chunk_num,
-                total_chunks=total_chunks
-            )
+        crawl_workers = [
+            asyncio.create_task(self._crawl_worker(crawl_queue, save_queue))
+            for _ in range(self.concurrency)
+        ]
+        persist_workers = [
+            asyncio.create_task(self._persistence_worker(save_queue, processed_urls))
+            for _ in range(self.persist_workers)
+        ]
+
+        try:
+            await self._discovery_producer(broadcasts, crawl_queue)
+            await asyncio.gather(*crawl_workers)
+
+            # One stop signal per persistence worker (after all results are queued)
+            for _ in range(self.persist_workers):
+                await save_queue.put(None)
+            await asyncio.gather(*persist_workers)
+        finally:
+            for task in crawl_workers + persist_workers:
+                task.cancel()
 
-        return items_saved
+        logger.info(f"✓ Pipeline complete: {self.stats['successful']} crawled, {self.stats['saved']} saved")
 
     async def run_async(
         self,
@@ -544,7 +782,8 @@ class OptimizedStandaloneCrawler:
         print("=" * 70)
         print(f"⚙️  Configuration:")
         print(f"   Concurrency: {self.concurrency} parallel crawlers")
-        print(f"   Chunk Size: {self.chunk_size} broadcasts per chunk")
+        print(f"   Batch Size: {self.chunk_size} broadcasts per DB batch")
+        print(f"   Persistence Workers: {self.persist_workers} (queue size {self.queue_size})")
         print(f"   Max Retries: {self.max_retries}")
         print(f"   Resume: {'Enabled' if resume else 'Disabled'}")
         print("=" * 70)
@@ -571,38 +810,37 @@ class OptimizedStandaloneCrawler:
             # Step 4: Update status to running
             self.update_execution_status('running')
 
-            # Step 5: Initialize browser pool
-            logger.info("🌐 Initializing browser pool...")
-            self.browser_pool = BrowserPool(pool_size=self.concurrency, headless=True)
-            await self.browser_pool.initialize()
-
-            # Step 6: Construct search URL
+            # Step 5: Construct search URL
             search_url = construct_search_url(platform, brand)
             self.log(f"🔗 Search URL: {search_url}", force=True)
 
-            # Step 7: Execute search crawler
-            broadcasts = self.execute_search_crawler(search_url, limit=limit)
+            # Step 6-7: Initialize browser pool while the search crawler runs (in a thread)
+            if self.owns_resources:
+                self.livebridge_queue = self._create_livebridge_queue()
+                logger.info("🌐 Initializing browser pool...")
+                self.browser_pool = self._create_browser_pool(self.concurrency)
+                _, broadcasts = await asyncio.gather(
+                    self.browser_pool.initialize(),
+                    asyncio.to_thread(self.execute_search_crawler, search_url, limit)
+                )
+            else:
+                broadcasts = await asyncio.to_thread(self.execute_search_crawler, search_url, limit)
             self.stats['total_broadcasts'] = len(broadcasts)
             logger.info(f"📊 Found {len(broadcasts)} broadcasts")
 
             # Step 8: Filter out already processed (if resuming)
             if processed_urls:
                 original_count = len(broadcasts)
-                broadcasts = [b for b in broadcasts if b.get('url') not in processed_urls]
+                already_processed = set(processed_urls)
+                broadcasts = [b for b in broadcasts if b.get('url') not in already_processed]
                 logger.info(f"Filtered {original_count - len(broadcasts)} already processed broadcasts")
 
             if not broadcasts:
                 logger.info("✓ All broadcasts already processed!")
                 return self.stats['successful']
 
-            # Step 9: Process broadcasts in chunks (Optimization #7)
-            total_chunks = (len(broadcasts) + self.chunk_size - 1) // self.chunk_size
-
-            for i in range(0, len(broadcasts), self.chunk_size):
-                chunk = broadcasts[i:i + self.chunk_size]
-                chunk_num = (i // self.chunk_size) + 1
-
-                await self.process_chunk(chunk, chunk_num, total_chunks, processed_urls)
+            # Step 9: Stream broadcasts through the crawl/persist pipeline
+            await self.run_pipeline(broadcasts, processed_urls)
 
             # Step 10: Update execution status to success
             self.update_execution_status('success', items_found=self.stats['successful'])
@@ -627,7 +865,22 @@ class OptimizedStandaloneCrawler:
             print(f"   Successful: {self.stats['successful']}")
             print(f"   Failed: {self.stats['failed']}")
             print(f"   Retried: {self.stats['retried']}")
-            print(f"   Skipped: {self.stats['skipped']}")
+            print(f"   Skipped: {self.stats['skipped']} (unchanged: {self.stats['unchanged']})")
+            print(f"   Saved: {self.stats['saved']} ({self.pipeline_stats['batches_saved']} batches)")
+            print(f"   HTTP Engine: {self.stats['http_engine']} (browser fallback: {self.stats['browser_fallback']})")
+            if self.raw_data != 'full':
+                print(f"   Raw data ({self.raw_data}): {self.stats['raw_data_saved_bytes'] / 1024:.1f} KB saved")
+            for stage in ('crawl_queue', 'save_queue'):
+                metrics = self.pipeline_stats[stage]
+                avg_depth = metrics['total_depth'] / metrics['samples'] if metrics['samples'] else 0
+                print(f"   {stage}: avg depth {avg_depth:.1f}, max {metrics['max_depth']}/{self.queue_size}")
+            if self.browser_pool:
+                pool_stats = self.browser_pool.get_stats()
+                print(f"   Browser Pool: {pool_stats['num_browsers']} browsers, {pool_stats['contexts_recycled']} contexts recycled, "
+                      f"{pool_stats['browser_restarts']} browser restarts, peak RSS per browser {pool_stats['peak_rss_mb']}MB")
+            for host, limits in HTTPClientRegistry.get_stats()['rate_limits'].items():
+                print(f"   Rate limit {host}: {limits['rate']} req/s, {limits['requests']} requests, "
+                      f"{limits['throttled']} throttled, waited {limits['waited_seconds']}s")
             print(f"")
             print(f"⚡ Performance:")
             if self.stats['successful'] > 0:
@@ -649,10 +902,202 @@ class OptimizedStandaloneCrawler:
             raise
 
         finally:
-            # Cleanup browser pool
-            if self.browser_pool:
-                logger.info("🧹 Cleaning up browser pool...")
-                await self.browser_pool.cleanup()
+            # Shared resources of a multi-brand sweep are closed by the sweep
+            if self.owns_resources:
+                await self._cleanup_resources()
+
+    def _create_browser_pool(self, pool_size: int) -> 'BrowserPool':
+        """Create (not yet initialized) browser pool with the configured sharding/recycling"""
+        return BrowserPool(
+            pool_size=pool_size,
+            headless=True,
+            num_browsers=self.num_browsers,
+            max_pages_per_context=self.max_pages_per_context,
+            max_memory_mb=self.max_browser_memory_mb
+        )
+
+    def _create_livebridge_queue(self) -> Optional['LivebridgeTaskQueue']:
+        """Create the background livebridge queue (None if livebridge crawling is disabled)"""
+        if not self.crawl_livebridge or not BROADCAST_CRAWLER_AVAILABLE:
+            return None
+        return LivebridgeTaskQueue(use_llm=self.use_livebridge_llm)
+
+    async def _cleanup_resources(self):
+        """Wait for livebridge tasks, then close browser pool, shared HTTP clients and pooled database connections"""
+        # Browser pool is not needed by livebridge tasks: release it first
+        if self.browser_pool:
+            logger.info("🧹 Cleaning up browser pool...")
+            await self.browser_pool.cleanup()
+            self.browser_pool = None
+
+        # Drain background livebridge crawls (they use the shared HTTP clients)
+        if self.livebridge_queue:
+            logger.info("⏳ Waiting for background livebridge crawls...")
+            await self.livebridge_queue.aclose()
+            stats = self.livebridge_queue.get_stats()
+            logger.info(
+                f"🌉 Livebridge: {stats['submitted']} queued, {stats['success']} saved, "
+                f"{stats['not_available']} not available, {stats['save_failed'] + stats['error']} failed"
+            )
+            self.livebridge_queue = None
+
+        # Close shared HTTP connections
+        await HTTPClientRegistry.aclose()
+        HTTPClientRegistry.close()
+
+        # Close pooled database connections
+        if self.saver:
+            await self.saver.close()
+            self.saver = None
+
+    def _spawn_brand_crawler(self) -> 'OptimizedStandaloneCrawler':
+        """
+        Create a brand run that shares this sweep's resources
+
+        The brand run keeps its own execution record, checkpoint and statistics
+        but borrows the browser pool, DB client, saver, fingerprint store,
+        loaded config and global crawl budget.
+
+        Returns:
+            OptimizedStandaloneCrawler for one brand
+        """
+        brand_crawler = OptimizedStandaloneCrawler(
+            verbose=self.verbose,
+            concurrency=self.concurrency,
+            chunk_size=self.chunk_size,
+            max_retries=self.max_retries,
+            persist_workers=self.persist_workers,
+            queue_size=self.queue_size,
+            child_sync=self.child_sync,
+            raw_data=self.raw_data,
+            crawl_livebridge=self.crawl_livebridge,
+            use_livebridge_llm=self.use_livebridge_llm,
+            use_http_engine=self.use_http_engine,
+            block_resources=self.block_resources,
+            num_browsers=self.num_browsers,
+            max_pages_per_context=self.max_pages_per_context,
+            max_browser_memory_mb=self.max_browser_memory_mb,
+            skip_unchanged=False,
+            db=self.db
+        )
+        brand_crawler.owns_resources = False
+        brand_crawler.browser_pool = self.browser_pool
+        brand_crawler.saver = self.saver
+        brand_crawler.livebridge_queue = self.livebridge_queue
+        brand_crawler.fingerprint_store = self.fingerprint_store
+        brand_crawler.crawl_budget = self.crawl_budget
+        brand_crawler.shared_config = self.shared_config
+        return brand_crawler
+
+    async def run_all_brands_async(
+        self,
+        trigger_type: str = 'manual',
+        limit: int = 50,
+        resume: bool = False,
+        brand_concurrency: int = 2
+    ) -> int:
+        """
+        Crawl all active brands in one process
+
+        Brand runs overlap (up to brand_concurrency at once), so one brand's
+        discovery runs while others crawl. All brands share one browser pool,
+        DB client and saver, and at most `concurrency` broadcasts are crawled
+        at a time across all brands. Each brand gets its own execution record.
+
+        Args:
+            trigger_type: 'scheduled' or 'manual'
+            limit: Maximum number of broadcasts to crawl per brand
+            resume: Resume each brand from its last checkpoint
+            brand_concurrency: Brands discovering/crawling at the same time (default: 2)
+
+        Returns:
+            Total number of broadcasts crawled across brands
+        """
+        self.start_time = datetime.now()
+
+        print("=" * 70)
+        print("🚀 Optimized Standalone Crawler - All Brands Sweep")
+        print("=" * 70)
+
+        try:
+            brands = self.db.get_active_brands()
+            if not brands:
+                logger.info("No active brands found")
+                return 0
+
+            self.shared_config = self.db.get_all_config()
+            print(f"⚙️  {len(brands)} active brands, {brand_concurrency} at a time, "
+                  f"{self.concurrency} concurrent broadcast crawls in total")
+
+            logger.info("🌐 Initializing shared browser pool...")
+            self.browser_pool = self._create_browser_pool(self.concurrency)
+            await self.browser_pool.initialize()
+            self.crawl_budget = asyncio.Semaphore(self.concurrency)
+            self.livebridge_queue = self._create_livebridge_queue()
+            if BROADCAST_CRAWLER_AVAILABLE:
+                self.saver = AsyncBroadcastSaver(
+                    child_sync=self.child_sync,
+                    raw_data=self.raw_data,
+                    max_connections=max(self.persist_workers * brand_concurrency * 4, 10)
+                )
+
+            brand_slots = asyncio.Semaphore(brand_concurrency)
+
+            async def run_brand(brand: Dict[str, Any]) -> Dict[str, Any]:
+                async with brand_slots:
+                    brand_crawler = self._spawn_brand_crawler()
+                    try:
+                        crawled = await brand_crawler.run_async(
+                            brand_id=brand['id'], trigger_type=trigger_type, limit=limit, resume=resume
+                        )
+                        error = None
+                    except Exception as e:
+                        # Recorded as failed on the brand's execution record; other brands continue
+                        crawled, error = 0, str(e)
+                    return {'brand': brand['name'], 'crawled': crawled, 'error': error, 'stats': brand_crawler.stats}
+
+            brand_results = await asyncio.gather(*(run_brand(brand) for brand in brands))
+
+            total = sum(result['crawled'] for result in brand_results)
+            duration = (datetime.now() - self.start_time).total_seconds()
+
+            print("\n" + "=" * 70)
+            print("✅ ALL BRANDS SWEEP COMPLETE")
+            print("=" * 70)
+            print(f"Duration: {duration:.1f}s")
+            for result in brand_results:
+                stats = result['stats']
+                status = f"❌ {result['error']}" if result['error'] else "✅"
+                print(f"   {result['brand']}: {stats['successful']}/{stats['total_broadcasts']} crawled, "
+                      f"{stats['saved']} saved, {stats['unchanged']} unchanged {status}")
+            print(f"Total crawled: {total}")
+            print("=" * 70)
+
+            return total
+
+        finally:
+            await self._cleanup_resources()
+
+    def run_all_brands(
+        self,
+        trigger_type: str = 'manual',
+        limit: int = 50,
+        resume: bool = False,
+        brand_concurrency: int = 2
+    ) -> int:
+        """
+        Synchronous wrapper for run_all_brands_async
+
+        Args:
+            trigger_type: 'scheduled' or 'manual'
+            limit: Maximum number of broadcasts to crawl per brand
+            resume: Resume each brand from its last checkpoint
+            brand_concurrency: Brands discovering/crawling at the same time
+
+        Returns:
+            Total number of broadcasts crawled across brands
+        """
+        return asyncio.run(self.run_all_brands_async(trigger_type, limit, resume, brand_concurrency))
 
     def run(
         self,
@@ -697,10 +1142,13 @@ Examples:
   # Scheduled trigger with verbose output
   python standalone_crawler_optimized.py --brand-name "Sulwhasoo" --trigger scheduled -v
 
+  # All active brands in one process (10 crawls in flight across brands)
+  python standalone_crawler_optimized.py --all-brands --concurrency 10 --brand-concurrency 3
+
 Performance Notes:
   - Default concurrency (5) is safe for most systems
   - Increase concurrency (10-15) for faster execution on powerful machines
-  - Chunk size affects memory usage: smaller chunks = less memory
+  - Chunk size is the DB batch size; pipeline queues hold at most 2x concurrency broadcasts
         """
     )
 
@@ -716,6 +1164,19 @@ Performance Notes:
         help='Brand name (alternative to brand-id)'
     )
 
+    parser.add_argument(
+        '--all-brands',
+        action='store_true',
+        help='Crawl all active brands (shared browser pool and DB client, one execution record per brand)'
+    )
+
+    parser.add_argument(
+        '--brand-concurrency',
+        type=int,
+        default=2,
+        help='With --all-brands: number of brands discovering/crawling at the same time (default: 2)'
+    )
+
     parser.add_argument(
         '--trigger',
         type=str,
@@ -748,7 +1209,7 @@ Performance Notes:
         '--chunk-size',
         type=int,
         default=10,
-        help='Number of broadcasts to process per chunk (default: 10)'
+        help='Maximum broadcasts per database batch (default: 10)'
     )
 
     parser.add_argument(
@@ -770,6 +1231,69 @@ Performance Notes:
         help='Disable automatic livebridge crawling (enabled by default)'
     )
 
+    parser.add_argument(
+        '--no-http-engine',
+        action='store_true',
+        help='Disable browserless HTTP crawling (always use Playwright)'
+    )
+
+    parser.add_argument(
+        '--persist-workers',
+        type=int,
+        default=2,
+        help='Number of concurrent database persistence workers (default: 2)'
+    )
+
+    parser.add_argument(
+        '--child-sync',
+        choices=['replace', 'diff'],
+        default='replace',
+        help='How to save child records: replace (delete + reinsert) or diff (write only changed rows, '
+             'requires content_hash columns) (default: replace)'
+    )
+
+    parser.add_argument(
+        '--raw-data',
+        choices=['full', 'slim', 'compressed', 'off'],
+        default='full',
+        help='How much original JSON to store: full, slim (no child arrays already in tables), '
+             'compressed (zstd archive, requires raw_data_compressed column) or off (default: full)'
+    )
+
+    parser.add_argument(
+        '--no-block-resources',
+        action='store_true',
+        help='Load images, media, fonts and trackers in browser pages (default: blocked)'
+    )
+
+    parser.add_argument(
+        '--browsers',
+        type=int,
+        default=None,
+        help='Number of Chromium processes to shard browser contexts across (default: auto from CPU count)'
+    )
+
+    parser.add_argument(
+        '--max-pages-per-context',
+        type=int,
+        default=50,
+        help='Recycle a browser context after this many pages (default: 50)'
+    )
+
+    parser.add_argument(
+        '--max-browser-memory',
+        type=float,
+        default=2048,
+        help='Per-browser memory budget: recycle a browser\'s contexts while its Chromium process tree '
+             'exceeds this many MB (default: 2048, 0 to disable)'
+    )
+
+    parser.add_argument(
+        '--force-recrawl',
+        action='store_true',
+        help='Crawl every broadcast even if its fingerprint is unchanged since the last save'
+    )
+
     parser.add_argument(
         '--livebridge-llm',
         action='store_true',
@@ -779,8 +1303,11 @@ Performance Notes:
     args = parser.parse_args()
 
     # Validate arguments
-    if not args.brand_id and not args.brand_name:
-        parser.error('Must provide either --brand-id or --brand-name')
+    if args.all_brands and (args.brand_id or args.brand_name):
+        parser.error('Cannot combine --all-brands with --brand-id or --brand-name')
+
+    if not args.all_brands and not args.brand_id and not args.brand_name:
+        parser.error('Must provide either --brand-id, --brand-name or --all-brands')
 
     if args.brand_id and args.brand_name:
         parser.error('Cannot provide both --brand-id and --brand-name')
@@ -791,18 +1318,35 @@ Performance Notes:
             verbose=args.verbose,
             concurrency=args.concurrency,
             chunk_size=args.chunk_size,
+            persist_workers=args.persist_workers,
+            child_sync=args.child_sync,
+            raw_data=args.raw_data,
             max_retries=args.max_retries,
             crawl_livebridge=not args.no_livebridge,  # Enabled by default
-            use_livebridge_llm=args.livebridge_llm  # Disabled by default
+            use_livebridge_llm=args.livebridge_llm,  # Disabled by default
+            use_http_engine=not args.no_http_engine,  # Enabled by default
+            block_resources=not args.no_block_resources,  # Enabled by default
+            num_browsers=args.browsers,
+            max_pages_per_context=args.max_pages_per_context,
+            max_browser_memory_mb=args.max_browser_memory or None,
+            skip_unchanged=not args.force_recrawl
         )
 
-        items_found = crawler.run(
-            brand_id=args.brand_id,
-            brand_name=args.brand_name,
-            trigger_type=args.trigger,
-            limit=args.limit,
-            resume=args.resume
-        )
+        if args.all_brands:
+            items_found = crawler.run_all_brands(
+                trigger_type=args.trigger,
+                limit=args.limit,
+                resume=args.resume,
+                brand_concurrency=args.brand_concurrency
+            )
+        else:
+            items_found = crawler.run(
+                brand_id=args.brand_id,
+                brand_name=args.brand_name,
+                trigger_type=args.trigger,
+                limit=args.limit,
+                resume=args.resume
+            )
 
         # Exit with success
         sys.exit(0)
@@ -4,6 +4,26 @@ Crawler Optimization Utilities
 
 from .browser_pool import BrowserPool
 from .checkpoint_manager import CheckpointManager
+from .comment_cursors import CommentCursorStore
+from .fingerprint_store import BroadcastFingerprintStore
+from .http_clients import HTTPClientRegistry
+from .image_preprocessor import ImagePreprocessor
+from .rate_limiter import AdaptiveTokenBucket, HostRateLimiter
+from .request_filter import RequestFilter
 from .url_detector import URLDetector, URLType
+from .vision_cache import VisionResponseCache
 
-__all__ = ['BrowserPool', 'CheckpointManager', 'URLDetector', 'URLType']
+__all__ = [
+    'AdaptiveTokenBucket',
+    'BroadcastFingerprintStore',
+    'BrowserPool',
+    'CheckpointManager',
+    'CommentCursorStore',
+    'HostRateLimiter',
+    'HTTPClientRegistry',
+    'ImagePreprocessor',
+    'RequestFilter',
+    'URLDetector',
+    'URLType',
+    'VisionResponseCache',
+]
@@ -5,9 +5,18 @@ Optimization #2: Browser Instance Pooling
 
 import asyncio
 import logging
-from typing import Optional, List
+import math
+import os
+import time
+from typing import Optional, List, Dict, Any
 from playwright.async_api import async_playwright, Browser, BrowserContext
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,26 +28,99 @@ class BrowserPool:
     - Eliminates browser startup overhead (1-2s per instance)
     - Reuses browser contexts for better performance
     - Manages browser lifecycle automatically
+    - Shards contexts across several Chromium processes (least-loaded selection)
+    - Recycles contexts after N pages or when their browser's memory exceeds a per-browser budget
+    - Relaunches Chromium if it crashes and health-checks contexts before handing them out
     """
 
-    def __init__(self, pool_size: int = 5, headless: bool = True):
+    def __init__(
+        self,
+        pool_size: int = 5,
+        headless: bool = True,
+        num_browsers: Optional[int] = None,
+        max_pages_per_context: int = 50,
+        max_memory_mb: Optional[float] = 2048,
+        health_check_timeout: float = 3.0,
+        memory_check_interval: float = 10.0
+    ):
         """
         Initialize browser pool
 
         Args:
             pool_size: Maximum number of concurrent browser contexts
             headless: Whether to run browsers in headless mode
+            num_browsers: Number of Chromium processes to shard contexts across (None = auto from CPU count)
+            max_pages_per_context: Recycle a context after this many uses (default: 50)
+            max_memory_mb: Per-browser RSS budget; a shard recycles released contexts while its
+                Chromium process tree exceeds this (requires psutil, None to disable)
+            health_check_timeout: Timeout for the health probe before handing out a context (default: 3s)
+            memory_check_interval: Minimum seconds between RSS measurements and between
+                memory-triggered recycles of a shard (default: 10s)
         """
         self.pool_size = pool_size
         self.headless = headless
+        self.num_browsers = max(1, min(pool_size, num_browsers or self.auto_num_browsers(pool_size)))
+        self.max_pages_per_context = max_pages_per_context
+        self.max_memory_mb = max_memory_mb if PSUTIL_AVAILABLE else None
+        self.health_check_timeout = health_check_timeout
+        self.memory_check_interval = memory_check_interval
         self.playwright = None
-        self.browser: Optional[Browser] = None
+        self.browsers: List[Optional[Browser]] = [None] * self.num_browsers
         self.contexts: List[BrowserContext] = []
-        self.available_contexts: asyncio.Queue = asyncio.Queue()
         self.lock = asyncio.Lock()
+
+        # Shard bookkeeping: idle contexts and in-use count per browser
+        self._idle: List[List[BrowserContext]] = [[] for _ in range(self.num_browsers)]
+        self._in_use: List[int] = [0] * self.num_browsers
+        self._available = asyncio.Semaphore(0)
+        self._shard_locks = [asyncio.Lock() for _ in range(self.num_browsers)]
         self._initialized = False
+        self._closing = False
+
+        # Per-context bookkeeping (keyed by context object)
+        self.context_uses: Dict[BrowserContext, int] = {}
+        self.context_shard: Dict[BrowserContext, int] = {}
+        self.context_generation: Dict[BrowserContext, int] = {}
+        self.browser_generations: List[int] = [0] * self.num_browsers
+
+        # Per-shard RSS cache and last memory-triggered recycle
+        self._last_rss_mb: List[Optional[float]] = [None] * self.num_browsers
+        self._last_rss_check: List[float] = [0.0] * self.num_browsers
+        self._last_memory_recycle: List[float] = [0.0] * self.num_browsers
 
-        logger.info(f"BrowserPool initialized with pool_size={pool_size}")
+        self.stats = {
+            'pages_served': 0,
+            'contexts_recycled': 0,
+            'health_check_failures': 0,
+            'browser_restarts': 0,
+            'peak_rss_mb': 0.0
+        }
+
+        if max_memory_mb and not PSUTIL_AVAILABLE:
+            logger.warning("psutil not installed - memory-based context recycling disabled")
+
+        logger.info(
+            f"BrowserPool initialized with pool_size={pool_size}, num_browsers={self.num_browsers}, "
+            f"max_pages_per_context={max_pages_per_context}, max_memory_mb={self.max_memory_mb}"
+        )
+
+    @staticmethod
+    def auto_num_browsers(pool_size: int, contexts_per_browser: int = 5) -> int:
+        """
+        Choose number of browser processes from core count
+
+        One browser per `contexts_per_browser` contexts, capped at half the CPU cores
+        (each Chromium spawns several renderer processes).
+
+        Args:
+            pool_size: Total number of contexts
+            contexts_per_browser: Target contexts per browser (default: 5)
+
+        Returns:
+            Number of browsers (>= 1)
+        """
+        max_by_cores = max(1, (os.cpu_count() or 2) // 2)
+        return max(1, min(max_by_cores, math.ceil(pool_size / contexts_per_browser)))
 
     async def initialize(self):
         """Initialize the browser pool"""
@@ -54,72 +136,335 @@ class BrowserPool:
             # Launch playwright
             self.playwright = await async_playwright().start()
 
-            # Launch single browser instance
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            )
-
-            # Create browser contexts (lightweight)
+            # Launch browser shards
+            await asyncio.gather(*(self._launch_browser(shard) for shard in range(self.num_browsers)))
+
+            # Create browser contexts (lightweight), round-robin across shards
             for i in range(self.pool_size):
-                context = await self.browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                    ignore_https_errors=True,  # Ignore SSL certificate errors
-                    extra_http_headers={
-                        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
-                    }
-                )
+                shard = i % self.num_browsers
+                context = await self._create_context(shard)
                 self.contexts.append(context)
-                await self.available_contexts.put(context)
-                logger.info(f"Created browser context {i+1}/{self.pool_size}")
+                self._idle[shard].append(context)
+                self._available.release()
+                logger.info(f"Created browser context {i+1}/{self.pool_size} (browser {shard + 1}/{self.num_browsers})")
 
             self._initialized = True
             logger.info("Browser pool initialization complete")
 
+    async def _launch_browser(self, shard: int):
+        """Launch the Chromium instance for a shard"""
+        browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=[
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                '--disable-blink-features=AutomationControlled',
+                self._shard_marker(shard)  # Unknown switch (ignored by Chromium), finds the process for RSS
+            ]
+        )
+        browser.on('disconnected', lambda _: self._on_browser_disconnected(shard))
+        self.browsers[shard] = browser
+        self.browser_generations[shard] += 1
+
+    def _shard_marker(self, shard: int) -> str:
+        """Command-line switch identifying a shard's Chromium browser process"""
+        return f"--browser-pool-shard={os.getpid()}.{id(self)}.{shard}"
+
+    def _on_browser_disconnected(self, shard: int):
+        """Log unexpected browser exits (relaunch happens lazily on next acquire)"""
+        if not self._closing:
+            logger.error(f"Browser {shard + 1} disconnected unexpectedly - will relaunch on next acquire")
+
+    def _is_connected(self, shard: int) -> bool:
+        """Check whether a shard's browser is alive"""
+        browser = self.browsers[shard]
+        return browser is not None and browser.is_connected()
+
+    async def _ensure_browser(self, shard: int):
+        """Relaunch a shard's Chromium if it crashed (caller must hold the shard lock)"""
+        if self._is_connected(shard):
+            return
+
+        logger.warning(f"Browser {shard + 1} not connected, relaunching Chromium...")
+        try:
+            if self.browsers[shard]:
+                await self.browsers[shard].close()
+        except Exception:
+            pass
+
+        await self._launch_browser(shard)
+        self.stats['browser_restarts'] += 1
+        logger.info(f"✓ Browser {shard + 1} relaunched (generation {self.browser_generations[shard]})")
+
+    async def _create_context(self, shard: int) -> BrowserContext:
+        """Create a new browser context on a shard's browser"""
+        context = await self.browsers[shard].new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            ignore_https_errors=True,  # Ignore SSL certificate errors
+            extra_http_headers={
+                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
+            }
+        )
+        self.context_uses[context] = 0
+        self.context_shard[context] = shard
+        self.context_generation[context] = self.browser_generations[shard]
+        return context
+
+    async def _replace_context(self, context: BrowserContext, reason: str) -> BrowserContext:
+        """
+        Close a context and replace it with a fresh one
+
+        Args:
+            context: The context to replace
+            reason: Why the context is recycled (for logging)
+
+        Returns:
+            The new context
+        """
+        shard = self.context_shard[context]
+        async with self._shard_locks[shard]:
+            await self._ensure_browser(shard)
+
+            try:
+                await asyncio.wait_for(context.close(), timeout=self.health_check_timeout)
+            except Exception as e:
+                logger.debug(f"Error closing recycled context: {e}")
+
+            new_context = await self._create_context(shard)
+            uses = self.context_uses.pop(context, 0)
+            self.context_shard.pop(context, None)
+            self.context_generation.pop(context, None)
+            if context in self.contexts:
+                self.contexts[self.contexts.index(context)] = new_context
+            else:
+                self.contexts.append(new_context)
+
+        self.stats['contexts_recycled'] += 1
+        logger.info(f"♻️  Recycled browser context after {uses} pages ({reason})")
+        return new_context
+
+    async def _discard_context(self, context: BrowserContext):
+        """
+        Close a dead context and remove it from the pool (its semaphore slot is not returned)
+
+        Args:
+            context: The context to drop (must be checked out)
+        """
+        shard = self.context_shard.pop(context, None)
+        self.context_uses.pop(context, None)
+        self.context_generation.pop(context, None)
+        if context in self.contexts:
+            self.contexts.remove(context)
+        if shard is not None:
+            self._in_use[shard] -= 1
+
+        try:
+            await asyncio.wait_for(context.close(), timeout=self.health_check_timeout)
+        except Exception as e:
+            logger.debug(f"Error closing dead context: {e}")
+
+    async def _refill_slot(self, shard: int) -> bool:
+        """
+        Add a fresh idle context to a shard (after a context was discarded)
+
+        Args:
+            shard: Browser shard index
+
+        Returns:
+            True if the slot was refilled, False if the pool shrank
+        """
+        try:
+            async with self._shard_locks[shard]:
+                await self._ensure_browser(shard)
+                context = await self._create_context(shard)
+        except Exception as e:
+            logger.error(f"✗ Could not refill browser context slot ({e}), pool size now {len(self.contexts)}")
+            return False
+
+        self.contexts.append(context)
+        self._idle[shard].append(context)
+        self._available.release()
+        return True
+
+    async def _is_healthy(self, context: BrowserContext) -> bool:
+        """
+        Cheap health probe: shard browser connected, context from its current browser, and responsive
+
+        Args:
+            context: The context to check
+
+        Returns:
+            True if the context can be used
+        """
+        shard = self.context_shard[context]
+        if not self._is_connected(shard):
+            return False
+        if self.context_generation.get(context) != self.browser_generations[shard]:
+            return False
+
+        try:
+            await asyncio.wait_for(context.cookies(), timeout=self.health_check_timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"Context health probe failed: {e}")
+            return False
+
+    def _find_browser_process(self, shard: int) -> Optional['psutil.Process']:
+        """Find a shard's Chromium browser process among this process's descendants"""
+        marker = self._shard_marker(shard)
+        for child in psutil.Process().children(recursive=True):
+            try:
+                if marker in child.cmdline():
+                    return child
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return None
+
+    def get_browser_rss_mb(self, shard: int) -> Optional[float]:
+        """
+        Get resident memory of one shard's Chromium process tree (browser, renderers, GPU, ...)
+
+        Args:
+            shard: Browser shard index
+
+        Returns:
+            RSS in MB, or None if psutil is unavailable or the process was not found
+        """
+        if not PSUTIL_AVAILABLE:
+            return None
+
+        now = time.monotonic()
+        cached = self._last_rss_mb[shard]
+        if cached is not None and now - self._last_rss_check[shard] < self.memory_check_interval:
+            return cached
+
+        try:
+            browser_process = self._find_browser_process(shard)
+            if browser_process is None:
+                return cached
+            total = 0
+            for process in [browser_process, *browser_process.children(recursive=True)]:
+                try:
+                    total += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        except Exception as e:
+            logger.debug(f"Failed to measure browser {shard + 1} RSS: {e}")
+            return cached
+
+        rss_mb = self._last_rss_mb[shard] = total / (1024 * 1024)
+        self._last_rss_check[shard] = now
+        self.stats['peak_rss_mb'] = max(self.stats['peak_rss_mb'], round(rss_mb, 1))
+        return rss_mb
+
+    def _select_shard(self) -> int:
+        """Pick the least-loaded shard that has an idle context"""
+        candidates = [shard for shard in range(self.num_browsers) if self._idle[shard]]
+        return min(candidates, key=lambda shard: (self._in_use[shard], -len(self._idle[shard])))
+
+    def _return_context(self, context: BrowserContext):
+        """Put a context back on its shard's idle list and wake a waiter"""
+        shard = self.context_shard[context]
+        self._in_use[shard] -= 1
+        self._idle[shard].append(context)
+        self._available.release()
+
     async def acquire_context(self) -> BrowserContext:
         """
-        Acquire a browser context from the pool
+        Acquire a browser context from the pool (least-loaded browser first)
 
         Returns:
             BrowserContext ready for use
         """
         if not self._initialized:
             await self.initialize()
+        if not self.contexts:
+            raise RuntimeError("Browser pool has no usable contexts left")
 
         # Wait for available context
-        context = await self.available_contexts.get()
+        await self._available.acquire()
+        shard = self._select_shard()
+        context = self._idle[shard].pop()
+        self._in_use[shard] += 1
+
+        try:
+            if not await self._is_healthy(context):
+                self.stats['health_check_failures'] += 1
+                context = await self._replace_context(context, reason='failed health check')
+        except Exception:
+            # Never hand the dead context out again: drop it and try to refill its slot
+            await self._discard_context(context)
+            await self._refill_slot(shard)
+            raise
+
+        self.context_uses[context] = self.context_uses.get(context, 0) + 1
+        self.stats['pages_served'] += 1
         logger.debug("Browser context acquired from pool")
         return context
 
     async def release_context(self, context: BrowserContext):
         """
         Release a browser context back to the pool
+        Recycles the context if it hit the page limit or its browser is over the memory budget
+        (at most one memory-triggered recycle per shard per memory_check_interval)
 
         Args:
             context: The context to release
         """
-        # Clear cookies and storage for clean state
-        try:
-            await context.clear_cookies()
-        except Exception as e:
-            logger.warning(f"Failed to clear cookies: {e}")
+        reason = None
+        shard = self.context_shard[context]
+        now = time.monotonic()
+        if self.context_uses.get(context, 0) >= self.max_pages_per_context:
+            reason = f"page limit {self.max_pages_per_context}"
+        elif self.max_memory_mb and now - self._last_memory_recycle[shard] >= self.memory_check_interval:
+            rss_mb = self.get_browser_rss_mb(shard)
+            if rss_mb and rss_mb > self.max_memory_mb:
+                reason = f"browser {shard + 1} RSS {rss_mb:.0f}MB > {self.max_memory_mb}MB"
+                self._last_memory_recycle[shard] = now
+                self._last_rss_mb[shard] = None  # Re-measure once the interval has passed
+
+        if reason:
+            try:
+                context = await self._replace_context(context, reason=reason)
+            except Exception as e:
+                logger.warning(f"Failed to recycle context: {e}")
+        else:
+            # Clear cookies and storage for clean state
+            try:
+                await context.clear_cookies()
+            except Exception as e:
+                logger.warning(f"Failed to clear cookies: {e}")
 
         # Return to pool
-        await self.available_contexts.put(context)
+        self._return_context(context)
         logger.debug("Browser context released back to pool")
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Dictionary with usage, recycling and memory statistics
+        """
+        return {
+            **self.stats,
+            'pool_size': self.pool_size,
+            'num_browsers': self.num_browsers,
+            'in_use_per_browser': list(self._in_use),
+            'browser_rss_mb': [round(rss, 1) if rss is not None else None for rss in self._last_rss_mb],
+            'context_uses': sorted(self.context_uses.values(), reverse=True)
+        }
+
     async def cleanup(self):
         """Clean up all browser resources"""
         if not self._initialized:
             return
 
         logger.info("Cleaning up browser pool...")
+        logger.info(f"Browser pool stats: {self.get_stats()}")
+        self._closing = True
 
         # Close all contexts
         for context in self.contexts:
@@ -128,12 +473,13 @@ class BrowserPool:
             except Exception as e:
                 logger.warning(f"Error closing context: {e}")
 
-        # Close browser
-        if self.browser:
-            try:
-                await self.browser.close()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
+        # Close browsers
+        for browser in self.browsers:
+            if browser:
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing browser: {e}")
 
         # Stop playwright
         if self.playwright:
@@ -142,6 +488,15 @@ class BrowserPool:
             except Exception as e:
                 logger.warning(f"Error stopping playwright: {e}")
 
+        self.contexts = []
+        self.browsers = [None] * self.num_browsers
+        self._idle = [[] for _ in range(self.num_browsers)]
+        self._in_use = [0] * self.num_browsers
+        self._available = asyncio.Semaphore(0)
+        self.context_uses.clear()
+        self.context_shard.clear()
+        self.context_generation.clear()
+        self._closing = False
         self._initialized = False
         logger.info("Browser pool cleanup complete")
 
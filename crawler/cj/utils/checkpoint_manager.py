@@ -5,8 +5,9 @@ Optimization #8: Add Progress Tracking & Resume Capability
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -17,68 +18,186 @@ class CheckpointManager:
     Manages crawler checkpoints for resume capability
 
     Features:
-    - Save progress after each chunk
+    - Save progress after each batch
     - Resume from last successful checkpoint
-    - Track processed URLs to avoid duplicates
+    - Track processed URLs to avoid duplicates (in-memory, O(1) lookups)
     - Store statistics and errors
+
+    Storage is an append-only JSONL journal: each save appends only the newly
+    processed URLs and a small progress record, and the journal is periodically
+    compacted into a single snapshot line.
+
+    Journal records:
+        {"type": "snapshot", "processed_urls": [...], "progress": {...}}
+        {"type": "urls", "urls": [...]}
+        {"type": "progress", "timestamp": ..., "total_urls": ..., ...}
     """
 
-    def __init__(self, execution_id: str, checkpoint_dir: str = "crawler/cj/checkpoints"):
+    def __init__(
+        self,
+        execution_id: str,
+        checkpoint_dir: str = "crawler/cj/checkpoints",
+        compact_every: int = 500
+    ):
         """
         Initialize checkpoint manager
 
         Args:
             execution_id: Unique execution ID
             checkpoint_dir: Directory to store checkpoint files
+            compact_every: Compact the journal after this many appended records (default: 500)
         """
         self.execution_id = execution_id
         self.checkpoint_dir = Path(checkpoint_dir)
-        self.checkpoint_file = self.checkpoint_dir / f"checkpoint_{execution_id}.json"
+        self.checkpoint_file = self.checkpoint_dir / f"checkpoint_{execution_id}.jsonl"
+        self.legacy_checkpoint_file = self.checkpoint_dir / f"checkpoint_{execution_id}.json"
+        self.compact_every = compact_every
+
+        # In-memory state (dict keeps insertion order for get_processed_urls)
+        self._processed: Dict[str, None] = {}
+        self._progress: Optional[Dict[str, Any]] = None
+        self._records_since_compaction = 0
 
         # Create checkpoint directory if it doesn't exist
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
+        self._load()
+
         logger.info(f"CheckpointManager initialized for execution {execution_id}")
 
+    def _load(self):
+        """Replay the journal (or import a legacy JSON checkpoint) into memory"""
+        if self.checkpoint_file.exists():
+            records = 0
+            corrupt = False
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final line from an interrupted write
+                        logger.warning("Skipping corrupt checkpoint journal line")
+                        corrupt = True
+                        continue
+                    self._apply(record)
+                    records += 1
+            self._records_since_compaction = records
+            # Rewrite so new appends never follow a torn line
+            if corrupt or records > self.compact_every:
+                self.compact()
+            return
+
+        if self.legacy_checkpoint_file.exists():
+            try:
+                with open(self.legacy_checkpoint_file, 'r', encoding='utf-8') as f:
+                    legacy = json.load(f)
+                processed_urls = legacy.pop('processed_urls', [])
+                self._processed = dict.fromkeys(processed_urls)
+                self._progress = legacy
+                self.compact()
+                self.legacy_checkpoint_file.unlink()
+                logger.info(f"Migrated legacy checkpoint ({len(processed_urls)} URLs) to journal")
+            except Exception as e:
+                logger.error(f"Failed to load legacy checkpoint: {e}")
+
+    def _apply(self, record: Dict[str, Any]):
+        """Apply one journal record to in-memory state"""
+        record_type = record.get('type')
+        if record_type == 'snapshot':
+            self._processed = dict.fromkeys(record.get('processed_urls', []))
+            self._progress = record.get('progress')
+        elif record_type == 'urls':
+            self._processed.update(dict.fromkeys(record.get('urls', [])))
+        elif record_type == 'progress':
+            self._progress = {k: v for k, v in record.items() if k != 'type'}
+
+    def _append(self, *records: Dict[str, Any]):
+        """Append records to the journal (one JSON object per line)"""
+        with open(self.checkpoint_file, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+        self._records_since_compaction += len(records)
+        if self._records_since_compaction >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the journal as a single snapshot line (atomic replace)"""
+        snapshot = {
+            'type': 'snapshot',
+            'processed_urls': list(self._processed),
+            'progress': self._progress
+        }
+        tmp_file = self.checkpoint_file.with_suffix('.jsonl.tmp')
+
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')) + '\n')
+            os.replace(tmp_file, self.checkpoint_file)
+            self._records_since_compaction = 1
+            logger.debug(f"Checkpoint journal compacted ({len(self._processed)} URLs)")
+        except Exception as e:
+            logger.error(f"Failed to compact checkpoint: {e}")
+
+    def mark_processed(self, urls: Iterable[str]):
+        """
+        Record processed URLs (appends only URLs not seen before)
+
+        Args:
+            urls: URLs that finished processing
+        """
+        new_urls = [url for url in urls if url and url not in self._processed]
+        if not new_urls:
+            return
+
+        self._processed.update(dict.fromkeys(new_urls))
+        try:
+            self._append({'type': 'urls', 'urls': new_urls})
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint: {e}")
+
     def save_checkpoint(
         self,
-        processed_urls: List[str],
-        total_urls: int,
-        items_saved: int,
-        current_chunk: int,
-        total_chunks: int,
+        processed_urls: Optional[Iterable[str]] = None,
+        total_urls: int = 0,
+        items_saved: int = 0,
+        current_chunk: int = 0,
+        total_chunks: int = 0,
         errors: List[Dict[str, Any]] = None
     ):
         """
         Save checkpoint to disk
 
         Args:
-            processed_urls: List of URLs already processed
+            processed_urls: URLs processed since the last save (already-recorded URLs are ignored)
             total_urls: Total number of URLs to process
             items_saved: Number of items successfully saved
             current_chunk: Current chunk number
             total_chunks: Total number of chunks
             errors: List of errors encountered
         """
-        checkpoint_data = {
+        if processed_urls:
+            self.mark_processed(processed_urls)
+
+        processed = len(self._processed)
+        progress = {
             'execution_id': self.execution_id,
             'timestamp': datetime.now().isoformat(),
-            'processed_urls': processed_urls,
             'total_urls': total_urls,
             'items_saved': items_saved,
             'current_chunk': current_chunk,
             'total_chunks': total_chunks,
-            'progress_percentage': round((len(processed_urls) / total_urls * 100), 2) if total_urls > 0 else 0,
+            'progress_percentage': round((processed / total_urls * 100), 2) if total_urls > 0 else 0,
             'errors': errors or []
         }
+        self._progress = progress
 
         try:
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint_data, f, indent=2, ensure_ascii=False)
+            self._append({'type': 'progress', **progress})
 
             logger.info(
-                f"Checkpoint saved: {len(processed_urls)}/{total_urls} URLs processed "
-                f"({checkpoint_data['progress_percentage']}%)"
+                f"Checkpoint saved: {processed}/{total_urls} URLs processed "
+                f"({progress['progress_percentage']}%)"
             )
 
         except Exception as e:
@@ -86,29 +205,30 @@ class CheckpointManager:
 
     def load_checkpoint(self) -> Optional[Dict[str, Any]]:
         """
-        Load checkpoint from disk
+        Get the current checkpoint (from memory)
 
         Returns:
             Checkpoint data dictionary or None if not found
         """
-        if not self.checkpoint_file.exists():
+        if self._progress is None and not self._processed:
             logger.info("No checkpoint found, starting fresh")
             return None
 
-        try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                checkpoint_data = json.load(f)
-
-            logger.info(
-                f"Checkpoint loaded: {len(checkpoint_data['processed_urls'])}/{checkpoint_data['total_urls']} "
-                f"URLs already processed ({checkpoint_data['progress_percentage']}%)"
-            )
+        checkpoint_data = {
+            'execution_id': self.execution_id,
+            'timestamp': None,
+            'total_urls': 0,
+            'progress_percentage': 0,
+            **(self._progress or {}),
+            'processed_urls': list(self._processed)
+        }
 
-            return checkpoint_data
+        logger.info(
+            f"Checkpoint loaded: {len(self._processed)}/{checkpoint_data['total_urls']} "
+            f"URLs already processed ({checkpoint_data['progress_percentage']}%)"
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to load checkpoint: {e}")
-            return None
+        return checkpoint_data
 
     def get_processed_urls(self) -> List[str]:
         """
@@ -117,10 +237,7 @@ class CheckpointManager:
         Returns:
             List of processed URL strings
         """
-        checkpoint = self.load_checkpoint()
-        if checkpoint:
-            return checkpoint.get('processed_urls', [])
-        return []
+        return list(self._processed)
 
     def should_process_url(self, url: str) -> bool:
         """
@@ -132,17 +249,21 @@ class CheckpointManager:
         Returns:
             True if URL should be processed, False if already done
         """
-        processed = self.get_processed_urls()
-        return url not in processed
+        return url not in self._processed
 
     def clear_checkpoint(self):
         """Remove checkpoint file (call after successful completion)"""
-        if self.checkpoint_file.exists():
-            try:
-                self.checkpoint_file.unlink()
-                logger.info("Checkpoint cleared")
-            except Exception as e:
-                logger.error(f"Failed to clear checkpoint: {e}")
+        self._processed = {}
+        self._progress = None
+        self._records_since_compaction = 0
+
+        for checkpoint_file in (self.checkpoint_file, self.legacy_checkpoint_file):
+            if checkpoint_file.exists():
+                try:
+                    checkpoint_file.unlink()
+                    logger.info("Checkpoint cleared")
+                except Exception as e:
+                    logger.error(f"Failed to clear checkpoint: {e}")
 
     def get_resume_info(self) -> Dict[str, Any]:
         """
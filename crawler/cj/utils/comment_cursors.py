@@ -0,0 +1,83 @@
+"""
+Comment Cursor Store
+Per-broadcast comment pagination cursors so recrawls fetch only new chat
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from .jsonl_index import JSONLIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CommentCursorStore(JSONLIndex):
+    """
+    Local index of the newest comment cursor stored per broadcast
+
+    A cursor records where comment pagination stopped:
+        {
+            'last_comment_no': ...,        # lastCommentNo of the last page fetched
+            'last_created_at_milli': ...,  # lastCreatedAtMilli of the last page fetched
+            'skip': 12,                    # comments after that cursor already consumed
+            'fetched': 3412,               # total comments consumed (keeps keep_odd_only parity)
+            'updated_at': '...'
+        }
+
+    Crawlers read cursors before fetching comments; savers commit the new cursor
+    only after the broadcast was saved, so a failed save is refetched next time.
+    Delete the index file (or call forget()) to force a full comment refetch.
+    """
+
+    _default: Optional['CommentCursorStore'] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, index_file: str = "crawler/cj/checkpoints/comment_cursors.jsonl"):
+        """
+        Initialize cursor store
+
+        Args:
+            index_file: Path of the JSONL cursor journal
+        """
+        super().__init__(index_file)
+
+    @classmethod
+    def default(cls) -> 'CommentCursorStore':
+        """
+        Get the process-wide store (shared by crawlers and savers)
+
+        Returns:
+            CommentCursorStore instance
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def commit(self, cursors: Dict[Any, Dict[str, Any]]):
+        """
+        Store new cursors (call after the comments were saved)
+
+        Args:
+            cursors: broadcast_id -> cursor
+        """
+        now = datetime.now().isoformat()
+        self.put_many({broadcast_id: {**cursor, 'updated_at': now} for broadcast_id, cursor in cursors.items()})
+
+    def commit_saved(self, crawler_data_list: Iterable[Dict[str, Any]], results: Iterable[Dict[str, Any]]):
+        """
+        Commit the cursors of broadcasts that were saved successfully
+
+        Args:
+            crawler_data_list: Crawler outputs (with broadcast.comment_cursor)
+            results: Save results in the same order
+        """
+        cursors = {}
+        for crawler_data, result in zip(crawler_data_list, results):
+            broadcast = crawler_data.get('broadcast', {})
+            cursor = broadcast.get('comment_cursor')
+            if cursor and result.get('status') == 'success' and not result.get('superseded'):
+                cursors[broadcast.get('broadcast_id')] = cursor
+        self.commit(cursors)
@@ -0,0 +1,137 @@
+"""
+Broadcast Fingerprint Store
+Skip recrawling broadcasts whose content has not changed since the last save
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .jsonl_index import JSONLIndex
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastFingerprintStore(JSONLIndex):
+    """
+    Local index of the last saved fingerprint per broadcast ID
+
+    A fingerprint is computed from the cheap viewer APIs (broadcast, coupons,
+    benefits) and records status, product/coupon/benefit counts, the broadcast
+    timestamps and a content hash of the stable fields. If a fresh fingerprint
+    equals the stored one, the full crawl (product pagination, comments,
+    livebridge) and save can be skipped. Comment counters are not part of the
+    fingerprint: callers also check for comments beyond the stored comment
+    cursor (APIExtractor.has_comments_since) before skipping.
+
+    Live broadcasts are never skipped. Fingerprints are committed only after
+    the broadcast was saved successfully.
+
+    Example:
+        >>> store = BroadcastFingerprintStore()
+        >>> fingerprint = BroadcastFingerprintStore.compute(broadcast_api, coupons, benefits)
+        >>> if not store.is_unchanged(broadcast_id, fingerprint):
+        ...     ...  # crawl + save, then store.commit({broadcast_id: fingerprint})
+    """
+
+    # Statuses whose content keeps changing (always recrawled)
+    LIVE_STATUSES = {'ONAIR'}
+
+    TIMESTAMP_FIELDS = ('startDate', 'endDate', 'expectedStartDate', 'updatedAt', 'modifiedAt')
+    PRODUCT_FIELDS = ('key', 'productNo', 'name', 'price', 'discountedSalePrice', 'discountRate')
+    # Counters that change without the content changing (excluded from the hash)
+    VOLATILE_FIELDS = {
+        'viewCount', 'likeCount', 'commentCount', 'stock', 'reviewCount',
+        'issuedCount', 'downloadCount', 'remainCount', 'remainQuantity'
+    }
+
+    def __init__(self, index_file: str = "crawler/cj/checkpoints/broadcast_fingerprints.jsonl"):
+        """
+        Initialize fingerprint store
+
+        Args:
+            index_file: Path of the JSONL fingerprint journal
+        """
+        super().__init__(index_file)
+
+    @classmethod
+    def compute(
+        cls,
+        broadcast_api_data: Dict[str, Any],
+        coupons: List[Dict[str, Any]],
+        benefits: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Compute a broadcast fingerprint from viewer API responses
+
+        Args:
+            broadcast_api_data: Main broadcast API response
+            coupons: Coupons API list
+            benefits: Benefits API list
+
+        Returns:
+            Fingerprint dict (status, counts, timestamps, content_hash)
+        """
+        products = broadcast_api_data.get('shoppingProducts') or []
+        content = {
+            'title': broadcast_api_data.get('title'),
+            'description': broadcast_api_data.get('description'),
+            'replay_url': broadcast_api_data.get('broadcastReplayEndUrl'),
+            'products': [{field: product.get(field) for field in cls.PRODUCT_FIELDS} for product in products],
+            'coupons': [cls._stable(coupon) for coupon in coupons],
+            'benefits': [cls._stable(benefit) for benefit in benefits]
+        }
+        canonical = json.dumps(content, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+
+        return {
+            'status': broadcast_api_data.get('status'),
+            'product_count': broadcast_api_data.get('productCount', len(products)),
+            'coupon_count': len(coupons),
+            'benefit_count': len(benefits),
+            'timestamps': {
+                field: broadcast_api_data.get(field)
+                for field in cls.TIMESTAMP_FIELDS
+                if broadcast_api_data.get(field) is not None
+            },
+            'content_hash': hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+        }
+
+    @classmethod
+    def _stable(cls, item: Any) -> Any:
+        """Drop volatile counters from an API item"""
+        if isinstance(item, dict):
+            return {k: v for k, v in item.items() if k not in cls.VOLATILE_FIELDS}
+        return item
+
+    def is_unchanged(self, broadcast_id: Any, fingerprint: Dict[str, Any]) -> bool:
+        """
+        Check whether a broadcast matches its stored fingerprint
+
+        Args:
+            broadcast_id: Broadcast ID
+            fingerprint: Fresh fingerprint (from compute)
+
+        Returns:
+            True if the broadcast can be skipped
+        """
+        if fingerprint.get('status') in self.LIVE_STATUSES:
+            return False
+
+        stored: Optional[Dict[str, Any]] = self.get(broadcast_id)
+        if not stored:
+            return False
+
+        stored.pop('saved_at', None)
+        return stored == fingerprint
+
+    def commit(self, fingerprints: Dict[Any, Dict[str, Any]]):
+        """
+        Store fingerprints (call after the broadcasts were saved)
+
+        Args:
+            fingerprints: broadcast_id -> fingerprint
+        """
+        now = datetime.now().isoformat()
+        self.put_many({broadcast_id: {**fingerprint, 'saved_at': now} for broadcast_id, fingerprint in fingerprints.items()})
@@ -0,0 +1,428 @@
+"""
+Process-wide HTTP Client Registry
+Shared keep-alive connection pools (HTTP/2 when available) with per-host limits, rate limiting and DNS caching
+"""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from .rate_limiter import HostRateLimiter
+
+# HTTP/2 support is optional (pip install h2)
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _DNSCache:
+    """
+    Bounded TTL cache of resolved addresses for the registry's own connections
+
+    Entries are (host, port) -> addresses; the least recently used entry is
+    evicted once max_entries is reached. Only connections opened by registry
+    clients consult it (see _DNSCachingBackend), socket.getaddrinfo is untouched.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.ttl = 0.0
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, ttl: float, max_entries: int):
+        """Set TTL and size bound (existing entries beyond the bound are evicted)"""
+        with self._lock:
+            self.ttl = ttl
+            self.max_entries = max_entries
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, host: str, port: int) -> Optional[List[str]]:
+        """Cached addresses, or None if missing or expired"""
+        key = (host, port)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, host: str, port: int, infos: List[tuple]) -> List[str]:
+        """Cache the addresses of getaddrinfo results (order kept, duplicates dropped)"""
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (time.monotonic() + self.ttl, addresses)
+            self._entries.move_to_end((host, port))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return addresses
+
+    def discard(self, host: str, port: int):
+        """Forget a host whose cached addresses no longer connect"""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def is_ip(host: str) -> bool:
+        try:
+            ipaddress.ip_address(host)
+            return True
+        except ValueError:
+            return False
+
+
+class _DNSCachingBackend(httpcore.NetworkBackend):
+    """httpcore network backend that resolves hosts through _DNSCache (sync client)"""
+
+    def __init__(self, cache: _DNSCache, backend: httpcore.NetworkBackend):
+        self._cache = cache
+        self._backend = backend
+
+    def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        if self._cache.is_ip(host):
+            return self._backend.connect_tcp(host, port, timeout, local_address, socket_options)
+
+        addresses = self._cache.get(host, port)
+        if addresses is None:
+            try:
+                infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                raise httpcore.ConnectError(str(e)) from e
+            addresses = self._cache.put(host, port, infos)
+
+        # Same fallback order as socket.create_connection; TLS still uses the hostname for SNI
+        for i, address in enumerate(addresses):
+            try:
+                return self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                if i == len(addresses) - 1:
+                    self._cache.discard(host, port)
+                    raise
+
+    def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds: float):
+        self._backend.sleep(seconds)
+
+
+class _AsyncDNSCachingBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend that resolves hosts through _DNSCache (async clients, non-blocking lookups)"""
+
+    def __init__(self, cache: _DNSCache, backend: httpcore.AsyncNetworkBackend):
+        self._cache = cache
+        self._backend = backend
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        if self._cache.is_ip(host):
+            return await self._backend.connect_tcp(host, port, timeout, local_address, socket_options)
+
+        addresses = self._cache.get(host, port)
+        if addresses is None:
+            try:
+                infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                raise httpcore.ConnectError(str(e)) from e
+            addresses = self._cache.put(host, port, infos)
+
+        for i, address in enumerate(addresses):
+            try:
+                return await self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                if i == len(addresses) - 1:
+                    self._cache.discard(host, port)
+                    raise
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float):
+        await self._backend.sleep(seconds)
+
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    """Response body stream that frees a per-host slot when closed"""
+
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _ReleasingSyncStream(httpx.SyncByteStream):
+    """Response body stream that frees a per-host slot when closed"""
+
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _HostLimitedAsyncTransport(httpx.AsyncBaseTransport):
+    """Caps concurrent requests per host and paces them through HostRateLimiter (async client)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.get(request.url.host)
+        if semaphore is None:
+            semaphore = self._semaphores[request.url.host] = asyncio.Semaphore(self._max_per_host)
+
+        await HostRateLimiter.acquire(request.url.host)
+        await semaphore.acquire()
+        started = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            HostRateLimiter.record(request.url.host, None)
+            raise
+        HostRateLimiter.record(
+            request.url.host, response.status_code, time.monotonic() - started,
+            response.headers.get('Retry-After')
+        )
+
+        # Slot is held until the body has been read and closed
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingAsyncStream(response.stream, semaphore.release),
+            extensions=response.extensions
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class _HostLimitedSyncTransport(httpx.BaseTransport):
+    """Caps concurrent requests per host and paces them through HostRateLimiter (thread-shared client)"""
+
+    def __init__(self, transport: httpx.BaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            semaphore = self._semaphores.get(request.url.host)
+            if semaphore is None:
+                semaphore = self._semaphores[request.url.host] = threading.BoundedSemaphore(self._max_per_host)
+
+        HostRateLimiter.acquire_sync(request.url.host)
+        semaphore.acquire()
+        started = time.monotonic()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            HostRateLimiter.record(request.url.host, None)
+            raise
+        HostRateLimiter.record(
+            request.url.host, response.status_code, time.monotonic() - started,
+            response.headers.get('Retry-After')
+        )
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingSyncStream(response.stream, semaphore.release),
+            extensions=response.extensions
+        )
+
+    def close(self):
+        self._transport.close()
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of shared httpx clients
+
+    All crawlers, extractors and the vision extractor take their clients from here,
+    so TLS sessions to apis.naver.com (and others) are reused across broadcasts
+    instead of being renegotiated per request or per component.
+
+    - One AsyncClient per event loop (asyncio primitives are loop-bound)
+    - One thread-safe sync Client per process (requests-style code paths)
+    - HTTP/2 when h2 is installed, keep-alive pooling, per-host connection limits
+    - Adaptive per-host pacing (HostRateLimiter), fed with every response
+    - Bounded TTL DNS cache in the clients' connection backend (other sockets are unaffected)
+
+    Clients are shared: callers must not close them. Call aclose() / close()
+    once at process or run shutdown.
+
+    Example:
+        >>> client = HTTPClientRegistry.get_async_client()
+        >>> response = await client.get(url, headers=headers)
+    """
+
+    TIMEOUT = 30.0
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 40
+    KEEPALIVE_EXPIRY = 30.0
+    MAX_CONNECTIONS_PER_HOST = 10
+    DNS_CACHE_TTL = 300.0  # seconds, 0 disables the cache
+    DNS_CACHE_MAX_ENTRIES = 1024
+
+    _async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _sync_client: Optional[httpx.Client] = None
+    _sync_lock = threading.Lock()
+    _dns_cache = _DNSCache()
+
+    @classmethod
+    def _client_kwargs(cls) -> Dict[str, Any]:
+        """Options shared by async and sync clients"""
+        return {
+            'verify': False,  # Naver endpoints are accessed without verification throughout the crawler
+            'http2': H2_AVAILABLE,
+            'timeout': cls.TIMEOUT,
+            'follow_redirects': True,
+            'limits': httpx.Limits(
+                max_connections=cls.MAX_CONNECTIONS,
+                max_keepalive_connections=cls.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=cls.KEEPALIVE_EXPIRY
+            )
+        }
+
+    @classmethod
+    def _install_dns_cache(cls, transport, backend_cls):
+        """
+        Route the transport's connects through the DNS cache
+
+        httpx does not take a network backend, so the one of its connection
+        pool is wrapped (connections are opened lazily, after this runs). This
+        relies on httpx/httpcore internals: requirements.txt pins the tested
+        range and scripts/test_dns_cache.py fails if the hook disappears.
+        """
+        if not cls.DNS_CACHE_TTL:
+            return
+        pool = getattr(transport, '_pool', None)
+        if not hasattr(pool, '_network_backend'):
+            logger.warning(f"⚠ DNS cache disabled: unsupported httpx/httpcore version ({httpx.__version__})")
+            return
+        cls._dns_cache.configure(cls.DNS_CACHE_TTL, cls.DNS_CACHE_MAX_ENTRIES)
+        pool._network_backend = backend_cls(cls._dns_cache, pool._network_backend)
+        logger.debug(f"DNS cache enabled (TTL {cls.DNS_CACHE_TTL}s, max {cls.DNS_CACHE_MAX_ENTRIES} hosts)")
+
+    @classmethod
+    def get_async_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared async client for the running event loop
+
+        Returns:
+            httpx.AsyncClient (do not close)
+        """
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None or client.is_closed:
+            kwargs = cls._client_kwargs()
+            transport = httpx.AsyncHTTPTransport(
+                verify=kwargs['verify'], http2=kwargs['http2'], limits=kwargs.pop('limits')
+            )
+            cls._install_dns_cache(transport, _AsyncDNSCachingBackend)
+            client = httpx.AsyncClient(
+                transport=_HostLimitedAsyncTransport(transport, cls.MAX_CONNECTIONS_PER_HOST),
+                **kwargs
+            )
+            cls._async_clients[loop] = client
+            logger.debug(f"Created shared async HTTP client (http2={H2_AVAILABLE})")
+        return client
+
+    @classmethod
+    def get_sync_client(cls) -> httpx.Client:
+        """
+        Get the shared sync client (thread-safe, usable from worker threads)
+
+        Returns:
+            httpx.Client (do not close)
+        """
+        with cls._sync_lock:
+            if cls._sync_client is None or cls._sync_client.is_closed:
+                kwargs = cls._client_kwargs()
+                transport = httpx.HTTPTransport(
+                    verify=kwargs['verify'], http2=kwargs['http2'], limits=kwargs.pop('limits')
+                )
+                cls._install_dns_cache(transport, _DNSCachingBackend)
+                cls._sync_client = httpx.Client(
+                    transport=_HostLimitedSyncTransport(transport, cls.MAX_CONNECTIONS_PER_HOST),
+                    **kwargs
+                )
+                logger.debug(f"Created shared sync HTTP client (http2={H2_AVAILABLE})")
+            return cls._sync_client
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared async client of the running event loop"""
+        client = cls._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    def close(cls):
+        """Close the shared sync client"""
+        with cls._sync_lock:
+            if cls._sync_client is not None:
+                cls._sync_client.close()
+                cls._sync_client = None
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """
+        Get registry statistics
+
+        Returns:
+            Dict with http2 flag, open client counts and DNS cache hits/misses
+        """
+        return {
+            'http2': H2_AVAILABLE,
+            'async_clients': sum(1 for client in cls._async_clients.values() if not client.is_closed),
+            'sync_client': cls._sync_client is not None and not cls._sync_client.is_closed,
+            'dns_cache_hits': cls._dns_cache.hits,
+            'dns_cache_misses': cls._dns_cache.misses,
+            'dns_cache_entries': len(cls._dns_cache),
+            'rate_limits': HostRateLimiter.get_stats()
+        }
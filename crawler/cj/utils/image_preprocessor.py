@@ -0,0 +1,156 @@
+"""
+In-Memory Image Preprocessor
+Bytes-in / bytes-out image preparation for vision LLM requests (no temp files)
+"""
+
+import io
+import logging
+from typing import List, Optional, Tuple
+
+# Pillow is optional: without it images are passed through unchanged
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ImagePreprocessor:
+    """
+    Prepare raw image bytes for a vision API in one decode / encode pass
+
+    Each image is decoded once, scaled down to fit the provider's width limit,
+    cut into overlapping tiles when it is a very tall banner (so text keeps a
+    readable size instead of being shrunk to fit the height limit) and
+    re-encoded to a compact JPEG in memory.
+
+    Example:
+        >>> preprocessor = ImagePreprocessor(max_size=(2048, 2048))
+        >>> for data, media_type in preprocessor.process(image_bytes):
+        ...     ...  # base64 into the request body
+    """
+
+    # Tile banners taller than this many times their width
+    TILE_ASPECT_RATIO = 2.5
+    # Overlap between consecutive tiles (fraction of tile height) so cut lines never split text
+    TILE_OVERLAP = 0.05
+    MAX_TILES = 8
+    JPEG_QUALITY = 85
+
+    # Magic bytes for passthrough media type detection
+    SIGNATURES = (
+        (b'\xff\xd8\xff', 'image/jpeg'),
+        (b'\x89PNG\r\n\x1a\n', 'image/png'),
+        (b'GIF87a', 'image/gif'),
+        (b'GIF89a', 'image/gif'),
+    )
+
+    def __init__(
+        self,
+        max_size: Tuple[int, int],
+        tile_aspect_ratio: Optional[float] = None,
+        quality: Optional[int] = None
+    ):
+        """
+        Initialize preprocessor
+
+        Args:
+            max_size: Provider size limit (width, height) in pixels
+            tile_aspect_ratio: Height/width ratio above which images are tiled (default: TILE_ASPECT_RATIO)
+            quality: JPEG quality (default: JPEG_QUALITY)
+        """
+        self.max_width, self.max_height = max_size
+        self.tile_aspect_ratio = tile_aspect_ratio or self.TILE_ASPECT_RATIO
+        self.quality = quality or self.JPEG_QUALITY
+
+    @classmethod
+    def media_type(cls, data: bytes) -> str:
+        """
+        Detect the media type of encoded image bytes
+
+        Args:
+            data: Image bytes
+
+        Returns:
+            MIME type (image/jpeg if unknown)
+        """
+        for signature, media_type in cls.SIGNATURES:
+            if data.startswith(signature):
+                return media_type
+        if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+            return 'image/webp'
+        return 'image/jpeg'
+
+    def process(self, data: bytes) -> List[Tuple[bytes, str]]:
+        """
+        Resize, tile and re-encode one image
+
+        Args:
+            data: Raw image bytes
+
+        Returns:
+            List of (encoded bytes, media type), one per tile in top-to-bottom order.
+            The original bytes are returned unchanged if Pillow is missing or decoding fails.
+        """
+        if not PIL_AVAILABLE:
+            return [(data, self.media_type(data))]
+
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                img.load()
+                width, height = img.size
+                tiles = self._tile_boxes(width, height)
+
+                # Small images that need no change are sent as-is (no re-encode)
+                if len(tiles) == 1 and width <= self.max_width and height <= self.max_height:
+                    return [(data, self.media_type(data))]
+
+                rgb = self._to_rgb(img)
+                encoded = [self._encode(self._fit(rgb.crop(box))) for box in tiles]
+
+            if len(tiles) > 1:
+                logger.debug(f"Tiled {width}x{height} image into {len(tiles)} parts")
+            return [(tile, 'image/jpeg') for tile in encoded]
+
+        except Exception as e:
+            logger.warning(f"⚠ Image preprocessing failed, sending original: {e}")
+            return [(data, self.media_type(data))]
+
+    def _tile_boxes(self, width: int, height: int) -> List[Tuple[int, int, int, int]]:
+        """Crop boxes (left, top, right, bottom) covering the image"""
+        if height <= width * self.tile_aspect_ratio:
+            return [(0, 0, width, height)]
+
+        tile_height = int(width * self.tile_aspect_ratio)
+        count = min(self.MAX_TILES, -(-height // tile_height))
+        # Spread tiles evenly so each one overlaps its neighbour
+        tile_height = min(height, int(height / count * (1 + self.TILE_OVERLAP)))
+        step = (height - tile_height) / (count - 1) if count > 1 else 0
+        return [(0, int(i * step), width, int(i * step) + tile_height) for i in range(count)]
+
+    def _fit(self, img: 'Image.Image') -> 'Image.Image':
+        """Scale down to the provider limit, keeping the aspect ratio"""
+        width, height = img.size
+        ratio = min(self.max_width / width, self.max_height / height, 1.0)
+        if ratio >= 1.0:
+            return img
+        return img.resize((max(1, int(width * ratio)), max(1, int(height * ratio))), Image.Resampling.LANCZOS)
+
+    def _to_rgb(self, img: 'Image.Image') -> 'Image.Image':
+        """Flatten transparency onto white (JPEG has no alpha)"""
+        if img.mode == 'RGB':
+            return img
+        if img.mode in ('RGBA', 'LA', 'P'):
+            rgba = img.convert('RGBA')
+            background = Image.new('RGB', rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.split()[-1])
+            return background
+        return img.convert('RGB')
+
+    def _encode(self, img: 'Image.Image') -> bytes:
+        """Encode to JPEG in memory"""
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=self.quality, optimize=True)
+        return buffer.getvalue()
@@ -0,0 +1,123 @@
+"""
+JSONL Key-Value Index
+Small persistent dict backed by an append-only JSONL journal
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JSONLIndex:
+    """
+    Persistent string-keyed index of JSON values
+
+    Each write appends {"key": ..., "value": ...} lines (value None deletes the
+    key); the last record per key wins on load. The journal is compacted on
+    load when it grows past twice the number of live keys.
+    Thread-safe within one process.
+    """
+
+    def __init__(self, index_file: str):
+        """
+        Initialize index
+
+        Args:
+            index_file: Path of the JSONL journal
+        """
+        self.index_file = Path(index_file)
+        self._entries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """Replay the journal into memory"""
+        if not self.index_file.exists():
+            return
+
+        records = 0
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt line in {self.index_file.name}")
+                    continue
+                records += 1
+                if record.get('value') is None:
+                    self._entries.pop(record.get('key'), None)
+                else:
+                    self._entries[record.get('key')] = record['value']
+
+        if records > 2 * len(self._entries) + 100:
+            self._compact()
+
+        logger.debug(f"Loaded {len(self._entries)} entries from {self.index_file.name}")
+
+    def _compact(self):
+        """Rewrite the journal with one line per key (atomic replace)"""
+        tmp_file = self.index_file.with_suffix('.jsonl.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for key, value in self._entries.items():
+                    f.write(json.dumps({'key': key, 'value': value}, ensure_ascii=False, separators=(',', ':')) + '\n')
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            logger.error(f"Failed to compact {self.index_file.name}: {e}")
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Get a value
+
+        Args:
+            key: Entry key (converted to str)
+
+        Returns:
+            Stored value (a copy for dicts), or None if missing
+        """
+        with self._lock:
+            value = self._entries.get(str(key))
+            return dict(value) if isinstance(value, dict) else value
+
+    def put_many(self, entries: Dict[Any, Any]):
+        """
+        Store values (None deletes)
+
+        Args:
+            entries: key -> value
+        """
+        if not entries:
+            return
+
+        records = [{'key': str(key), 'value': value} for key, value in entries.items()]
+        with self._lock:
+            for record in records:
+                if record['value'] is None:
+                    self._entries.pop(record['key'], None)
+                else:
+                    self._entries[record['key']] = record['value']
+            try:
+                with open(self.index_file, 'a', encoding='utf-8') as f:
+                    for record in records:
+                        f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+            except Exception as e:
+                logger.error(f"Failed to save {self.index_file.name}: {e}")
+
+    def forget(self, key: Any):
+        """
+        Delete a key
+
+        Args:
+            key: Entry key
+        """
+        self.put_many({key: None})
+
+    def __len__(self) -> int:
+        return len(self._entries)
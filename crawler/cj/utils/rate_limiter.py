@@ -0,0 +1,305 @@
+"""
+Per-host Adaptive Rate Limiter
+Token buckets keyed by host that slow down on 429/403/high latency and speed up on success
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to the host's responses (AIMD)
+
+    - 2xx/3xx under target latency: rate increases additively (up to max_rate)
+    - Slow responses: rate decreases by 10%
+    - 429/503: rate halves and the bucket pauses for Retry-After (or the cooldown)
+    - 403: rate halves and the bucket pauses for the cooldown
+    - Network errors: rate decreases by 25%
+
+    Usable from asyncio (acquire) and from threads (acquire_sync).
+    """
+
+    COOLDOWN_SECONDS = 5.0
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        target_latency: float = 2.0
+    ):
+        """
+        Initialize bucket
+
+        Args:
+            rate: Initial requests per second
+            burst: Maximum tokens (requests allowed back to back)
+            min_rate: Floor for the adaptive rate
+            max_rate: Ceiling for the adaptive rate (default: 4x initial rate)
+            target_latency: Responses slower than this (seconds) reduce the rate
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate * 4
+        self.target_latency = target_latency
+        self.increase_step = self.max_rate * 0.05
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        self.stats = {'requests': 0, 'throttled': 0, 'waited_seconds': 0.0}
+
+    def _reserve(self) -> float:
+        """Take one token (possibly going negative) and return how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self.stats['requests'] += 1
+            self.stats['waited_seconds'] += wait
+            return wait
+
+    async def acquire(self) -> float:
+        """
+        Wait for a token (asyncio)
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def acquire_sync(self) -> float:
+        """
+        Wait for a token (blocking)
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(self, status_code: Optional[int], latency: float = 0.0, retry_after: Optional[float] = None):
+        """
+        Adapt the rate to a response
+
+        Args:
+            status_code: HTTP status, or None for a network error
+            latency: Seconds until the response arrived
+            retry_after: Retry-After header value in seconds (if any)
+        """
+        with self._lock:
+            old_rate = self.rate
+            if status_code in (429, 503, 403):
+                self.rate = max(self.min_rate, self.rate * 0.5)
+                pause = retry_after if retry_after is not None else self.COOLDOWN_SECONDS
+                self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+                self._tokens = min(self._tokens, 0.0)
+                self.stats['throttled'] += 1
+            elif status_code is None:
+                self.rate = max(self.min_rate, self.rate * 0.75)
+            elif latency > self.target_latency:
+                self.rate = max(self.min_rate, self.rate * 0.9)
+            elif status_code < 400:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+        if status_code in (429, 503, 403):
+            logger.warning(f"⚠ Throttled ({status_code}): rate {old_rate:.2f} → {self.rate:.2f} req/s")
+
+    def cap(self, rate: float, burst: int, min_rate: float, max_rate: float):
+        """
+        Tighten the bucket's limits in place (never loosens them)
+
+        Tokens, pauses and statistics are kept.
+
+        Args:
+            rate: Upper bound for the current rate
+            burst: Upper bound for the burst size
+            min_rate: Upper bound for the adaptive floor
+            max_rate: Upper bound for the adaptive ceiling
+        """
+        with self._lock:
+            self.max_rate = min(self.max_rate, max_rate)
+            self.min_rate = min(self.min_rate, min_rate, self.max_rate)
+            self.rate = max(self.min_rate, min(self.rate, rate, self.max_rate))
+            self.burst = min(self.burst, burst)
+            self._tokens = min(self._tokens, float(self.burst))
+            self.increase_step = self.max_rate * 0.05
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bucket statistics"""
+        return {
+            'rate': round(self.rate, 3),
+            'requests': self.stats['requests'],
+            'throttled': self.stats['throttled'],
+            'waited_seconds': round(self.stats['waited_seconds'], 2)
+        }
+
+
+class HostRateLimiter:
+    """
+    Process-wide registry of AdaptiveTokenBucket per host
+
+    Requests through HTTPClientRegistry clients are limited and recorded
+    automatically; other call sites use acquire()/acquire_sync() and record().
+
+    Example:
+        >>> await HostRateLimiter.acquire(url)
+        >>> response = await client.get(url)
+        >>> HostRateLimiter.record(url, response.status_code, latency)
+    """
+
+    # Starting limits per host (rate = requests/second); unknown hosts use DEFAULT_LIMITS
+    HOST_LIMITS: Dict[str, Dict[str, float]] = {
+        'apis.naver.com': {'rate': 10.0, 'burst': 10, 'min_rate': 1.0, 'max_rate': 40.0},
+        'view.shoppinglive.naver.com': {'rate': 3.0, 'burst': 5, 'min_rate': 0.5, 'max_rate': 12.0},
+        'shoppinglive.naver.com': {'rate': 3.0, 'burst': 5, 'min_rate': 0.5, 'max_rate': 12.0},
+        'brand.naver.com': {'rate': 0.5, 'burst': 1, 'min_rate': 0.1, 'max_rate': 4.0},
+        'api.ocr.space': {'rate': 0.5, 'burst': 1, 'min_rate': 0.1, 'max_rate': 2.0},
+    }
+    DEFAULT_LIMITS = {'rate': 5.0, 'burst': 5, 'min_rate': 0.5, 'max_rate': 20.0}
+
+    _buckets: Dict[str, AdaptiveTokenBucket] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        """Extract host from a URL (or return the host as-is)"""
+        if '://' in url_or_host:
+            return (urlparse(url_or_host).hostname or '').lower()
+        return url_or_host.lower()
+
+    @classmethod
+    def get_bucket(cls, url_or_host: str) -> AdaptiveTokenBucket:
+        """
+        Get (or create) the bucket for a host
+
+        Args:
+            url_or_host: URL or host name
+
+        Returns:
+            AdaptiveTokenBucket for the host
+        """
+        host = cls._host(url_or_host)
+        with cls._lock:
+            bucket = cls._buckets.get(host)
+            if bucket is None:
+                bucket = cls._buckets[host] = AdaptiveTokenBucket(**cls.HOST_LIMITS.get(host, cls.DEFAULT_LIMITS))
+            return bucket
+
+    @classmethod
+    def configure(cls, host: str, **limits):
+        """
+        Override limits for a host (replaces its bucket)
+
+        Args:
+            host: Host name
+            **limits: AdaptiveTokenBucket arguments (rate, burst, min_rate, max_rate, target_latency)
+        """
+        host = cls._host(host)
+        merged = {**cls.HOST_LIMITS.get(host, cls.DEFAULT_LIMITS), **limits}
+        with cls._lock:
+            cls._buckets[host] = AdaptiveTokenBucket(**merged)
+
+    @classmethod
+    def limit(cls, url_or_host: str, rate: float, burst: int, min_rate: float, max_rate: float):
+        """
+        Cap a host's limits, keeping the stricter of the current and given ones
+
+        Unlike configure(), callers with different settings cannot loosen each
+        other's limits, and an existing bucket keeps its adaptive state.
+
+        Args:
+            url_or_host: URL or host name
+            rate: Upper bound for the current rate (requests/second)
+            burst: Upper bound for the burst size
+            min_rate: Upper bound for the adaptive floor
+            max_rate: Upper bound for the adaptive ceiling
+        """
+        cls.get_bucket(url_or_host).cap(rate, burst, min_rate, max_rate)
+
+    @staticmethod
+    def spacing_limits(min_delay: float, max_delay: float) -> Dict[str, float]:
+        """
+        Bucket limits equivalent to a random delay of min_delay..max_delay seconds
+
+        Starts at the mean delay, never goes faster than min_delay and may back off
+        to twice max_delay.
+
+        Args:
+            min_delay: Shortest delay between requests (seconds)
+            max_delay: Longest delay between requests (seconds)
+
+        Returns:
+            Keyword arguments for limit()
+        """
+        return {
+            'rate': 2.0 / (min_delay + max_delay),
+            'burst': 1,
+            'min_rate': 1.0 / (2 * max_delay),
+            'max_rate': 1.0 / min_delay,
+        }
+
+    @classmethod
+    async def acquire(cls, url_or_host: str) -> float:
+        """Wait for a request slot for the host (asyncio); returns seconds waited"""
+        return await cls.get_bucket(url_or_host).acquire()
+
+    @classmethod
+    def acquire_sync(cls, url_or_host: str) -> float:
+        """Wait for a request slot for the host (blocking); returns seconds waited"""
+        return cls.get_bucket(url_or_host).acquire_sync()
+
+    @classmethod
+    def record(
+        cls,
+        url_or_host: str,
+        status_code: Optional[int],
+        latency: float = 0.0,
+        retry_after: Optional[str] = None
+    ):
+        """
+        Feed a response back to the host's bucket
+
+        Args:
+            url_or_host: URL or host name
+            status_code: HTTP status, or None for a network error
+            latency: Seconds until the response arrived
+            retry_after: Raw Retry-After header value (seconds form only)
+        """
+        retry_seconds = None
+        if retry_after:
+            try:
+                retry_seconds = float(retry_after)
+            except ValueError:
+                retry_seconds = None  # HTTP-date form: fall back to the cooldown
+        cls.get_bucket(url_or_host).record(status_code, latency, retry_seconds)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statistics per host
+
+        Returns:
+            host -> bucket statistics
+        """
+        with cls._lock:
+            return {host: bucket.get_stats() for host, bucket in cls._buckets.items()}
@@ -0,0 +1,154 @@
+"""
+Request Filter for Playwright Pages
+Aborts media, images, fonts and trackers so pages only load what crawlers need
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional, Set
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class RequestFilter:
+    """
+    Route-based request filter attached per page
+
+    Target JSON APIs (allow patterns) always pass. Everything else is aborted if it
+    is a blocked resource type, an HLS/DASH segment, or a request to a tracker host.
+
+    Aborted requests are never downloaded, so bytes saved are estimated from
+    typical sizes per category (ESTIMATED_BYTES).
+
+    Example:
+        >>> request_filter = RequestFilter(allow_patterns=APIExtractor.TARGET_API_PATTERNS)
+        >>> await request_filter.attach(page)
+        >>> ...
+        >>> request_filter.get_stats()
+    """
+
+    BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+
+    # Video player segments/manifests (fetched via XHR by the HLS player)
+    BLOCKED_EXTENSIONS = ('.m3u8', '.ts', '.m4s', '.mp4', '.webm', '.mpd')
+
+    TRACKER_HOSTS = (
+        'google-analytics.com',
+        'googletagmanager.com',
+        'doubleclick.net',
+        'facebook.net',
+        'facebook.com',
+        'wcs.naver.net',
+        'lcs.naver.com',
+        'tivan.naver.com',
+        'nlog.naver.com',
+        'veta.naver.com',
+        'siape.veta.naver.com',
+        'kakao.com',
+        'criteo.com',
+        'criteo.net',
+    )
+
+    # Typical response sizes used to estimate bytes saved
+    ESTIMATED_BYTES = {
+        'image': 40_000,
+        'media': 500_000,
+        'font': 60_000,
+        'segment': 500_000,
+        'tracker': 3_000,
+    }
+
+    def __init__(
+        self,
+        allow_patterns: Iterable[str] = (),
+        blocked_resource_types: Optional[Set[str]] = None,
+        tracker_hosts: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize RequestFilter
+
+        Args:
+            allow_patterns: URL substrings that are never blocked (target JSON APIs)
+            blocked_resource_types: Playwright resource types to abort (default: image, media, font)
+            tracker_hosts: Host suffixes treated as trackers (default: TRACKER_HOSTS)
+        """
+        self.allow_patterns = tuple(allow_patterns)
+        self.blocked_resource_types = (
+            blocked_resource_types if blocked_resource_types is not None else self.BLOCKED_RESOURCE_TYPES
+        )
+        self.tracker_hosts = tuple(tracker_hosts) if tracker_hosts is not None else self.TRACKER_HOSTS
+        self.stats: Dict[str, Any] = {
+            'allowed': 0,
+            'blocked': {},
+            'estimated_bytes_saved': 0
+        }
+
+    async def attach(self, page):
+        """
+        Install the route handler on a page
+
+        Args:
+            page: Playwright page
+        """
+        await page.route('**/*', self._handle_route)
+        logger.debug("Request filter attached to page")
+
+    def classify(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Decide whether a request should be blocked
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type (document, xhr, image, ...)
+
+        Returns:
+            Block category ('image', 'media', 'font', 'segment', 'tracker') or None to allow
+        """
+        if any(pattern in url for pattern in self.allow_patterns):
+            return None
+
+        host = urlparse(url).hostname or ''
+        if any(host == tracker or host.endswith('.' + tracker) for tracker in self.tracker_hosts):
+            return 'tracker'
+
+        if resource_type in self.blocked_resource_types:
+            return resource_type
+
+        path = urlparse(url).path.lower()
+        if path.endswith(self.BLOCKED_EXTENSIONS):
+            return 'segment'
+
+        return None
+
+    async def _handle_route(self, route):
+        """Abort or continue a routed request"""
+        request = route.request
+        category = self.classify(request.url, request.resource_type)
+
+        try:
+            if category is None:
+                self.stats['allowed'] += 1
+                await route.continue_()
+                return
+
+            blocked = self.stats['blocked']
+            blocked[category] = blocked.get(category, 0) + 1
+            self.stats['estimated_bytes_saved'] += self.ESTIMATED_BYTES.get(category, 0)
+            await route.abort('blockedbyclient')
+        except Exception as e:
+            # Page may be closing while requests are in flight
+            logger.debug(f"Route handling failed for {request.url}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-page filter statistics
+
+        Returns:
+            Dict with allowed count, blocked counts per category and estimated bytes saved
+        """
+        return {
+            'allowed': self.stats['allowed'],
+            'blocked': dict(self.stats['blocked']),
+            'blocked_total': sum(self.stats['blocked'].values()),
+            'estimated_bytes_saved': self.stats['estimated_bytes_saved']
+        }
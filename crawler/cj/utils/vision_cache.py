@@ -0,0 +1,276 @@
+"""
+Vision Response Cache
+Content-addressed SQLite cache of vision LLM responses (TTL + size-bounded LRU)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class VisionResponseCache:
+    """
+    Local cache of vision LLM extraction results
+
+    Entries are keyed by the SHA-256 of the image bytes (in request order),
+    the provider, the model and the prompt version, so an unchanged banner
+    set never reaches the API twice while a new model or prompt misses.
+    Entries expire after TTL_SECONDS; when the cache grows past MAX_ENTRIES
+    or MAX_BYTES the least recently used entries are evicted.
+
+    The cache also keeps HTTP validators (ETag / Last-Modified) and the bytes
+    hash per image URL, so crawlers can revalidate banners with conditional
+    requests and look up the cached response without redownloading them.
+
+    Safe to share between threads; the SQLite file (WAL mode) can be shared
+    between processes.
+
+    Example:
+        >>> cache = VisionResponseCache.default()
+        >>> key = VisionResponseCache.make_key(image_hashes, 'gpt-4o-mini-vision', 'gpt-5-mini', 'event-v1')
+        >>> result = cache.get(key)
+        >>> if result is None:
+        ...     result = call_llm(...)
+        ...     cache.put(key, result, provider='gpt-4o-mini-vision', model='gpt-5-mini', prompt_version='event-v1')
+    """
+
+    TTL_SECONDS = 30 * 24 * 3600
+    MAX_ENTRIES = 5000
+    MAX_BYTES = 50 * 1024 * 1024
+
+    _default: Optional['VisionResponseCache'] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_file: str = "crawler/cj/checkpoints/vision_cache.sqlite3",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize cache
+
+        Args:
+            cache_file: Path of the SQLite database
+            ttl_seconds: Entry lifetime (default: TTL_SECONDS)
+            max_entries: Maximum number of responses kept (default: MAX_ENTRIES)
+            max_bytes: Maximum total size of stored responses (default: MAX_BYTES)
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else self.TTL_SECONDS
+        self.max_entries = max_entries if max_entries is not None else self.MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.cache_file), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT,
+                model TEXT,
+                prompt_version TEXT,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+            CREATE TABLE IF NOT EXISTS image_validators (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                image_hash TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+
+    @classmethod
+    def default(cls) -> 'VisionResponseCache':
+        """
+        Get the process-wide cache (shared by all vision extractors)
+
+        Returns:
+            VisionResponseCache instance
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @staticmethod
+    def hash_image(data: bytes) -> str:
+        """
+        Hash image bytes
+
+        Args:
+            data: Raw image bytes (as downloaded, before any resizing)
+
+        Returns:
+            SHA-256 hex digest
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def make_key(image_hashes: Iterable[str], provider: str, model: str, prompt_version: str) -> str:
+        """
+        Build the cache key of one vision request
+
+        Args:
+            image_hashes: Bytes hashes of the images, in request order
+            provider: Provider identifier
+            model: Model identifier
+            prompt_version: Prompt version
+
+        Returns:
+            Cache key (SHA-256 hex digest)
+        """
+        material = '\n'.join([provider, model, prompt_version, *image_hashes])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a response
+
+        Args:
+            key: Cache key (from make_key)
+
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[1] > self.ttl_seconds:
+                    if row is not None:
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.misses += 1
+                    return None
+
+                self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                self.hits += 1
+                return json.loads(row[0])
+            except Exception as e:
+                logger.warning(f"⚠ Vision cache lookup failed: {e}")
+                self.misses += 1
+                return None
+
+    def put(self, key: str, response: Any, provider: str = None, model: str = None, prompt_version: str = None):
+        """
+        Store a response and evict expired / least recently used entries
+
+        Args:
+            key: Cache key (from make_key)
+            response: JSON-serializable response
+            provider: Provider identifier (informational)
+            model: Model identifier (informational)
+            prompt_version: Prompt version (informational)
+        """
+        payload = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, model, prompt_version, payload, len(payload.encode('utf-8')), now, now)
+                )
+                self._evict(now)
+            except Exception as e:
+                logger.warning(f"⚠ Vision cache write failed: {e}")
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used ones until within limits"""
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._conn.execute("DELETE FROM image_validators WHERE updated_at < ?", (now - self.ttl_seconds,))
+
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        evict = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evict.append((key,))
+            count -= 1
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        logger.debug(f"Evicted {len(evict)} vision cache entries")
+
+    def get_validators(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored validators of an image URL
+
+        Args:
+            url: Image URL
+
+        Returns:
+            {'etag', 'last_modified', 'image_hash'} or None if unknown
+        """
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT etag, last_modified, image_hash FROM image_validators WHERE url = ?", (url,)
+                ).fetchone()
+            except Exception as e:
+                logger.warning(f"⚠ Vision cache lookup failed: {e}")
+                return None
+        if row is None:
+            return None
+        return {'etag': row[0], 'last_modified': row[1], 'image_hash': row[2]}
+
+    def put_validators(self, url: str, image_hash: str, etag: str = None, last_modified: str = None):
+        """
+        Remember the validators and bytes hash of a downloaded image
+
+        Args:
+            url: Image URL
+            image_hash: Bytes hash (from hash_image)
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO image_validators VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, image_hash, time.time())
+                )
+            except Exception as e:
+                logger.warning(f"⚠ Vision cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with entries, bytes, hits and misses
+        """
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {'entries': count, 'bytes': total, 'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
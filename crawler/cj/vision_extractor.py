@@ -7,9 +7,10 @@ Supports: Claude Haiku, GPT-4o Mini, Gemini Flash (all with vision)
 
 import os
 import json
+import asyncio
 import base64
-from typing import Dict, Optional, List
-from pathlib import Path
+import hashlib
+from typing import Dict, Optional, List, Tuple, Union
 from enum import Enum
 import urllib3
 
@@ -32,6 +33,26 @@ except ImportError:
     OPENAI_AVAILABLE = False
     print("⚠ OpenAI not installed. Install with: pip install openai")
 
+try:
+    from utils.http_clients import HTTPClientRegistry
+except ImportError:
+    HTTPClientRegistry = None
+
+try:
+    from utils.vision_cache import VisionResponseCache
+    VISION_CACHE_AVAILABLE = True
+except ImportError:
+    VISION_CACHE_AVAILABLE = False
+
+try:
+    from utils.image_preprocessor import ImagePreprocessor, PIL_AVAILABLE
+except ImportError:
+    ImagePreprocessor = None
+    PIL_AVAILABLE = False
+
+if not PIL_AVAILABLE:
+    print("⚠ PIL not installed (images are sent unresized). Install with: pip install Pillow")
+
 try:
     import google.generativeai as genai
     GOOGLE_AVAILABLE = True
@@ -39,12 +60,9 @@ except ImportError:
     GOOGLE_AVAILABLE = False
     print("⚠ Google Generative AI not installed. Install with: pip install google-generativeai")
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    print("⚠ PIL not installed. Install with: pip install Pillow")
+
+# Image file path or raw image bytes
+ImageInput = Union[str, bytes]
 
 
 class VisionProvider(Enum):
@@ -78,15 +96,51 @@ class VisionExtractor:
         VisionProvider.GEMINI_FLASH: (3072, 3072),
     }
 
-    def __init__(self, provider: VisionProvider = VisionProvider.GPT_4O_MINI):
+    # Bump when the prompt or the response mapping changes meaning (invalidates cached responses)
+    PROMPT_VERSION = "event-v1"
+
+    # Grouped extraction (extract_from_images_grouped)
+    GROUP_SIZE = 4
+    MAX_CONCURRENT_GROUPS = 4
+
+    # Response fields merged across groups
+    SCALAR_FIELDS = ('event_title', 'event_date')
+    LIST_FIELDS = ('live_benefits', 'benefits_by_purchase_amount', 'coupon_benefits')
+
+    def __init__(
+        self,
+        provider: VisionProvider = VisionProvider.GPT_4O_MINI,
+        cache: Optional['VisionResponseCache'] = None,
+        use_cache: bool = True
+    ):
         """
         Initialize Vision extractor
 
         Args:
             provider: Which vision LLM provider to use (default: GPT-4o Mini)
+            cache: Response cache (default: the shared VisionResponseCache)
+            use_cache: Whether to cache responses by image content (default: True)
         """
         self.provider = provider
         self.model = self.MODELS[provider]
+        # Prompt text hash is part of the version so prompt edits never hit stale entries
+        prompt_hash = hashlib.sha1(self._build_prompt().encode('utf-8')).hexdigest()[:8]
+        self.prompt_version = f"{self.PROMPT_VERSION}-{prompt_hash}"
+
+        # Bytes-in / bytes-out resize, tiling and re-encoding (no temp files)
+        self.preprocessor = ImagePreprocessor(self.MAX_IMAGE_SIZE[provider]) if ImagePreprocessor else None
+
+        self.cache = None
+        if use_cache and VISION_CACHE_AVAILABLE:
+            try:
+                self.cache = cache or VisionResponseCache.default()
+            except Exception as e:
+                print(f"⚠ Vision cache unavailable: {e}")
+
+        # Async client (grouped extraction), created lazily per event loop
+        self._api_key = None
+        self._async_client = None
+        self._async_client_loop = None
 
         # Initialize appropriate client
         if provider == VisionProvider.CLAUDE_HAIKU:
@@ -95,6 +149,7 @@ class VisionExtractor:
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+            self._api_key = api_key
             self.client = anthropic.Anthropic(api_key=api_key)
 
         elif provider == VisionProvider.GPT_4O_MINI:
@@ -103,8 +158,9 @@ class VisionExtractor:
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable not set")
-            # Create httpx client with SSL verification disabled
-            http_client = httpx.Client(verify=False)
+            # Shared pooled httpx client (SSL verification disabled)
+            http_client = HTTPClientRegistry.get_sync_client() if HTTPClientRegistry else httpx.Client(verify=False)
+            self._api_key = api_key
             self.client = openai.OpenAI(api_key=api_key, http_client=http_client)
 
         elif provider == VisionProvider.GEMINI_FLASH:
@@ -118,60 +174,58 @@ class VisionExtractor:
 
         print(f"✓ Vision Extractor initialized: {provider.value} ({self.model})")
 
-    def _resize_image_if_needed(self, image_path: str) -> str:
+    def _load_image(self, image: ImageInput) -> bytes:
+        """Get raw image bytes (reads paths once)"""
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            return bytes(image)
+        with open(image, "rb") as image_file:
+            return image_file.read()
+
+    def _cache_key(self, image_hashes: List[str]) -> str:
+        """Build the response cache key for an image set"""
+        return VisionResponseCache.make_key(image_hashes, self.provider.value, self.model, self.prompt_version)
+
+    def get_cached(self, image_hashes: List[str], group_size: Optional[int] = None) -> Optional[Dict]:
         """
-        Resize image if it exceeds API limits
+        Look up a cached extraction without loading the images
 
         Args:
-            image_path: Path to image file
+            image_hashes: Bytes hashes of the images, in extraction order
+            group_size: Group size used by extract_from_images_grouped (None: single request)
 
         Returns:
-            Path to (possibly resized) image
+            Cached extraction result (merged if grouped), or None if any request misses
+            (or if caching is disabled)
         """
-        if not PIL_AVAILABLE:
-            return image_path
-
-        max_width, max_height = self.MAX_IMAGE_SIZE[self.provider]
-
-        try:
-            img = Image.open(image_path)
-            width, height = img.size
-
-            if width <= max_width and height <= max_height:
-                return image_path
+        if not self.cache or not image_hashes:
+            return None
+        if group_size is None:
+            return self.cache.get(self._cache_key(image_hashes))
 
-            # Calculate resize ratio
-            ratio = min(max_width / width, max_height / height)
-            new_size = (int(width * ratio), int(height * ratio))
+        results = []
+        for i in range(0, len(image_hashes), max(1, group_size)):
+            result = self.cache.get(self._cache_key(image_hashes[i:i + group_size]))
+            if result is None:
+                return None
+            results.append(result)
+        return self.merge_results(results)
 
-            # Resize and save to temp file
-            img_resized = img.resize(new_size, Image.Resampling.LANCZOS)
-            temp_path = f"{image_path}.resized.jpg"
-            img_resized.save(temp_path, "JPEG", quality=95)
+    def _prepare_images(self, images: List[bytes]) -> List[Tuple[str, str]]:
+        """
+        Preprocess images in memory and base64-encode them for the request body
 
-            print(f"  ℹ Resized image: {width}x{height} → {new_size[0]}x{new_size[1]}")
-            return temp_path
+        Args:
+            images: Raw image bytes
 
-        except Exception as e:
-            print(f"  ⚠ Image resize failed: {e}")
-            return image_path
-
-    def _encode_image(self, image_path: str) -> str:
-        """Encode image to base64"""
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
-
-    def _get_image_media_type(self, image_path: str) -> str:
-        """Detect image media type from file extension"""
-        ext = Path(image_path).suffix.lower()
-        media_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        return media_types.get(ext, 'image/jpeg')
+        Returns:
+            List of (media type, base64 data), one per tile in image order
+        """
+        prepared = []
+        for data in images:
+            tiles = self.preprocessor.process(data) if self.preprocessor else [(data, 'image/jpeg')]
+            for tile, media_type in tiles:
+                prepared.append((media_type, base64.b64encode(tile).decode('ascii')))
+        return prepared
 
     def _build_prompt(self) -> str:
         """Build extraction prompt for Korean event data"""
@@ -250,12 +304,39 @@ class VisionExtractor:
 - JSON 형식만 응답하세요 (설명 없이)
 """
 
-    def extract_from_images(self, image_paths: List[str], url: str = None) -> Optional[Dict]:
+    def _cache_lookup(self, images: List[bytes]) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Look up the cached response of an image set
+
+        Args:
+            images: Raw image bytes
+
+        Returns:
+            (cache key or None if caching is unavailable, cached result or None)
+        """
+        if not self.cache:
+            return None, None
+        try:
+            cache_key = self._cache_key([VisionResponseCache.hash_image(data) for data in images])
+            return cache_key, self.cache.get(cache_key)
+        except Exception as e:
+            print(f"  ⚠ Vision cache lookup failed: {e}")
+            return None, None
+
+    def _cache_store(self, cache_key: Optional[str], result: Optional[Dict]):
+        """Cache a successful extraction (failures are retried next run)"""
+        if result and cache_key:
+            self.cache.put(
+                cache_key, result,
+                provider=self.provider.value, model=self.model, prompt_version=self.prompt_version
+            )
+
+    def extract_from_images(self, image_paths: List[ImageInput], url: str = None) -> Optional[Dict]:
         """
         Extract event information from images using vision LLM
 
         Args:
-            image_paths: List of paths to event images
+            image_paths: List of event images (file paths or raw bytes)
             url: Event URL (for reference)
 
         Returns:
@@ -265,32 +346,158 @@ class VisionExtractor:
             print("⚠ No images provided")
             return None
 
-        print(f"  Processing {len(image_paths)} images with vision LLM...")
+        try:
+            images = [self._load_image(image) for image in image_paths]
+        except Exception as e:
+            print(f"⚠ Failed to read images: {e}")
+            return None
+
+        cache_key, cached = self._cache_lookup(images)
+        if cached is not None:
+            print(f"  ⚡ Vision cache hit ({len(images)} images, {self.provider.value})")
+            return cached
+
+        print(f"  Processing {len(images)} images with vision LLM...")
 
         try:
+            result = None
             if self.provider == VisionProvider.CLAUDE_HAIKU:
-                return self._extract_claude(image_paths)
+                result = self._extract_claude(images)
             elif self.provider == VisionProvider.GPT_4O_MINI:
-                return self._extract_openai(image_paths)
+                result = self._extract_openai(images)
             elif self.provider == VisionProvider.GEMINI_FLASH:
-                return self._extract_gemini(image_paths)
+                result = self._extract_gemini(images)
+
+            self._cache_store(cache_key, result)
+            return result
         except Exception as e:
             print(f"⚠ Vision extraction failed ({self.provider.value}): {e}")
             import traceback
             traceback.print_exc()
             return None
 
-    def _extract_claude(self, image_paths: List[str]) -> Optional[Dict]:
-        """Extract using Claude Vision API"""
+    async def extract_from_images_grouped(
+        self,
+        image_paths: List[ImageInput],
+        url: str = None,
+        group_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Extract event information with images split into groups sent concurrently
+
+        Each group of up to group_size images is one request (cached per group)
+        on the provider's async client; at most max_concurrency requests are in
+        flight. Group results are merged in image order (see merge_results), so
+        the output does not depend on which request finishes first. Failed
+        groups are skipped.
+
+        Args:
+            image_paths: List of event images (file paths or raw bytes)
+            url: Event URL (for reference)
+            group_size: Images per request (default: GROUP_SIZE)
+            max_concurrency: Maximum concurrent requests (default: MAX_CONCURRENT_GROUPS)
+
+        Returns:
+            Merged extraction result, or None if every group failed
+        """
+        if not image_paths:
+            print("⚠ No images provided")
+            return None
+
+        try:
+            images = await asyncio.to_thread(lambda: [self._load_image(image) for image in image_paths])
+        except Exception as e:
+            print(f"⚠ Failed to read images: {e}")
+            return None
+
+        # Tiles of one banner always stay in the same request
+        group_size = max(1, group_size or self.GROUP_SIZE)
+        groups = [images[i:i + group_size] for i in range(0, len(images), group_size)]
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_GROUPS)
+
+        print(f"  Processing {len(images)} images in {len(groups)} groups with vision LLM...")
+
+        async def extract_group(index: int, group: List[bytes]) -> Optional[Dict]:
+            cache_key, cached = await asyncio.to_thread(self._cache_lookup, group)
+            if cached is not None:
+                print(f"  ⚡ Vision cache hit (group {index + 1}/{len(groups)})")
+                return cached
+
+            async with semaphore:
+                try:
+                    if self.provider == VisionProvider.CLAUDE_HAIKU:
+                        result = await self._extract_claude_async(group)
+                    elif self.provider == VisionProvider.GPT_4O_MINI:
+                        result = await self._extract_openai_async(group)
+                    else:
+                        result = await self._extract_gemini_async(group)
+                except Exception as e:
+                    print(f"⚠ Vision extraction failed for group {index + 1}/{len(groups)} ({self.provider.value}): {e}")
+                    return None
+
+            await asyncio.to_thread(self._cache_store, cache_key, result)
+            return result
+
+        results = await asyncio.gather(*(extract_group(i, group) for i, group in enumerate(groups)))
+        succeeded = [result for result in results if result]
+        print(f"  ✓ {len(succeeded)}/{len(groups)} groups extracted")
+
+        return self.merge_results(succeeded) if succeeded else None
+
+    @classmethod
+    def merge_results(cls, results: List[Dict]) -> Dict:
+        """
+        Merge per-group extraction results deterministically
+
+        Scalar fields take the first non-empty value in group order; list fields
+        are concatenated in group order, dropping items that repeat an earlier
+        one (compared case-insensitively with whitespace collapsed).
+
+        Args:
+            results: Group results in image order
+
+        Returns:
+            Merged result
+        """
+        merged: Dict = {field: None for field in cls.SCALAR_FIELDS}
+        merged.update({field: [] for field in cls.LIST_FIELDS})
+        seen: Dict[str, set] = {field: set() for field in cls.LIST_FIELDS}
+
+        for result in results:
+            for field in cls.SCALAR_FIELDS:
+                if not merged[field] and result.get(field):
+                    merged[field] = result[field]
+            for field in cls.LIST_FIELDS:
+                for item in result.get(field) or []:
+                    text = item if isinstance(item, str) else json.dumps(item, ensure_ascii=False, sort_keys=True)
+                    normalized = ' '.join(text.split()).casefold()
+                    if normalized and normalized not in seen[field]:
+                        seen[field].add(normalized)
+                        merged[field].append(item)
+
+        return merged
+
+    def _get_async_client(self):
+        """Get the async provider client for the running event loop (Claude / OpenAI)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # Shared pooled httpx client of this loop (SSL verification disabled)
+            http_client = HTTPClientRegistry.get_async_client() if HTTPClientRegistry else httpx.AsyncClient(verify=False)
+            if self.provider == VisionProvider.CLAUDE_HAIKU:
+                self._async_client = anthropic.AsyncAnthropic(api_key=self._api_key, http_client=http_client)
+            else:
+                self._async_client = openai.AsyncOpenAI(api_key=self._api_key, http_client=http_client)
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _claude_request(self, images: List[bytes]) -> Dict:
+        """Build Claude messages.create arguments"""
         prompt = self._build_prompt()
 
         # Build content with multiple images
         content = []
-        for img_path in image_paths:
-            resized_path = self._resize_image_if_needed(img_path)
-            image_data = self._encode_image(resized_path)
-            media_type = self._get_image_media_type(resized_path)
-
+        for media_type, image_data in self._prepare_images(images):
             content.append({
                 "type": "image",
                 "source": {
@@ -306,30 +513,38 @@ class VisionExtractor:
             "text": prompt
         })
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=1024,
-            messages=[{
+        return {
+            "model": self.model,
+            "max_tokens": 1024,
+            "messages": [{
                 "role": "user",
                 "content": content
             }]
-        )
+        }
+
+    def _extract_claude(self, images: List[bytes]) -> Optional[Dict]:
+        """Extract using Claude Vision API"""
+        response = self.client.messages.create(**self._claude_request(images))
 
         result_text = response.content[0].text
         return self._parse_json_response(result_text)
 
-    def _extract_openai(self, image_paths: List[str]) -> Optional[Dict]:
-        """Extract using OpenAI Vision API"""
+    async def _extract_claude_async(self, images: List[bytes]) -> Optional[Dict]:
+        """Extract using Claude Vision API (async client)"""
+        request = await asyncio.to_thread(self._claude_request, images)
+        response = await self._get_async_client().messages.create(**request)
+
+        result_text = response.content[0].text
+        return self._parse_json_response(result_text)
+
+    def _openai_request(self, images: List[bytes]) -> Dict:
+        """Build OpenAI chat.completions.create arguments"""
         prompt = self._build_prompt()
 
         # Build content with multiple images
         content = [{"type": "text", "text": prompt}]
 
-        for img_path in image_paths:
-            resized_path = self._resize_image_if_needed(img_path)
-            image_data = self._encode_image(resized_path)
-            media_type = self._get_image_media_type(resized_path)
-
+        for media_type, image_data in self._prepare_images(images):
             content.append({
                 "type": "image_url",
                 "image_url": {
@@ -337,31 +552,60 @@ class VisionExtractor:
                 }
             })
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            response_format={"type": "json_object"},
-            messages=[{
+        return {
+            "model": self.model,
+            "response_format": {"type": "json_object"},
+            "messages": [{
                 "role": "user",
                 "content": content
             }]
-        )
+        }
+
+    def _extract_openai(self, images: List[bytes]) -> Optional[Dict]:
+        """Extract using OpenAI Vision API"""
+        response = self.client.chat.completions.create(**self._openai_request(images))
 
         result_text = response.choices[0].message.content
         return self._parse_json_response(result_text)
 
-    def _extract_gemini(self, image_paths: List[str]) -> Optional[Dict]:
-        """Extract using Google Gemini Vision API"""
+    async def _extract_openai_async(self, images: List[bytes]) -> Optional[Dict]:
+        """Extract using OpenAI Vision API (async client)"""
+        request = await asyncio.to_thread(self._openai_request, images)
+        response = await self._get_async_client().chat.completions.create(**request)
+
+        result_text = response.choices[0].message.content
+        return self._parse_json_response(result_text)
+
+    def _gemini_content(self, images: List[bytes]) -> List:
+        """Build Gemini generate_content input"""
         prompt = self._build_prompt()
 
-        # Build content with multiple images
+        # Build content with multiple images (inline blobs, no PIL objects)
         content = [prompt]
 
-        for img_path in image_paths:
-            resized_path = self._resize_image_if_needed(img_path)
-            img = Image.open(resized_path)
-            content.append(img)
+        for data in images:
+            tiles = self.preprocessor.process(data) if self.preprocessor else [(data, 'image/jpeg')]
+            for tile, media_type in tiles:
+                content.append({"mime_type": media_type, "data": tile})
 
+        return content
+
+    def _extract_gemini(self, images: List[bytes]) -> Optional[Dict]:
+        """Extract using Google Gemini Vision API"""
         response = self.client.generate_content(
+            self._gemini_content(images),
+            generation_config=genai.GenerationConfig(
+                response_mime_type="application/json",
+            )
+        )
+
+        result_text = response.text
+        return self._parse_json_response(result_text)
+
+    async def _extract_gemini_async(self, images: List[bytes]) -> Optional[Dict]:
+        """Extract using Google Gemini Vision API (async)"""
+        content = await asyncio.to_thread(self._gemini_content, images)
+        response = await self.client.generate_content_async(
             content,
             generation_config=genai.GenerationConfig(
                 response_mime_type="application/json",